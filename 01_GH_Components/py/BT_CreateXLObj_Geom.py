@@ -32,6 +32,7 @@ EM October 21, 2020
         zoneExclude_: <Optional> Pass in a list of string values to filter out certain zones by name. If the zone name includes the string anywhere in its name, it will be removed from the set to output.
         tfa_: <Optional> Input either a list of values (numbers) or a list of geometry representing the TFA (Treated Floor Area) of the building (m2). Set input as 'From Zone Geometry' and it will try and read any TFA from Zone's Room Objects as well. Direct input will take precedence over any Zone Rooms though. Leave blank for no TFA output to the PHPP
         thermalBridges_: <Optional> Input of Thermal Bridge Objects to write to the PHPP
+        zoneDocuments_: <Optional> For mixed-use / multi-PHPP projects. Input a list of strings in the format " Document Name: Zone Name, Zone Name " to split the zones up into separate PHPP documents, all in one go (instead of a 'Filter PHPP Objs' and a 'Create Excel Obj - Geom' for each document). Each zone goes to the first document with a matching name (the name can be just part of the zone name). Materials, Constructions, Window Components, Thermal Bridges, Climate and Footprint are the same for all the documents. Note that any tfa_ numbers input will be written to every document, so use 'From Zone Geometry' to get each document's own TFA.
         udRowStarts_: <Optional> Input a list of string values for any non-standard starting positions (rows) in your PHPP. This might be neccessary if you have modified your PHPP from the normal one you got originally. For instance, if you added new rows to the PHPP in  order to add more rooms (Additional Ventilation) or surfaces (Areas) or that sort of thing. To set the correct values here, input strings in the format " Worksheet Name, Start Key: New Start Row " - so use commas to separate the levels of the dict, then a semicolon before the value you want to input. Will accept multiline strings for multiple value resets.
         Enter any of the following valid Start Rows:
             -  Additional Ventilation, Rooms: ## (Default=56)
@@ -44,7 +45,7 @@ EM October 21, 2020
             -  Electricity non-res, Office Equip: ## (Default=62)
             -  Electricity non-res, Kitchen: ## (Default=77)
     Returns:
-        toPHPP_Geom_: A DataTree of the final clean, Excel-Ready output objects. Each output object has a Worksheet-Name, a Cell Range, and a Value. Connect to the 'Geom_' input on the 'Write 2PHPP' Component to write to Excel.
+        toPHPP_Geom_: A DataTree of the final clean, Excel-Ready output objects. Each branch holds one Write Batch of all the Excel-Ready writes (each a Worksheet-Name, a Cell Range, and a Value) for that part of the PHPP. Connect to the 'Geom_' input on the 'Write 2PHPP' Component to write to Excel. If zoneDocuments_ are input, each document's objects are in their own branch {Document Number; ...} in the same order as the zoneDocuments_ input. Use a 'Tree Branch' to pull out each document's objects for its own 'Write 2PHPP' Component.
 """
 
 ghenv.Component.Name = "BT_CreateXLObj_Geom"
@@ -67,7 +68,8 @@ from collections import defaultdict
 import statistics
 
 # Classes and Defs
-PHPP_XL_Obj = sc.sticky['PHPP_XL_Obj'] 
+PHPP_XL_Address = sc.sticky['PHPP_XL_Address']
+PHPP_XL_WriteBatch = sc.sticky['PHPP_XL_WriteBatch']
 preview = sc.sticky['Preview']
 PHPP_DHW_System = sc.sticky['PHPP_DHW_System']
 PHPP_DHW_usage = sc.sticky['PHPP_DHW_usage'] 
@@ -81,7 +83,7 @@ def getUvalues(_inputBranch):
     uID_Count = 1
     uValueUID_Names = []
     uValuesConstructorStartRow = 10
-    uValuesList = []
+    uValuesList = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
     print 'Creating the U-Values Objects...'
     for eachConst in _inputBranch:
         # for each Construction Assembly in the model....
@@ -119,16 +121,16 @@ def getUvalues(_inputBranch):
             uValueUID_Names.append('{:02d}ud-{}'.format(uID_Count, constName_clean) )
             
             # Create the Objects for the Header Piece (Name, Rsi, Rse)
-            nameAddress = '{}{}'.format('M', uValuesConstructorStartRow + 1) # Construction Name
-            rSi = '{}{}'.format('M', uValuesConstructorStartRow + 3) # R-surface-int
-            rSe = '{}{}'.format('M', uValuesConstructorStartRow + 4) # R-surface-ext
-            intIns = '{}{}'.format('S', uValuesConstructorStartRow + 1) # Interior Insulation Flag
+            nameAddress = PHPP_XL_Address.cell('M', uValuesConstructorStartRow + 1) # Construction Name
+            rSi = PHPP_XL_Address.cell('M', uValuesConstructorStartRow + 3) # R-surface-int
+            rSe = PHPP_XL_Address.cell('M', uValuesConstructorStartRow + 4) # R-surface-ext
+            intIns = PHPP_XL_Address.cell('S', uValuesConstructorStartRow + 1) # Interior Insulation Flag
             
-            uValuesList.append( PHPP_XL_Obj('U-Values', nameAddress, constName_clean))
-            uValuesList.append( PHPP_XL_Obj('U-Values', rSi, 0, 'M2K/W', 'HR-FT2-F/BTU'))
-            uValuesList.append( PHPP_XL_Obj('U-Values', rSe, 0, 'M2K/W', 'HR-FT2-F/BTU')) # For now, zero out
+            uValuesList.add('U-Values', nameAddress, constName_clean)
+            uValuesList.add('U-Values', rSi, 0, 'M2K/W', 'HR-FT2-F/BTU')
+            uValuesList.add('U-Values', rSe, 0, 'M2K/W', 'HR-FT2-F/BTU') # For now, zero out
             if eachConst.IntInsul != None:
-                uValuesList.append( PHPP_XL_Obj('U-Values', intIns, 'x'))
+                uValuesList.add('U-Values', intIns, 'x')
             
             # Create the actual Material Layers for PHPP U-Value
             layerCount = 0
@@ -152,14 +154,14 @@ def getUvalues(_inputBranch):
                             layerThickness = getattr(eachMatLayer, 'LayerThickness')*1000 # Cus PHPP uses mm for thickness
                             
                             # Set up the Range tagets
-                            layer1Address_L = '{}{}'.format('L', uValuesConstructorStartRow + 7 + layerCount) # Material Name
-                            layer1Address_M = '{}{}'.format('M', uValuesConstructorStartRow + 7 + layerCount) # Conductivity
-                            layer1Address_S = '{}{}'.format('S', uValuesConstructorStartRow + 7 + layerCount) # Thickness
+                            layer1Address_L = PHPP_XL_Address.cell('L', uValuesConstructorStartRow + 7 + layerCount) # Material Name
+                            layer1Address_M = PHPP_XL_Address.cell('M', uValuesConstructorStartRow + 7 + layerCount) # Conductivity
+                            layer1Address_S = PHPP_XL_Address.cell('S', uValuesConstructorStartRow + 7 + layerCount) # Thickness
                             
                             # Create the Layer Objects
-                            uValuesList.append( PHPP_XL_Obj('U-Values', layer1Address_L, layerMatName))# Material Name
-                            uValuesList.append( PHPP_XL_Obj('U-Values', layer1Address_M, layerMatCond, 'W/MK', 'HR-FT2-F/BTU-IN')) # Conductivity
-                            uValuesList.append( PHPP_XL_Obj('U-Values', layer1Address_S, layerThickness, 'MM', 'IN')) # Thickness
+                            uValuesList.add('U-Values', layer1Address_L, layerMatName)# Material Name
+                            uValuesList.add('U-Values', layer1Address_M, layerMatCond, 'W/MK', 'HR-FT2-F/BTU-IN') # Conductivity
+                            uValuesList.add('U-Values', layer1Address_S, layerThickness, 'MM', 'IN') # Thickness
                             
                             layerCount+=1
             
@@ -172,7 +174,7 @@ def getComponents(_inputBranch):
     winComponentStartRow = 15
     frame_Count = 0
     glass_Count = 0
-    winComponentsList = []
+    winComponentsList = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
     glassNameDict = {}
     frameNameDict = {}
     
@@ -193,14 +195,14 @@ def getComponents(_inputBranch):
             glassNameDict[gNm] = '{:02d}ud-{}'.format(glass_Count+1, gNm)
             
             # Set the glass range addresses
-            Address_Gname = '{}{}'.format('IE', winComponentStartRow + glass_Count) # Name
-            Address_Gvalue = '{}{}'.format('IF', winComponentStartRow + glass_Count) # g-Value
-            Address_Uvalue = '{}{}'.format('IG', winComponentStartRow + glass_Count) # U-Value
+            Address_Gname = PHPP_XL_Address.cell('IE', winComponentStartRow + glass_Count) # Name
+            Address_Gvalue = PHPP_XL_Address.cell('IF', winComponentStartRow + glass_Count) # g-Value
+            Address_Uvalue = PHPP_XL_Address.cell('IG', winComponentStartRow + glass_Count) # U-Value
             
             # Create the PHPP write Objects
-            winComponentsList.append( PHPP_XL_Obj('Components', Address_Gname, gNm))# Glass Type Name
-            winComponentsList.append( PHPP_XL_Obj('Components', Address_Gvalue, gV))# g-Value
-            winComponentsList.append( PHPP_XL_Obj('Components', Address_Uvalue, uG, 'W/M2K', 'BTU/HR-FT2-F' ))# U-Value
+            winComponentsList.add('Components', Address_Gname, gNm)# Glass Type Name
+            winComponentsList.add('Components', Address_Gvalue, gV)# g-Value
+            winComponentsList.add('Components', Address_Uvalue, uG, 'W/M2K', 'BTU/HR-FT2-F' )# U-Value
             
             glass_Count +=1
             
@@ -221,46 +223,46 @@ def getComponents(_inputBranch):
             frameNameDict[fNm] = '{:02d}ud-{}'.format(frame_Count+1, fNm) # was glass_count????
             
             # Set the frame range address
-            Address_Fname = '{}{}'.format('IL', winComponentStartRow + frame_Count)
-            Address_Uf_Left = '{}{}'.format('IM', winComponentStartRow + frame_Count)
-            Address_Uf_Right = '{}{}'.format('IN', winComponentStartRow + frame_Count)
-            Address_Uf_Bottom = '{}{}'.format('IO', winComponentStartRow + frame_Count)
-            Address_Uf_Top = '{}{}'.format('IP', winComponentStartRow + frame_Count)
-            Address_W_Left = '{}{}'.format('IQ', winComponentStartRow + frame_Count)
-            Address_W_Right = '{}{}'.format('IR', winComponentStartRow + frame_Count)
-            Address_W_Bottom = '{}{}'.format('IS', winComponentStartRow + frame_Count)
-            Address_W_Top = '{}{}'.format('IT', winComponentStartRow + frame_Count)
-            Address_Psi_g_Left = '{}{}'.format('IU', winComponentStartRow + frame_Count)
-            Address_Psi_g_Right = '{}{}'.format('IV', winComponentStartRow + frame_Count)
-            Address_Psi_g_Bottom = '{}{}'.format('IW', winComponentStartRow + frame_Count)
-            Address_Psi_g_Top = '{}{}'.format('IX', winComponentStartRow + frame_Count)
-            Address_Psi_I_Left = '{}{}'.format('IY', winComponentStartRow + frame_Count)
-            Address_Psi_I_Right = '{}{}'.format('IZ', winComponentStartRow + frame_Count)
-            Address_Psi_I_Bottom = '{}{}'.format('JA', winComponentStartRow + frame_Count)
-            Address_Psi_I_Top = '{}{}'.format('JB', winComponentStartRow + frame_Count)
+            Address_Fname = PHPP_XL_Address.cell('IL', winComponentStartRow + frame_Count)
+            Address_Uf_Left = PHPP_XL_Address.cell('IM', winComponentStartRow + frame_Count)
+            Address_Uf_Right = PHPP_XL_Address.cell('IN', winComponentStartRow + frame_Count)
+            Address_Uf_Bottom = PHPP_XL_Address.cell('IO', winComponentStartRow + frame_Count)
+            Address_Uf_Top = PHPP_XL_Address.cell('IP', winComponentStartRow + frame_Count)
+            Address_W_Left = PHPP_XL_Address.cell('IQ', winComponentStartRow + frame_Count)
+            Address_W_Right = PHPP_XL_Address.cell('IR', winComponentStartRow + frame_Count)
+            Address_W_Bottom = PHPP_XL_Address.cell('IS', winComponentStartRow + frame_Count)
+            Address_W_Top = PHPP_XL_Address.cell('IT', winComponentStartRow + frame_Count)
+            Address_Psi_g_Left = PHPP_XL_Address.cell('IU', winComponentStartRow + frame_Count)
+            Address_Psi_g_Right = PHPP_XL_Address.cell('IV', winComponentStartRow + frame_Count)
+            Address_Psi_g_Bottom = PHPP_XL_Address.cell('IW', winComponentStartRow + frame_Count)
+            Address_Psi_g_Top = PHPP_XL_Address.cell('IX', winComponentStartRow + frame_Count)
+            Address_Psi_I_Left = PHPP_XL_Address.cell('IY', winComponentStartRow + frame_Count)
+            Address_Psi_I_Right = PHPP_XL_Address.cell('IZ', winComponentStartRow + frame_Count)
+            Address_Psi_I_Bottom = PHPP_XL_Address.cell('JA', winComponentStartRow + frame_Count)
+            Address_Psi_I_Top = PHPP_XL_Address.cell('JB', winComponentStartRow + frame_Count)
             
             # Create the PHPP Objects for the Frames
-            winComponentsList.append( PHPP_XL_Obj('Components', Address_Fname, fNm))# Frame Type Name
+            winComponentsList.add('Components', Address_Fname, fNm)# Frame Type Name
             
-            winComponentsList.append( PHPP_XL_Obj('Components', Address_Uf_Left, uF_L, 'W/M2K', 'BTU/HR-FT2-F')) # Frame Type U-Values
-            winComponentsList.append( PHPP_XL_Obj('Components', Address_Uf_Right, uF_R, 'W/M2K', 'BTU/HR-FT2-F'))
-            winComponentsList.append( PHPP_XL_Obj('Components', Address_Uf_Bottom, uF_B, 'W/M2K', 'BTU/HR-FT2-F'))
-            winComponentsList.append( PHPP_XL_Obj('Components', Address_Uf_Top, uF_T, 'W/M2K', 'BTU/HR-FT2-F'))
+            winComponentsList.add('Components', Address_Uf_Left, uF_L, 'W/M2K', 'BTU/HR-FT2-F') # Frame Type U-Values
+            winComponentsList.add('Components', Address_Uf_Right, uF_R, 'W/M2K', 'BTU/HR-FT2-F')
+            winComponentsList.add('Components', Address_Uf_Bottom, uF_B, 'W/M2K', 'BTU/HR-FT2-F')
+            winComponentsList.add('Components', Address_Uf_Top, uF_T, 'W/M2K', 'BTU/HR-FT2-F')
             
-            winComponentsList.append( PHPP_XL_Obj('Components', Address_W_Left, wF_L, 'M', 'IN')) # Frame Type Widths
-            winComponentsList.append( PHPP_XL_Obj('Components', Address_W_Right, wF_R, 'M', 'IN'))
-            winComponentsList.append( PHPP_XL_Obj('Components', Address_W_Bottom, wF_B, 'M', 'IN'))
-            winComponentsList.append( PHPP_XL_Obj('Components', Address_W_Top, wF_T, 'M', 'IN'))
+            winComponentsList.add('Components', Address_W_Left, wF_L, 'M', 'IN') # Frame Type Widths
+            winComponentsList.add('Components', Address_W_Right, wF_R, 'M', 'IN')
+            winComponentsList.add('Components', Address_W_Bottom, wF_B, 'M', 'IN')
+            winComponentsList.add('Components', Address_W_Top, wF_T, 'M', 'IN')
             
-            winComponentsList.append( PHPP_XL_Obj('Components', Address_Psi_g_Left, psiG_L, 'W/MK', 'BTU/HR-FT-F')) # Frame Type Psi-Glazing
-            winComponentsList.append( PHPP_XL_Obj('Components', Address_Psi_g_Right, psiG_R, 'W/MK', 'BTU/HR-FT-F'))
-            winComponentsList.append( PHPP_XL_Obj('Components', Address_Psi_g_Bottom, psiG_B, 'W/MK', 'BTU/HR-FT-F'))
-            winComponentsList.append( PHPP_XL_Obj('Components', Address_Psi_g_Top, psiG_T, 'W/MK', 'BTU/HR-FT-F'))
+            winComponentsList.add('Components', Address_Psi_g_Left, psiG_L, 'W/MK', 'BTU/HR-FT-F') # Frame Type Psi-Glazing
+            winComponentsList.add('Components', Address_Psi_g_Right, psiG_R, 'W/MK', 'BTU/HR-FT-F')
+            winComponentsList.add('Components', Address_Psi_g_Bottom, psiG_B, 'W/MK', 'BTU/HR-FT-F')
+            winComponentsList.add('Components', Address_Psi_g_Top, psiG_T, 'W/MK', 'BTU/HR-FT-F')
             
-            winComponentsList.append( PHPP_XL_Obj('Components', Address_Psi_I_Left, psiI_L, 'W/MK', 'BTU/HR-FT-F')) # Frame Type Psi-Installs
-            winComponentsList.append( PHPP_XL_Obj('Components', Address_Psi_I_Right, psiI_R, 'W/MK', 'BTU/HR-FT-F'))
-            winComponentsList.append( PHPP_XL_Obj('Components', Address_Psi_I_Bottom, psiI_B, 'W/MK', 'BTU/HR-FT-F'))
-            winComponentsList.append( PHPP_XL_Obj('Components', Address_Psi_I_Top, psiI_T, 'W/MK', 'BTU/HR-FT-F'))
+            winComponentsList.add('Components', Address_Psi_I_Left, psiI_L, 'W/MK', 'BTU/HR-FT-F') # Frame Type Psi-Installs
+            winComponentsList.add('Components', Address_Psi_I_Right, psiI_R, 'W/MK', 'BTU/HR-FT-F')
+            winComponentsList.add('Components', Address_Psi_I_Bottom, psiI_B, 'W/MK', 'BTU/HR-FT-F')
+            winComponentsList.add('Components', Address_Psi_I_Top, psiI_T, 'W/MK', 'BTU/HR-FT-F')
             
             frame_Count +=1
             
@@ -273,7 +275,7 @@ def getAreas(_inputBranch, _zones):
     areasRowStart = 41
     areaCount = 0
     uID_Count = 1
-    areasList = []
+    areasList = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
     surfacesIncluded = []
     print "Creating the 'Areas' Objects..."
     for surface in _inputBranch:
@@ -306,27 +308,27 @@ def getAreas(_inputBranch, _zones):
                     assemblyName = uIDName
             
             # Setup the Excel Address Locations
-            Address_Name = '{}{}'.format('L', areasRowStart + areaCount)
-            Address_GroupNum = '{}{}'.format('M', areasRowStart + areaCount)
-            Address_Quantity = '{}{}'.format('P', areasRowStart + areaCount)
-            Address_Area = '{}{}'.format('V', areasRowStart + areaCount)
-            Address_Assembly = '{}{}'.format('AC', areasRowStart + areaCount)
-            Address_AngleNorth = '{}{}'.format('AG', areasRowStart + areaCount)
-            Address_AngleHoriz = '{}{}'.format('AH', areasRowStart + areaCount)
-            Address_ShadingFac = '{}{}'.format('AJ', areasRowStart + areaCount)
-            Address_Abs = '{}{}'.format('AK', areasRowStart + areaCount)
-            Address_Emmis = '{}{}'.format('AL', areasRowStart + areaCount)
+            Address_Name = PHPP_XL_Address.cell('L', areasRowStart + areaCount)
+            Address_GroupNum = PHPP_XL_Address.cell('M', areasRowStart + areaCount)
+            Address_Quantity = PHPP_XL_Address.cell('P', areasRowStart + areaCount)
+            Address_Area = PHPP_XL_Address.cell('V', areasRowStart + areaCount)
+            Address_Assembly = PHPP_XL_Address.cell('AC', areasRowStart + areaCount)
+            Address_AngleNorth = PHPP_XL_Address.cell('AG', areasRowStart + areaCount)
+            Address_AngleHoriz = PHPP_XL_Address.cell('AH', areasRowStart + areaCount)
+            Address_ShadingFac = PHPP_XL_Address.cell('AJ', areasRowStart + areaCount)
+            Address_Abs = PHPP_XL_Address.cell('AK', areasRowStart + areaCount)
+            Address_Emmis = PHPP_XL_Address.cell('AL', areasRowStart + areaCount)
             
-            areasList.append( PHPP_XL_Obj('Areas', Address_Name, nm))# Surface Name
-            areasList.append( PHPP_XL_Obj('Areas', Address_GroupNum, groupNum))# Surface Group Number
-            areasList.append( PHPP_XL_Obj('Areas', Address_Quantity, quantity))# Surface Quantity
-            areasList.append( PHPP_XL_Obj('Areas', Address_Area, surfaceArea, 'M2', 'FT2'))# Surface Area (m2)
-            areasList.append( PHPP_XL_Obj('Areas', Address_Assembly, assemblyName))# Assembly Type Name
-            areasList.append( PHPP_XL_Obj('Areas', Address_AngleNorth, angleFromNorth))# Orientation Off North
-            areasList.append( PHPP_XL_Obj('Areas', Address_AngleHoriz, angleFromHoriz))# Orientation Off Horizontal
-            areasList.append( PHPP_XL_Obj('Areas', Address_ShadingFac, shading))# Shading Factor
-            areasList.append( PHPP_XL_Obj('Areas', Address_Abs, abs))# Absorptivity
-            areasList.append( PHPP_XL_Obj('Areas', Address_Emmis, emmis))# Emmissivity
+            areasList.add('Areas', Address_Name, nm)# Surface Name
+            areasList.add('Areas', Address_GroupNum, groupNum)# Surface Group Number
+            areasList.add('Areas', Address_Quantity, quantity)# Surface Quantity
+            areasList.add('Areas', Address_Area, surfaceArea, 'M2', 'FT2')# Surface Area (m2)
+            areasList.add('Areas', Address_Assembly, assemblyName)# Assembly Type Name
+            areasList.add('Areas', Address_AngleNorth, angleFromNorth)# Orientation Off North
+            areasList.add('Areas', Address_AngleHoriz, angleFromHoriz)# Orientation Off Horizontal
+            areasList.add('Areas', Address_ShadingFac, shading)# Shading Factor
+            areasList.add('Areas', Address_Abs, abs)# Absorptivity
+            areasList.add('Areas', Address_Emmis, emmis)# Emmissivity
             
             # Add the PHPP UD Surface Name to the Surface Object
             setattr(surface, 'UD_Srfc_Name', '{:d}-{}'.format(uID_Count, nm) )
@@ -337,12 +339,12 @@ def getAreas(_inputBranch, _zones):
             uID_Count += 1
             areaCount += 1
     
-    areasList.append( PHPP_XL_Obj('Areas', 'L19', 'Suspended Floor') )
+    areasList.add('Areas', 'L19', 'Suspended Floor')
     return areasList, surfacesIncluded
 
 def getThermalBridges(_inputBranch, _startRows):
     tb_RowStart = _startRows.get('Areas').get('TB')
-    tb_List = []
+    tb_List = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
     print "Creating the 'Thermal Bridging' Objects..."
     for i, tb in enumerate(_inputBranch):
         # for each Thermal Bridge in the model....
@@ -352,24 +354,24 @@ def getThermalBridges(_inputBranch, _startRows):
             i = i+1
         
          # Setup the Excel Address Locations
-        Address_Name = '{}{}'.format('L', tb_RowStart + i)
-        Address_GroupNo = '{}{}'.format('M', tb_RowStart + i)
-        Address_Quantity = '{}{}'.format('P', tb_RowStart + i)
-        Address_Length = '{}{}'.format('R', tb_RowStart + i)
-        Address_PsiValue = '{}{}'.format('X', tb_RowStart + i)
+        Address_Name = PHPP_XL_Address.cell('L', tb_RowStart + i)
+        Address_GroupNo = PHPP_XL_Address.cell('M', tb_RowStart + i)
+        Address_Quantity = PHPP_XL_Address.cell('P', tb_RowStart + i)
+        Address_Length = PHPP_XL_Address.cell('R', tb_RowStart + i)
+        Address_PsiValue = PHPP_XL_Address.cell('X', tb_RowStart + i)
         
-        tb_List.append( PHPP_XL_Obj('Areas', Address_Name, tb.Name))
-        tb_List.append( PHPP_XL_Obj('Areas', Address_GroupNo, tb.GroupNo))
-        tb_List.append( PHPP_XL_Obj('Areas', Address_Quantity, 1))
-        tb_List.append( PHPP_XL_Obj('Areas', Address_Length, tb.Length, 'M', 'FT'))
-        tb_List.append( PHPP_XL_Obj('Areas', Address_PsiValue, tb.PsiValue, 'W/MK', 'BTU/HR-FT-F'))
+        tb_List.add('Areas', Address_Name, tb.Name)
+        tb_List.add('Areas', Address_GroupNo, tb.GroupNo)
+        tb_List.add('Areas', Address_Quantity, 1)
+        tb_List.add('Areas', Address_Length, tb.Length, 'M', 'FT')
+        tb_List.add('Areas', Address_PsiValue, tb.PsiValue, 'W/MK', 'BTU/HR-FT-F')
     
     return tb_List
 
 def getWindows(_inputBranch, _surfacesIncluded, _srfcBranch):
     windowsRowStart = 24
     windowsCount = 0
-    winSurfacesList = []
+    winSurfacesList = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
     
     print "Creating the 'Windows' Objects..."
     for window in _inputBranch:
@@ -402,32 +404,32 @@ def getWindows(_inputBranch, _surfacesIncluded, _srfcBranch):
                     hostUD = getattr(srfc, 'UD_Srfc_Name')
            
            # Get the Window Range Addresses
-            Address_varType = '{}{}'.format('F', windowsRowStart + windowsCount)
-            Address_winQuantity = '{}{}'.format('L', windowsRowStart + windowsCount)
-            Address_winName = '{}{}'.format('M', windowsRowStart + windowsCount)
-            Address_w = '{}{}'.format('Q', windowsRowStart + windowsCount)
-            Address_h = '{}{}'.format('R', windowsRowStart + windowsCount)
-            Address_hostName = '{}{}'.format('S', windowsRowStart + windowsCount)
-            Address_glassType = '{}{}'.format('T', windowsRowStart + windowsCount)
-            Address_frameType = '{}{}'.format('U', windowsRowStart + windowsCount)
-            Address_install_Left = '{}{}'.format('AA', windowsRowStart + windowsCount)
-            Address_install_Right = '{}{}'.format('AB', windowsRowStart + windowsCount)
-            Address_install_Bottom = '{}{}'.format('AC', windowsRowStart + windowsCount)
-            Address_install_Top = '{}{}'.format('AD', windowsRowStart + windowsCount)
+            Address_varType = PHPP_XL_Address.cell('F', windowsRowStart + windowsCount)
+            Address_winQuantity = PHPP_XL_Address.cell('L', windowsRowStart + windowsCount)
+            Address_winName = PHPP_XL_Address.cell('M', windowsRowStart + windowsCount)
+            Address_w = PHPP_XL_Address.cell('Q', windowsRowStart + windowsCount)
+            Address_h = PHPP_XL_Address.cell('R', windowsRowStart + windowsCount)
+            Address_hostName = PHPP_XL_Address.cell('S', windowsRowStart + windowsCount)
+            Address_glassType = PHPP_XL_Address.cell('T', windowsRowStart + windowsCount)
+            Address_frameType = PHPP_XL_Address.cell('U', windowsRowStart + windowsCount)
+            Address_install_Left = PHPP_XL_Address.cell('AA', windowsRowStart + windowsCount)
+            Address_install_Right = PHPP_XL_Address.cell('AB', windowsRowStart + windowsCount)
+            Address_install_Bottom = PHPP_XL_Address.cell('AC', windowsRowStart + windowsCount)
+            Address_install_Top = PHPP_XL_Address.cell('AD', windowsRowStart + windowsCount)
             
             # Create the PHPP Window Object
-            winSurfacesList.append( PHPP_XL_Obj('Windows', Address_varType, variantType)) # Quantity
-            winSurfacesList.append( PHPP_XL_Obj('Windows', Address_winQuantity, quant)) # Quantity
-            winSurfacesList.append( PHPP_XL_Obj('Windows', Address_winName, nm)) # Name
-            winSurfacesList.append( PHPP_XL_Obj('Windows', Address_w, w, 'M', 'FT')) # Width
-            winSurfacesList.append( PHPP_XL_Obj('Windows', Address_h, h, 'M', 'FT')) # Height
-            winSurfacesList.append( PHPP_XL_Obj('Windows', Address_hostName, hostUD)) # Host Name
-            winSurfacesList.append( PHPP_XL_Obj('Windows', Address_glassType, glassTypeUD)) # Glass UD Name
-            winSurfacesList.append( PHPP_XL_Obj('Windows', Address_frameType, frameTypeUD)) # Frame UD Name
-            winSurfacesList.append( PHPP_XL_Obj('Windows', Address_install_Left, window.Installs.Inst_L)) # Install Condition Left
-            winSurfacesList.append( PHPP_XL_Obj('Windows', Address_install_Right, window.Installs.Inst_R)) # Install Condition Right
-            winSurfacesList.append( PHPP_XL_Obj('Windows', Address_install_Bottom, window.Installs.Inst_B)) # Install Condition Bottom
-            winSurfacesList.append( PHPP_XL_Obj('Windows', Address_install_Top, window.Installs.Inst_T)) # Install Condition Top
+            winSurfacesList.add('Windows', Address_varType, variantType) # Quantity
+            winSurfacesList.add('Windows', Address_winQuantity, quant) # Quantity
+            winSurfacesList.add('Windows', Address_winName, nm) # Name
+            winSurfacesList.add('Windows', Address_w, w, 'M', 'FT') # Width
+            winSurfacesList.add('Windows', Address_h, h, 'M', 'FT') # Height
+            winSurfacesList.add('Windows', Address_hostName, hostUD) # Host Name
+            winSurfacesList.add('Windows', Address_glassType, glassTypeUD) # Glass UD Name
+            winSurfacesList.add('Windows', Address_frameType, frameTypeUD) # Frame UD Name
+            winSurfacesList.add('Windows', Address_install_Left, window.Installs.Inst_L) # Install Condition Left
+            winSurfacesList.add('Windows', Address_install_Right, window.Installs.Inst_R) # Install Condition Right
+            winSurfacesList.add('Windows', Address_install_Bottom, window.Installs.Inst_B) # Install Condition Bottom
+            winSurfacesList.add('Windows', Address_install_Top, window.Installs.Inst_T) # Install Condition Top
             
             windowsCount += 1
             
@@ -439,7 +441,7 @@ def getShading(_inputBranch, _surfacesIncluded):
     
     row_start = 17
     row_count = 0
-    shadingList = []
+    shadingList = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
     print "Creating the 'Shading' Objects..."
     for window in _inputBranch:
         if includeWindow(_surfacesIncluded, getattr(window, 'HostSrfc')):
@@ -451,12 +453,12 @@ def getShading(_inputBranch, _surfacesIncluded):
             shadingDims = window.getShadingDims_Simple()
             if shadingDims:
                 try:
-                    shadingList.append( PHPP_XL_Obj( 'Shading', '{}{}'.format('Z', row),  shadingDims.Horizon.h_hori))
-                    shadingList.append( PHPP_XL_Obj( 'Shading', '{}{}'.format('AA', row), shadingDims.Horizon.d_hori))
-                    shadingList.append( PHPP_XL_Obj( 'Shading', '{}{}'.format('AB', row), shadingDims.Reveal.o_reveal))
-                    shadingList.append( PHPP_XL_Obj( 'Shading', '{}{}'.format('AC', row), shadingDims.Reveal.d_reveal))
-                    shadingList.append( PHPP_XL_Obj( 'Shading', '{}{}'.format('AD', row), shadingDims.Overhang.o_over))
-                    shadingList.append( PHPP_XL_Obj( 'Shading', '{}{}'.format('AE', row), shadingDims.Overhang.d_over))
+                    shadingList.add( 'Shading', PHPP_XL_Address.cell('Z', row),  shadingDims.Horizon.h_hori)
+                    shadingList.add( 'Shading', PHPP_XL_Address.cell('AA', row), shadingDims.Horizon.d_hori)
+                    shadingList.add( 'Shading', PHPP_XL_Address.cell('AB', row), shadingDims.Reveal.o_reveal)
+                    shadingList.add( 'Shading', PHPP_XL_Address.cell('AC', row), shadingDims.Reveal.d_reveal)
+                    shadingList.add( 'Shading', PHPP_XL_Address.cell('AD', row), shadingDims.Overhang.o_over)
+                    shadingList.add( 'Shading', PHPP_XL_Address.cell('AE', row), shadingDims.Overhang.d_over)
                 except Exception as e:
                     print('Something went wrong getting the Shading Dimension values?')
                     print(e)
@@ -466,17 +468,17 @@ def getShading(_inputBranch, _surfacesIncluded):
                 winter_factor, summer_factor = shading_factors
                 
                 if winter_factor:
-                    shadingList.append( PHPP_XL_Obj( 'Shading', '{}{}'.format('AF', row), winter_factor))
+                    shadingList.add( 'Shading', PHPP_XL_Address.cell('AF', row), winter_factor)
                 
                 if summer_factor:
-                    shadingList.append( PHPP_XL_Obj( 'Shading', '{}{}'.format('AG', row), summer_factor))
+                    shadingList.add( 'Shading', PHPP_XL_Address.cell('AG', row), summer_factor)
     
     return shadingList
 
 def getTFA(tfaFromUser, tfaBranch, _zones):
     ##########################################
     ##############     TFA     ###############
-    tfa = []
+    tfa = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
     
     if len(tfaFromUser)>0:
         if tfaFromUser[0] == 'From Zone Geometry':
@@ -499,7 +501,7 @@ def getTFA(tfaFromUser, tfaBranch, _zones):
                         tfaSurfaceAreas.append( roomTFA )
                 # Total up the TFA Areas for output
                 tfaTotal = sum(tfaSurfaceAreas)
-                tfa.append( PHPP_XL_Obj('Areas', 'V34', tfaTotal, 'M2', 'FT2' )) # TFA (m2)
+                tfa.add('Areas', 'V34', tfaTotal, 'M2', 'FT2' ) # TFA (m2)
             except:
                 pass
         else:
@@ -516,13 +518,13 @@ def getTFA(tfaFromUser, tfaBranch, _zones):
             
             if sum(tfaSurfaceAreas) != 0:
                 tfaTotal = sum(tfaSurfaceAreas)
-                tfa.append( PHPP_XL_Obj('Areas', 'V34', tfaTotal, 'M2', 'FT2' )) # TFA (m2)
+                tfa.add('Areas', 'V34', tfaTotal, 'M2', 'FT2' ) # TFA (m2)
     
     return tfa
 
 def getAddnlVentRooms(_inputBranch, _ventSystems, _zones, _startRows):
     print "Creating 'Additional Ventilation' Rooms... "
-    addnlVentRooms = []
+    addnlVentRooms = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
     ventUnitsUsed = []
     roomRowStart = _startRows.get('Additional Ventilation').get('Rooms', 57)
     ventUnitRowStart = _startRows.get('Additional Ventilation').get('Vent Unit Selection', 97)
@@ -575,47 +577,47 @@ def getAddnlVentRooms(_inputBranch, _ventSystems, _zones, _startRows):
                 speed_low = None
                 time_low = None
             
-            address_Amount = '{}{}'.format('D', roomRowStart + i)
-            address_Name = '{}{}'.format('E', roomRowStart + i)
-            address_VentAllocation = '{}{}'.format('F', roomRowStart + i)
-            address_Area = '{}{}'.format('G', roomRowStart + i)
-            address_RoomHeight = '{}{}'.format('H', roomRowStart + i)
-            address_SupplyAirFlow = '{}{}'.format('J', roomRowStart + i)
-            address_ExractAirFlow = '{}{}'.format('K', roomRowStart + i)
-            address_TransferAirFlow = '{}{}'.format('L', roomRowStart + i)
-            address_Util_hrs = '{}{}'.format('N', roomRowStart + i)
-            address_Util_days = '{}{}'.format('O', roomRowStart + i)
-            address_Holidays = '{}{}'.format('P', roomRowStart + i)
+            address_Amount = PHPP_XL_Address.cell('D', roomRowStart + i)
+            address_Name = PHPP_XL_Address.cell('E', roomRowStart + i)
+            address_VentAllocation = PHPP_XL_Address.cell('F', roomRowStart + i)
+            address_Area = PHPP_XL_Address.cell('G', roomRowStart + i)
+            address_RoomHeight = PHPP_XL_Address.cell('H', roomRowStart + i)
+            address_SupplyAirFlow = PHPP_XL_Address.cell('J', roomRowStart + i)
+            address_ExractAirFlow = PHPP_XL_Address.cell('K', roomRowStart + i)
+            address_TransferAirFlow = PHPP_XL_Address.cell('L', roomRowStart + i)
+            address_Util_hrs = PHPP_XL_Address.cell('N', roomRowStart + i)
+            address_Util_days = PHPP_XL_Address.cell('O', roomRowStart + i)
+            address_Holidays = PHPP_XL_Address.cell('P', roomRowStart + i)
             
-            address_ventSpeed_high = '{}{}'.format('Q', roomRowStart + i)
-            address_ventTime_high = '{}{}'.format('R', roomRowStart + i) 
-            address_ventSpeed_med = '{}{}'.format('S', roomRowStart + i)
-            address_ventTime_med = '{}{}'.format('T', roomRowStart + i)
-            address_ventSpeed_low = '{}{}'.format('U', roomRowStart + i)
-            address_ventTime_low = '{}{}'.format('V', roomRowStart + i)
+            address_ventSpeed_high = PHPP_XL_Address.cell('Q', roomRowStart + i)
+            address_ventTime_high = PHPP_XL_Address.cell('R', roomRowStart + i) 
+            address_ventSpeed_med = PHPP_XL_Address.cell('S', roomRowStart + i)
+            address_ventTime_med = PHPP_XL_Address.cell('T', roomRowStart + i)
+            address_ventSpeed_low = PHPP_XL_Address.cell('U', roomRowStart + i)
+            address_ventTime_low = PHPP_XL_Address.cell('V', roomRowStart + i)
             
             ventMatchFormula = '=MATCH("{}",E{}:E{},0)'.format(ventSystemName, ventUnitRowStart, ventUnitRowStart+9)
             
-            addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_Amount, 1 ))
-            addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_Name, '{}-{}'.format(roomObj.RoomNumber, roomObj.RoomName )))
-            addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_VentAllocation, ventMatchFormula ))
-            addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_Area, roomObj.FloorArea_TFA, 'M2', 'FT2'))
-            addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_RoomHeight, roomObj.RoomClearHeight, 'M2', 'FT2'))
+            addnlVentRooms.add('Additional Vent', address_Amount, 1 )
+            addnlVentRooms.add('Additional Vent', address_Name, '{}-{}'.format(roomObj.RoomNumber, roomObj.RoomName ))
+            addnlVentRooms.add('Additional Vent', address_VentAllocation, ventMatchFormula )
+            addnlVentRooms.add('Additional Vent', address_Area, roomObj.FloorArea_TFA, 'M2', 'FT2')
+            addnlVentRooms.add('Additional Vent', address_RoomHeight, roomObj.RoomClearHeight, 'M2', 'FT2')
             
-            addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_SupplyAirFlow, roomAirFlow_sup, 'M3/H', 'CFM'))
-            addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_ExractAirFlow, roomAirFlow_eta, 'M3/H', 'CFM'))
-            addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_TransferAirFlow, roomAirFlow_trans, 'M3/H', 'CFM'))
+            addnlVentRooms.add('Additional Vent', address_SupplyAirFlow, roomAirFlow_sup, 'M3/H', 'CFM')
+            addnlVentRooms.add('Additional Vent', address_ExractAirFlow, roomAirFlow_eta, 'M3/H', 'CFM')
+            addnlVentRooms.add('Additional Vent', address_TransferAirFlow, roomAirFlow_trans, 'M3/H', 'CFM')
             
-            addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_Util_hrs, '24'))
-            addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_Util_days, '7'))
-            addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_Holidays,'0'))
+            addnlVentRooms.add('Additional Vent', address_Util_hrs, '24')
+            addnlVentRooms.add('Additional Vent', address_Util_days, '7')
+            addnlVentRooms.add('Additional Vent', address_Holidays,'0')
             
-            addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_ventSpeed_high, speed_high if speed_high else 1))
-            addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_ventTime_high, time_high if time_high else 1))
-            addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_ventSpeed_med,speed_med if speed_med else 1))
-            addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_ventTime_med, time_med if time_med else 0))
-            addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_ventSpeed_low,speed_low if speed_low else 0))
-            addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_ventTime_low, time_low if time_low else 0))
+            addnlVentRooms.add('Additional Vent', address_ventSpeed_high, speed_high if speed_high else 1)
+            addnlVentRooms.add('Additional Vent', address_ventTime_high, time_high if time_high else 1)
+            addnlVentRooms.add('Additional Vent', address_ventSpeed_med,speed_med if speed_med else 1)
+            addnlVentRooms.add('Additional Vent', address_ventTime_med, time_med if time_med else 0)
+            addnlVentRooms.add('Additional Vent', address_ventSpeed_low,speed_low if speed_low else 0)
+            addnlVentRooms.add('Additional Vent', address_ventTime_low, time_low if time_low else 0)
             
             # Keep track of the names of the Vent units used
             ventUnitsUsed.append( ventUnitName )
@@ -628,47 +630,47 @@ def getAddnlVentRooms(_inputBranch, _ventSystems, _zones, _startRows):
                 for exhaustVentObj in ventSystem.ExhaustObjs:
                     for mode in ['on', 'off']:
                         
-                        address_Amount = '{}{}'.format('D', roomRowStart + rowCount)
-                        address_Name = '{}{}'.format('E', roomRowStart + rowCount)
-                        address_VentAllocation = '{}{}'.format('F', roomRowStart + rowCount)
-                        address_Area = '{}{}'.format('G', roomRowStart + rowCount)
-                        address_RoomHeight = '{}{}'.format('H', roomRowStart + rowCount)
-                        address_SupplyAirFlow = '{}{}'.format('J', roomRowStart + rowCount)
-                        address_ExractAirFlow = '{}{}'.format('K', roomRowStart + rowCount)
-                        address_TransferAirFlow = '{}{}'.format('L', roomRowStart + rowCount)
-                        address_Util_hrs = '{}{}'.format('N', roomRowStart + rowCount)
-                        address_Util_days = '{}{}'.format('O', roomRowStart + rowCount)
-                        address_Holidays = '{}{}'.format('P', roomRowStart + rowCount)
+                        address_Amount = PHPP_XL_Address.cell('D', roomRowStart + rowCount)
+                        address_Name = PHPP_XL_Address.cell('E', roomRowStart + rowCount)
+                        address_VentAllocation = PHPP_XL_Address.cell('F', roomRowStart + rowCount)
+                        address_Area = PHPP_XL_Address.cell('G', roomRowStart + rowCount)
+                        address_RoomHeight = PHPP_XL_Address.cell('H', roomRowStart + rowCount)
+                        address_SupplyAirFlow = PHPP_XL_Address.cell('J', roomRowStart + rowCount)
+                        address_ExractAirFlow = PHPP_XL_Address.cell('K', roomRowStart + rowCount)
+                        address_TransferAirFlow = PHPP_XL_Address.cell('L', roomRowStart + rowCount)
+                        address_Util_hrs = PHPP_XL_Address.cell('N', roomRowStart + rowCount)
+                        address_Util_days = PHPP_XL_Address.cell('O', roomRowStart + rowCount)
+                        address_Holidays = PHPP_XL_Address.cell('P', roomRowStart + rowCount)
                             
-                        address_ventSpeed_high = '{}{}'.format('Q', roomRowStart + rowCount)
-                        address_ventTime_high = '{}{}'.format('R', roomRowStart + rowCount) 
-                        address_ventSpeed_med = '{}{}'.format('S', roomRowStart + rowCount)
-                        address_ventTime_med = '{}{}'.format('T', roomRowStart + rowCount)
-                        address_ventSpeed_low = '{}{}'.format('U', roomRowStart + rowCount)
-                        address_ventTime_low = '{}{}'.format('V', roomRowStart + rowCount)
+                        address_ventSpeed_high = PHPP_XL_Address.cell('Q', roomRowStart + rowCount)
+                        address_ventTime_high = PHPP_XL_Address.cell('R', roomRowStart + rowCount) 
+                        address_ventSpeed_med = PHPP_XL_Address.cell('S', roomRowStart + rowCount)
+                        address_ventTime_med = PHPP_XL_Address.cell('T', roomRowStart + rowCount)
+                        address_ventSpeed_low = PHPP_XL_Address.cell('U', roomRowStart + rowCount)
+                        address_ventTime_low = PHPP_XL_Address.cell('V', roomRowStart + rowCount)
                         
                         ventMatchFormula = '=MATCH("{}",E{}:E{},0)'.format(exhaustVentObj.Name, ventUnitRowStart, ventUnitRowStart+9)
                         
-                        addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_Amount, 1 ))
-                        addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_Name, exhaustVentObj.Name +' [ON]' if mode=='on' else exhaustVentObj.Name +' [OFF]'))
-                        addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_VentAllocation, ventMatchFormula ))
-                        addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_Area, '10', 'M', 'FT'))
-                        addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_RoomHeight, '2.5', 'M', 'FT' ))
+                        addnlVentRooms.add('Additional Vent', address_Amount, 1 )
+                        addnlVentRooms.add('Additional Vent', address_Name, exhaustVentObj.Name +' [ON]' if mode=='on' else exhaustVentObj.Name +' [OFF]')
+                        addnlVentRooms.add('Additional Vent', address_VentAllocation, ventMatchFormula )
+                        addnlVentRooms.add('Additional Vent', address_Area, '10', 'M', 'FT')
+                        addnlVentRooms.add('Additional Vent', address_RoomHeight, '2.5', 'M', 'FT' )
                         
-                        addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_SupplyAirFlow, exhaustVentObj.FlowRate_On if mode=='on' else exhaustVentObj.FlowRate_Off, 'M3/H', 'CFM'))
-                        addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_ExractAirFlow, exhaustVentObj.FlowRate_On if mode=='on' else exhaustVentObj.FlowRate_Off, 'M3/H', 'CFM'))
-                        addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_TransferAirFlow, '0', 'M3/H', 'CFM' ))
+                        addnlVentRooms.add('Additional Vent', address_SupplyAirFlow, exhaustVentObj.FlowRate_On if mode=='on' else exhaustVentObj.FlowRate_Off, 'M3/H', 'CFM')
+                        addnlVentRooms.add('Additional Vent', address_ExractAirFlow, exhaustVentObj.FlowRate_On if mode=='on' else exhaustVentObj.FlowRate_Off, 'M3/H', 'CFM')
+                        addnlVentRooms.add('Additional Vent', address_TransferAirFlow, '0', 'M3/H', 'CFM' )
                         
-                        addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_Util_hrs, exhaustVentObj.HrsPerDay_On if mode=='on' else 24 - float(exhaustVentObj.HrsPerDay_On)))
-                        addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_Util_days, exhaustVentObj.DaysPerWeek_On if mode=='on' else 7))
-                        addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_Holidays, exhaustVentObj.Holidays))
+                        addnlVentRooms.add('Additional Vent', address_Util_hrs, exhaustVentObj.HrsPerDay_On if mode=='on' else 24 - float(exhaustVentObj.HrsPerDay_On))
+                        addnlVentRooms.add('Additional Vent', address_Util_days, exhaustVentObj.DaysPerWeek_On if mode=='on' else 7)
+                        addnlVentRooms.add('Additional Vent', address_Holidays, exhaustVentObj.Holidays)
                         
-                        addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_ventSpeed_high, 1))
-                        addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_ventTime_high, 1))
-                        addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_ventSpeed_med,0))
-                        addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_ventTime_med, 0))
-                        addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_ventSpeed_low, 0))
-                        addnlVentRooms.append( PHPP_XL_Obj('Additional Vent', address_ventTime_low, 0))
+                        addnlVentRooms.add('Additional Vent', address_ventSpeed_high, 1)
+                        addnlVentRooms.add('Additional Vent', address_ventTime_high, 1)
+                        addnlVentRooms.add('Additional Vent', address_ventSpeed_med,0)
+                        addnlVentRooms.add('Additional Vent', address_ventTime_med, 0)
+                        addnlVentRooms.add('Additional Vent', address_ventSpeed_low, 0)
+                        addnlVentRooms.add('Additional Vent', address_ventTime_low, 0)
                         
                         rowCount += 1
     
@@ -676,7 +678,7 @@ def getAddnlVentRooms(_inputBranch, _ventSystems, _zones, _startRows):
 
 def getAddnlVentSystems(_inputBranch, _ventUnitsUsed, _startRows):
     # Go through each Ventilation System passed in
-    vent = []
+    vent = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
     ventCompoRowStart = _startRows.get('Components').get('Ventilator')
     ventUnitRowStart = _startRows.get('Additional Ventilation').get('Vent Unit Selection')
     ventDuctsRowStart = _startRows.get('Additional Ventilation').get('Vent Ducts')
@@ -686,8 +688,8 @@ def getAddnlVentSystems(_inputBranch, _ventUnitsUsed, _startRows):
     
     if len(_inputBranch)>0:
         print "Creating 'Additional Ventilation' Systems..."
-        vent.append( PHPP_XL_Obj('Ventilation', 'H42', 'x') ) # Turn on Additional Vent
-        vent.append( PHPP_XL_Obj('Additional Vent', 'F'+str(ventDuctsRowStart-11) , "=AVERAGE(Climate!E24, Climate!F24, Climate!N24, Climate!O24, Climate!P24") ) # External Average Temp
+        vent.add('Ventilation', 'H42', 'x') # Turn on Additional Vent
+        vent.add('Additional Vent', 'F'+str(ventDuctsRowStart-11) , "=AVERAGE(Climate!E24, Climate!F24, Climate!N24, Climate!O24, Climate!P24") # External Average Temp
         
         for key in _inputBranch[0].keys():
             ventSystem = _inputBranch[0][key] 
@@ -704,46 +706,46 @@ def getAddnlVentSystems(_inputBranch, _ventUnitsUsed, _startRows):
             # Basic Ventialtion
             if ventIncluded:
                 # Create the Vent Unit in the Components Worksheet
-                vent.append( PHPP_XL_Obj('Components', 'JH{}'.format(ventCompoRowStart + ventCount), ventSystem.Unit_Name if ventSystem else 'Default_Name' )) #  Create the Vent Unit
-                vent.append( PHPP_XL_Obj('Components', 'JI{}'.format(ventCompoRowStart + ventCount), ventSystem.Unit_HR if ventSystem else 0.75 )) #  Vent Heat Recovery
-                vent.append( PHPP_XL_Obj('Components', 'JJ{}'.format(ventCompoRowStart + ventCount), ventSystem.Unit_MR if ventSystem else 0 )) #  Vent Moisture Recovery
-                vent.append( PHPP_XL_Obj('Components', 'JK{}'.format(ventCompoRowStart + ventCount), ventSystem.Unit_ElecEff if ventSystem else 0.45, 'WH/M3', 'W/CFM')) #  Vent Elec Efficiency
-                vent.append( PHPP_XL_Obj('Components', 'JL{}'.format(ventCompoRowStart + ventCount), 1, 'M3/H', 'CFM')) #  DEFAULT MIN FLOW
-                vent.append( PHPP_XL_Obj('Components', 'JM{}'.format(ventCompoRowStart + ventCount), 10000, 'M3/H', 'CFM' )) #  DEFAULT MAX FLOW
+                vent.add('Components', PHPP_XL_Address.cell('JH', ventCompoRowStart + ventCount), ventSystem.Unit_Name if ventSystem else 'Default_Name' ) #  Create the Vent Unit
+                vent.add('Components', PHPP_XL_Address.cell('JI', ventCompoRowStart + ventCount), ventSystem.Unit_HR if ventSystem else 0.75 ) #  Vent Heat Recovery
+                vent.add('Components', PHPP_XL_Address.cell('JJ', ventCompoRowStart + ventCount), ventSystem.Unit_MR if ventSystem else 0 ) #  Vent Moisture Recovery
+                vent.add('Components', PHPP_XL_Address.cell('JK', ventCompoRowStart + ventCount), ventSystem.Unit_ElecEff if ventSystem else 0.45, 'WH/M3', 'W/CFM') #  Vent Elec Efficiency
+                vent.add('Components', PHPP_XL_Address.cell('JL', ventCompoRowStart + ventCount), 1, 'M3/H', 'CFM') #  DEFAULT MIN FLOW
+                vent.add('Components', PHPP_XL_Address.cell('JM', ventCompoRowStart + ventCount), 10000, 'M3/H', 'CFM' ) #  DEFAULT MAX FLOW
                 
                 # Set the Vent Unit Type
-                vent.append( PHPP_XL_Obj('Ventilation', 'L12', ventSystem.SystemType) ) 
+                vent.add('Ventilation', 'L12', ventSystem.SystemType) 
                 
                 # Set the UD name for access in 'Addnl-Vent' dropdown list
                 setattr(ventSystem, 'Unit_Name_UD', '{:02d}ud-{}'.format(ventCount+1, ventSystem.Unit_Name))
                 
                 # Build the Vent Unit
-                vent.append(  PHPP_XL_Obj('Additional Vent',  'D{}'.format(ventUnitRowStart + ventCount) ,  1) ) # Quantity
-                vent.append(  PHPP_XL_Obj('Additional Vent',  'E{}'.format(ventUnitRowStart + ventCount) ,  ventSystem.SystemName  if ventSystem.SystemName else '') ) # System Name
-                vent.append(  PHPP_XL_Obj('Additional Vent',  'F{}'.format(ventUnitRowStart + ventCount) ,  ventSystem.Unit_Name_UD if ventSystem else '') ) # Vent Conpmonent UD Name
-                vent.append(  PHPP_XL_Obj('Additional Vent',  'Q{}'.format(ventUnitRowStart + ventCount) ,  ventSystem.Exterior if ventSystem else '') ) # Exterior Installation?
-                vent.append(  PHPP_XL_Obj('Additional Vent',  'X{}'.format(ventUnitRowStart + ventCount) ,  '2-Elec.') ) # Frost Protection Type
-                vent.append(  PHPP_XL_Obj('Additional Vent',  'Y{}'.format(ventUnitRowStart + ventCount) ,  ventSystem.FrostTemp if ventSystem else '-5', 'C', 'F') ) # Frost Protection Temp
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('D', ventUnitRowStart + ventCount) ,  1) # Quantity
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('E', ventUnitRowStart + ventCount) ,  ventSystem.SystemName  if ventSystem.SystemName else '') # System Name
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('F', ventUnitRowStart + ventCount) ,  ventSystem.Unit_Name_UD if ventSystem else '') # Vent Conpmonent UD Name
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('Q', ventUnitRowStart + ventCount) ,  ventSystem.Exterior if ventSystem else '') # Exterior Installation?
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('X', ventUnitRowStart + ventCount) ,  '2-Elec.') # Frost Protection Type
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('Y', ventUnitRowStart + ventCount) ,  ventSystem.FrostTemp if ventSystem else '-5', 'C', 'F') # Frost Protection Temp
                 
                 # Build the Vent Unit Ducting
-                vent.append( PHPP_XL_Obj('Additional Vent',  'D{}'.format(ventDuctsRowStart + ductsCount) , 1)) # Quantity
-                vent.append( PHPP_XL_Obj('Additional Vent',  'E{}'.format(ventDuctsRowStart + ductsCount) , ventSystem.Duct01.DuctWidth if ventSystem else 104, 'MM', 'IN'))
-                vent.append( PHPP_XL_Obj('Additional Vent',  'H{}'.format(ventDuctsRowStart + ductsCount) , ventSystem.Duct01.InsulationThickness if ventSystem else 52, 'MM', 'IN'))
-                vent.append( PHPP_XL_Obj('Additional Vent',  'I{}'.format(ventDuctsRowStart + ductsCount) , ventSystem.Duct01.InsulationLambda if ventSystem else 0.04, 'W/MK', 'HR-FT2-F/BTU-IN'))
-                vent.append( PHPP_XL_Obj('Additional Vent',  'J{}'.format(ventDuctsRowStart + ductsCount) , 'x' ))# Reflective
-                vent.append( PHPP_XL_Obj('Additional Vent',  'L{}'.format(ventDuctsRowStart + ductsCount) , ventSystem.Duct01.DuctLength if ventSystem else 5, 'M', 'FT' ))
-                vent.append( PHPP_XL_Obj('Additional Vent',  'M{}'.format(ventDuctsRowStart + ductsCount) , '1'))
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('D', ventDuctsRowStart + ductsCount) , 1) # Quantity
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('E', ventDuctsRowStart + ductsCount) , ventSystem.Duct01.DuctWidth if ventSystem else 104, 'MM', 'IN')
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('H', ventDuctsRowStart + ductsCount) , ventSystem.Duct01.InsulationThickness if ventSystem else 52, 'MM', 'IN')
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('I', ventDuctsRowStart + ductsCount) , ventSystem.Duct01.InsulationLambda if ventSystem else 0.04, 'W/MK', 'HR-FT2-F/BTU-IN')
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('J', ventDuctsRowStart + ductsCount) , 'x' )# Reflective
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('L', ventDuctsRowStart + ductsCount) , ventSystem.Duct01.DuctLength if ventSystem else 5, 'M', 'FT' )
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('M', ventDuctsRowStart + ductsCount) , '1')
                 
-                vent.append( PHPP_XL_Obj('Additional Vent',  'D{}'.format(ventDuctsRowStart + ductsCount+1) , 1)) # Quantity
-                vent.append( PHPP_XL_Obj('Additional Vent',  'E{}'.format(ventDuctsRowStart + ductsCount+1) , ventSystem.Duct02.DuctWidth if ventSystem else 104, 'MM', 'IN'))
-                vent.append( PHPP_XL_Obj('Additional Vent',  'H{}'.format(ventDuctsRowStart + ductsCount+1) , ventSystem.Duct02.InsulationThickness if ventSystem else 52, 'MM', 'IN'))
-                vent.append( PHPP_XL_Obj('Additional Vent',  'I{}'.format(ventDuctsRowStart + ductsCount+1) , ventSystem.Duct02.InsulationLambda if ventSystem else 0.04, 'W/MK', 'HR-FT2-F/BTU-IN'))
-                vent.append( PHPP_XL_Obj('Additional Vent',  'J{}'.format(ventDuctsRowStart + ductsCount+1) , 'x' ))# Reflective
-                vent.append( PHPP_XL_Obj('Additional Vent',  'L{}'.format(ventDuctsRowStart + ductsCount+1) , ventSystem.Duct02.DuctLength if ventSystem else 5, 'M', 'FT'))
-                vent.append( PHPP_XL_Obj('Additional Vent',  'N{}'.format(ventDuctsRowStart + ductsCount+1) , '1'))
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('D', ventDuctsRowStart + ductsCount+1) , 1) # Quantity
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('E', ventDuctsRowStart + ductsCount+1) , ventSystem.Duct02.DuctWidth if ventSystem else 104, 'MM', 'IN')
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('H', ventDuctsRowStart + ductsCount+1) , ventSystem.Duct02.InsulationThickness if ventSystem else 52, 'MM', 'IN')
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('I', ventDuctsRowStart + ductsCount+1) , ventSystem.Duct02.InsulationLambda if ventSystem else 0.04, 'W/MK', 'HR-FT2-F/BTU-IN')
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('J', ventDuctsRowStart + ductsCount+1) , 'x' )# Reflective
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('L', ventDuctsRowStart + ductsCount+1) , ventSystem.Duct02.DuctLength if ventSystem else 5, 'M', 'FT')
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('N', ventDuctsRowStart + ductsCount+1) , '1')
                 
-                vent.append( PHPP_XL_Obj('Additional Vent',  '{}{}'.format(chr(ductColCount), ventDuctsRowStart + ductsCount) , 1)) # Assign Duct to Vent
-                vent.append( PHPP_XL_Obj('Additional Vent',  '{}{}'.format(chr(ductColCount), ventDuctsRowStart + ductsCount+1) , 1)) # Assign Duct to Vent
+                vent.add('Additional Vent',  PHPP_XL_Address.cell(chr(ductColCount), ventDuctsRowStart + ductsCount) , 1) # Assign Duct to Vent
+                vent.add('Additional Vent',  PHPP_XL_Address.cell(chr(ductColCount), ventDuctsRowStart + ductsCount+1) , 1) # Assign Duct to Vent
                 
                 ductColCount+=1
                 ductsCount+=2
@@ -754,43 +756,43 @@ def getAddnlVentSystems(_inputBranch, _ventUnitsUsed, _startRows):
                 # Add in any 'Exhaust Only' ventilation objects (kitchen hoods, etc...)
                 for exhaustSystem in ventSystem.ExhaustObjs:
                     # Build the Vent in the Components Worksheet
-                    vent.append( PHPP_XL_Obj('Components', 'JH{}'.format(ventCompoRowStart + ventCount), exhaustSystem.Name if exhaustSystem.Name else 'Exhaust' )) #  Create the Vent Unit
-                    vent.append( PHPP_XL_Obj('Components', 'JI{}'.format(ventCompoRowStart + ventCount), 0 )) #  Vent Heat Recovery
-                    vent.append( PHPP_XL_Obj('Components', 'JJ{}'.format(ventCompoRowStart + ventCount), 0 )) #  Vent Moisture Recovery
-                    vent.append( PHPP_XL_Obj('Components', 'JK{}'.format(ventCompoRowStart + ventCount), 0.25, 'WH/M3', 'W/CFM' )) #  Vent Elec Efficiency
-                    vent.append( PHPP_XL_Obj('Components', 'JL{}'.format(ventCompoRowStart + ventCount), 1, 'M3/H', 'CFM')) #  DEFAULT MIN FLOW
-                    vent.append( PHPP_XL_Obj('Components', 'JM{}'.format(ventCompoRowStart + ventCount), 10000, 'M3/H', 'CFM' )) #  DEFAULT MAX FLOW
+                    vent.add('Components', PHPP_XL_Address.cell('JH', ventCompoRowStart + ventCount), exhaustSystem.Name if exhaustSystem.Name else 'Exhaust' ) #  Create the Vent Unit
+                    vent.add('Components', PHPP_XL_Address.cell('JI', ventCompoRowStart + ventCount), 0 ) #  Vent Heat Recovery
+                    vent.add('Components', PHPP_XL_Address.cell('JJ', ventCompoRowStart + ventCount), 0 ) #  Vent Moisture Recovery
+                    vent.add('Components', PHPP_XL_Address.cell('JK', ventCompoRowStart + ventCount), 0.25, 'WH/M3', 'W/CFM' ) #  Vent Elec Efficiency
+                    vent.add('Components', PHPP_XL_Address.cell('JL', ventCompoRowStart + ventCount), 1, 'M3/H', 'CFM') #  DEFAULT MIN FLOW
+                    vent.add('Components', PHPP_XL_Address.cell('JM', ventCompoRowStart + ventCount), 10000, 'M3/H', 'CFM' ) #  DEFAULT MAX FLOW
                     
                     # Set the UD name for access in 'Addnl-Vent' dropdown list
                     setattr(exhaustSystem, 'Unit_Name_UD', '{:02d}ud-{}'.format(ventCount+1, exhaustSystem.Name))
                     
                     # Build the Vent Unit
-                    vent.append(  PHPP_XL_Obj('Additional Vent',  'D{}'.format(ventUnitRowStart + ventCount) ,  1) ) # Quantity
-                    vent.append(  PHPP_XL_Obj('Additional Vent',  'E{}'.format(ventUnitRowStart + ventCount) ,  exhaustSystem.Name  if exhaustSystem.Name else 'Exhaust_Unit') )
-                    vent.append(  PHPP_XL_Obj('Additional Vent',  'F{}'.format(ventUnitRowStart + ventCount) ,  exhaustSystem.Unit_Name_UD) ) # Vent Component UD Name
-                    vent.append(  PHPP_XL_Obj('Additional Vent',  'Q{}'.format(ventUnitRowStart + ventCount) ,  '') ) # Exterior Installation?
-                    vent.append(  PHPP_XL_Obj('Additional Vent',  'X{}'.format(ventUnitRowStart + ventCount) ,  '1-No') ) # Frost Protection Type
-                    vent.append(  PHPP_XL_Obj('Additional Vent',  'Y{}'.format(ventUnitRowStart + ventCount) ,  '-5', 'C', 'F') ) # Frost Protection Temp
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('D', ventUnitRowStart + ventCount) ,  1) # Quantity
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('E', ventUnitRowStart + ventCount) ,  exhaustSystem.Name  if exhaustSystem.Name else 'Exhaust_Unit')
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('F', ventUnitRowStart + ventCount) ,  exhaustSystem.Unit_Name_UD) # Vent Component UD Name
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('Q', ventUnitRowStart + ventCount) ,  '') # Exterior Installation?
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('X', ventUnitRowStart + ventCount) ,  '1-No') # Frost Protection Type
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('Y', ventUnitRowStart + ventCount) ,  '-5', 'C', 'F') # Frost Protection Temp
                     
                     # Build the Vent Unit Ducting
-                    vent.append( PHPP_XL_Obj('Additional Vent',  'D{}'.format(ventDuctsRowStart + ductsCount) , 1)) # Quantity
-                    vent.append( PHPP_XL_Obj('Additional Vent',  'E{}'.format(ventDuctsRowStart + ductsCount) , exhaustSystem.Duct01.DuctWidth if exhaustSystem else 104, 'MM', 'IN'))
-                    vent.append( PHPP_XL_Obj('Additional Vent',  'H{}'.format(ventDuctsRowStart + ductsCount) , exhaustSystem.Duct01.InsulationThickness if exhaustSystem else 52, 'MM', 'IN'))
-                    vent.append( PHPP_XL_Obj('Additional Vent',  'I{}'.format(ventDuctsRowStart + ductsCount) , exhaustSystem.Duct01.InsulationLambda if exhaustSystem else 0.04, 'W/MK', 'HR-FT2-F/BTU-IN'))
-                    vent.append( PHPP_XL_Obj('Additional Vent',  'J{}'.format(ventDuctsRowStart + ductsCount) , 'x' ))# Reflective
-                    vent.append( PHPP_XL_Obj('Additional Vent',  'L{}'.format(ventDuctsRowStart + ductsCount) , exhaustSystem.Duct01.DuctLength if exhaustSystem else 5, 'M', 'FT'))
-                    vent.append( PHPP_XL_Obj('Additional Vent',  'M{}'.format(ventDuctsRowStart + ductsCount) , '1'))
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('D', ventDuctsRowStart + ductsCount) , 1) # Quantity
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('E', ventDuctsRowStart + ductsCount) , exhaustSystem.Duct01.DuctWidth if exhaustSystem else 104, 'MM', 'IN')
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('H', ventDuctsRowStart + ductsCount) , exhaustSystem.Duct01.InsulationThickness if exhaustSystem else 52, 'MM', 'IN')
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('I', ventDuctsRowStart + ductsCount) , exhaustSystem.Duct01.InsulationLambda if exhaustSystem else 0.04, 'W/MK', 'HR-FT2-F/BTU-IN')
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('J', ventDuctsRowStart + ductsCount) , 'x' )# Reflective
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('L', ventDuctsRowStart + ductsCount) , exhaustSystem.Duct01.DuctLength if exhaustSystem else 5, 'M', 'FT')
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('M', ventDuctsRowStart + ductsCount) , '1')
                     
-                    vent.append( PHPP_XL_Obj('Additional Vent',  'D{}'.format(ventDuctsRowStart + ductsCount+1) , 1)) # Quantity
-                    vent.append( PHPP_XL_Obj('Additional Vent',  'E{}'.format(ventDuctsRowStart + ductsCount+1) , exhaustSystem.Duct02.DuctWidth if exhaustSystem else 104, 'MM', 'IN'))
-                    vent.append( PHPP_XL_Obj('Additional Vent',  'H{}'.format(ventDuctsRowStart + ductsCount+1) , exhaustSystem.Duct02.InsulationThickness if exhaustSystem else 52, 'MM', 'IN'))
-                    vent.append( PHPP_XL_Obj('Additional Vent',  'I{}'.format(ventDuctsRowStart + ductsCount+1) , exhaustSystem.Duct02.InsulationLambda if exhaustSystem else 0.04, 'W/MK', 'HR-FT2-F/BTU-IN'))
-                    vent.append( PHPP_XL_Obj('Additional Vent',  'J{}'.format(ventDuctsRowStart + ductsCount+1) , 'x' ))# Reflective
-                    vent.append( PHPP_XL_Obj('Additional Vent',  'L{}'.format(ventDuctsRowStart + ductsCount+1) , exhaustSystem.Duct02.DuctLength if exhaustSystem else 5, 'M', 'FT'))
-                    vent.append( PHPP_XL_Obj('Additional Vent',  'N{}'.format(ventDuctsRowStart + ductsCount+1) , '1'))
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('D', ventDuctsRowStart + ductsCount+1) , 1) # Quantity
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('E', ventDuctsRowStart + ductsCount+1) , exhaustSystem.Duct02.DuctWidth if exhaustSystem else 104, 'MM', 'IN')
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('H', ventDuctsRowStart + ductsCount+1) , exhaustSystem.Duct02.InsulationThickness if exhaustSystem else 52, 'MM', 'IN')
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('I', ventDuctsRowStart + ductsCount+1) , exhaustSystem.Duct02.InsulationLambda if exhaustSystem else 0.04, 'W/MK', 'HR-FT2-F/BTU-IN')
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('J', ventDuctsRowStart + ductsCount+1) , 'x' )# Reflective
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('L', ventDuctsRowStart + ductsCount+1) , exhaustSystem.Duct02.DuctLength if exhaustSystem else 5, 'M', 'FT')
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('N', ventDuctsRowStart + ductsCount+1) , '1')
                     
-                    vent.append( PHPP_XL_Obj('Additional Vent',  '{}{}'.format(chr(ductColCount), ventDuctsRowStart + ductsCount) , 1)) # Assign Duct to Vent
-                    vent.append( PHPP_XL_Obj('Additional Vent',  '{}{}'.format(chr(ductColCount), ventDuctsRowStart + ductsCount+1) , 1)) # Assign Duct to Vent
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell(chr(ductColCount), ventDuctsRowStart + ductsCount) , 1) # Assign Duct to Vent
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell(chr(ductColCount), ventDuctsRowStart + ductsCount+1) , 1) # Assign Duct to Vent
                     
                     ductColCount+=1
                     ductsCount+=2
@@ -800,7 +802,7 @@ def getAddnlVentSystems(_inputBranch, _ventUnitsUsed, _startRows):
 
 def getNonResRoomData(_inputBranch, _zones, _startRows):
     print "Creating 'Electricity non-res' Objects ... "
-    elecNonRes = []
+    elecNonRes = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
     rowStart_Lighting = _startRows.get('Electricity non-res').get('Lighting', 19)
     rowStart_OfficeEquip = _startRows.get('Electricity non-res').get('Office Equip', 62)
     rowStart_Kitchen = _startRows.get('Electricity non-res').get('Kitchen', 77)
@@ -823,20 +825,20 @@ def getNonResRoomData(_inputBranch, _zones, _startRows):
                 roomID = '{}-{}'.format(getattr(roomObj, 'RoomNumber', None), getattr(roomObj, 'RoomName', None) )
                 lightingControlNum = getattr(roomObj, 'NonRes_RoomLightingControl', '1-').split('-')[0]
                 
-                elecNonRes.append( PHPP_XL_Obj('Electricity non-res', 'C{}'.format(rowStart_Lighting+i), roomID))
-                elecNonRes.append( PHPP_XL_Obj('Electricity non-res', 'D{}'.format(rowStart_Lighting+i), getattr(roomObj, 'FloorArea_Gross', None), 'M2', 'FT2'))
-                elecNonRes.append( PHPP_XL_Obj('Electricity non-res', 'F{}'.format(rowStart_Lighting+i), getattr(roomObj, 'NonRes_RoomUse', None) ))
-                elecNonRes.append( PHPP_XL_Obj('Electricity non-res', 'H{}'.format(rowStart_Lighting+i), 0)) # Deviation From North=0
-                elecNonRes.append( PHPP_XL_Obj('Electricity non-res', 'J{}'.format(rowStart_Lighting+i), 0.69)) # Triple Glazing
-                elecNonRes.append( PHPP_XL_Obj('Electricity non-res', 'M{}'.format(rowStart_Lighting+i), getattr(roomObj, 'RoomDepth', None), 'M', 'FT'))
-                elecNonRes.append( PHPP_XL_Obj('Electricity non-res', 'N{}'.format(rowStart_Lighting+i), '=D{}/M{}'.format(rowStart_Lighting+i, rowStart_Lighting+i)  ))
-                elecNonRes.append( PHPP_XL_Obj('Electricity non-res', 'O{}'.format(rowStart_Lighting+i), getattr(roomObj, 'RoomClearHeight', None), 'M', 'FT'))
-                elecNonRes.append( PHPP_XL_Obj('Electricity non-res', 'P{}'.format(rowStart_Lighting+i), 1, 'M', 'FT'  )) # Lintel Height
-                elecNonRes.append( PHPP_XL_Obj('Electricity non-res', 'Q{}'.format(rowStart_Lighting+i), 0, 'M', 'FT'  )) # Window Width                
-                elecNonRes.append( PHPP_XL_Obj('Electricity non-res', 'W{}'.format(rowStart_Lighting+i), lightingControlNum ))
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('C', rowStart_Lighting+i), roomID)
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('D', rowStart_Lighting+i), getattr(roomObj, 'FloorArea_Gross', None), 'M2', 'FT2')
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('F', rowStart_Lighting+i), getattr(roomObj, 'NonRes_RoomUse', None) )
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('H', rowStart_Lighting+i), 0) # Deviation From North=0
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('J', rowStart_Lighting+i), 0.69) # Triple Glazing
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('M', rowStart_Lighting+i), getattr(roomObj, 'RoomDepth', None), 'M', 'FT')
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('N', rowStart_Lighting+i), '=D{}/M{}'.format(rowStart_Lighting+i, rowStart_Lighting+i)  )
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('O', rowStart_Lighting+i), getattr(roomObj, 'RoomClearHeight', None), 'M', 'FT')
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('P', rowStart_Lighting+i), 1, 'M', 'FT'  ) # Lintel Height
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('Q', rowStart_Lighting+i), 0, 'M', 'FT'  ) # Window Width                
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('W', rowStart_Lighting+i), lightingControlNum )
                 
                 if getattr(roomObj, 'NonRes_RoomMotionControl', 'No')=='Yes':
-                    elecNonRes.append( PHPP_XL_Obj('Electricity non-res', 'X{}'.format(rowStart_Lighting+i), 'x' ))
+                    elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('X', rowStart_Lighting+i), 'x' )
     
     return elecNonRes
 
@@ -869,12 +871,12 @@ def getInfiltration(_inputBranch, _zonesToInclude):
         bldgWeightedACH = sum(zonesWeightedACH) / sum(zonesFloorArea)
         bldgVn50 = sum(zonesVn50)
     
-    airtightness = []
+    airtightness = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
     print("Creating the Airtightness Objects...")
-    airtightness.append(PHPP_XL_Obj('Ventilation', 'N25', Coef_E if Coef_E else float(0.07) ))# Wind protection E
-    airtightness.append(PHPP_XL_Obj('Ventilation', 'N26', Coef_F if Coef_F else float(15) ))# Wind protection F
-    airtightness.append(PHPP_XL_Obj('Ventilation', 'N27', bldgWeightedACH if bldgWeightedACH else float(0.6) ))# ACH50
-    airtightness.append(PHPP_XL_Obj('Ventilation', 'P27', bldgVn50 if bldgVn50 else '=N9*1.2', 'M3', 'FT3' ))#  Internal Reference Volume
+    airtightness.add('Ventilation', 'N25', Coef_E if Coef_E else float(0.07) )# Wind protection E
+    airtightness.add('Ventilation', 'N26', Coef_F if Coef_F else float(15) )# Wind protection F
+    airtightness.add('Ventilation', 'N27', bldgWeightedACH if bldgWeightedACH else float(0.6) )# ACH50
+    airtightness.add('Ventilation', 'P27', bldgVn50 if bldgVn50 else '=N9*1.2', 'M3', 'FT3' )#  Internal Reference Volume
     
     return airtightness
 
@@ -905,7 +907,7 @@ def filterName(_zoneName, _zonesNamesToFilter):
     return flag
 
 def getGround(_floorElements, _zones):
-    ground = []
+    ground = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
     
     colLetter = {
         0: {'col0':'C', 'col1':'H', 'col2':'P'},
@@ -936,63 +938,63 @@ def getGround(_floorElements, _zones):
         col1 = colLetter[i]['col1']
         col2 = colLetter[i]['col2']
         
-        ground.append(PHPP_XL_Obj('Ground', col1+'9', floorElement.soilThermalConductivity, 'W/MK', 'HR-FT2-F/BTU-IN' ))
-        ground.append(PHPP_XL_Obj('Ground', col1+'10', floorElement.soilHeatCapacity, 'MJ/M3K', 'BTU/FT3-F' ))
-        ground.append(PHPP_XL_Obj('Ground', col1+'18', floorElement.FloorArea, 'M2', 'FT2' ))
-        ground.append(PHPP_XL_Obj('Ground', col1+'19', floorElement.PerimLen, 'M', 'FT' ))
-        ground.append(PHPP_XL_Obj('Ground', col2+'17', floorElement.FloorUvalue, 'W/MK', 'HR-FT2-F/BTU' ))
-        ground.append(PHPP_XL_Obj('Ground', col2+'18', floorElement.PerimPsixLen, 'W/K', 'BTU/HR-F' ))
-        ground.append(PHPP_XL_Obj('Ground', col1+'49', floorElement.groundWaterDepth, 'M', 'FT' ))
-        ground.append(PHPP_XL_Obj('Ground', col1+'50', floorElement.groundWaterFlowrate, 'M/DAY', 'FT/DAY' ))
+        ground.add('Ground', col1+'9', floorElement.soilThermalConductivity, 'W/MK', 'HR-FT2-F/BTU-IN' )
+        ground.add('Ground', col1+'10', floorElement.soilHeatCapacity, 'MJ/M3K', 'BTU/FT3-F' )
+        ground.add('Ground', col1+'18', floorElement.FloorArea, 'M2', 'FT2' )
+        ground.add('Ground', col1+'19', floorElement.PerimLen, 'M', 'FT' )
+        ground.add('Ground', col2+'17', floorElement.FloorUvalue, 'W/MK', 'HR-FT2-F/BTU' )
+        ground.add('Ground', col2+'18', floorElement.PerimPsixLen, 'W/K', 'BTU/HR-F' )
+        ground.add('Ground', col1+'49', floorElement.groundWaterDepth, 'M', 'FT' )
+        ground.add('Ground', col1+'50', floorElement.groundWaterFlowrate, 'M/DAY', 'FT/DAY' )
         
         if '1' in floorElement.Type or 'SLAB' in floorElement.Type.upper():
             # Slab on Grade Type
-            ground.append(PHPP_XL_Obj('Ground', col0+'24', 'x' ))
-            ground.append(PHPP_XL_Obj('Ground', col0+'29', '' ))
-            ground.append(PHPP_XL_Obj('Ground', col0+'32', '' ))
-            ground.append(PHPP_XL_Obj('Ground', col0+'38', '' ))
-            ground.append(PHPP_XL_Obj('Ground', col1+'25', floorElement.perimInsulDepth, 'M', 'IN' ))
-            ground.append(PHPP_XL_Obj('Ground', col1+'26', floorElement.perimInsulThick, 'M', 'IN' ))
-            ground.append(PHPP_XL_Obj('Ground', col1+'27', floorElement.perimInsulConductivity, 'W/MK', 'HR-FT2-F/BTU-IN' ))
+            ground.add('Ground', col0+'24', 'x' )
+            ground.add('Ground', col0+'29', '' )
+            ground.add('Ground', col0+'32', '' )
+            ground.add('Ground', col0+'38', '' )
+            ground.add('Ground', col1+'25', floorElement.perimInsulDepth, 'M', 'IN' )
+            ground.add('Ground', col1+'26', floorElement.perimInsulThick, 'M', 'IN' )
+            ground.add('Ground', col1+'27', floorElement.perimInsulConductivity, 'W/MK', 'HR-FT2-F/BTU-IN' )
             if 'V' in floorElement.perimInsulOrientation.upper():
-                ground.append(PHPP_XL_Obj('Ground', col2+'25', '' ))
+                ground.add('Ground', col2+'25', '' )
             else:
-                ground.append(PHPP_XL_Obj('Ground', col2+'25', 'x' ))
+                ground.add('Ground', col2+'25', 'x' )
         elif '2' in floorElement.Type or 'HEATED' in floorElement.Type.upper():
             # Heated Basement
-            ground.append(PHPP_XL_Obj('Ground', col0+'24', '' ))
-            ground.append(PHPP_XL_Obj('Ground', col0+'29', 'x' ))
-            ground.append(PHPP_XL_Obj('Ground', col0+'32', '' ))
-            ground.append(PHPP_XL_Obj('Ground', col0+'38', '' ))
-            ground.append(PHPP_XL_Obj('Ground', col1+'30', floorElement.WallHeight_BG, 'M', 'FT' ))
-            ground.append(PHPP_XL_Obj('Ground', col2+'30', floorElement.WallU_BG, 'W/M2K', 'HR-FT2-F/BTU'))
+            ground.add('Ground', col0+'24', '' )
+            ground.add('Ground', col0+'29', 'x' )
+            ground.add('Ground', col0+'32', '' )
+            ground.add('Ground', col0+'38', '' )
+            ground.add('Ground', col1+'30', floorElement.WallHeight_BG, 'M', 'FT' )
+            ground.add('Ground', col2+'30', floorElement.WallU_BG, 'W/M2K', 'HR-FT2-F/BTU')
             
         elif '3' in floorElement.Type or 'UNHEATED' in floorElement.Type.upper():
             # Unheated Basement
-            ground.append(PHPP_XL_Obj('Ground', col0+'24', '' ))
-            ground.append(PHPP_XL_Obj('Ground', col0+'29', '' ))
-            ground.append(PHPP_XL_Obj('Ground', col0+'32', 'x' ))
-            ground.append(PHPP_XL_Obj('Ground', col0+'38', '' ))
-            ground.append(PHPP_XL_Obj('Ground', col1+'33', floorElement.WallHeight_AG, 'M', 'FT' ))
-            ground.append(PHPP_XL_Obj('Ground', col2+'33', floorElement.WallU_AG, 'W/M2K', 'HR-FT2-F/BTU' ))
-            ground.append(PHPP_XL_Obj('Ground', col1+'34', floorElement.WallHeight_BG, 'M', 'FT' ))
-            ground.append(PHPP_XL_Obj('Ground', col2+'34', floorElement.WallU_BG, 'W/M2K', 'HR-FT2-F/BTU'  ))
-            ground.append(PHPP_XL_Obj('Ground', col2+'35', floorElement.FloorU, 'W/M2K', 'HR-FT2-F/BTU' ))
-            ground.append(PHPP_XL_Obj('Ground', col1+'35', floorElement.ACH ))
-            ground.append(PHPP_XL_Obj('Ground', col1+'36', floorElement.Volume, 'M3', 'FT3' ))
+            ground.add('Ground', col0+'24', '' )
+            ground.add('Ground', col0+'29', '' )
+            ground.add('Ground', col0+'32', 'x' )
+            ground.add('Ground', col0+'38', '' )
+            ground.add('Ground', col1+'33', floorElement.WallHeight_AG, 'M', 'FT' )
+            ground.add('Ground', col2+'33', floorElement.WallU_AG, 'W/M2K', 'HR-FT2-F/BTU' )
+            ground.add('Ground', col1+'34', floorElement.WallHeight_BG, 'M', 'FT' )
+            ground.add('Ground', col2+'34', floorElement.WallU_BG, 'W/M2K', 'HR-FT2-F/BTU'  )
+            ground.add('Ground', col2+'35', floorElement.FloorU, 'W/M2K', 'HR-FT2-F/BTU' )
+            ground.add('Ground', col1+'35', floorElement.ACH )
+            ground.add('Ground', col1+'36', floorElement.Volume, 'M3', 'FT3' )
             
         elif '4' in floorElement.Type or 'CRAWL' in floorElement.Type.upper():
             # Suspended Floor overCrawlspace
-            ground.append(PHPP_XL_Obj('Ground', col0+'24', '' ))
-            ground.append(PHPP_XL_Obj('Ground', col0+'29', '' ))
-            ground.append(PHPP_XL_Obj('Ground', col0+'32', '' ))
-            ground.append(PHPP_XL_Obj('Ground', col0+'38', 'x' ))
-            ground.append(PHPP_XL_Obj('Ground', col1+'39', floorElement.CrawlU, 'W/M2K', 'HR-FT2-F/BTU'  ))
-            ground.append(PHPP_XL_Obj('Ground', col1+'40', floorElement.WallHeight, 'M', 'FT' ))
-            ground.append(PHPP_XL_Obj('Ground', col1+'41', floorElement.WallU, 'W/M2K', 'HR-FT2-F/BTU'  ))
-            ground.append(PHPP_XL_Obj('Ground', col2+'39', floorElement.VentOpeningArea, 'M2', 'FT2' ))
-            ground.append(PHPP_XL_Obj('Ground', col2+'40', floorElement.windVelocity, 'M/S', 'M/H' ))
-            ground.append(PHPP_XL_Obj('Ground', col2+'41', floorElement.windFactor ))
+            ground.add('Ground', col0+'24', '' )
+            ground.add('Ground', col0+'29', '' )
+            ground.add('Ground', col0+'32', '' )
+            ground.add('Ground', col0+'38', 'x' )
+            ground.add('Ground', col1+'39', floorElement.CrawlU, 'W/M2K', 'HR-FT2-F/BTU'  )
+            ground.add('Ground', col1+'40', floorElement.WallHeight, 'M', 'FT' )
+            ground.add('Ground', col1+'41', floorElement.WallU, 'W/M2K', 'HR-FT2-F/BTU'  )
+            ground.add('Ground', col2+'39', floorElement.VentOpeningArea, 'M2', 'FT2' )
+            ground.add('Ground', col2+'40', floorElement.windVelocity, 'M/S', 'M/H' )
+            ground.add('Ground', col2+'41', floorElement.windFactor )
             
     return ground
 
@@ -1017,48 +1019,48 @@ def getDHWSystem(_dhwSystems, _zones):
     
     ##########################################
     # DHW System Excel Objs
-    dhwSystem = []
+    dhwSystem = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
     if dhw_:
         print("Creating the 'DHW' Objects...")
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J146', dhw_.forwardTemp, 'C', 'F'))
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'P145', 0, 'C', 'F'))
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'P29', 0, 'C', 'F'))
+        dhwSystem.add('DHW+Distribution', 'J146', dhw_.forwardTemp, 'C', 'F')
+        dhwSystem.add('DHW+Distribution', 'P145', 0, 'C', 'F')
+        dhwSystem.add('DHW+Distribution', 'P29', 0, 'C', 'F')
         
         # Usage Volume
         if dhw_.usage != None:
             if dhw_.usage.UsageType == 'Res':
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J47', dhw_.usage.demand_showers, 'LITER', 'GALLON' ) )
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J48', dhw_.usage.demand_others, 'LITER', 'GALLON' ) )
+                dhwSystem.add('DHW+Distribution', 'J47', dhw_.usage.demand_showers, 'LITER', 'GALLON' )
+                dhwSystem.add('DHW+Distribution', 'J48', dhw_.usage.demand_others, 'LITER', 'GALLON' )
             elif dhw_.usage.UsageType == 'NonRes':
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J47', '=Q57', 'LITER', 'GALLON' ))
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J48', '=Q58', 'LITER', 'GALLON' ))
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J58', getattr(dhw_.usage, 'use_daysPerYear') ) )
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J62', 'x' if getattr(dhw_.usage, 'useShowers') != 'False' else '' ))
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J63', 'x' if getattr(dhw_.usage, 'useHandWashing') != 'False' else '' ))
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J64', 'x' if getattr(dhw_.usage, 'useWashStand') != 'False' else '' ))
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J65', 'x' if getattr(dhw_.usage, 'useBidets') != 'False' else '' ))
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J66', 'x' if getattr(dhw_.usage, 'useBathing') != 'False' else '' ))
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J67', 'x' if getattr(dhw_.usage, 'useToothBrushing') != 'False' else '' ))
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J68', 'x' if getattr(dhw_.usage, 'useCooking') != 'False' else '' ))
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J74', 'x' if getattr(dhw_.usage, 'useDishwashing') != 'False' else '' ))
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J75', 'x' if getattr(dhw_.usage, 'useCleanKitchen') != 'False' else '' ))
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J76', 'x' if getattr(dhw_.usage, 'useCleanRooms') != 'False' else '' ))
+                dhwSystem.add('DHW+Distribution', 'J47', '=Q57', 'LITER', 'GALLON' )
+                dhwSystem.add('DHW+Distribution', 'J48', '=Q58', 'LITER', 'GALLON' )
+                dhwSystem.add('DHW+Distribution', 'J58', getattr(dhw_.usage, 'use_daysPerYear') )
+                dhwSystem.add('DHW+Distribution', 'J62', 'x' if getattr(dhw_.usage, 'useShowers') != 'False' else '' )
+                dhwSystem.add('DHW+Distribution', 'J63', 'x' if getattr(dhw_.usage, 'useHandWashing') != 'False' else '' )
+                dhwSystem.add('DHW+Distribution', 'J64', 'x' if getattr(dhw_.usage, 'useWashStand') != 'False' else '' )
+                dhwSystem.add('DHW+Distribution', 'J65', 'x' if getattr(dhw_.usage, 'useBidets') != 'False' else '' )
+                dhwSystem.add('DHW+Distribution', 'J66', 'x' if getattr(dhw_.usage, 'useBathing') != 'False' else '' )
+                dhwSystem.add('DHW+Distribution', 'J67', 'x' if getattr(dhw_.usage, 'useToothBrushing') != 'False' else '' )
+                dhwSystem.add('DHW+Distribution', 'J68', 'x' if getattr(dhw_.usage, 'useCooking') != 'False' else '' )
+                dhwSystem.add('DHW+Distribution', 'J74', 'x' if getattr(dhw_.usage, 'useDishwashing') != 'False' else '' )
+                dhwSystem.add('DHW+Distribution', 'J75', 'x' if getattr(dhw_.usage, 'useCleanKitchen') != 'False' else '' )
+                dhwSystem.add('DHW+Distribution', 'J76', 'x' if getattr(dhw_.usage, 'useCleanRooms') != 'False' else '' )
         
         # Recirc Piping
         if len(dhw_.circulation_piping)>0:
-            dhwSystem.append( PHPP_XL_Obj('Aux Electricity', 'H29', 1 ) ) # Circulator Pump
+            dhwSystem.add('Aux Electricity', 'H29', 1 ) # Circulator Pump
             
         for colNum, recirc_line in enumerate(dhw_.circulation_piping):
             col = chr(ord('J') + colNum)
             
             if ord(col) <= ord('N'):
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 149), recirc_line.length , 'M', 'FT'))
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 150), recirc_line.diam, 'MM','IN') )
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 151), recirc_line.insulThck, 'MM', 'IN' ) )
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 152), 'x' if recirc_line.insulRefl=='Yes' else '' ) )
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 153), recirc_line.insulCond, 'W/MK', 'HR-FT2-F/BTU-IN' ) )
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 155), recirc_line.quality ) )
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 159), recirc_line.period ) )
+                dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 149), recirc_line.length , 'M', 'FT')
+                dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 150), recirc_line.diam, 'MM','IN')
+                dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 151), recirc_line.insulThck, 'MM', 'IN' )
+                dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 152), 'x' if recirc_line.insulRefl=='Yes' else '' )
+                dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 153), recirc_line.insulCond, 'W/MK', 'HR-FT2-F/BTU-IN' )
+                dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 155), recirc_line.quality )
+                dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 159), recirc_line.period )
             else:
                 dhwRecircWarning = "Too many recirculation loops. PHPP only allows up to 5 loops to be entered.\nConsolidate the loops before moving forward"
                 ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, dhwRecircWarning)
@@ -1068,38 +1070,38 @@ def getDHWSystem(_dhwSystems, _zones):
             col = chr(ord('J') + colNum)
             
             if ord(col) <= ord('N'):
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 167), branch_line.diameter, 'M', 'IN'))
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 168), branch_line.totalLength, 'M', 'FT'))
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 169), branch_line.totalTapPoints))
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 171), branch_line.tapOpenings))
-                dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 172), branch_line.utilisation))
+                dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 167), branch_line.diameter, 'M', 'IN')
+                dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 168), branch_line.totalLength, 'M', 'FT')
+                dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 169), branch_line.totalTapPoints)
+                dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 171), branch_line.tapOpenings)
+                dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 172), branch_line.utilisation)
             else:
                 dhwRecircWarning = "Too many branch piping sets. PHPP only allows up to 5 sets to be entered.\nConsolidate the piping sets before moving forward"
                 ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, dhwRecircWarning)
         
         # Tanks
         if dhw_.tank1:
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J186', dhw_.tank1.type))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J189', 'x' if dhw_.tank1.solar==True else ''))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J191', dhw_.tank1.hl_rate, 'W/K', 'BTU/HR-F'))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J192', dhw_.tank1.vol, 'LITER', 'GALLON'))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J193', dhw_.tank1.stndbyFrac))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J195', dhw_.tank1.loction))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J198', dhw_.tank1.locaton_t, 'C', 'F'))
+            dhwSystem.add('DHW+Distribution', 'J186', dhw_.tank1.type)
+            dhwSystem.add('DHW+Distribution', 'J189', 'x' if dhw_.tank1.solar==True else '')
+            dhwSystem.add('DHW+Distribution', 'J191', dhw_.tank1.hl_rate, 'W/K', 'BTU/HR-F')
+            dhwSystem.add('DHW+Distribution', 'J192', dhw_.tank1.vol, 'LITER', 'GALLON')
+            dhwSystem.add('DHW+Distribution', 'J193', dhw_.tank1.stndbyFrac)
+            dhwSystem.add('DHW+Distribution', 'J195', dhw_.tank1.loction)
+            dhwSystem.add('DHW+Distribution', 'J198', dhw_.tank1.locaton_t, 'C', 'F')
         if dhw_.tank2:
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'M186', dhw_.tank2.type) )
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'M189', 'x' if dhw_.tank2.solar==True else ''))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'M191', dhw_.tank2.hl_rate, 'W/K', 'BTU/HR-F'))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'M192', dhw_.tank2.vol, 'LITER', 'GALLON'))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'M193', dhw_.tank2.stndbyFrac))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'M195', dhw_.tank2.loction))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'M198', dhw_.tank2.locaton_t, 'C', 'F'))
+            dhwSystem.add('DHW+Distribution', 'M186', dhw_.tank2.type)
+            dhwSystem.add('DHW+Distribution', 'M189', 'x' if dhw_.tank2.solar==True else '')
+            dhwSystem.add('DHW+Distribution', 'M191', dhw_.tank2.hl_rate, 'W/K', 'BTU/HR-F')
+            dhwSystem.add('DHW+Distribution', 'M192', dhw_.tank2.vol, 'LITER', 'GALLON')
+            dhwSystem.add('DHW+Distribution', 'M193', dhw_.tank2.stndbyFrac)
+            dhwSystem.add('DHW+Distribution', 'M195', dhw_.tank2.loction)
+            dhwSystem.add('DHW+Distribution', 'M198', dhw_.tank2.locaton_t, 'C', 'F')
         if dhw_.tank_buffer:
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'P186', dhw_.tank_buffer.type))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'P191', dhw_.tank_buffer.hl_rate, 'W/K', 'BTU/HR-F'))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'P192', dhw_.tank_buffer.vol, 'LITER', 'GALLON'))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'P195', dhw_.tank_buffer.loction))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'P198', dhw_.tank_buffer.locaton_t, 'C', 'F'))
+            dhwSystem.add('DHW+Distribution', 'P186', dhw_.tank_buffer.type)
+            dhwSystem.add('DHW+Distribution', 'P191', dhw_.tank_buffer.hl_rate, 'W/K', 'BTU/HR-F')
+            dhwSystem.add('DHW+Distribution', 'P192', dhw_.tank_buffer.vol, 'LITER', 'GALLON')
+            dhwSystem.add('DHW+Distribution', 'P195', dhw_.tank_buffer.loction)
+            dhwSystem.add('DHW+Distribution', 'P198', dhw_.tank_buffer.locaton_t, 'C', 'F')
         
     return dhwSystem
 
@@ -1242,33 +1244,33 @@ def combineDHWSystems(_dhwSystems):
     return combinedDHWSys
 
 def getLocation(_locationObjs):
-    climate = []
+    climate = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
     
     if len(_locationObjs) == 0:
         return climate
     
     loc = _locationObjs[0]
     print("Creating the 'Climate' Objeects...")
-    climate.append( PHPP_XL_Obj('Climate', 'D9', loc.Country if loc else 'US-United States of America' )) # Climate Data Set Name (Dropdown)
-    climate.append( PHPP_XL_Obj('Climate', 'D10', loc.Region if loc else 'New York' )) # Climate Data Set Name (Dropdown)
-    climate.append( PHPP_XL_Obj('Climate', 'D12', loc.DataSet if loc else 'US0055b-New York' )) # Climate Data Set Name (Dropdown)
-    climate.append( PHPP_XL_Obj('Climate', 'D18', loc.Altitude if loc else '=D17' )) # Altitude
+    climate.add('Climate', 'D9', loc.Country if loc else 'US-United States of America' ) # Climate Data Set Name (Dropdown)
+    climate.add('Climate', 'D10', loc.Region if loc else 'New York' ) # Climate Data Set Name (Dropdown)
+    climate.add('Climate', 'D12', loc.DataSet if loc else 'US0055b-New York' ) # Climate Data Set Name (Dropdown)
+    climate.add('Climate', 'D18', loc.Altitude if loc else '=D17' ) # Altitude
     
     return climate
 
 def getAppliances(_appliances, _zones):
     
     if len(_appliances) == 0:
-        return []
+        return PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
     
     
     print("Creating the 'Appliance' obejcts...")
-    apps = []
+    apps = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
     
     # First, turn all the appliances off
     useRows = [14, 16, 18, 21, 22, 23, 24, 31, 32, 33]
     for rowNum in useRows:
-        apps.append( PHPP_XL_Obj('Electricity', 'F{}'.format(rowNum), 0) )
+        apps.add('Electricity', PHPP_XL_Address.cell('F', rowNum), 0)
     
     #---------------------------------------------------------------------------
     # Basic Appliances
@@ -1277,41 +1279,41 @@ def getAppliances(_appliances, _zones):
             continue
         
         if 'dishwasher' in appliance.Name:
-            apps.append( PHPP_XL_Obj('Electricity', 'F14', 1) )
-            apps.append( PHPP_XL_Obj('Electricity', 'H14', 1) )
-            apps.append( PHPP_XL_Obj('Electricity', 'J14', appliance.NominalDemand) )
-            apps.append( PHPP_XL_Obj('Electricity', 'D15', appliance.Type) )
+            apps.add('Electricity', 'F14', 1)
+            apps.add('Electricity', 'H14', 1)
+            apps.add('Electricity', 'J14', appliance.NominalDemand)
+            apps.add('Electricity', 'D15', appliance.Type)
         elif 'clothesWasher' in appliance.Name:
-            apps.append( PHPP_XL_Obj('Electricity', 'F16', 1) )
-            apps.append( PHPP_XL_Obj('Electricity', 'H16', 1) )
-            apps.append( PHPP_XL_Obj('Electricity', 'J16', appliance.NominalDemand) )
-            apps.append( PHPP_XL_Obj('Electricity', 'N16', appliance.UtilizationFactor) )
-            apps.append( PHPP_XL_Obj('Electricity', 'D17', appliance.Type) )
+            apps.add('Electricity', 'F16', 1)
+            apps.add('Electricity', 'H16', 1)
+            apps.add('Electricity', 'J16', appliance.NominalDemand)
+            apps.add('Electricity', 'N16', appliance.UtilizationFactor)
+            apps.add('Electricity', 'D17', appliance.Type)
         elif 'clothesDryer' in appliance.Name:
-            apps.append( PHPP_XL_Obj('Electricity', 'F18', 1) )
-            apps.append( PHPP_XL_Obj('Electricity', 'H18', 1) )
+            apps.add('Electricity', 'F18', 1)
+            apps.add('Electricity', 'H18', 1)
             if 'GAS' in appliance.Type.upper():
-                apps.append( PHPP_XL_Obj('Electricity', 'J19', appliance.NominalDemand) )
+                apps.add('Electricity', 'J19', appliance.NominalDemand)
             else:
-                apps.append( PHPP_XL_Obj('Electricity', 'J18', appliance.NominalDemand) )
-            apps.append( PHPP_XL_Obj('Electricity', 'D19', appliance.Type) )
-            apps.append( PHPP_XL_Obj('Electricity', 'L19', 0.60) )
+                apps.add('Electricity', 'J18', appliance.NominalDemand)
+            apps.add('Electricity', 'D19', appliance.Type)
+            apps.add('Electricity', 'L19', 0.60)
         elif 'fridge' == appliance.Name:
-            apps.append( PHPP_XL_Obj('Electricity', 'F21', 1) )
-            apps.append( PHPP_XL_Obj('Electricity', 'H21', 1) )
-            apps.append( PHPP_XL_Obj('Electricity', 'J21', appliance.NominalDemand) )
+            apps.add('Electricity', 'F21', 1)
+            apps.add('Electricity', 'H21', 1)
+            apps.add('Electricity', 'J21', appliance.NominalDemand)
         elif 'freezer' == appliance.Name:
-            apps.append( PHPP_XL_Obj('Electricity', 'F22', 1) )
-            apps.append( PHPP_XL_Obj('Electricity', 'H22', 1) )
-            apps.append( PHPP_XL_Obj('Electricity', 'J22', appliance.NominalDemand) )
+            apps.add('Electricity', 'F22', 1)
+            apps.add('Electricity', 'H22', 1)
+            apps.add('Electricity', 'J22', appliance.NominalDemand)
         elif 'fridgeFreezer' == appliance.Name:
-            apps.append( PHPP_XL_Obj('Electricity', 'F23', 1) )
-            apps.append( PHPP_XL_Obj('Electricity', 'H23', 1) )
-            apps.append( PHPP_XL_Obj('Electricity', 'J23', appliance.NominalDemand) )
+            apps.add('Electricity', 'F23', 1)
+            apps.add('Electricity', 'H23', 1)
+            apps.add('Electricity', 'J23', appliance.NominalDemand)
         elif 'cooking' in appliance.Name:
-            apps.append( PHPP_XL_Obj('Electricity', 'F24', 1) )
-            apps.append( PHPP_XL_Obj('Electricity', 'J24', appliance.NominalDemand) )
-            apps.append( PHPP_XL_Obj('Electricity', 'D25', appliance.Type) )
+            apps.add('Electricity', 'F24', 1)
+            apps.add('Electricity', 'J24', appliance.NominalDemand)
+            apps.add('Electricity', 'D25', appliance.Type)
     
     #---------------------------------------------------------------------------
     # Harder Appliances
@@ -1320,7 +1322,8 @@ def getAppliances(_appliances, _zones):
     consumerElec = [ _ for _ in _appliances if 'consumerElec' in _.Name]
     totalFA = sum([_.ZoneFloorArea for _ in consumerElec])
     totalCExFA = sum([(_.ZoneFloorArea * _.NominalDemand) for _ in consumerElec])
-    apps.append( PHPP_XL_Obj('Electricity', 'J27', (totalCExFA / totalFA) ))
+    if totalFA != 0:
+        apps.add('Electricity', 'J27', (totalCExFA / totalFA) )
     
     # For 'other' user-determined type elec equip / appliances
     others = [ _ for _ in _appliances if 'ud__' in _.Name]
@@ -1333,32 +1336,155 @@ def getAppliances(_appliances, _zones):
         ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, msg)
     
     for i, each in enumerate(others):
-        apps.append( PHPP_XL_Obj('Electricity', 'D{}'.format(i+31), each.Name) )
-        apps.append( PHPP_XL_Obj('Electricity', 'F{}'.format(i+31), 1) )
-        apps.append( PHPP_XL_Obj('Electricity', 'H{}'.format(i+31), 1) )
-        apps.append( PHPP_XL_Obj('Electricity', 'J{}'.format(i+31), each.NominalDemand) )
+        apps.add('Electricity', PHPP_XL_Address.cell('D', i+31), each.Name)
+        apps.add('Electricity', PHPP_XL_Address.cell('F', i+31), 1)
+        apps.add('Electricity', PHPP_XL_Address.cell('H', i+31), 1)
+        apps.add('Electricity', PHPP_XL_Address.cell('J', i+31), each.NominalDemand)
     
     return apps
 
 def getPHPPLighting(_lighting, _zones):
-    if len(_lighting) == 0:
-        return []
+    phppLighting = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
     
+    # Nothing to average if none of the Zones have any lighting (or any floor area)
     lighting = [ _ for _ in _lighting if _.Zone in _zones] # Filter
-    lightingXfa = sum([ (_.NominalDemand * _.ZoneFloorArea) for _ in lighting])
     total_zone_FA = sum([_.ZoneFloorArea for _ in lighting])
+    if len(lighting) == 0 or total_zone_FA == 0:
+        return phppLighting
+    
+    lightingXfa = sum([ (_.NominalDemand * _.ZoneFloorArea) for _ in lighting])
     avg_lighting_eff =  lightingXfa / total_zone_FA
+    phppLighting.add('Electricity', 'L26', avg_lighting_eff)
     
-    return [ PHPP_XL_Obj('Electricity', 'L26', avg_lighting_eff) ]
+    return phppLighting
 
 def getFootprint(_fp):
+    footprint = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
     try:
         fp_area = _fp[0].Footprint_area
-        fpObj = PHPP_XL_Obj('Areas', 'V33', fp_area)
     except:
-        fpObj = PHPP_XL_Obj('Areas', 'V33', 0)
+        fp_area = 0
+    footprint.add('Areas', 'V33', fp_area)
+    
+    return footprint
+
+
+def parseZoneDocuments(_udIn):
+    """Reads the zoneDocuments_ input into an ordered list of (Document Name, [Zone Names]).
+    Each line should be in the format " Document Name: Zone Name, Zone Name, ... " """
+    zoneDocs = []
+    try:
+        for each in _udIn:
+            for line in each.splitlines():
+                if len(line.strip()) == 0:
+                    continue
+                docName, zoneNames = line.split(':')
+                zoneDocs.append( (docName.strip(), [x.strip() for x in zoneNames.split(',') if len(x.strip())>0]) )
+    except:
+        zoneDocsMsg = "Couldn't read the zoneDocuments_ input? Make sure each line has the Document name, then\n"\
+        "a colon, then the Zone name(s) separated by commas. ie: 'Office PHPP: Office, Lobby'"
+        ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, zoneDocsMsg)
+        return []
+    
+    return zoneDocs
+
+def partitionPHPPObjs(_PHPPObjs, _zones, _zoneDocs, _floorElements):
+    """Sorts the zone-level PHPP Objects into the PHPP document each one's zone is
+    assigned to, in a single pass over each Branch. Each zone goes to the first
+    document with a matching name. Returns a list of (Document Name, Zone Names, Branches)
+    where Branches is a dict of the PHPP Object lists by Branch number. The building-level 
+    Branches (materials, constructions, windows, vent systems, climate...) are shared
+    by all the documents, same as the 'Filter PHPP Objs' component."""
+    
+    zonesDocNum = {}
+    docZones = [ [] for doc in _zoneDocs ]
+    for zoneName in _zones:
+        for docNum, (docName, docZoneNames) in enumerate(_zoneDocs):
+            if not filterName(zoneName, docZoneNames):
+                zonesDocNum[zoneName] = docNum
+                docZones[docNum].append(zoneName)
+                break
+        else:
+            noDocMsg = 'Zone "{}" does not match any of the zoneDocuments_ so it will not be exported.'.format(zoneName)
+            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, noDocMsg)
+    
+    docBranches = []
+    for docNum in range(len(_zoneDocs)):
+        branches = dict( (i, _PHPPObjs.Branch(i)) for i in range(_PHPPObjs.BranchCount) )
+        for i in [4, 5, 6, 8, 10, 11]:
+            branches[i] = []
+        docBranches.append( branches )
+    
+    def addByZone(_objs, _branchNum, _zoneName):
+        for obj in _objs:
+            docNum = zonesDocNum.get( _zoneName(obj) )
+            if docNum is not None:
+                docBranches[docNum][_branchNum].append( obj )
+    
+    addByZone(_PHPPObjs.Branch(4), 4, lambda srfc: srfc.HostZoneName)
+    addByZone(_PHPPObjs.Branch(6), 6, lambda room: room.HostZoneName)
+    addByZone(_PHPPObjs.Branch(8), 8, lambda zoneObj: zoneObj.ZoneName)
+    addByZone(_floorElements, 11, lambda grndSrfc: getattr(grndSrfc, 'Zone', None))
+    
+    # Windows go with their Host Surface's Zone
+    srfcZones = dict( (srfc.Name, srfc.HostZoneName) for srfc in _PHPPObjs.Branch(4) )
+    addByZone(_PHPPObjs.Branch(5), 5, lambda window: srfcZones.get(window.HostSrfc))
+    
+    # A DHW System can serve Zones in more than one document
+    for dhw in _PHPPObjs.Branch(10):
+        for docNum in set( zonesDocNum[z] for z in dhw.ZonesAssigned if z in zonesDocNum ):
+            docBranches[docNum][10].append( dhw )
+    
+    return [ (docName, docZones[docNum], docBranches[docNum]) for docNum, (docName, docZoneNames) in enumerate(_zoneDocs) ]
+
+def createGeomXLObjs(_branches, _zones, _shared, _startRows):
+    """Builds all the Excel-Ready Objects for a single PHPP document, in Output 
+    Branch order. _shared holds the building-level ones which are the same
+    for every document and so only get created once."""
+    areasList, surfacesIncluded     = getAreas( _branches[4], _zones )
+    winSurfacesList                 = getWindows( _branches[5], surfacesIncluded, _branches[4] )   
+    shadingList                     = getShading( _branches[5], surfacesIncluded )
+    tfa                             = getTFA(tfa_, _branches[6], _zones)
+    addnlVentRooms, ventUnitsUsed   = getAddnlVentRooms( _branches[6], _branches[7], _zones, _startRows )
+    vent                            = getAddnlVentSystems( _branches[7], ventUnitsUsed, _startRows )
+    airtightness                    = getInfiltration( _branches[8], _zones)
+    ground                          = getGround( _branches[11], _zones )
+    dhw                             = getDHWSystem( _branches[10], _zones )
+    nonRes_Elec                     = getNonResRoomData( _branches[6], _zones, _startRows )
+    elec_equip_appliance            = getAppliances( _branches[13], _zones )
+    phpp_lighting                   = getPHPPLighting( _branches[14], _zones )
+    
+    return [ _shared['uValues'], _shared['winComponents'], areasList, winSurfacesList,
+            shadingList, tfa, _shared['thermalBridges'], addnlVentRooms, vent, airtightness,
+            ground, dhw, nonRes_Elec, _shared['location'], elec_equip_appliance, 
+            phpp_lighting, _shared['footprint'] ]
+
+def giveWarnings(_xlObjs, _docName=None):
+    prefix = '{}: '.format(_docName) if _docName else ''
+    
+    if len(_xlObjs[2])/10 > 100:
+        AreasWarning = prefix + 'Warning: It looks like you have {:.0f} surfaces in the model. By Default\n'\
+        'the PHPP can only hold 100 surfaces. Before writing out to the PHPP be sure to\n '\
+        'add more lines to the "Areas" worksheet of your excel file.\n'\
+        'After adding lines to the PHPP, be sure to input the correct Start Rows into\n'\
+        'the "udRowStarts_" of this component.'.format(len(_xlObjs[2])/10)
+        ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, AreasWarning)
+    
+    if len(_xlObjs[7])/17 > 30:
+        VentWarning = prefix + 'Warning: It looks like you have {:.0f} rooms in the model. By Default\n'\
+        'the PHPP can only hold 30 different rooms in the Additional Ventilation worksheet.\n'\
+        'Before writing out to the PHPP be sure to add more lines to the\n'\
+        '"Additional Ventilation" worksheet in the "Dimensionsing of Air Quantities" section.\n'\
+        'After adding lines to the PHPP, be sure to input the correct Start Rows into\n'\
+        'the "udRowStarts_" of this component.'.format(len(_xlObjs[7])/17)
+        ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, VentWarning)
     
-    return [ fpObj ]
+    if len(_xlObjs[12])/8 > 22:
+        NonResWarning = prefix + 'Warning: It looks like you have {:.0f} Non-Residential Rooms in the model. By Default\n'\
+        'the PHPP can only hold 22 different rooms in the "Electricity non-res" worksheet.\n'\
+        'Before writing out to the PHPP be sure to add more lines to the \n '\
+        '"Electricity non-res" worksheet in the "Lighting/non-residential" section.'.format(len(_xlObjs[12])/8)
+        ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, NonResWarning)
 
 
 #-------------------------------------------------------------------------------
@@ -1392,70 +1518,46 @@ if _PHPPObjs.BranchCount>0:
         zones = [x for x in zones if filterName(x, zoneExclude_)]
     print 'Inlcuding Zones {} in the Export'.format(zones)
 
+try:
+    zoneDocs = parseZoneDocuments(zoneDocuments_)
+except NameError:
+    zoneDocs = []
+
 #-------------------------------------------------------------------------------
 # Construct the Excel-Ready Write Objects
 toPHPP_Geom_ = DataTree[Object]() # Master tree to hold all the results
 if _PHPPObjs.BranchCount != 0:
-    uValuesList, uValueUID_Names    = getUvalues( _PHPPObjs.Branch(1) )
-    winComponentsList               = getComponents( _PHPPObjs.Branch(5) )
-    areasList, surfacesIncluded     = getAreas( _PHPPObjs.Branch(4), zones )
-    tb_List                         = getThermalBridges( thermalBridges_, startRows)
-    winSurfacesList                 = getWindows( _PHPPObjs.Branch(5), surfacesIncluded, _PHPPObjs.Branch(4) )   
-    shadingList                     = getShading( _PHPPObjs.Branch(5), surfacesIncluded )
-    tfa                             = getTFA(tfa_, _PHPPObjs.Branch(6), zones)
-    addnlVentRooms, ventUnitsUsed   = getAddnlVentRooms( _PHPPObjs.Branch(6), _PHPPObjs.Branch(7), zones, startRows )
-    vent                            = getAddnlVentSystems( _PHPPObjs.Branch(7), ventUnitsUsed, startRows )
-    airtightness                    = getInfiltration( _PHPPObjs.Branch(8), zones)
-    ground                          = getGround( grndFloorElements_ if len(grndFloorElements_)>0 else _PHPPObjs.Branch(11), zones )
-    dhw                             = getDHWSystem( _PHPPObjs.Branch(10), zones )
-    nonRes_Elec                     = getNonResRoomData( _PHPPObjs.Branch(6), zones, startRows )
-    location                        = getLocation( _PHPPObjs.Branch(12) )
-    elec_equip_appliance            = getAppliances( _PHPPObjs.Branch(13), zones )
-    phpp_lighting                   = getPHPPLighting( _PHPPObjs.Branch(14), zones )
-    footprint                       = getFootprint( _PHPPObjs.Branch(15) )
-    
-    #---------------------------------------------------------------------------
-    # Add all the Excel-Ready Objects to a master Tree for outputting / passing
-    toPHPP_Geom_.AddRange(uValuesList, GH_Path(0))
-    toPHPP_Geom_.AddRange(winComponentsList, GH_Path(1))
-    toPHPP_Geom_.AddRange(areasList, GH_Path(2))
-    toPHPP_Geom_.AddRange(winSurfacesList, GH_Path(3))
-    toPHPP_Geom_.AddRange(shadingList, GH_Path(4))
-    toPHPP_Geom_.AddRange(tfa, GH_Path(5))
-    toPHPP_Geom_.AddRange(tb_List, GH_Path(6))
-    toPHPP_Geom_.AddRange(addnlVentRooms, GH_Path(7))
-    toPHPP_Geom_.AddRange(vent, GH_Path(8))  
-    toPHPP_Geom_.AddRange(airtightness, GH_Path(9))  
-    toPHPP_Geom_.AddRange(ground, GH_Path(10)) 
-    toPHPP_Geom_.AddRange(dhw, GH_Path(11)) 
-    toPHPP_Geom_.AddRange(nonRes_Elec, GH_Path(12))
-    toPHPP_Geom_.AddRange(location, GH_Path(13))
-    toPHPP_Geom_.AddRange(elec_equip_appliance, GH_Path(14))
-    toPHPP_Geom_.AddRange(phpp_lighting, GH_Path(15))
-    toPHPP_Geom_.AddRange(footprint, GH_Path(16))
-    
-    #---------------------------------------------------------------------------
-    # Give Warnings
-    if len(toPHPP_Geom_.Branch(2))/10 > 100:
-        AreasWarning = 'Warning: It looks like you have {:.0f} surfaces in the model. By Default\n'\
-        'the PHPP can only hold 100 surfaces. Before writing out to the PHPP be sure to\n '\
-        'add more lines to the "Areas" worksheet of your excel file.\n'\
-        'After adding lines to the PHPP, be sure to input the correct Start Rows into\n'\
-        'the "udRowStarts_" of this component.'.format(len(toPHPP_Geom_.Branch(2))/10)
-        ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, AreasWarning)
-    
-    if len(toPHPP_Geom_.Branch(7))/17 > 30:
-        VentWarning = 'Warning: It looks like you have {:.0f} rooms in the model. By Default\n'\
-        'the PHPP can only hold 30 different rooms in the Additional Ventilation worksheet.\n'\
-        'Before writing out to the PHPP be sure to add more lines to the\n'\
-        '"Additional Ventilation" worksheet in the "Dimensionsing of Air Quantities" section.\n'\
-        'After adding lines to the PHPP, be sure to input the correct Start Rows into\n'\
-        'the "udRowStarts_" of this component.'.format(len(toPHPP_Geom_.Branch(7))/17)
-        ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, VentWarning)
-    
-    if len(toPHPP_Geom_.Branch(12))/8 > 22:
-        NonResWarning = 'Warning: It looks like you have {:.0f} Non-Residential Rooms in the model. By Default\n'\
-        'the PHPP can only hold 22 different rooms in the "Electricity non-res" worksheet.\n'\
-        'Before writing out to the PHPP be sure to add more lines to the \n '\
-        '"Electricity non-res" worksheet in the "Lighting/non-residential" section.'.format(len(toPHPP_Geom_.Branch(12))/8)
-        ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, NonResWarning)
\ No newline at end of file
+    floorElements = grndFloorElements_ if len(grndFloorElements_)>0 else _PHPPObjs.Branch(11)
+    
+    # The building-level objects are the same for every PHPP document
+    uValuesList, uValueUID_Names = getUvalues( _PHPPObjs.Branch(1) )
+    shared = {'uValues': uValuesList,
+              'winComponents': getComponents( _PHPPObjs.Branch(5) ),
+              'thermalBridges': getThermalBridges( thermalBridges_, startRows),
+              'location': getLocation( _PHPPObjs.Branch(12) ),
+              'footprint': getFootprint( _PHPPObjs.Branch(15) ),
+              }
+    
+    if len(zoneDocs)>0:
+        # Partitioned: one set of Write Objects for each PHPP document, all in one pass
+        for docNum, (docName, docZones, docBranches) in enumerate(partitionPHPPObjs(_PHPPObjs, zones, zoneDocs, floorElements)):
+            print 'PHPP Document {} "{}": Zones {}'.format(docNum, docName, docZones)
+            if len(docZones) == 0:
+                noZonesMsg = 'No Zones were found for the "{}" PHPP document? Nothing will be written to it.'.format(docName)
+                ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, noZonesMsg)
+                continue
+            
+            xlObjs = createGeomXLObjs(docBranches, docZones, shared, startRows)
+            for branchNum, xlObjList in enumerate(xlObjs):
+                toPHPP_Geom_.Add(xlObjList, GH_Path(docNum, branchNum))
+            giveWarnings(xlObjs, docName)
+    else:
+        branches = dict( (i, _PHPPObjs.Branch(i)) for i in range(_PHPPObjs.BranchCount) )
+        branches[11] = floorElements
+        
+        #---------------------------------------------------------------------------
+        # Add all the Excel-Ready Objects to a master Tree for outputting / passing
+        xlObjs = createGeomXLObjs(branches, zones, shared, startRows)
+        for branchNum, xlObjList in enumerate(xlObjs):
+            toPHPP_Geom_.Add(xlObjList, GH_Path(branchNum))
+        giveWarnings(xlObjs)
\ No newline at end of file
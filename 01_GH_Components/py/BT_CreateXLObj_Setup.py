@@ -37,7 +37,7 @@ EM September 29, 2020
         >   4) If you input in 2 values in a multiline entry, the first value will be use for the daytime ACH and the second will be used for the nightime ACH.
         dhw_: <Optional>
     Returns:
-        toPHPP_Setup_: A DataTree of the final clean, Excel-Ready output objects. Each output object has a Worksheet-Name, a Cell Range, and a Value. Connect to the 'Setup_' input on the 'Write 2PHPP' Component to write to Excel.
+        toPHPP_Setup_: A DataTree of the final clean, Excel-Ready output objects. Each branch holds one Write Batch of all the Excel-Ready writes (each a Worksheet-Name, a Cell Range, and a Value) for that part of the PHPP. Connect to the 'Setup_' input on the 'Write 2PHPP' Component to write to Excel.
 """
 
 ghenv.Component.Name = "BT_CreateXLObj_Setup"
@@ -56,7 +56,8 @@ import scriptcontext as sc
 import Grasshopper.Kernel as ghK
 
 # Classes and Defs
-PHPP_XL_Obj = sc.sticky['PHPP_XL_Obj'] 
+PHPP_XL_Address = sc.sticky['PHPP_XL_Address']
+PHPP_XL_WriteBatch = sc.sticky['PHPP_XL_WriteBatch']
 preview = sc.sticky['Preview']
 
 #-------------------------------------------------------------------------------
@@ -82,27 +83,27 @@ if mechCooling_equip==False and mechCooling_verification==True:
 
 #-------------------------------------------------------------------------------
 # DHW
-dhwSystem = []
+dhwSystem = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
 if dhw_:
-    dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J146', dhw_.forwardTemp, 'C', 'F' ))
-    dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'P145', 0, 'C', 'F' ))
-    dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'P29', 0, 'C', 'F' ))
+    dhwSystem.add('DHW+Distribution', 'J146', dhw_.forwardTemp, 'C', 'F' )
+    dhwSystem.add('DHW+Distribution', 'P145', 0, 'C', 'F' )
+    dhwSystem.add('DHW+Distribution', 'P29', 0, 'C', 'F' )
     
     # Recirc Piping
     if len(dhw_.circulation_piping)>0:
-        dhwSystem.append( PHPP_XL_Obj('Aux Electricity', 'H29', 1 ) ) # Circulator Pump
+        dhwSystem.add('Aux Electricity', 'H29', 1 ) # Circulator Pump
         
     for colNum, recirc_line in enumerate(dhw_.circulation_piping):
         col = chr(ord('J') + colNum)
         
         if ord(col) <= ord('N'):
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 149), recirc_line.length, 'M', 'FT' ))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 150), recirc_line.diam, 'MM','IN' ))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 151), recirc_line.insulThck, 'MM', 'IN' ))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 152), 'x' if recirc_line.insulRefl=='Yes' else '' ))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 153), recirc_line.insulCond, 'W/MK', 'HR-FT2-F/BTU-IN'  ))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 155), recirc_line.quality ))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 159), recirc_line.period ))
+            dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 149), recirc_line.length, 'M', 'FT' )
+            dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 150), recirc_line.diam, 'MM','IN' )
+            dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 151), recirc_line.insulThck, 'MM', 'IN' )
+            dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 152), 'x' if recirc_line.insulRefl=='Yes' else '' )
+            dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 153), recirc_line.insulCond, 'W/MK', 'HR-FT2-F/BTU-IN'  )
+            dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 155), recirc_line.quality )
+            dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 159), recirc_line.period )
         else:
             dhwRecircWarning = "Too many recirculation loops. PHPP only allows up to 5 loops to be entered.\n"\
             "Consolidate the loops before moving forward"
@@ -113,11 +114,11 @@ if dhw_:
         col = chr(ord('J') + colNum)
         
         if ord(col) <= ord('N'):
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 167), branch_line.diameter, 'M', 'IN'))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 168), branch_line.totalLength, 'M', 'FT'))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 169), branch_line.totalTapPoints))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 171), branch_line.tapOpenings))
-            dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', '{}{}'.format(col, 172), branch_line.utilisation))
+            dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 167), branch_line.diameter, 'M', 'IN')
+            dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 168), branch_line.totalLength, 'M', 'FT')
+            dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 169), branch_line.totalTapPoints)
+            dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 171), branch_line.tapOpenings)
+            dhwSystem.add('DHW+Distribution', PHPP_XL_Address.cell(col, 172), branch_line.utilisation)
         else:
             dhwRecircWarning = "Too many branch piping sets. PHPP only allows up to 5 sets to be entered.\n"\
             "Consolidate the piping sets before moving forward"
@@ -125,205 +126,205 @@ if dhw_:
     
     # Tanks
     if dhw_.tank1:
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J186', dhw_.tank1.type) )
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J189', 'x' if dhw_.tank1.solar==True else '') )
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J191', dhw_.tank1.hl_rate, 'W/K', 'BTU/HR-F') )
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J192', dhw_.tank1.vol, 'LITER', 'GALLON') )
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J193', dhw_.tank1.stndbyFrac) )
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J195', dhw_.tank1.loction) )
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'J198', dhw_.tank1.locaton_t, 'C', 'F') )
+        dhwSystem.add('DHW+Distribution', 'J186', dhw_.tank1.type)
+        dhwSystem.add('DHW+Distribution', 'J189', 'x' if dhw_.tank1.solar==True else '')
+        dhwSystem.add('DHW+Distribution', 'J191', dhw_.tank1.hl_rate, 'W/K', 'BTU/HR-F')
+        dhwSystem.add('DHW+Distribution', 'J192', dhw_.tank1.vol, 'LITER', 'GALLON')
+        dhwSystem.add('DHW+Distribution', 'J193', dhw_.tank1.stndbyFrac)
+        dhwSystem.add('DHW+Distribution', 'J195', dhw_.tank1.loction)
+        dhwSystem.add('DHW+Distribution', 'J198', dhw_.tank1.locaton_t, 'C', 'F')
     if dhw_.tank2:
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'M186', dhw_.tank2.type) )
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'M189', 'x' if dhw_.tank2.solar==True else '') )
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'M191', dhw_.tank2.hl_rate, 'W/K', 'BTU/HR-F') )
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'M192', dhw_.tank2.vol, 'LITER', 'GALLON') )
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'M193', dhw_.tank2.stndbyFrac) )
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'M195', dhw_.tank2.loction) )
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'M198', dhw_.tank2.locaton_t, 'C', 'F') )
+        dhwSystem.add('DHW+Distribution', 'M186', dhw_.tank2.type)
+        dhwSystem.add('DHW+Distribution', 'M189', 'x' if dhw_.tank2.solar==True else '')
+        dhwSystem.add('DHW+Distribution', 'M191', dhw_.tank2.hl_rate, 'W/K', 'BTU/HR-F')
+        dhwSystem.add('DHW+Distribution', 'M192', dhw_.tank2.vol, 'LITER', 'GALLON')
+        dhwSystem.add('DHW+Distribution', 'M193', dhw_.tank2.stndbyFrac)
+        dhwSystem.add('DHW+Distribution', 'M195', dhw_.tank2.loction)
+        dhwSystem.add('DHW+Distribution', 'M198', dhw_.tank2.locaton_t, 'C', 'F')
     if dhw_.tank_buffer:
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'P186', dhw_.tank_buffer.type) )
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'P191', dhw_.tank_buffer.hl_rate, 'W/K', 'BTU/HR-F') )
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'P192', dhw_.tank_buffer.vol, 'LITER', 'GALLON') )
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'P195', dhw_.tank_buffer.loction) )
-        dhwSystem.append( PHPP_XL_Obj('DHW+Distribution', 'P198', dhw_.tank_buffer.locaton_t, 'C', 'F') )
+        dhwSystem.add('DHW+Distribution', 'P186', dhw_.tank_buffer.type)
+        dhwSystem.add('DHW+Distribution', 'P191', dhw_.tank_buffer.hl_rate, 'W/K', 'BTU/HR-F')
+        dhwSystem.add('DHW+Distribution', 'P192', dhw_.tank_buffer.vol, 'LITER', 'GALLON')
+        dhwSystem.add('DHW+Distribution', 'P195', dhw_.tank_buffer.loction)
+        dhwSystem.add('DHW+Distribution', 'P198', dhw_.tank_buffer.locaton_t, 'C', 'F')
 
 #-------------------------------------------------------------------------------
 # Verification
-verification = []
+verification = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
 if verification_:
-    verification.append( PHPP_XL_Obj('Verification', 'F28', verification_.NumResUnits if verification_ else 1  )) # Num Dwelling Units
-    verification.append( PHPP_XL_Obj('Verification', 'K29', verification_.SpecCapacity if verification_ else 60, 'WH/KM2', 'BTU/FT2' )) # Spec Capacity
-    verification.append( PHPP_XL_Obj('Verification', 'N29', verification_.MechCooling if verification_ else ''  )) # Cooling
-    verification.append( PHPP_XL_Obj('Verification', 'K4', verification_.BldgName if verification_ else 'x' )) # Building Name
-    verification.append( PHPP_XL_Obj('Verification', 'M7', verification_.BldgCountry if verification_ else 'US-United States of America'  )) # Building Country
+    verification.add('Verification', 'F28', verification_.NumResUnits if verification_ else 1  ) # Num Dwelling Units
+    verification.add('Verification', 'K29', verification_.SpecCapacity if verification_ else 60, 'WH/KM2', 'BTU/FT2' ) # Spec Capacity
+    verification.add('Verification', 'N29', verification_.MechCooling if verification_ else ''  ) # Cooling
+    verification.add('Verification', 'K4', verification_.BldgName if verification_ else 'x' ) # Building Name
+    verification.add('Verification', 'M7', verification_.BldgCountry if verification_ else 'US-United States of America'  ) # Building Country
     
     if verification_.Certification != None:
-        verification.append( PHPP_XL_Obj('Verification', 'R78', verification_.Certification.energy_standard ))
-        verification.append( PHPP_XL_Obj('Verification', 'R80', verification_.Certification.cert_class ))
-        verification.append( PHPP_XL_Obj('Verification', 'R82', verification_.Certification.pe_type ))
-        verification.append( PHPP_XL_Obj('Verification', 'R85', verification_.Certification.enerphit_type ))
-        verification.append( PHPP_XL_Obj('Verification', 'R87', verification_.Certification.retrofit ))
+        verification.add('Verification', 'R78', verification_.Certification.energy_standard )
+        verification.add('Verification', 'R80', verification_.Certification.cert_class )
+        verification.add('Verification', 'R82', verification_.Certification.pe_type )
+        verification.add('Verification', 'R85', verification_.Certification.enerphit_type )
+        verification.add('Verification', 'R87', verification_.Certification.retrofit )
     
     # IHG and Occupancy
-    verification.append( PHPP_XL_Obj('Verification', 'R20', getattr(verification_, 'BuildingType', "1-Residential building" )))
-    verification.append( PHPP_XL_Obj('Verification', 'R24', getattr(verification_, 'IHG_Type', '10-Dwelling' )))
-    verification.append( PHPP_XL_Obj('Verification', 'R25', getattr(verification_, 'IHG_Values', '2-Standard' )))
+    verification.add('Verification', 'R20', getattr(verification_, 'BuildingType', "1-Residential building" ))
+    verification.add('Verification', 'R24', getattr(verification_, 'IHG_Type', '10-Dwelling' ))
+    verification.add('Verification', 'R25', getattr(verification_, 'IHG_Values', '2-Standard' ))
     if getattr(verification_, 'Occupancy', '' ) != '':
-        verification.append( PHPP_XL_Obj('Verification', 'Q29', getattr(verification_, 'Occupancy', '' )))
-    verification.append( PHPP_XL_Obj('Verification', 'R29', getattr(verification_, 'OccupancyMethod', '1-Standard (only for residential buildings)' )))
+        verification.add('Verification', 'Q29', getattr(verification_, 'Occupancy', '' ))
+    verification.add('Verification', 'R29', getattr(verification_, 'OccupancyMethod', '1-Standard (only for residential buildings)' ))
 
 
 
 #-------------------------------------------------------------------------------
 # Climate Data
-climate = []
+climate = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
 if climate_:
-    climate.append( PHPP_XL_Obj('Climate', 'D12', climate_.DataSet if climate_ else 'DE-9999-PHPP-Standard' )) # Climate Data Set Name (Dropdown)
-    climate.append( PHPP_XL_Obj('Climate', 'D18', climate_.Altitude if climate_ else '=D17' )) # Altitude
+    climate.add('Climate', 'D12', climate_.DataSet if climate_ else 'DE-9999-PHPP-Standard' ) # Climate Data Set Name (Dropdown)
+    climate.add('Climate', 'D18', climate_.Altitude if climate_ else '=D17' ) # Altitude
 
 #-------------------------------------------------------------------------------
 # Airtightness
-airtightness = []
+airtightness = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
 if airtightness_:
-    airtightness.append(PHPP_XL_Obj('Ventilation', 'N25', airtightness_.Coef_E if airtightness_ else float(0.07) ))# Wind protection E
-    airtightness.append(PHPP_XL_Obj('Ventilation', 'N26', airtightness_.Coef_F if airtightness_ else float(15) ))# Wind protection F
-    airtightness.append(PHPP_XL_Obj('Ventilation', 'N27', airtightness_.ACH50 if airtightness_ else float(0.6) ))# ACH50
-    airtightness.append(PHPP_XL_Obj('Ventilation', 'P27', airtightness_.VN50 if airtightness_ else '=N9*1.2', 'M3', 'FT3' ))#  Internal Reference Volume
+    airtightness.add('Ventilation', 'N25', airtightness_.Coef_E if airtightness_ else float(0.07) )# Wind protection E
+    airtightness.add('Ventilation', 'N26', airtightness_.Coef_F if airtightness_ else float(15) )# Wind protection F
+    airtightness.add('Ventilation', 'N27', airtightness_.ACH50 if airtightness_ else float(0.6) )# ACH50
+    airtightness.add('Ventilation', 'P27', airtightness_.VN50 if airtightness_ else '=N9*1.2', 'M3', 'FT3' )#  Internal Reference Volume
 
 #-------------------------------------------------------------------------------
 # Ventilation Single
-vent = []
+vent = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
 if ventilationSingle_:
     # Create the Vent Unit in the Components Worksheet
-    vent.append( PHPP_XL_Obj('Components', 'JH15', ventilationSingle_.Unit_Name if ventilationSingle_ else 'Default_Name' )) #  Create the Vent Unit
-    vent.append( PHPP_XL_Obj('Components', 'JI15', ventilationSingle_.Unit_HR if ventilationSingle_ else 0.75 )) #  Vent Heat Recovery
-    vent.append( PHPP_XL_Obj('Components', 'JJ15', ventilationSingle_.Unit_MR if ventilationSingle_ else 0 )) #  Vent Moisture Recovery
-    vent.append( PHPP_XL_Obj('Components', 'JK15', ventilationSingle_.Unit_ElecEff if ventilationSingle_ else 0.45, 'WH/M3', 'W/CFM'  )) #  Vent Elec Efficiency
+    vent.add('Components', 'JH15', ventilationSingle_.Unit_Name if ventilationSingle_ else 'Default_Name' ) #  Create the Vent Unit
+    vent.add('Components', 'JI15', ventilationSingle_.Unit_HR if ventilationSingle_ else 0.75 ) #  Vent Heat Recovery
+    vent.add('Components', 'JJ15', ventilationSingle_.Unit_MR if ventilationSingle_ else 0 ) #  Vent Moisture Recovery
+    vent.add('Components', 'JK15', ventilationSingle_.Unit_ElecEff if ventilationSingle_ else 0.45, 'WH/M3', 'W/CFM'  ) #  Vent Elec Efficiency
     
     # Assign the Vent Unit
-    vent.append( PHPP_XL_Obj('Ventilation', 'L12', ventilationSingle_.Unit_Type if ventilationSingle_ else '1-Balanced PH ventilation with HR' )) #  Assign the Vent Unit Type
-    vent.append( PHPP_XL_Obj('Ventilation', 'K88', '01ud-{}'.format(ventilationSingle_.Unit_Name) if ventilationSingle_ else '01ud-Default_Name' )) #  Assign the Vent Unit
-    vent.append( PHPP_XL_Obj('Ventilation', 'R90', ventilationSingle_.FrostTemp if ventilationSingle_ else '-5', 'C', 'F' )) #  HRV Frost Protection Limit
+    vent.add('Ventilation', 'L12', ventilationSingle_.Unit_Type if ventilationSingle_ else '1-Balanced PH ventilation with HR' ) #  Assign the Vent Unit Type
+    vent.add('Ventilation', 'K88', '01ud-{}'.format(ventilationSingle_.Unit_Name) if ventilationSingle_ else '01ud-Default_Name' ) #  Assign the Vent Unit
+    vent.add('Ventilation', 'R90', ventilationSingle_.FrostTemp if ventilationSingle_ else '-5', 'C', 'F' ) #  HRV Frost Protection Limit
     
     # Ducts
-    vent.append( PHPP_XL_Obj('Ventilation', 'N91', ventilationSingle_.Duct01.DuctLength if ventilationSingle_ else 5, 'M', 'FT'))
-    vent.append( PHPP_XL_Obj('Ventilation', 'L106', ventilationSingle_.Duct01.DuctWidth if ventilationSingle_ else 104, 'MM', 'IN'))
-    vent.append( PHPP_XL_Obj('Ventilation', 'L107', ventilationSingle_.Duct01.InsulationThickness if ventilationSingle_ else 52, 'MM', 'IN' ))
-    vent.append( PHPP_XL_Obj('Ventilation', 'L109', 'x' ))# Reflective
-    vent.append( PHPP_XL_Obj('Ventilation', 'L112', ventilationSingle_.Duct01.InsulationLambda if ventilationSingle_ else 0.04, 'W/MK', 'HR-FT2-F/BTU-IN'))
+    vent.add('Ventilation', 'N91', ventilationSingle_.Duct01.DuctLength if ventilationSingle_ else 5, 'M', 'FT')
+    vent.add('Ventilation', 'L106', ventilationSingle_.Duct01.DuctWidth if ventilationSingle_ else 104, 'MM', 'IN')
+    vent.add('Ventilation', 'L107', ventilationSingle_.Duct01.InsulationThickness if ventilationSingle_ else 52, 'MM', 'IN' )
+    vent.add('Ventilation', 'L109', 'x' )# Reflective
+    vent.add('Ventilation', 'L112', ventilationSingle_.Duct01.InsulationLambda if ventilationSingle_ else 0.04, 'W/MK', 'HR-FT2-F/BTU-IN')
     
-    vent.append( PHPP_XL_Obj('Ventilation', 'N93', ventilationSingle_.Duct02.DuctLength if ventilationSingle_ else 5, 'M', 'FT'))
-    vent.append( PHPP_XL_Obj('Ventilation', 'Q106', ventilationSingle_.Duct02.DuctWidth if ventilationSingle_ else 104, 'MM', 'IN'))
-    vent.append( PHPP_XL_Obj('Ventilation', 'Q107', ventilationSingle_.Duct02.InsulationThickness if ventilationSingle_ else 52, 'MM', 'IN'))
-    vent.append( PHPP_XL_Obj('Ventilation', 'Q109', 'x' ))# Reflective
-    vent.append( PHPP_XL_Obj('Ventilation', 'Q112', ventilationSingle_.Duct02.InsulationLambda if ventilationSingle_ else 0.04, 'W/MK', 'HR-FT2-F/BTU-IN'))
+    vent.add('Ventilation', 'N93', ventilationSingle_.Duct02.DuctLength if ventilationSingle_ else 5, 'M', 'FT')
+    vent.add('Ventilation', 'Q106', ventilationSingle_.Duct02.DuctWidth if ventilationSingle_ else 104, 'MM', 'IN')
+    vent.add('Ventilation', 'Q107', ventilationSingle_.Duct02.InsulationThickness if ventilationSingle_ else 52, 'MM', 'IN')
+    vent.add('Ventilation', 'Q109', 'x' )# Reflective
+    vent.add('Ventilation', 'Q112', ventilationSingle_.Duct02.InsulationLambda if ventilationSingle_ else 0.04, 'W/MK', 'HR-FT2-F/BTU-IN')
 
 
 #-------------------------------------------------------------------------------
 # PER
-per = []
+per = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
 if Heating_Cooling_.Branches:
-    per.append( PHPP_XL_Obj('PER', 'P10', Heating_Cooling_.Branch(0)[0].heatPrimaryGen if Heating_Cooling_.Branches else "5-Direct electricity" )) # Primary Heat Generator
-    per.append( PHPP_XL_Obj('PER', 'P12', Heating_Cooling_.Branch(0)[0].heatScondaryGen if Heating_Cooling_.Branches else "-" )) # Secondary Heat Generator
-    per.append( PHPP_XL_Obj('PER', 'S10', Heating_Cooling_.Branch(0)[0].heatFracPrimary if Heating_Cooling_.Branches else "1" )) # Heat Fraction Primary
-    per.append( PHPP_XL_Obj('PER', 'T10', Heating_Cooling_.Branch(0)[0].dhwFracPrrimary if Heating_Cooling_.Branches else "0" )) # DHW Fraction Primary
+    per.add('PER', 'P10', Heating_Cooling_.Branch(0)[0].heatPrimaryGen if Heating_Cooling_.Branches else "5-Direct electricity" ) # Primary Heat Generator
+    per.add('PER', 'P12', Heating_Cooling_.Branch(0)[0].heatScondaryGen if Heating_Cooling_.Branches else "-" ) # Secondary Heat Generator
+    per.add('PER', 'S10', Heating_Cooling_.Branch(0)[0].heatFracPrimary if Heating_Cooling_.Branches else "1" ) # Heat Fraction Primary
+    per.add('PER', 'T10', Heating_Cooling_.Branch(0)[0].dhwFracPrrimary if Heating_Cooling_.Branches else "0" ) # DHW Fraction Primary
 
 #-------------------------------------------------------------------------------
 # MECH
-mech = []
+mech = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
 hp_count = 0
 if Heating_Cooling_.Branches: # If there are any mechanical equipment objects
     #---------------------------------------------------------------------------
     # Boiler
     if Heating_Cooling_.Branch(1)[0].Boiler:
-        mech.append( PHPP_XL_Obj('Boiler', 'N21', Heating_Cooling_.Branch(1)[0].Boiler.Type)) 
-        mech.append( PHPP_XL_Obj('Boiler', 'N22', Heating_Cooling_.Branch(1)[0].Boiler.Fuel)) 
-        mech.append( PHPP_XL_Obj('Boiler', 'M31', Heating_Cooling_.Branch(1)[0].Boiler.UseTypicalValues)) 
+        mech.add('Boiler', 'N21', Heating_Cooling_.Branch(1)[0].Boiler.Type) 
+        mech.add('Boiler', 'N22', Heating_Cooling_.Branch(1)[0].Boiler.Fuel) 
+        mech.add('Boiler', 'M31', Heating_Cooling_.Branch(1)[0].Boiler.UseTypicalValues) 
     
     #---------------------------------------------------------------------------
     if Heating_Cooling_.Branch(1)[0].HP_Options:
         print dir(Heating_Cooling_.Branch(1)[0].HP_Options)
         
-        mech.append( PHPP_XL_Obj('DHW+Distribution', 'J30', Heating_Cooling_.Branch(1)[0].HP_Options.DesignForwardWaterTemp))
-        mech.append( PHPP_XL_Obj('HP', 'M22', Heating_Cooling_.Branch(1)[0].HP_Options.Distribution))
-        mech.append( PHPP_XL_Obj('HP', 'M27', Heating_Cooling_.Branch(1)[0].HP_Options.NominalPower))
-        mech.append( PHPP_XL_Obj('HP', 'M28', Heating_Cooling_.Branch(1)[0].HP_Options.RadExponent))
-        mech.append( PHPP_XL_Obj('HP', 'M42', Heating_Cooling_.Branch(1)[0].HP_Options.BackupType))
-        mech.append( PHPP_XL_Obj('HP', 'M43', Heating_Cooling_.Branch(1)[0].HP_Options.ElecFlowWater_dT))
-        mech.append( PHPP_XL_Obj('HP', 'M46', Heating_Cooling_.Branch(1)[0].HP_Options.Priority))
-        mech.append( PHPP_XL_Obj('HP', 'M48', Heating_Cooling_.Branch(1)[0].HP_Options.Control))
-        mech.append( PHPP_XL_Obj('HP', 'M50', Heating_Cooling_.Branch(1)[0].HP_Options.GroundWaterDepth))
-        mech.append( PHPP_XL_Obj('HP', 'M51', Heating_Cooling_.Branch(1)[0].HP_Options.GroundPumpPower))
+        mech.add('DHW+Distribution', 'J30', Heating_Cooling_.Branch(1)[0].HP_Options.DesignForwardWaterTemp)
+        mech.add('HP', 'M22', Heating_Cooling_.Branch(1)[0].HP_Options.Distribution)
+        mech.add('HP', 'M27', Heating_Cooling_.Branch(1)[0].HP_Options.NominalPower)
+        mech.add('HP', 'M28', Heating_Cooling_.Branch(1)[0].HP_Options.RadExponent)
+        mech.add('HP', 'M42', Heating_Cooling_.Branch(1)[0].HP_Options.BackupType)
+        mech.add('HP', 'M43', Heating_Cooling_.Branch(1)[0].HP_Options.ElecFlowWater_dT)
+        mech.add('HP', 'M46', Heating_Cooling_.Branch(1)[0].HP_Options.Priority)
+        mech.add('HP', 'M48', Heating_Cooling_.Branch(1)[0].HP_Options.Control)
+        mech.add('HP', 'M50', Heating_Cooling_.Branch(1)[0].HP_Options.GroundWaterDepth)
+        mech.add('HP', 'M51', Heating_Cooling_.Branch(1)[0].HP_Options.GroundPumpPower)
     
     # Heating Equipment | Space Heating Heat-Pump
     if Heating_Cooling_.Branch(1)[0].HP_heating:
         hp_count +=1
-        mech.append( PHPP_XL_Obj('HP', 'J21', '4-' + Heating_Cooling_.Branch(1)[0].HP_heating.Name))
-        mech.append( PHPP_XL_Obj('HP', 'I635', Heating_Cooling_.Branch(1)[0].HP_heating.Name)) 
-        mech.append( PHPP_XL_Obj('HP', 'I637', Heating_Cooling_.Branch(1)[0].HP_heating.Source)) 
+        mech.add('HP', 'J21', '4-' + Heating_Cooling_.Branch(1)[0].HP_heating.Name)
+        mech.add('HP', 'I635', Heating_Cooling_.Branch(1)[0].HP_heating.Name) 
+        mech.add('HP', 'I637', Heating_Cooling_.Branch(1)[0].HP_heating.Source) 
         for i, item in enumerate(Heating_Cooling_.Branch(1)[0].HP_heating.T_Source):
-            mech.append( PHPP_XL_Obj('HP', 'K{}'.format(i+640), item)) 
+            mech.add('HP', PHPP_XL_Address.cell('K', i+640), item) 
         for i, item in enumerate(Heating_Cooling_.Branch(1)[0].HP_heating.T_Sink):
-            mech.append( PHPP_XL_Obj('HP', 'L{}'.format(i+640), item)) 
+            mech.add('HP', PHPP_XL_Address.cell('L', i+640), item) 
         for i, item in enumerate(Heating_Cooling_.Branch(1)[0].HP_heating.HC):
-            mech.append( PHPP_XL_Obj('HP', 'M{}'.format(i+640), item)) 
+            mech.add('HP', PHPP_XL_Address.cell('M', i+640), item) 
         for i, item in enumerate(Heating_Cooling_.Branch(1)[0].HP_heating.COP):
-            mech.append( PHPP_XL_Obj('HP', 'N{}'.format(i+640), item)) 
-        mech.append( PHPP_XL_Obj('HP', 'M658', Heating_Cooling_.Branch(1)[0].HP_heating.dT_Sink)) 
+            mech.add('HP', PHPP_XL_Address.cell('N', i+640), item) 
+        mech.add('HP', 'M658', Heating_Cooling_.Branch(1)[0].HP_heating.dT_Sink) 
     
     #---------------------------------------------------------------------------
     # Equipment | DHW Heat-Pump
     if Heating_Cooling_.Branch(1)[0].HP_dhw:
         hp_count += 1
-        mech.append( PHPP_XL_Obj('HP', 'J36', '5-' + Heating_Cooling_.Branch(1)[0].HP_dhw.Name))
-        mech.append( PHPP_XL_Obj('HP', 'I665', Heating_Cooling_.Branch(1)[0].HP_dhw.Name))
-        mech.append( PHPP_XL_Obj('HP', 'I667', Heating_Cooling_.Branch(1)[0].HP_dhw.Source)) 
+        mech.add('HP', 'J36', '5-' + Heating_Cooling_.Branch(1)[0].HP_dhw.Name)
+        mech.add('HP', 'I665', Heating_Cooling_.Branch(1)[0].HP_dhw.Name)
+        mech.add('HP', 'I667', Heating_Cooling_.Branch(1)[0].HP_dhw.Source) 
         for i, item in enumerate(Heating_Cooling_.Branch(1)[0].HP_dhw.T_Source):
-            mech.append( PHPP_XL_Obj('HP', 'K{}'.format(i+670), item)) 
+            mech.add('HP', PHPP_XL_Address.cell('K', i+670), item) 
         for i, item in enumerate(Heating_Cooling_.Branch(1)[0].HP_dhw.T_Sink):
-            mech.append( PHPP_XL_Obj('HP', 'L{}'.format(i+670), item)) 
+            mech.add('HP', PHPP_XL_Address.cell('L', i+670), item) 
         for i, item in enumerate(Heating_Cooling_.Branch(1)[0].HP_dhw.HC):
-            mech.append( PHPP_XL_Obj('HP', 'M{}'.format(i+670), item)) 
+            mech.add('HP', PHPP_XL_Address.cell('M', i+670), item) 
         for i, item in enumerate(Heating_Cooling_.Branch(1)[0].HP_dhw.COP):
-            mech.append( PHPP_XL_Obj('HP', 'N{}'.format(i+670), item)) 
-        mech.append( PHPP_XL_Obj('HP', 'M688', Heating_Cooling_.Branch(1)[0].HP_dhw.dT_Sink)) 
+            mech.add('HP', PHPP_XL_Address.cell('N', i+670), item) 
+        mech.add('HP', 'M688', Heating_Cooling_.Branch(1)[0].HP_dhw.dT_Sink) 
     
-    mech.append( PHPP_XL_Obj('HP', 'M18', 2 if hp_count==2 else 1)) # Can't ever be zero
+    mech.add('HP', 'M18', 2 if hp_count==2 else 1) # Can't ever be zero
     
     #---------------------------------------------------------------------------
     # Cooling Equipment
     if Heating_Cooling_.Branch(1)[0].SupplyAirCooling:
         onOff, maxPower, seer = Heating_Cooling_.Branch(1)[0].SupplyAirCooling.getValsForPHPP()
-        mech.append( PHPP_XL_Obj('Cooling units', 'I15', 'x' ))
-        mech.append( PHPP_XL_Obj('Cooling units', 'P17', onOff))
-        mech.append( PHPP_XL_Obj('Cooling units', 'P18', maxPower, 'KW', 'BTU/H'))
-        mech.append( PHPP_XL_Obj('Cooling units', 'P20', seer, 'W/W', 'BTU/HW'))
+        mech.add('Cooling units', 'I15', 'x' )
+        mech.add('Cooling units', 'P17', onOff)
+        mech.add('Cooling units', 'P18', maxPower, 'KW', 'BTU/H')
+        mech.add('Cooling units', 'P20', seer, 'W/W', 'BTU/HW')
     
     if Heating_Cooling_.Branch(1)[0].RecircCooling:
         onOff, maxPower, volumeFlow, variableVol, seer = Heating_Cooling_.Branch(1)[0].RecircCooling.getValsForPHPP()
-        mech.append( PHPP_XL_Obj('Cooling units', 'I22', 'x' ))
-        mech.append( PHPP_XL_Obj('Cooling units', 'P24', onOff))
-        mech.append( PHPP_XL_Obj('Cooling units', 'P25', maxPower, 'KW', 'BTU/H'))
-        mech.append( PHPP_XL_Obj('Cooling units', 'P26', volumeFlow, 'M3/H', 'CFM'))
-        mech.append( PHPP_XL_Obj('Cooling units', 'P28', variableVol))
-        mech.append( PHPP_XL_Obj('Cooling units', 'P29', seer, 'W/W', 'BTU/HW'))
+        mech.add('Cooling units', 'I22', 'x' )
+        mech.add('Cooling units', 'P24', onOff)
+        mech.add('Cooling units', 'P25', maxPower, 'KW', 'BTU/H')
+        mech.add('Cooling units', 'P26', volumeFlow, 'M3/H', 'CFM')
+        mech.add('Cooling units', 'P28', variableVol)
+        mech.add('Cooling units', 'P29', seer, 'W/W', 'BTU/HW')
     
     if Heating_Cooling_.Branch(1)[0].AddnlDehumid:
         wasteHeat, SEER = Heating_Cooling_.Branch(1)[0].AddnlDehumid.getValsForPHPP()
-        mech.append( PHPP_XL_Obj('Cooling units', 'I32', 'x' ))
-        mech.append( PHPP_XL_Obj('Cooling units', 'P34', wasteHeat))
-        mech.append( PHPP_XL_Obj('Cooling units', 'P35', SEER, 'W/W', 'BTU/HW'))
+        mech.add('Cooling units', 'I32', 'x' )
+        mech.add('Cooling units', 'P34', wasteHeat)
+        mech.add('Cooling units', 'P35', SEER, 'W/W', 'BTU/HW')
     
     if Heating_Cooling_.Branch(1)[0].PanelCooling:
         SEER = Heating_Cooling_.Branch(1)[0].PanelCooling.getValsForPHPP()
-        mech.append( PHPP_XL_Obj('Cooling units', 'I37', 'x' ))
-        mech.append( PHPP_XL_Obj('Cooling units', 'P39', SEER, 'W/W', 'BTU/HW'))
+        mech.add('Cooling units', 'I37', 'x' )
+        mech.add('Cooling units', 'P39', SEER, 'W/W', 'BTU/HW')
 
 
 
 #-------------------------------------------------------------------------------
 # Summer Vent
-sumVent = []
+sumVent = PHPP_XL_WriteBatch(_source=ghenv.Component.NickName)
 if len(summerVent_)>0:
     if summerVent_[0] != False:
         try:
@@ -336,21 +337,21 @@ if len(summerVent_)>0:
         except:
             sumVentACH_night = '=L31'
         
-        sumVent.append( PHPP_XL_Obj('SummVent', 'L31', sumVentACH_day) )        # Daytime window Ventilation Default
-        sumVent.append( PHPP_XL_Obj('SummVent', 'P59', sumVentACH_night))       # Nightime window Ventilation Default
-        sumVent.append( PHPP_XL_Obj('SummVent', 'R21', ''))                     # HRV Summer Bypass - Clear
-        sumVent.append( PHPP_XL_Obj('SummVent', 'R22', 'x'))                    # HRV Summer Bypass Set Temp difference (default)
-        sumVent.append( PHPP_XL_Obj('SummVent', 'R23', ''))                     # HRV Summer Bypass - Clear
-        sumVent.append( PHPP_XL_Obj('SummVent', 'R24', ''))                     # HRV Summer Bypass - Clear
+        sumVent.add('SummVent', 'L31', sumVentACH_day)        # Daytime window Ventilation Default
+        sumVent.add('SummVent', 'P59', sumVentACH_night)       # Nightime window Ventilation Default
+        sumVent.add('SummVent', 'R21', '')                     # HRV Summer Bypass - Clear
+        sumVent.add('SummVent', 'R22', 'x')                    # HRV Summer Bypass Set Temp difference (default)
+        sumVent.add('SummVent', 'R23', '')                     # HRV Summer Bypass - Clear
+        sumVent.add('SummVent', 'R24', '')                     # HRV Summer Bypass - Clear
  
 #-------------------------------------------------------------------------------
 # Add it all to a master Tree
 toPHPP_Setup_ = DataTree[Object]() # Master tree to hold all the results
-toPHPP_Setup_.AddRange(verification, GH_Path(0))
-toPHPP_Setup_.AddRange(climate, GH_Path(1))
-toPHPP_Setup_.AddRange(airtightness, GH_Path(2))
-toPHPP_Setup_.AddRange(vent, GH_Path(3))
-toPHPP_Setup_.AddRange(per, GH_Path(4))
-toPHPP_Setup_.AddRange(mech, GH_Path(5))
-toPHPP_Setup_.AddRange(sumVent, GH_Path(6))
-toPHPP_Setup_.AddRange(dhwSystem, GH_Path(7))
\ No newline at end of file
+toPHPP_Setup_.Add(verification, GH_Path(0))
+toPHPP_Setup_.Add(climate, GH_Path(1))
+toPHPP_Setup_.Add(airtightness, GH_Path(2))
+toPHPP_Setup_.Add(vent, GH_Path(3))
+toPHPP_Setup_.Add(per, GH_Path(4))
+toPHPP_Setup_.Add(mech, GH_Path(5))
+toPHPP_Setup_.Add(sumVent, GH_Path(6))
+toPHPP_Setup_.Add(dhwSystem, GH_Path(7))
\ No newline at end of file
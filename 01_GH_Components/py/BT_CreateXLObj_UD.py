@@ -53,13 +53,13 @@ toPHPP_UD_ = DataTree[Object]()
 # Use Path 100 so that it always comes last. UD values should override anything else in the document.
 if len(_worksheetNames) == len(_rangeAddresses) and len(_worksheetNames) == len(_rangeValues):
     for i in range(len(_worksheetNames)):
-        toPHPP_UD_.Add( PHPP_XL_Obj(_worksheetNames[i],  _rangeAddresses[i], _rangeValues[i]), GH_Path(100) )
+        toPHPP_UD_.Add( PHPP_XL_Obj(_worksheetNames[i],  _rangeAddresses[i], _rangeValues[i], _source=ghenv.Component.NickName, _override=True), GH_Path(100) )
 elif len(_rangeValues) == len(_rangeAddresses) and len(_worksheetNames) > 0:
     for i in range(len(_rangeValues)):
-        toPHPP_UD_.Add( PHPP_XL_Obj(_worksheetNames[0],  _rangeAddresses[i], _rangeValues[i]), GH_Path(100) )
+        toPHPP_UD_.Add( PHPP_XL_Obj(_worksheetNames[0],  _rangeAddresses[i], _rangeValues[i], _source=ghenv.Component.NickName, _override=True), GH_Path(100) )
 else:
     msgError = "Mismatched list lengths.\nMake sure the same number of items is being input into all the input ports."
     ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, msgError)
 
 
-
+
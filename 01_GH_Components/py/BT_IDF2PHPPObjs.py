@@ -20,23 +20,25 @@
 # @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
 #
 """
-Takes in the IDF 'Objects' from the reader and organizes them for export to the PHPP. Gets all the relevant Materials, Constructions and Surfaces from the IDF file.
+Takes in the IDF 'Objects' from the reader and organizes them for export to the PHPP. Gets all the relevant Materials, Constructions and Surfaces from the IDF file. When the IDF is re-read, only the Surfaces, Windows, Materials and Constructions that changed (by Class and Name) are re-built. Everything else is re-used from the last run. Zones are always re-calculated.
 -
-EM October 10, 2020
+EM Oct. 18, 2026
 
     Args:
         _HBZones: <Optional> If connected, the component will try and read detailed 'Frame' and 'Glass' Object data for each window in building. If this isn't hooked up, the normal EP windows will be used to create PHPP-Style Window Components. 
         _IDF_Objs_List: Takes in a list if IDF objects. Connect to the 'IDF_Objs_List' output on the 'IDF Reader' Component
+        incremental_: (bool) Default=True. Set False to re-build every object from scratch each time.
     Returns:
         opaqueSurfaces: A List of the opaque surface IDF Objects found 
         windowObjects: A List of the window surface IDF Objects found
         zoneNames_: A List of the Zone names found
+        zoneParams_: A List of the ZoneParams (ZoneName, InfiltrationACH50, Volume_Vn50, TFA, Volume_Gross, FloorArea_Gross) for each Zone, in the same order as 'zoneNames_'. Only filled in when _HBZones are connected. To see it, add an output named 'zoneParams_' to the component.
         PHPPObjs_: DataTree of all the organized, setup PHPP objects to pass to the writer
 """
 
 ghenv.Component.Name = "BT_IDF2PHPPObjs"
 ghenv.Component.NickName = "IDF-->PHPP Objs"
-ghenv.Component.Message = 'OCT_10_2020'
+ghenv.Component.Message = 'OCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "BT"
 ghenv.Component.SubCategory = "02 | IDF2PHPP"
@@ -47,21 +49,22 @@ from Grasshopper.Kernel.Data import GH_Path
 import Grasshopper.Kernel as ghK
 import scriptcontext as sc
 from collections import namedtuple
-import ghpythonlib.components as ghc
 import math
-import copy
 from collections import defaultdict
-import rhinoscriptsyntax as rs
+import Rhino
 from collections import namedtuple
 
 # Classes and Defs
 preview=sc.sticky['Preview']
 phpp_calcNorthAngle=sc.sticky['phpp_calcNorthAngle']
 phpp_GetWindowSize=sc.sticky['phpp_GetWindowSize']
+phpp_polygonUnion2D=sc.sticky['phpp_polygonUnion2D']
+phpp_mergeTriangles=sc.sticky['phpp_mergeTriangles']
+phpp_calcZoneParams=sc.sticky['phpp_calcZoneParams']
 phpp_makeHBMaterial=sc.sticky['phpp_makeHBMaterial']
 phpp_makeHBConstruction=sc.sticky['phpp_makeHBConstruction']
 
-phpp_ClimateData = sc.sticky['phpp_ClimateData']
+phpp_ClimateStore = sc.sticky['phpp_ClimateStore']
 
 PHPP_XL_Obj=sc.sticky['PHPP_XL_Obj']
 PHPP_Glazing=sc.sticky['PHPP_Glazing']
@@ -81,13 +84,25 @@ IDF_Obj_Construction=sc.sticky['IDF_Obj_Construction']
 IDF_Obj_surfaceWindow=sc.sticky['IDF_Obj_surfaceWindow']
 IDF_Obj_surfaceOpaque=sc.sticky['IDF_Obj_surfaceOpaque']
 IDF_Obj_location = sc.sticky['IDF_Obj_location']
+IDF_Class = sc.sticky['IDF_Class']
+IDF_Model = sc.sticky['IDF_Model']
+IDF_BuildCache = sc.sticky['IDF_BuildCache']
+IDF_ZoneGeometryCache = sc.sticky['IDF_ZoneGeometryCache']
 
 hb_hive = sc.sticky["honeybee_Hive"]()
 HBZoneObjects = hb_hive.callFromHoneybeeHive(_HBZones)
 
-def parseIDFObjects(_IDF_Objs):
+def getComponentCache(_cacheClass):
+    # One cache of each type for each copy of this component on the canvas
+    cacheKey = '{}_{}'.format(_cacheClass.__name__, ghenv.Component.InstanceGuid)
+    if cacheKey not in sc.sticky:
+        sc.sticky[cacheKey] = _cacheClass()
+    
+    return sc.sticky[cacheKey]
+
+def parseIDFObjects(_idf, _cache):
     # Looks at the IDF Objects and parses them  out
-    # Builds class objects as appropriate
+    # Builds class objects as appropriate, re-using any unchanged ones from the cache
     zones = []
     zoneInfiltrationRates = []
     zonesList = []
@@ -100,63 +115,54 @@ def parseIDFObjects(_IDF_Objs):
     location = []
     
     # First, need to find the North Direction. Have to do that before the rest
-    for each in _IDF_Objs:
-    # Look at each of the IDF objects coming in....
-        try:
-            idfObjName = getattr(each, 'objName')
-        except:
-            idfObjName = ''
-        
-        if idfObjName == 'Building':
-            # If the IDF Obj is a 'Building'
-            # Create the Building Object and get the Project's North Angle Vector
-            bldg = IDF_Obj_building(each)
-            bldgNorthVec = bldg.NorthVector
-    
-    # Now go through and pull out each class object
-    for eachIDFobj in _IDF_Objs:
-        try:
-            idfObjName = getattr(eachIDFobj, 'objName')
-        except:
-            idfObjName = ''
-        
-        # If its an opaque Building Surface object
-        if 'BuildingSurface:Detailed' in idfObjName:
-            opaqueSurfaces.append(  IDF_Obj_surfaceOpaque(eachIDFobj, bldgNorthVec)  )
-        
-        # If its a 'Material' or 'Material:AirGap' object
-        elif idfObjName == 'Material:AirGap' or idfObjName == 'Material':
-            opaqueMaterials.append( IDF_Obj_MaterialLayer(eachIDFobj) )
-        
-        elif idfObjName == 'Material:NoMass':
-            opaqueMaterials.append( IDF_Obj_MaterialLayer(eachIDFobj, noMass=True) )
-        
-        # If its a simple EP Style Window Material
-        elif 'WindowMaterial:SimpleGlazingSystem' in idfObjName:
-            windowMaterialsSimple[eachIDFobj.Name] = IDF_Obj_MaterialWindowSimple(eachIDFobj)
-        
-        elif 'WindowMaterial:Gas' in idfObjName:
-            windowMaterialGas[eachIDFobj.Name]  = IDF_Obj_MaterialWindowGas( eachIDFobj )
-        
-        elif 'WindowMaterial:Glazing' in idfObjName:
-            windowMaterialGlazing[eachIDFobj.Name]  = IDF_Obj_MaterialWindowGlazing( eachIDFobj )
-        
-        elif 'Construction' in idfObjName:
-            allConstructions.append( IDF_Obj_Construction( eachIDFobj )  )
-        
-        elif idfObjName == 'Zone':
-            newObj = IDF_Zone( eachIDFobj )
-            zones.append( IDF_Zone( eachIDFobj ) )
-        
-        elif idfObjName == 'ZoneList':
-            zonesList.append( IDF_ZoneList( eachIDFobj ) )
-            
-        elif 'ZoneInfiltration:DesignFlowRate' in idfObjName:
-            zoneInfiltrationRates.append( IDF_ZoneInfilFlowRate( eachIDFobj  ) )
-        
-        elif 'Site:Location' in idfObjName:
-            location = eachIDFobj
-            
+    for each in _idf['Building']:
+        # Create the Building Object and get the Project's North Angle Vector
+        bldg = IDF_Obj_building(each)
+        bldgNorthVec = bldg.NorthVector
+    
+    # The surfaces all depend on the North direction as well
+    northSignature = (bldgNorthVec.X, bldgNorthVec.Y, bldgNorthVec.Z)
+    
+    # Now pull out each class object, straight from the model's Class index
+    # If its an opaque Building Surface object
+    for eachIDFobj in _idf.objectsOfClasses( _idf.classesContaining('BuildingSurface:Detailed') ):
+        opaqueSurfaces.append(  _cache.build(eachIDFobj, lambda obj: IDF_Obj_surfaceOpaque(obj, bldgNorthVec), northSignature)  )
+    
+    # If its a 'Material' or 'Material:AirGap' object
+    for eachIDFobj in _idf.objectsOfClasses( ['Material', 'Material:AirGap'] ):
+        opaqueMaterials.append( _cache.build(eachIDFobj, IDF_Obj_MaterialLayer) )
+    
+    for eachIDFobj in _idf['Material:NoMass']:
+        opaqueMaterials.append( _cache.build(eachIDFobj, lambda obj: IDF_Obj_MaterialLayer(obj, noMass=True)) )
+    
+    # If its a simple EP Style Window Material
+    for eachIDFobj in _idf.objectsOfClasses( _idf.classesContaining('WindowMaterial:SimpleGlazingSystem') ):
+        windowMaterialsSimple[eachIDFobj.Name] = _cache.build(eachIDFobj, IDF_Obj_MaterialWindowSimple)
+    
+    for eachIDFobj in _idf.objectsOfClasses( _idf.classesContaining('WindowMaterial:Gas') ):
+        windowMaterialGas[eachIDFobj.Name]  = _cache.build(eachIDFobj, IDF_Obj_MaterialWindowGas)
+    
+    for eachIDFobj in _idf.objectsOfClasses( _idf.classesContaining('WindowMaterial:Glazing') ):
+        windowMaterialGlazing[eachIDFobj.Name]  = _cache.build(eachIDFobj, IDF_Obj_MaterialWindowGlazing)
+    
+    for eachIDFobj in _idf.objectsOfClasses( _idf.classesContaining('Construction') ):
+        allConstructions.append( _cache.build(eachIDFobj, IDF_Obj_Construction) )
+    
+    # The Zone Objects get their ACH50, Volume and TFA set later on from all 
+    # the other objects, so they always get re-built
+    
+    for eachIDFobj in _idf['Zone']:
+        zones.append( IDF_Zone( eachIDFobj ) )
+    
+    for eachIDFobj in _idf['ZoneList']:
+        zonesList.append( IDF_ZoneList( eachIDFobj ) )
+    
+    for eachIDFobj in _idf.objectsOfClasses( _idf.classesContaining('ZoneInfiltration:DesignFlowRate') ):
+        zoneInfiltrationRates.append( IDF_ZoneInfilFlowRate( eachIDFobj  ) )
+    
+    for eachIDFobj in _idf.objectsOfClasses( _idf.classesContaining('Site:Location') ):
+        location = eachIDFobj
+    
     return opaqueSurfaces, opaqueMaterials, windowMaterialsSimple, windowMaterialGas, windowMaterialGlazing, allConstructions, zones, zoneInfiltrationRates, zonesList, location
 
 def materialWindowSimpleFromLayers(_const):
@@ -253,23 +259,14 @@ def getPHPPRooms(_HBZoneObjects):
         
     return HBZonePHPPRooms, HBZoneVentSystems
 
-def getIDFWindowObjects(_IDF_Objs, _windowConstructionsSimple, _windowMaterialsSimple):
+def getIDFWindowObjects(_idf, _windowConstructionsSimple, _windowMaterialsSimple, _cache):
     # Finds all  the widnow surfaces and builds window objects
     windowSurfaces = []
-    windowObjs_raw = []
     windowObjs_filtered = []
-    windowObjs_triangulated = {}
+    windowObjs_triangulated = defaultdict(list)
     
-    for eachIDFobj in _IDF_Objs:
-        try:
-            idfObjName = getattr(eachIDFobj, 'objName')
-            
-        except:
-            idfObjName = ''
-        
-        # If its an EP Window Object
-        if 'FenestrationSurface:Detailed' in idfObjName:
-            windowObjs_raw.append(eachIDFobj)
+    # All the EP Window Objects
+    windowObjs_raw = _idf.objectsOfClasses( _idf.classesContaining('FenestrationSurface:Detailed') )
     
     ##################################################
     # Fix for window triangulation
@@ -277,50 +274,26 @@ def getIDFWindowObjects(_IDF_Objs, _windowConstructionsSimple, _windowMaterialsS
         # Honeybee adds the code '..._glzP_0, ..._glzP_1, etc..' suffix to the name for its triangulated windows
         if '_glzP_' in windowObj.Name:
             # See if it has only 3 vertices as well just to double check
-            numOfVerts = 0
-            for key in windowObj.__dict__.keys():
-                if 'XYZ Vertex' in key:
-                    numOfVerts += 1
+            numOfVerts = len(windowObj.vertexPoints())
             if numOfVerts == 3:
                 # Ok, so its a triangulated window.
                 # File the triangulated window in the dictionary using its name as key
                 
                 tempWindowName = windowObj.Name.split('_glzP_')[0]
-                if tempWindowName not in windowObjs_triangulated.keys():
-                    windowObjs_triangulated[ tempWindowName ] = [windowObj]
-                else:
-                    windowObjs_triangulated[ tempWindowName ].append(windowObj)
+                windowObjs_triangulated[ tempWindowName ].append(windowObj)
             else:
                 windowObjs_filtered.append(windowObj)
         else:
             windowObjs_filtered.append(windowObj)
 
-    # Unite the triangulated objects
-    for key in windowObjs_triangulated.keys():
-        perims = []
-        for windowObj in windowObjs_triangulated[key]:
-            triangleVerts = []
-            # Get the verts
-            for key in windowObj.__dict__.keys():
-                if 'XYZ Vertex' in key:
-                    verts = getattr(windowObj, key).split(' ')
-                    verts = [float(x) for x in verts]
-                    point = ghc.ConstructPoint(verts[0], verts[1], verts[2])
-                    triangleVerts.append( point )
-            
-            # Union the Segments, find the outside perimeter
-            perim = ghc.PolyLine(triangleVerts, closed=True)
-            perims.append(perim)
-        
-        unionedPerim = ghc.RegionUnion(perims)
+    # Unite the triangulated objects back into a single window, using the edges they share
+    for windowName, triangleObjs in windowObjs_triangulated.items():
+        newVerts = phpp_mergeTriangles( [windowObj.vertices for windowObj in triangleObjs] )
         
         # Build a new Window Obj using this now unioned geometry
-        newVertPoints = ghc.ControlPoints(unionedPerim).points #windowObj.__dict__
-        newWindowObj = copy.deepcopy(windowObj)
-        
-        for i in range(len(newVertPoints)):
-            setattr(newWindowObj, 'XYZ Vertex {} {}'.format(i+1, '{m}'), str(newVertPoints[i]).replace(',',' '))
-            setattr(newWindowObj, 'Name', windowObj.Name[:-7])
+        windowObj = triangleObjs[0]
+        newWindowObj = IDF_Class(windowObj.objName, list(windowObj.values), newVerts, windowObj.schema)
+        newWindowObj.setField('Name', windowName)
         
         windowObjs_filtered.append(newWindowObj)
     
@@ -335,41 +308,93 @@ def getIDFWindowObjects(_IDF_Objs, _windowConstructionsSimple, _windowMaterialsS
             winterShadingFactor = None
             summerShadingFactor = None
             
-            # Create the new IDF_Obj_surfaceWindow Object
-            windowSurfaces.append( IDF_Obj_surfaceWindow(eachWindowObj, thisWindowEP_WinSimp_Obj, winterShadingFactor, summerShadingFactor) )
+            # Create the new IDF_Obj_surfaceWindow Object, or re-use the last one if neither
+            # the window nor its glazing material have changed
+            windowSurfaces.append( _cache.build(eachWindowObj,
+                    lambda obj: IDF_Obj_surfaceWindow(obj, thisWindowEP_WinSimp_Obj, winterShadingFactor, summerShadingFactor),
+                    thisWindowEP_WinSimp_Obj.Name, thisWindowEP_WinSimp_Obj.uValue, thisWindowEP_WinSimp_Obj.gValue) )
     
     return windowSurfaces
 
+def buildHostSurfaceIndex(_zoneObjs):
+    # Index of every HB Zone surface name --> the HB Zone(s) it belongs to
+    srfcIndex = defaultdict(list)
+    for zone in _zoneObjs:
+        for surface in zone.surfaces:
+            if zone not in srfcIndex[surface.name]:
+                srfcIndex[surface.name].append(zone)
+    
+    return srfcIndex
+
+def findHostZones(_hostSrfcName, _srfcIndex, _fallbackMatches):
+    # Look up the window's host surface name directly first. If that doesn't work, fall
+    # back to any HB surface names found inside the IDF host name (the old substring test)
+    # Only do the fallback search once for each host name
+    hostZones = _srfcIndex.get(_hostSrfcName)
+    if hostZones:
+        return hostZones
+    
+    if _hostSrfcName not in _fallbackMatches:
+        hostZones = []
+        for srfcName, zones in _srfcIndex.items():
+            if srfcName in _hostSrfcName:
+                hostZones.extend( zone for zone in zones if zone not in hostZones )
+        _fallbackMatches[_hostSrfcName] = hostZones
+    
+    return _fallbackMatches[_hostSrfcName]
+
 def updatePHPPStyleWindows(_zoneObjs, _IDFwindowSurfaces):
     # Used to update / overwrite the IDF window Params with the more detailed
     # Params from the HB Zone 'phppWindowDict' <if they exist>
+    # Finds each window's host zone using an index of all the HB Zone surface names
+    
+    srfcIndex = buildHostSurfaceIndex(_zoneObjs)
+    fallbackMatches = {}
+    windowsMissingHost = []
+    windowsAmbiguousHost = []
     
     for IDFwindowObj in _IDFwindowSurfaces:
         # Find the IDFWindow's host zone
-        for zone in _zoneObjs:
-            for surface in zone.surfaces:
-                if surface.name in IDFwindowObj.HostSrfc:
-                    # Found the window's host zone
-                    try:
-                        #print 'Updating IDFWindow Object: <{}> with Params from HB Zone'.format(IDFwindowObj.Name)
-                        # Get the HB Zone's detailed PHPP Style Window Data
-                        phppWindowObj = zone.phppWindowDict[ IDFwindowObj.Name ]
-                        
-                        # Re-set the IDF-Window Obj's param data with the detailed HB Data
-                        setattr(IDFwindowObj, 'Type_Variant', phppWindowObj.Type_Variant)
-                        setattr(IDFwindowObj, 'Type_Frame', phppWindowObj.Type_Frame)
-                        setattr(IDFwindowObj, 'Type_Glass', phppWindowObj.Type_Glass)
-                        setattr(IDFwindowObj, 'Installs', phppWindowObj.Installs)
-                        
-                        shadingDims = phppWindowObj.getShadingDims_Simple()
-                        if shadingDims: IDFwindowObj.setShadingDims_Simple(shadingDims)
-                        
-                        winter, summer = phppWindowObj.getShadingFactors()
-                        if winter: setattr(IDFwindowObj, 'winterShadingFac', winter)
-                        if summer: setattr(IDFwindowObj, 'summerShadingFac', summer)
-                    except:
-                        pass
-                    break
+        hostZones = findHostZones(IDFwindowObj.HostSrfc, srfcIndex, fallbackMatches)
+        if not hostZones:
+            windowsMissingHost.append(IDFwindowObj.Name)
+            continue
+        
+        # Get the HB Zone's detailed PHPP Style Window Data, if there is any
+        zonesWithWindow = [zone for zone in hostZones if IDFwindowObj.Name in getattr(zone, 'phppWindowDict', {})]
+        if not zonesWithWindow:
+            continue
+        
+        if len(hostZones) > 1:
+            windowsAmbiguousHost.append( '{} ({})'.format(IDFwindowObj.Name, ', '.join(zone.name for zone in hostZones)) )
+        
+        phppWindowObj = zonesWithWindow[0].phppWindowDict[ IDFwindowObj.Name ]
+        
+        try:
+            # Re-set the IDF-Window Obj's param data with the detailed HB Data
+            setattr(IDFwindowObj, 'Type_Variant', phppWindowObj.Type_Variant)
+            setattr(IDFwindowObj, 'Type_Frame', phppWindowObj.Type_Frame)
+            setattr(IDFwindowObj, 'Type_Glass', phppWindowObj.Type_Glass)
+            setattr(IDFwindowObj, 'Installs', phppWindowObj.Installs)
+            
+            shadingDims = phppWindowObj.getShadingDims_Simple()
+            if shadingDims: IDFwindowObj.setShadingDims_Simple(shadingDims)
+            
+            winter, summer = phppWindowObj.getShadingFactors()
+            if winter: setattr(IDFwindowObj, 'winterShadingFac', winter)
+            if summer: setattr(IDFwindowObj, 'summerShadingFac', summer)
+        except Exception as e:
+            print 'Error updating IDFWindow Object: <{}> with Params from HB Zone: {}'.format(IDFwindowObj.Name, e)
+    
+    if windowsMissingHost:
+        warning = 'Could not find the host HB Zone for {} window(s). These will use the\n'\
+        'simple EnergyPlus window data:\n  {}'.format(len(windowsMissingHost), '\n  '.join(windowsMissingHost))
+        ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, warning)
+    
+    if windowsAmbiguousHost:
+        warning = 'Found more than one possible host HB Zone for {} window(s). Used the\n'\
+        'first zone found for each:\n  {}'.format(len(windowsAmbiguousHost), '\n  '.join(windowsAmbiguousHost))
+        ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, warning)
 
 def filterSurfaces(_surfaces):
     # Filter to only include the surface if its 'exposed' to the outdoors or Ground (not an interior floor / wall)
@@ -382,101 +407,30 @@ def filterSurfaces(_surfaces):
         
     return exposedSurfaces
 
-def buildZoneBrep(_zoneObjs, _opaqueSurfaces):
-    # Takes in the IDF Surfaces and builds Zone Breps from them
-    # Sets the ZoneObj as an attr using the new Brep
+def buildZoneBrep(_zoneObjs, _zoneGeom):
+    # Gets the Zone Breps built from the IDF Surfaces
+    # Sets the ZoneObj as an attr using the Brep
     
     zoneBreps = []
     
-    for zone in _zoneObjs:    
-        zoneSurfaces = []
-        for srfc in _opaqueSurfaces:
-            if srfc.HostZoneName == zone.ZoneName:
-                zoneSurfaces.append( ghc.BoundarySurfaces(srfc.Boundary) )
-        zoneBrep = ghc.BrepJoin( zoneSurfaces ).breps
+    for zone in _zoneObjs:
+        zoneBrep = _zoneGeom.brep(zone.ZoneName)
         zoneBreps.append( zoneBrep )
         setattr(zone, 'ZoneBrep', zoneBrep)
     
     return zoneBreps
 
-def calcZoneParams(_zonesList, _zoneObjs, _opaqueSurfaces, _rooms, _HBZoneObjs):
-    # Looks at the ZoneList, and for each Zone in the List
-    # Finds the Floor Area, the exposed Surface Area (Outdoors) and the Zone Volume
-    # And the right Infiltration Rate. Calcs the total Infiltration Rate in m3/h for each Zone
-    # Sets Zone Attributes for ACH, Volume, Floor Area
-    
-    blowerPressure = 50 #Pa - for calc'ing the tested/input ACH
-    
-    # Get the Infiltration Rate, Volume, Floor Area from the IDF File
-    for zoneList in _zonesList:
-        for zoneInfilObj in zoneInfiltrationRates:
-            if zoneInfilObj.ZoneName == zoneList.Name:
-                # Use this InfilObj's params...
-                # So now for each actual ZONE name in the Zone List...
-                for eachKey in zoneList.__dict__.keys():
-                    if eachKey != 'Name': # Cus' this key is only the name of the ZoneList Object
-                        zoneNameinList = getattr(zoneList, eachKey)
-                        for zoneObj in _zoneObjs:
-                            if zoneObj.ZoneName == zoneNameinList:
-                                # Find the HB Zone Obj
-                                for HBzone in _HBZoneObjs:
-                                    if HBzone.name == zoneObj.ZoneName:
-                                        thisHBZone = HBzone
-                                
-                                # Ok, found the right Zone Obj. Get the Reference Values
-                                # Find the PHPProom Volumes for the zone
-                                roomVn50s = []
-                                for room in _rooms:
-                                    if room.HostZoneName == zoneObj.ZoneName:
-                                        roomVn50s.append(room.RoomNetClearVolume)
-                                
-                                # Get the Gross Exposed Surface Area of the Zone
-                                zoneExposedFacadeArea = thisHBZone.getExposedArea()
-                                
-                                # The Gross Reference Floor area to use for calcs
-                                zoneRefFloorArea = thisHBZone.getFloorArea()
-                                
-                                # Zone Volume, but use Room Vn50s if there are any
-                                zoneRefVolume = thisHBZone.getZoneVolume()
-                                if len(roomVn50s) != 0:
-                                    zoneRefVolume = sum(roomVn50s)
-                                
-                                # Calc the Infiltration Rate by Floor Area or by Facade Area
-                                try:
-                                    infilRatebyFloor = float( getattr(zoneInfilObj, 'FlowRatePerFloorArea') )# m3/s-m2
-                                    infilRatebyFacadeArea = 0
-                                    zoneInfilRate = infilRatebyFloor * zoneRefFloorArea * 60 * 60 # sec/min * min/hour
-                                    zoneACH50 = ((math.pow((blowerPressure/4),0.63)) * zoneInfilRate ) / zoneRefVolume
-                                except:
-                                    try:
-                                        infilRatebyFloor = 0
-                                        infilRatebyFacadeArea = float( getattr(zoneInfilObj, 'FlowRatePerSurfaceArea') )# m3/s-m2
-                                        zoneInfilRate = infilRatebyFacadeArea * zoneExposedFacadeArea * 60 * 60
-                                        zoneACH50 = ((math.pow((blowerPressure/4),0.63)) * zoneInfilRate ) / zoneRefVolume
-                                    except:
-                                        print 'something went wrong. Maybe no Infiltration rate applied?'
-                                
-                                # Set the attributes on the Zone Objects
-                                setattr(zoneObj, 'InfiltrationACH50', zoneACH50)
-                                setattr(zoneObj, 'Volume_Gross', zoneRefVolume)
-                                setattr(zoneObj, 'FloorArea_Gross', zoneRefFloorArea)
-                                setattr(zoneObj, 'Volume_Vn50', zoneRefVolume)
-                                setattr(zoneObj, 'TFA', zoneRefFloorArea)
-                                
-    
-    # Try and get the room Vn50 and TFA from the PHPP_Roooms in the HB Zone
-    for zone in _zoneObjs:
-        zoneTFAs = []
-        zoneVn50s = []
-        
-        for room in _rooms:
-            if room.HostZoneName == zone.ZoneName:
-                zoneTFAs.append( room.FloorArea_TFA )
-                zoneVn50s.append( room.RoomNetClearVolume )
-        
-        if zoneTFAs and zoneVn50s:
-            setattr(zone, 'TFA', sum(zoneTFAs) )
-            setattr(zone, 'Volume_Vn50', sum(zoneVn50s) )
+def hbZoneQuantities(_zoneObjs, _HBZoneObjs):
+    # Returns a dict of Zone Name --> the HB Zone's (Exposed Area, Floor Area, Volume)
+    # for each IDF Zone which has an HB Zone
+    zoneNames = set( zone.ZoneName for zone in _zoneObjs )
+    
+    quantities = {}
+    for hbZone in _HBZoneObjs:
+        if hbZone.name in zoneNames and hbZone.name not in quantities:
+            quantities[hbZone.name] = (hbZone.getExposedArea(), hbZone.getFloorArea(), hbZone.getZoneVolume())
+    
+    return quantities
 
 def getDHWSys(_zoneObjs):
     dhwSystems = defaultdict()
@@ -504,28 +458,14 @@ def getGround(_zoneObjs):
     
     return groundObjs
 
-def findNearestPHPPclimateZone(_lat, _long, _climateData):
+def findNearestPHPPclimateZone(_lat, _long, _climateIndex):
     """ Finds the nearest PHPP Climate zone to the EPW Lat /Long 
     
     Methodology copied from the PHPP v 9.6a (SI) Climate worksheet
     """
-    def sortByDist(e):
-        return e['distToEPW']
-    
-    for each in _climateData:
-        eachLat = float(each.get('Latitude', 0))
-        eachLong = float(each.get('Longitude', 0))
-        
-        a = math.sin(math.pi/180*eachLat)*math.sin(math.pi/180*_lat)+math.cos(math.pi/180*eachLat)*math.cos(math.pi/180*_lat)*math.cos(math.pi/180*(eachLong-_long))
-        b = max([-1, a])
-        c = min([1, b])
-        d = math.acos(c)
-        kmFromEPWLocation = 6378 * d
-        
-        each['distToEPW'] = kmFromEPWLocation
     
-    _climateData.sort(key=sortByDist)
-    climateSetToUse = _climateData[0]
+    nearest = _climateIndex.nearest(_lat, _long, k=1)
+    climateSetToUse = nearest[0].Data if nearest else {}
     
     dataSet = climateSetToUse.get('Dataset', 'US0055b-New York')
     alt = '=J23'
@@ -562,41 +502,39 @@ def get_phpp_lighting(_zones):
     
     return lighting
 
-def calcFootprint(_zoneObjs, _opaqueSurfaces):
+def calcFootprint(_zoneObjs, _zoneGeom):
     # Finds the 'footprint' of the building for 'Primary Energy Renewable' reference
-    # 1) Re-build the zone Breps
-    # 2) Join all the zone Breps into a single brep
-    # 3) Find the 'box' for the single joined brep
-    # 4) Find the lowest Z points on the box, offset another 10 units 'down'
-    # 5) Make a new Plane at this new location
-    # 6) Projects the brep onto the new Plane
+    # 1) Get the Floor, Roof and Ceiling surfaces of all the Zones
+    # 2) Flatten them onto the ground (just drop the Z)
+    # 3) Find the area and outline of their 2D union
+    # 4) Build the footprint surface from the outline, at the lowest Z
     
     #-----
-    zoneBreps = []
-    for zone in _zoneObjs:    
-        zoneSurfaces = []
-        for srfc in _opaqueSurfaces:
-            if srfc.HostZoneName == zone.ZoneName:
-                zoneSurfaces.append( ghc.BoundarySurfaces(srfc.Boundary) )
-        zoneBrep = ghc.BrepJoin( zoneSurfaces ).breps
-        zoneBreps.append( zoneBrep )
-    
-    bldg_mass = ghc.SolidUnion(zoneBreps)
+    polygons = []
+    zValues = []
+    for zone in _zoneObjs:
+        for srfc in _zoneGeom.surfaces(zone.ZoneName):
+            if srfc.srfcType in ('Floor', 'Roof', 'Ceiling'):
+                polygons.append( zip(srfc.Vertices[0::3], srfc.Vertices[1::3]) )
+                zValues.extend( srfc.Vertices[2::3] )
     
-    if bldg_mass == None:
+    if not polygons:
         return None
     
-    #------- Find Corners, Find 'bottom' (lowest Z)
-    bldg_mass_corners = [v for v in ghc.BoxCorners(bldg_mass)]
-    bldg_mass_corners.sort(reverse=False, key=lambda point3D: point3D.Z)
-    rect_pts = bldg_mass_corners[0:3]
+    footprint2D = phpp_polygonUnion2D(polygons)
     
-    #------- Project Brep to Footprint
-    projection_plane1 = ghc.Plane3Pt(rect_pts[0], rect_pts[1], rect_pts[2])
-    projection_plane2 = ghc.Move(projection_plane1, ghc.UnitZ(-10)).geometry
-    matrix = rs.XformPlanarProjection(projection_plane2)
-    footprint_srfc = rs.TransformObjects (bldg_mass, matrix, copy=True)
-    footprint_area = rs.Area(footprint_srfc)
+    if footprint2D.Area == 0:
+        return None
+    
+    #------- Build the outline and surface at the bottom of the building
+    z = min(zValues)
+    tolerance = Rhino.RhinoDoc.ActiveDoc.ModelAbsoluteTolerance
+    outlineSegments = [Rhino.Geometry.LineCurve(Rhino.Geometry.Point3d(x1, y1, z), Rhino.Geometry.Point3d(x2, y2, z))
+                        for x1, y1, x2, y2 in footprint2D.Outline]
+    outlines = Rhino.Geometry.Curve.JoinCurves(outlineSegments, tolerance)
+    footprint_srfc = Rhino.Geometry.Brep.CreatePlanarBreps(outlines, tolerance)
+    footprint_srfc = list(footprint_srfc) if footprint_srfc else list(outlines)
+    footprint_area = footprint2D.Area
     
     #------- Output
     Footprint = namedtuple('Footprint', ['Footprint_surface', 'Footprint_area'])
@@ -608,6 +546,20 @@ def calcFootprint(_zoneObjs, _opaqueSurfaces):
 #-------------------------------------------------------------------------------
 ##### Read the IDF Objects and Build class objects  ##########
 
+# The Class / Name indexed model of the IDF Objects. Built once, when the file was read
+idf = IDF_Model.fromObjects(_IDF_Objs_List)
+
+# The objects built last time, to re-use any that haven't changed
+try:
+    incremental = incremental_ is not False
+except NameError:
+    incremental = True
+
+buildCache = getComponentCache(IDF_BuildCache)
+if not incremental:
+    buildCache.clear()
+buildCache.startPass()
+
 # Get Material Layers, Constructions, Surfaces
 (opaqueSurfaces,
 opaqueMaterials,
@@ -618,7 +570,7 @@ allConstructions,
 zones,
 zoneInfiltrationRates,
 zonesList,
-location) = parseIDFObjects(_IDF_Objs_List)
+location) = parseIDFObjects(idf, buildCache)
 
 opaqueSurfaces_Exposed = filterSurfaces(opaqueSurfaces)
 
@@ -628,7 +580,10 @@ windowConstructionsSimple,
 windowMaterialsSimple) = filterConstructions(allConstructions, windowMaterialsSimple, windowMaterialGas, windowMaterialGlazing)
 
 # IDf Window Objects
-windowObjects = getIDFWindowObjects(_IDF_Objs_List, windowConstructionsSimple, windowMaterialsSimple)
+windowObjects = getIDFWindowObjects(idf, windowConstructionsSimple, windowMaterialsSimple, buildCache)
+
+buildCache.endPass()
+print('>>>Re-used {} unchanged objects, built {} new or changed objects.'.format(buildCache.numReused, buildCache.numBuilt))
 
 # Zone Rooms, Ventialtion from HB, Update windows to Detailed data from HB Zones
 if len(_HBZones)>0 and len(_IDF_Objs_List)>1:
@@ -636,9 +591,10 @@ if len(_HBZones)>0 and len(_IDF_Objs_List)>1:
     updatePHPPStyleWindows(HBZoneObjects, windowObjects)
     
     # Calc and  set Zone Attributes
-    buildZoneBrep(zones, opaqueSurfaces)  # Build the Zone Breps and add to Zone Objects
-    footprint = calcFootprint(zones, opaqueSurfaces)
-    calcZoneParams(zonesList, zones, opaqueSurfaces, HBZonePHPPRooms, HBZoneObjects)   # Determine Infiltation and add to Zone Objects
+    zoneGeom = getComponentCache(IDF_ZoneGeometryCache).update(opaqueSurfaces) # Group the surfaces by Zone, keep any unchanged Zone Breps
+    buildZoneBrep(zones, zoneGeom)  # Build the Zone Breps and add to Zone Objects
+    footprint = calcFootprint(zones, zoneGeom)
+    zoneParams = phpp_calcZoneParams(zonesList, zoneInfiltrationRates, zones, HBZonePHPPRooms, hbZoneQuantities(zones, HBZoneObjects))   # Determine Infiltation and add to Zone Objects
     dhwSystemObj = getDHWSys(HBZoneObjects)
     groundObjs = getGround(HBZoneObjects)
     elec_equip_appliances = get_appliances(HBZoneObjects)
@@ -650,16 +606,13 @@ else:
     elec_equip_appliances = []
     phpp_lighting = []
     footprint = []
+    zoneParams = {}
 
 # Figure out the Closest PHPP Climate Zone
-latitude = float(getattr(location, 'Latitude {deg}', 51.30))
-longitude = float(getattr(location, 'Longitude {deg}', 9.44))
-climate = findNearestPHPPclimateZone(latitude, longitude, phpp_ClimateData)
-    
 try:
     latitude = float(getattr(location, 'Latitude {deg}', 51.30))
     longitude = float(getattr(location, 'Longitude {deg}', 9.44))
-    climate = findNearestPHPPclimateZone(latitude, longitude, phpp_ClimateData)
+    climate = findNearestPHPPclimateZone(latitude, longitude, phpp_ClimateStore.index)
 except:
     print 'Error finding the nearest PHPP Climate Zone?'
     climate = []
@@ -693,4 +646,7 @@ PHPPObjs_.Add(footprint, GH_Path(15))
 # Output Preview of Zone Names
 zoneNames_ = []
 for zoneObj in PHPPObjs_.Branch(8):
-    zoneNames_.append(zoneObj.ZoneName)
\ No newline at end of file
+    zoneNames_.append(zoneObj.ZoneName)
+
+# Output the Zone Infiltration, Volume and Floor Area params
+zoneParams_ = [zoneParams[zoneName] for zoneName in zoneNames_ if zoneName in zoneParams]
\ No newline at end of file
@@ -20,12 +20,13 @@
 # @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
 #
 """
-Use this to Read and parse an IDF file (EnergyPlus). This will go thorugh the IDF and pull out all the 'Objects'. It finds the empty newlines in the .IDF to identify each 'new' object and create a new object for each using the standard '!-' marker to establish keys. Will create key/value for EACH key found. Can use the getattr() method for keys with spaces in the name
+Use this to Read and parse an IDF file (EnergyPlus). This will go thorugh the IDF and pull out all the 'Objects'. The file is read line by line in a single pass: each object ends at its ';'. Field values are stored by position, and named using a shared field list for each IDF Class (from the standard '!-' markers, if there are any. Without them, the surface vertices are found from each object's 'Number of Vertices' field, and any surface whose vertices don't add up is left out with a warning). Can use the getattr() method for field names with spaces in the name. The parsed objects are also saved to a '.idf2phpp_cache' folder next to the IDF so that if the file hasn't changed, the next read loads them straight from the cache instead. An EnergyPlus .epJSON file can be read as well: it gets loaded directly as JSON and turned into exactly the same IDF objects, skipping the text parsing entirely.
 -
-EM Mar. 26, 2020
+EM Oct. 18, 2026
 
     Args:
-        _idfFileAddress: Input the path/file location of the .IDF file used for the EnergyPlus simulation. Connect to the 'idfFileAddress' output from the Honeybee 'exportToOpenStudio' Component.
+        _idfFileAddress: Input the path/file location of the .IDF (or .epJSON) file used for the EnergyPlus simulation. Connect to the 'idfFileAddress' output from the Honeybee 'exportToOpenStudio' Component.
+        useCache_: (bool) Default=True. Set False to always re-read the IDF file and ignore any saved cache.
     Returns:
         IDF_Objs_List: A list of IDF-Objects found in the source file containing all their relevant parameters. Connect this to the '_IDF_Objs_List' input on the 'IDF-->PHPP' component in order to create PHPP writable objects from these.
         surfaces_: A text preview of all the Opaque surface objects found in the IDF along with all their parameters
@@ -38,44 +39,33 @@ EM Mar. 26, 2020
 
 ghenv.Component.Name = "BT_ReadIDFfile"
 ghenv.Component.NickName = "Read IDF File"
-ghenv.Component.Message = 'MAR_26_2020'
+ghenv.Component.Message = 'OCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "BT"
 ghenv.Component.SubCategory = "02 | IDF2PHPP"
 
-from System import Object
-from Grasshopper import DataTree
-from Grasshopper.Kernel.Data import GH_Path
-from shutil import copyfile
+import scriptcontext as sc
+import Grasshopper.Kernel as ghK
 import os
 
-class IDF_Class:
-    # A simple class to hold onto the IDF object data
-    
-    def __init__(self, _varName, *_initial_data):   
-        """Setting up the IDF Class Object and bringing in all its attributes
-        """
-        self.objName = _varName
-        for dictionary in _initial_data:
-            for key in dictionary:
-                if key != None and dictionary[key] != None:
-                    setattr(self, key, dictionary[key])
-    def __repr__(self):
-        return "An IDF File object with all its Params"
+# Classes and Defs
+IDF_Model = sc.sticky['IDF_Model']
+idf_objectStream = sc.sticky['idf_objectStream']
+idf_epJSONStream = sc.sticky['idf_epJSONStream']
+IDF_ParseCache = sc.sticky['IDF_ParseCache']
 
 def idfObjPreview(_obj):
     outputList = []
     
-    outputList.append(_obj.__dict__.get('objName') + '::')
-    for k, v in _obj.__dict__.items():
+    outputList.append(_obj.objName + '::')
+    for k, v in _obj.items():
         outputList.append(' > {}: {}'.format(k, v) )
     outputList.append('-------')
     
     return outputList
 
 # Clear out the temporary variables
-file = ''
-lines_clean = []
+IDF_Objs_List = []
 idfFilePath = None
 
 if _idfFileAddress:
@@ -86,61 +76,38 @@ elif resultFileAddress_:
     idfFilePath = os.path.join(outputDir, "in.idf")
 
 ##### Bring in the data from the IDF file
+try:
+    useCache = useCache_ is not False
+except NameError:
+    useCache = True
+
 if idfFilePath: 
-    # Make a copy of the IDF file as a text file
-    newFile = idfFilePath.replace('.idf', '.txt')
-    copyfile(idfFilePath, newFile)
-    
-    print('>>>Opening the file to read....')
-    
-    # Open file for reading
-    file = open(newFile, 'r')
+    cache = IDF_ParseCache(idfFilePath)
+    idf = cache.load() if useCache else None
     
-    # Read lines into variable called lines
-    lines = file.readlines()
-    
-    print('>>>Read the file successfully. Closing file.')
-    # Close the file
-    file.close()
-
-if file:
-    # Clean up the file a bit (get rid of the line breaks)
-    for line in lines:
-        if line != '\n': # get rid of the empty lines
-            newLine = line.strip() # Get ride of any newlines at end of str
-            newLineAsList = newLine.split('!- ') # Break into pieces
-            
-            # Get rid of all the extra white spaces, remove commas
-            newLineAsList_Clean = []
-            for each in newLineAsList:
-                each = each.replace(",", "")
-                each = each.replace(";", "")
-                each = each.rstrip()
-                newLineAsList_Clean.append( each )
-            
-            lines_clean.append(newLineAsList_Clean)
+    if idf is not None:
+        print('>>>Loaded {} objects from the IDF cache.'.format(len(idf)))
+    else:
+        print('>>>Reading the IDF file....')
+        
+        # Stream the file, building each IDF Class object as soon as its read
+        # and index them all by Class and Name in the IDF Model
+        if os.path.splitext(idfFilePath)[1].lower() == '.epjson':
+            idf = IDF_Model( idf_epJSONStream(idfFilePath) )
+        else:
+            idf = IDF_Model( idf_objectStream(idfFilePath) )
+        
+        print('>>>Read {} objects from the file successfully.'.format(len(idf)))
+        
+        if useCache:
+            cache.save(idf)
     
-    # Organize the date into Class blocks (break at each 'header')
-    tempTree = DataTree[Object]()
-    p = 0
-    # Go through the imported Data and create a new branch for each item
-    for i in range(len(lines_clean)):
-        if len(lines_clean[i]) == 1:
-            p += 1
-        tempTree.Add(lines_clean[i], GH_Path(p))
+    IDF_Objs_List = idf.objects
     
-    # Create all the IDF Class object blocks
-    IDF_Objs_List = []
-    for each in tempTree.Branches:
-        tempDict = {}
-        Name = ''
-        for eachListItem in each:
-            if len(eachListItem) == 1:
-                objName = eachListItem[0]
-            else:
-                tempDict[eachListItem[1]] = eachListItem[0]
-        
-        IDF_Objs_List.append(IDF_Class(objName, tempDict))
+    for warning in idf.warnings:
+        ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, warning)
+else:
+    idf = IDF_Model()
 
 # Output the preview items
 surfaces_ = []
@@ -148,14 +115,13 @@ fenestration_ = []
 constuctions_ = []
 materials_ = []
 
-if IDF_Objs_List != None:
-    for each in IDF_Objs_List:
-        if 'BuildingSurface' in each.__dict__.get('objName', None):
-            surfaces_ =  surfaces_ + idfObjPreview(each)
-        elif 'Fenestration' in each.__dict__.get('objName', None):
-            fenestration_ =  fenestration_ + idfObjPreview(each)
-        elif 'Construction' in each.__dict__.get('objName', None):
-            constuctions_ =  constuctions_ + idfObjPreview(each)
-        elif 'Material' in each.__dict__.get('objName', None):
-            materials_ =  materials_ + idfObjPreview(each)
-
+previewGroups = [
+        (surfaces_, idf.classesContaining('BuildingSurface')),
+        (fenestration_, [c for c in idf.classesContaining('Fenestration') if 'BuildingSurface' not in c]),
+        (constuctions_, [c for c in idf.classesContaining('Construction') if 'BuildingSurface' not in c and 'Fenestration' not in c]),
+        (materials_, [c for c in idf.classesContaining('Material') if 'BuildingSurface' not in c and 'Fenestration' not in c and 'Construction' not in c])
+        ]
+
+for previewList, classNames in previewGroups:
+    for each in idf.objectsOfClasses(classNames):
+        previewList.extend( idfObjPreview(each) )
@@ -70,14 +70,18 @@ import scriptcontext as sc
 PHPP_XL_Obj = sc.sticky['PHPP_XL_Obj'] 
 preview = sc.sticky['Preview']
 
+def variantObj(_shtNm, _rangeAddress, _val):
+    # The links to the 'Variants' worksheet win over any value written to the same cell by another component
+    return PHPP_XL_Obj(_shtNm, _rangeAddress, _val, _source=ghenv.Component.NickName, _override=True)
+
 variants_ = DataTree[Object]()
 
 paths = {'vent':1, 'uVals':6, 'air':0, 'tb':2, 'cert':3, 'win':4, 'per':5}
 
 if windows_:
     for i in range(24, 175):
-        variants_.Add(  PHPP_XL_Obj('Windows', 'T{}'.format(i), '=G{}'.format(i) ), GH_Path( paths['win'] )  )
-        variants_.Add(  PHPP_XL_Obj('Windows', 'U{}'.format(i), '=H{}'.format(i) ), GH_Path( paths['win'] )  )
+        variants_.Add(  variantObj('Windows', 'T{}'.format(i), '=G{}'.format(i) ), GH_Path( paths['win'] )  )
+        variants_.Add(  variantObj('Windows', 'U{}'.format(i), '=H{}'.format(i) ), GH_Path( paths['win'] )  )
 
 if uValues_:
     for i in range(0, 10):
@@ -85,26 +89,26 @@ if uValues_:
         row_Variant = 410+i*2
         row_Compo = 15+i
         
-        variants_.Add(  PHPP_XL_Obj('U-Values', 'M'+str(row_Uval), '=F'+str(row_Uval) ), GH_Path(paths['uVals'])  )
-        variants_.Add(  PHPP_XL_Obj('U-Values', 'S'+str(row_Uval), '=G'+str(row_Uval) ), GH_Path(paths['uVals'])  )
-        variants_.Add(  PHPP_XL_Obj('Variants', 'B'+str(row_Variant), '=Components!D'+str(row_Compo) ), GH_Path(paths['uVals'])  )
+        variants_.Add(  variantObj('U-Values', 'M'+str(row_Uval), '=F'+str(row_Uval) ), GH_Path(paths['uVals'])  )
+        variants_.Add(  variantObj('U-Values', 'S'+str(row_Uval), '=G'+str(row_Uval) ), GH_Path(paths['uVals'])  )
+        variants_.Add(  variantObj('Variants', 'B'+str(row_Variant), '=Components!D'+str(row_Compo) ), GH_Path(paths['uVals'])  )
 
 if airtightness_:
-    variants_.Add(  PHPP_XL_Obj('Ventilation', 'N27', '=D27' ), GH_Path( paths['air'] )  )
+    variants_.Add(  variantObj('Ventilation', 'N27', '=D27' ), GH_Path( paths['air'] )  )
 
 if len(ventilation_)==1:
-    variants_.Add(  PHPP_XL_Obj('Ventilation', 'L12', '=D12' ), GH_Path(100)  )
-    variants_.Add(  PHPP_XL_Obj('Additional Vent', 'F97', '=Variants!D856' ), GH_Path(paths['vent'])  )
-    variants_.Add(  PHPP_XL_Obj('Additional Vent', 'H127', '=Variants!D858' ), GH_Path(paths['vent'])  )
-    variants_.Add(  PHPP_XL_Obj('Additional Vent', 'H128', '=Variants!D858' ), GH_Path(paths['vent'])  )
-    variants_.Add(  PHPP_XL_Obj('Additional Vent', 'L127', '=Variants!D857' ), GH_Path(paths['vent'])  )
-    variants_.Add(  PHPP_XL_Obj('Additional Vent', 'L128', '=Variants!D857' ), GH_Path(paths['vent'])  )
+    variants_.Add(  variantObj('Ventilation', 'L12', '=D12' ), GH_Path(100)  )
+    variants_.Add(  variantObj('Additional Vent', 'F97', '=Variants!D856' ), GH_Path(paths['vent'])  )
+    variants_.Add(  variantObj('Additional Vent', 'H127', '=Variants!D858' ), GH_Path(paths['vent'])  )
+    variants_.Add(  variantObj('Additional Vent', 'H128', '=Variants!D858' ), GH_Path(paths['vent'])  )
+    variants_.Add(  variantObj('Additional Vent', 'L127', '=Variants!D857' ), GH_Path(paths['vent'])  )
+    variants_.Add(  variantObj('Additional Vent', 'L128', '=Variants!D857' ), GH_Path(paths['vent'])  )
 elif len(ventilation_)==5:
-    variants_.Add(  PHPP_XL_Obj('Ventilation', 'L12', '=D12' ), GH_Path(100)  )
+    variants_.Add(  variantObj('Ventilation', 'L12', '=D12' ), GH_Path(100)  )
     for each in ventilation_:
         first, reference = each.split('=')
         wrksht, rng = first.split('!')
-        variants_.Add(  PHPP_XL_Obj(wrksht, rng, '='+reference ), GH_Path(paths['vent'])  )
+        variants_.Add(  variantObj(wrksht, rng, '='+reference ), GH_Path(paths['vent'])  )
 elif len(ventilation_)!=0:
     msg1 = "Error. ventialtion_ input not understood? Either input TRUE to use the defaults\n"\
     "or input multiline line string with the excel formula to write? Multine string format should look like:\n"\
@@ -117,18 +121,18 @@ elif len(ventilation_)!=0:
     ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, msg1)
 
 if thermalBridges_:
-    variants_.Add(  PHPP_XL_Obj('Areas', 'R145', '=Variants!D933' ), GH_Path(paths['tb'])  )
+    variants_.Add(  variantObj('Areas', 'R145', '=Variants!D933' ), GH_Path(paths['tb'])  )
 
 if certification_:
-    variants_.Add(  PHPP_XL_Obj('Verification', 'R78', '=Variants!D927' ), GH_Path(paths['cert'])  )
-    variants_.Add(  PHPP_XL_Obj('Verification', 'R80', '=Variants!D928' ), GH_Path(paths['cert'])  )
-    variants_.Add(  PHPP_XL_Obj('Verification', 'R82', '=Variants!D929' ), GH_Path(paths['cert'])  )
-    variants_.Add(  PHPP_XL_Obj('Verification', 'R85', '=Variants!D930' ), GH_Path(paths['cert'])  )
-    variants_.Add(  PHPP_XL_Obj('Verification', 'R87', '=Variants!D931' ), GH_Path(paths['cert'])  )
+    variants_.Add(  variantObj('Verification', 'R78', '=Variants!D927' ), GH_Path(paths['cert'])  )
+    variants_.Add(  variantObj('Verification', 'R80', '=Variants!D928' ), GH_Path(paths['cert'])  )
+    variants_.Add(  variantObj('Verification', 'R82', '=Variants!D929' ), GH_Path(paths['cert'])  )
+    variants_.Add(  variantObj('Verification', 'R85', '=Variants!D930' ), GH_Path(paths['cert'])  )
+    variants_.Add(  variantObj('Verification', 'R87', '=Variants!D931' ), GH_Path(paths['cert'])  )
     
 if primaryEnergy_:
-    variants_.Add(  PHPP_XL_Obj('PER', 'P10', '=H10' ), GH_Path(paths['per'])  )
-    variants_.Add(  PHPP_XL_Obj('PER', 'P12', '=H12' ), GH_Path(paths['per'])  )
-    variants_.Add(  PHPP_XL_Obj('PER', 'S10', '=I10' ), GH_Path(paths['per'])  )
-    variants_.Add(  PHPP_XL_Obj('PER', 'T10', '=J10' ), GH_Path(paths['per'])  )
-
+    variants_.Add(  variantObj('PER', 'P10', '=H10' ), GH_Path(paths['per'])  )
+    variants_.Add(  variantObj('PER', 'P12', '=H12' ), GH_Path(paths['per'])  )
+    variants_.Add(  variantObj('PER', 'S10', '=I10' ), GH_Path(paths['per'])  )
+    variants_.Add(  variantObj('PER', 'T10', '=J10' ), GH_Path(paths['per'])  )
+
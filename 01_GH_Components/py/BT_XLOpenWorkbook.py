@@ -29,7 +29,7 @@ Original component by Jack Hymowitz, Pinnacle Scholar Summer Research Student, S
 Updated October 24, 2020
 
     Args:
-        _run: Set to true to enable the excel application, false saves the open sheet and stops the application
+        _run: Set to true to enable the excel application, false saves the open sheet and stops the application. While a background export (runAsync_ on 'Write XL Workbook') is writing, Excel is left as it is until the export is done.
         visible_: Set to true to show the Excel application on the screen. Default true.
         useUserWorkbook_: Set to true to look for and use an open excel interface instead of starting a new one. For now, should not be used (set to false or disconnected)
         _oldFilename: The full file path to the source file
@@ -62,6 +62,10 @@ from shutil import copyfile
 import Grasshopper.Kernel as ghK
 import inspect
 
+# Classes and Defs
+PHPP_XL_WriteBaseline = sc.sticky['PHPP_XL_WriteBaseline']
+PHPP_XL_InstanceLock = sc.sticky['PHPP_XL_InstanceLock']
+
 
 class ExcelInstance:
     """A holder for the methods we use to interact with the Excel COM interface"""
@@ -208,15 +212,20 @@ class MyComponent(component):
     def StopExcel(self):
         
         if "excel" in sc.sticky:
-            print("Quitting")
             excel=sc.sticky["excel"]
             
-            try:
-                excel.saveAndQuit(False)
-            except:
-                pass
-            
-            del sc.sticky["excel"]
+            with PHPP_XL_InstanceLock.hold(excel) as holding:
+                if not holding:
+                    ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, PHPP_XL_InstanceLock.busyMessage)
+                    return
+                
+                print("Quitting")
+                try:
+                    excel.saveAndQuit(False)
+                except:
+                    pass
+                
+                del sc.sticky["excel"]
     
     def doCopy(self, oldFilename, newDirectory, newFilename):
         
@@ -238,6 +247,10 @@ class MyComponent(component):
         
         try:
             copyfile(src, dest)
+            
+            # A fresh copy, so any write baseline left from an old file with this name is out of date
+            if os.path.exists(dest + PHPP_XL_WriteBaseline.fileSuffix):
+                os.remove(dest + PHPP_XL_WriteBaseline.fileSuffix)
         except:
             msg1 = "Unable to copy file? Sorry, check file paths and filenames are correct? No stray spaces or returns?"
             ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, msg1)
@@ -253,8 +266,8 @@ class MyComponent(component):
         filename = self.doCopy(oldFilename, newDirectory, newFilename)
         
         if excel.openWorkbook(filename): #If we need to open a new sheet, set it up
-            if "XLSdata" in sc.sticky: 
-                del sc.sticky["XLSdata"]
+            if "XLSbaseline" in sc.sticky: 
+                del sc.sticky["XLSbaseline"]
             excel.loadSheets()
         
         return True
@@ -271,6 +284,15 @@ class MyComponent(component):
         if excel==None:
             return None
         
+        with PHPP_XL_InstanceLock.hold(excel) as holding:
+            if not holding:
+                ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, PHPP_XL_InstanceLock.busyMessage)
+                return excel
+            
+            return self.SetupExcel(excel, visible, useUserWorkbook, oldFilename, newDirectory, newFilename)
+    
+    def SetupExcel(self, excel, visible, useUserWorkbook, oldFilename, newDirectory, newFilename):
+        
         if not useUserWorkbook:
             if visible==None:
                 visible=True
@@ -26,7 +26,7 @@ To configure this module, provide three comma separated lists of the same length
 Component by Jack Hymowitz, August 29, 2020
 
     Args:
-        excel: A running excel instance
+        excel: A running excel instance. Nothing is read while a background export (runAsync_ on 'Write XL Workbook') is still writing to it.
         sheets: A comma separated list of the worksheet to read from for each output.
         fields: A comma separated list of the cells to read for each output
         labels: A comma separated list of what to  label each read cell
@@ -51,6 +51,9 @@ import scriptcontext as sc
 import Grasshopper.Kernel as ghK
 from math import floor,log10
 
+# Classes and Defs
+PHPP_XL_InstanceLock = sc.sticky['PHPP_XL_InstanceLock']
+
 class MyComponent(component):
     def doRead(self, excel, sheets, fields, labels):
         if sheets:
@@ -102,7 +105,11 @@ class MyComponent(component):
         return (data,text)
     def RunScript(self, excel, sheets, fields, labels):
         if excel and excel.activeWorkbook and excel.sheetsDict:
-            return self.doRead(excel,sheets,fields,labels)
+            with PHPP_XL_InstanceLock.hold(excel) as holding:
+                if not holding:
+                    ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, PHPP_XL_InstanceLock.busyMessage)
+                    return (None,None)
+                return self.doRead(excel,sheets,fields,labels)
         msg1 = "No Excel Instance!"
         ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, msg1)
         return (None,None)
@@ -26,7 +26,7 @@ Component by Jack Hymowitz, August 29, 2020
 
     Args:
         save: Set to true to save the workbook
-        excel: The excel instance
+        excel: The excel instance. It isn't saved while a background export (runAsync_ on 'Write XL Workbook') is still writing to it.
     Returns:
         excel: The excel instance after the component runs
 """
@@ -45,14 +45,21 @@ import System
 import Rhino
 import rhinoscriptsyntax as rs
 import Grasshopper.Kernel as ghK
+import scriptcontext as sc
+
+# Classes and Defs
+PHPP_XL_InstanceLock = sc.sticky['PHPP_XL_InstanceLock']
 
 class MyComponent(component):
     
     def RunScript(self, save, excel):
         if (save is None  or save) and excel:
-            if not excel.save():
-                msg1 = "Unable to save"
-                ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, msg1)
+            with PHPP_XL_InstanceLock.hold(excel) as holding:
+                if not holding:
+                    ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, PHPP_XL_InstanceLock.busyMessage)
+                elif not excel.save():
+                    msg1 = "Unable to save"
+                    ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, msg1)
         else:
             msg1 = "No Excel Instance or save set to false"
             ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, msg1)
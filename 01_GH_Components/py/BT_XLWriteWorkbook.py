@@ -20,19 +20,26 @@
 # @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
 #
 """
-Writes a series of objects to an excel sheet, then recalculates the sheet.
+Writes a series of objects to an excel sheet, then recalculates the PHPP.
 These objects should be in a Treemap, and need a Worksheet, Range, and Value variable.
 Optionally only writes the differances from the last execution of this function, to reduce writing time.
+The last values written are saved (as a short hash of each cell) in a file next to the PHPP ('PHPP.xlsx.idf2phpp.json'), so this still works after closing Rhino or on another computer. Any cells changed by hand in the PHPP since the last write are found and reported.
+Neighbouring cells on each worksheet are grouped and written as blocks, which is much faster than writing cell by cell.
 -
 Component by Jack Hymowitz, August 29, 2020
 
     Args:
-        _excel: A running ExcelInterface from OpenExcel Workbook
+        _excel: A running ExcelInterface from OpenExcel Workbook. Or for the 'xlsx' backend_, the full file path of the PHPP .xlsx file to write to.
         useDiff_: Set to True to only write the differance out to excel, enabled by default.
         color_: set to True to highlight outputted fields, enabled by default.
-        _XL_Objects: TreeMap of objects to write with Worksheet, Range, and Value
+        _XL_Objects: TreeMap of objects to write with Worksheet, Range, and Value. Either single PHPP_XL_Objs or the Write Batches from the 'Create Excel Obj' components.
+        backend_: <Optional> 'Excel' (default) writes through a running Excel. 'xlsx' writes the values straight into the PHPP .xlsx file without Excel, which is much faster and works without Office installed. The file should not be open in Excel while writing. All formulas and formatting are kept, and the PHPP will recalculate the next time it is opened in Excel.
+        keepHandEdits_: <Optional> When useDiff_ is on, any cells that were changed by hand in the PHPP since the last write are overwritten with the model's values (default). Set to True to keep those hand edits instead, unless the model's value for the cell has changed.
+        runAsync_: <Optional> Set to True to write in the background, so Rhino and Grasshopper aren't frozen during a big export. The component shows the progress (and cells per second) while it writes, and the numWrites once it's done. If the inputs change while it's writing, the new export starts as soon as the current one is done. With the 'Excel' backend, Excel itself can only be driven from Grasshopper's own thread, so each block of cells is still written there: Rhino stays responsive between the blocks, but the export is no faster. Until it's done, the other XL components (Read, Save, Open, or another Write) using the same Excel show a warning instead of running.
+        cancel_: <Optional> Set to True to stop a background export after the block of cells it is writing now. The cells already written stay in the PHPP, and the next export writes the rest.
+        recalc_: <Optional> How to recalculate the PHPP after writing (Excel backend only). 'full' (default) turns Excel's automatic calculation back on, which recalculates everything that depends on the cells written (including any deferred writes). 'defer' doesn't recalculate at all, until the next 'full' write, for running a batch of writes (like a parameter sweep) with just one recalculation at the end. Excel is left in manual calculation after a 'defer' write, and the component shows a warning.
     Returns:
-        excel: The running ExcelInterface is outputted after this function runs.
+        excel: The running ExcelInterface (or the .xlsx file path) is outputted after this function runs.
         numWrites: The number of writes that occured, for debugging purposes.
 """
 ghenv.Component.Name = "BT_XLWriteWorkbook"
@@ -52,31 +59,57 @@ import scriptcontext as sc
 from System import Object
 from Grasshopper.Kernel.Data import GH_Path
 import clr
+import os
 from contextlib import contextmanager
 clr.AddReferenceByName('Microsoft.Office.Interop.Excel')#, Culture=neutral, PublicKeyToken=71e9bce111e9429c')
 from Microsoft.Office.Interop import Excel
 
+# Classes and Defs
+PHPP_XL_Address = sc.sticky['PHPP_XL_Address']
+PHPP_XL_WriteSet = sc.sticky['PHPP_XL_WriteSet']
+PHPP_XL_WritePlan = sc.sticky['PHPP_XL_WritePlan']
+PHPP_XLSX_Workbook = sc.sticky['PHPP_XLSX_Workbook']
+PHPP_XL_WriteBaseline = sc.sticky['PHPP_XL_WriteBaseline']
+PHPP_XL_BackgroundWriter = sc.sticky['PHPP_XL_BackgroundWriter']
+PHPP_XL_InstanceLock = sc.sticky['PHPP_XL_InstanceLock']
+PHPP_XL_Recalc = sc.sticky['PHPP_XL_Recalc']
+
 
 class MyComponent(component):
     
+    def warn(self, _msg):
+        #Warnings from the background writer's thread are kept until the component next updates
+        
+        worker = getattr(self, 'worker', None)
+        if worker is not None and worker.isWorkerThread():
+            worker.warn(_msg)
+        else:
+            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, _msg)
+    
     @staticmethod
     @contextmanager
-    def writingToExcel(_excel):
+    def writingToExcel(_excel, _keepManual=False):
         """ Changes the Excel Doc settings to help speed up """
         
         # Note: xlCalculationManual / Automatic set only works AFTER the workbook is opened
+        # Setting it back to Automatic recalculates straight away, so leave it Manual
+        # when the recalculation is deferred
         
         try:
             _excel.ex.Calculation = -4135 
             _excel.ex.ScreenUpdating = False
             yield
         finally:
-            _excel.ex.Calculation = -4105 
+            if not _keepManual:
+                _excel.ex.Calculation = -4105 
             _excel.ex.ScreenUpdating = True
     
     def checkPHPPVersion(self, _excel):
         """ Looks at !Data:D3 to find version number. Returns 'SI' or 'IP' unit type"""
-        version = _excel.sheetsDict['Data'].Range['B3'].Value2
+        if isinstance(_excel, PHPP_XLSX_Workbook):
+            version = _excel.getCellValue('Data', 'B3')
+        else:
+            version = _excel.sheetsDict['Data'].Range['B3'].Value2
         
         if not version:
             print('Using "SI" Units')
@@ -89,68 +122,324 @@ class MyComponent(component):
             return 'SI'
     
     def doReadObjs(self, objects, _unitType):
-        #If useDiff is false, this is used. Simply reads all objects in
+        #Reads all the objects in, one write per cell, and warns about any cells written with different values
         
-        diff=[]
-        for eachBranch in objects.Branches:
-            for obj in eachBranch:
-                diff.append((obj.getWorksheet(_unitType),obj.Range,obj.getValue(_unitType)))
-        return diff
-    
-    def doDiff(self, objects, _unitType):
-        #If useDiff is true (or not set), this is used. Only objects that have changed are written
+        writeSet=PHPP_XL_WriteSet()
+        for path, eachBranch in objects:
+            writeSet.addXLObjs(eachBranch, _unitType, path)
         
+        print(writeSet)
+        if writeSet.Conflicts:
+            msg1 = "{} cell(s) are written more than once with different values. Only the last one is written:\n{}".format(
+                len(writeSet.Conflicts), "\n".join(writeSet.getConflictMessages()))
+            self.warn(msg1)
+        
+        return writeSet.getWrites()
+    
+    def getNewObjs(self, writes):
         newObj={}
-        for eachBranch in objects.Branches:
-            for obj in eachBranch:
-                newObj[(obj.getWorksheet(_unitType),obj.Range)]=obj.getValue(_unitType);
-        
-        diff=[]
-        if "XLSdata" in sc.sticky:    #We are checking diffs
-            oldObj=sc.sticky["XLSdata"]
-            for x in newObj.keys():
-                if not x in oldObj.keys() or oldObj[x]!=newObj[x]: #If the value didn't exist before or was changed, it's a change
-                    diff.append((x[0],x[1],newObj[x]))
-            for x in oldObj.keys():
-                if not x in newObj.keys():                         #If the value existed before and is now gone, it is a change
-                    diff.append((x[0],x[1],""))
+        for sheetName, rangeAddress, value in writes:
+            newObj[(sheetName,rangeAddress)]=value
+        return newObj
+    
+    def getBaseline(self, _workbookPath):
+        #The hashes of the last values written, saved in a file next to the workbook
+        
+        if _workbookPath and os.path.isabs(_workbookPath):
+            return PHPP_XL_WriteBaseline(_workbookPath)
+        
+        #A new workbook that hasn't been saved yet, so only keep it in memory
+        if not "XLSbaseline" in sc.sticky:
+            sc.sticky["XLSbaseline"]=PHPP_XL_WriteBaseline()
+        return sc.sticky["XLSbaseline"]
+    
+    def readCurrentCells(self, excel, baseline):
+        #Reads back the cells from the last write, one Range per worksheet, as Formulas
+        
+        currentCells={}
+        for sheetName, address, top, left in baseline.getBounds():
+            if isinstance(excel, PHPP_XLSX_Workbook):
+                cells=excel.readCells(sheetName)
+                for rangeAddress in baseline.Cells[sheetName]:
+                    currentCells[(sheetName,rangeAddress)]=cells.get(rangeAddress.upper())
+                continue
             
-        else:                                       #Not checking diffs
-            for x in newObj.keys():
-                diff.append((x[0],x[1],newObj[x]))
-        sc.sticky["newXLSdata"]=newObj
+            sheet=excel.sheetsDict.get(sheetName)
+            if sheet is None:
+                continue
+            
+            formulas=sheet.Range[address].Formula
+            for rangeAddress in baseline.Cells[sheetName]:
+                rowCol=PHPP_XL_Address.fromA1(rangeAddress)
+                if rowCol is None:
+                    continue
+                elif isinstance(formulas, System.Array):
+                    currentCells[(sheetName,rangeAddress)]=formulas.GetValue(rowCol[0]-top+formulas.GetLowerBound(0), rowCol[1]-left+formulas.GetLowerBound(1))
+                else:
+                    currentCells[(sheetName,rangeAddress)]=formulas
+        return currentCells
+    
+    def doDiff(self, newObj, baseline, currentCells, keepHandEdits):
+        #If useDiff is true (or not set), this is used. Only objects that have changed since the last write are written
+        
+        diff=baseline.getDiff(newObj)
+        
+        handEdits=baseline.findHandEdits(currentCells)
+        if handEdits:
+            msg1 = "{} cell(s) have been changed in the PHPP since the last write: {}{}".format(
+                len(handEdits), ", ".join("{}!{}".format(*x) for x in handEdits[:10]), "..." if len(handEdits)>10 else "")
+            if keepHandEdits:
+                msg1 += "\nThese are being kept, unless the model's value for them has changed."
+                diff=[x for x in diff if not ((x[0],x[1]) in handEdits and not (x[0],x[1]) in newObj)]
+            else:
+                msg1 += "\nThese are being overwritten. Set keepHandEdits_ to True to keep them."
+                inDiff=set((x[0],x[1]) for x in diff)
+                for x in handEdits:
+                    if not x in inDiff:
+                        diff.append((x[0],x[1],newObj.get(x,"")))
+            self.warn(msg1)
+        
         return diff
     
-    def doWrite(self, excel, border, data):
-        #Write out the data we have found
+    @staticmethod
+    def toValue2(_values):
+        """ A block's rows of values as the 2D array Excel wants for a multi-cell Value2 """
+        if len(_values) == 1 and len(_values[0]) == 1:
+            return _values[0][0]
         
-        with self.writingToExcel(excel):
-            for eachItem in data:
+        arr = System.Array.CreateInstance(Object, len(_values), len(_values[0]))
+        for i, rowValues in enumerate(_values):
+            for j, value in enumerate(rowValues):
+                arr[i, j] = value
+        return arr
+    
+    def doWriteCells(self, sheet, sheetName, address, values):
+        #One bad cell (ie: part of a merged cell) fails the whole block, so write the block's cells one at a time
+        #Returns the (Worksheet, (row, col)) of any cells that still couldn't be written
+        
+        failed = []
+        top, left = PHPP_XL_Address.rangeFromA1(address)[:2]
+        for i, rowValues in enumerate(values):
+            for j, value in enumerate(rowValues):
+                cellAddress = PHPP_XL_Address.toA1( (top + i, left + j) )
+                try:
+                    sheet.Range[cellAddress].Value2 = value
+                except:
+                    msg1 = "Could not write to: {}!{}".format(sheetName, cellAddress)
+                    self.warn(msg1)
+                    failed.append( (sheetName, (top + i, left + j)) )
+        return failed
+    
+    def doWrite(self, excel, border, data, progress=None, recalc=None):
+        #Write out the data we have found, one COM call per block of cells
+        #Returns the (Worksheet, (row, col) or Range) of any cells that couldn't be written, or None if it was cancelled
+        
+        failed = []
+        plan = PHPP_XL_WritePlan(data)
+        print('Writing {} cells to Excel in {} blocks'.format(plan.NumWrites, plan.NumBlocks))
+        if progress:
+            progress.setTotal(plan.NumWrites)
+        
+        with self.writingToExcel(excel, PHPP_XL_Recalc.getMode(recalc) == 'defer'):
+            for sheetName in plan.Blocks.keys():
+                sheet = excel.sheetsDict.get(sheetName)
+                if sheet is None:
+                    msg1 = "Sheet not found: " + sheetName
+                    self.warn(msg1)
+                    failed.extend( (sheetName, cell) for cell in plan.getCells(sheetName) )
+                    continue
+                
+                for address, values in plan.getBlocks(sheetName):
+                    try:
+                        sheet.Range[address].Value2 = self.toValue2(values)
+                    except:
+                        failed.extend( self.doWriteCells(sheet, sheetName, address, values) )
+                    
+                    if progress and not progress.step(len(values) * len(values[0])):
+                        return None
+                
+                if(border == None or border):
+                    for address in plan.getHighlightRanges(sheetName):
+                        sheet.Range[address].Interior.ColorIndex=8
+            
+            for eachItem in plan.Loose:
                 try:
                     excel.sheetsDict[eachItem[0]].Range[eachItem[1]].Value2 = eachItem[2]
                     if(border == None or border):
                         excel.sheetsDict[eachItem[0]].Range[eachItem[1]].Interior.ColorIndex=8
                 except:
                     msg1 = "Sheet not found: " + eachItem[0]
-                    ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, msg1)
-            if "newXLSdata" in sc.sticky:
-                sc.sticky["XLSdata"]=sc.sticky["newXLSdata"]
+                    self.warn(msg1)
+                    failed.append( (eachItem[0], eachItem[1]) )
+                
+                if progress and not progress.step():
+                    return None
+        
+        return failed
+    
+    def doWriteXLSX(self, workbook, border, data, progress=None):
+        #Write the data straight into the .xlsx file, no Excel. All in one go, so it can only be cancelled before it starts
+        #Returns the cells that couldn't be written, or None if nothing was written
+        
+        if progress:
+            progress.setTotal(len(data))
+            if progress.Cancelled:
+                return None
+        
+        try:
+            numCells = workbook.write(data, border == None or border)
+        except (IOError, OSError) as e:
+            msg1 = "Could not write to: {}\nIs the file open in Excel?\n{}".format(workbook.FilePath, e)
+            self.warn(msg1)
+            return None
+        
+        print('Wrote {} cells to: {}'.format(numCells, workbook.FilePath))
+        for warning in workbook.Warnings:
+            self.warn(warning)
+        if progress:
+            progress.step(len(data))
+        return workbook.Skipped
+    
+    def dropFailed(self, newObj, failed):
+        #Leaves any cells that couldn't be written out of the new baseline, so the next write tries them again
+        
+        failed = set(failed)
+        for key in list(newObj.keys()):
+            sheetName, rangeAddress = key
+            cellRange = PHPP_XL_Address.rangeFromA1(rangeAddress)
+            cells = PHPP_XL_Address.rangeCells(cellRange) if cellRange else []
+            if key in failed or any((sheetName, cell) in failed for cell in cells):
+                del newObj[key]
+    
+    def doExport(self, workbook, workbookPath, useDiff, border, XL_Objects, keepHandEdits, progress=None, recalc=None):
+        #Work out what to write, write it, then save the new baseline for next time
+        #Returns the writes, and the number of cells actually written
+        
+        unitType = self.checkPHPPVersion(workbook)
+        writes = self.doReadObjs(XL_Objects, unitType)
+        newObj = self.getNewObjs(writes)
+        baseline = self.getBaseline(workbookPath)
+        
+        if useDiff is None or useDiff:
+            diff=self.doDiff(newObj, baseline, self.readCurrentCells(workbook, baseline), keepHandEdits)
+        else:
+            diff=writes
+        
+        if isinstance(workbook, PHPP_XLSX_Workbook):
+            failed = self.doWriteXLSX(workbook, border, diff, progress)
+        else:
+            failed = self.doWrite(workbook, border, diff, progress, recalc)
+        
+        if failed is not None:
+            if failed:
+                self.dropFailed(newObj, failed)
+            baseline.update(newObj)
+            return diff, len(diff) - len(failed)
+        
+        if progress and progress.Cancelled:
+            msg1 = "The export was cancelled after {} of {} cells. Run it again to write the rest.".format(progress.CellsDone, len(diff))
+            self.warn(msg1)
+        return diff, progress.CellsDone if progress else 0
+    
+    def RunXLSX(self, filePath, useDiff, border, XL_Objects, keepHandEdits, progress=None):
+        
+        if not filePath or not XL_Objects:
+            return (None,0)
+        
+        try:
+            workbook = PHPP_XLSX_Workbook(str(filePath))
+        except Exception as e:
+            msg1 = "Could not open the PHPP file: {}\n{}".format(filePath, e)
+            self.warn(msg1)
+            return (None,0)
+        
+        diff, numWritten = self.doExport(workbook, os.path.abspath(str(filePath)), useDiff, border, XL_Objects, keepHandEdits, progress)
+        
+        return (filePath,numWritten)
     
-    def RunScript(self, excel, useDiff, border, XL_Objects):
+    def RunExcel(self, excel, useDiff, border, XL_Objects, keepHandEdits, progress=None, recalc=None):
         
         if not excel or not excel.activeWorkbook or not XL_Objects:
             msg1 = "No Excel Instance!"
-            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, msg1)
+            self.warn(msg1)
             return (None,0)
         
-        unitType = self.checkPHPPVersion(excel)
+        #The background export waits its turn, but on the Grasshopper thread waiting would hang Rhino
+        with PHPP_XL_InstanceLock.hold(excel, progress is not None) as holding:
+            if not holding:
+                self.warn(PHPP_XL_InstanceLock.busyMessage)
+                return (None,0)
+            
+            return self.RunExcelLocked(excel, useDiff, border, XL_Objects, keepHandEdits, progress, recalc)
+    
+    def RunExcelLocked(self, excel, useDiff, border, XL_Objects, keepHandEdits, progress=None, recalc=None):
         
-        if useDiff is None or useDiff:
-            diff=self.doDiff(XL_Objects, unitType)
+        diff, numWritten = self.doExport(excel, excel.activeWorkbook.FullName, useDiff, border, XL_Objects, keepHandEdits, progress, recalc)
+        
+        sheetNames = set(eachWrite[0] for eachWrite in diff)
+        if progress and progress.Cancelled:
+            #Only part of it was written, so leave the recalculation for the next export
+            self.recalc.add(excel.activeWorkbook.FullName, sheetNames)
         else:
-            diff=self.doReadObjs(XL_Objects, unitType)
+            self.recalc.calculate(excel, sheetNames, recalc)
+            if self.recalc.LeftManual:
+                msg1 = "Excel has been left in manual calculation, so the PHPP is not up to date yet.\n"\
+                "Press F9 in Excel, or set recalc_ to 'full', to recalculate it and turn automatic calculation back on."
+                self.warn(msg1)
+        print(self.recalc)
+        
+        return (excel,numWritten)
+    
+    def RunExport(self, excel, useDiff, border, XL_Objects, backend, keepHandEdits, recalc, progress=None):
+        
+        if backend and str(backend).strip().lower() == 'xlsx':
+            return self.RunXLSX(excel, useDiff, border, XL_Objects, keepHandEdits, progress)
+        return self.RunExcel(excel, useDiff, border, XL_Objects, keepHandEdits, progress, recalc)
+    
+    def RunAsync(self, excel, useDiff, border, XL_Objects, backend, keepHandEdits, recalc, cancel):
+        #Hands the export to the background writer and returns straight away. While it's
+        #writing, this component updates every half second to show the progress
+        
+        key = (excel if isinstance(excel, basestring) else id(excel), backend, useDiff, border, keepHandEdits, recalc,
+               tuple(id(obj) for path, eachBranch in XL_Objects for obj in eachBranch))
+        #The updates showing the progress shouldn't start the export again (ie: after it failed)
+        refreshOnly, self.refreshOnly = getattr(self, 'refreshOnly', False), False
+        if key != self.worker.Key and not cancel and not refreshOnly:
+            job = lambda progress: self.RunExport(excel, useDiff, border, XL_Objects, backend, keepHandEdits, recalc, progress)
+            self.worker.submit(job, key)
         
-        self.doWrite(excel, border,diff)
-        excel.ex.Calculate()
+        for msg1 in self.worker.popMessages():
+            self.warn(msg1)
+        ghenv.Component.Message = self.worker.getStatusMessage()
+        print(self.worker)
+        
+        if self.worker.IsBusy:
+            def refresh(doc):
+                self.refreshOnly = True
+                ghenv.Component.ExpireSolution(False)
+            ghenv.Component.OnPingDocument().ScheduleSolution(500, Grasshopper.Kernel.GH_Document.GH_ScheduleDelegate(refresh))
+        
+        return (excel, self.worker.Result[1] if self.worker.Result else 0)
+    
+    def RunScript(self, excel, useDiff, border, XL_Objects, backend=None, keepHandEdits=None, runAsync=None, cancel=None, recalc=None):
+        
+        if getattr(self, 'worker', None) is None:
+            self.worker = PHPP_XL_BackgroundWriter()
+        if getattr(self, 'recalc', None) is None:
+            self.recalc = PHPP_XL_Recalc()
+        if cancel:
+            self.worker.cancel()
+        
+        #A copy of the tree, so the background writer isn't reading it while Grasshopper changes it
+        objects = [(str(path), list(eachBranch)) for path, eachBranch in zip(XL_Objects.Paths, XL_Objects.Branches)] if XL_Objects else []
+        
+        if runAsync:
+            return self.RunAsync(excel, useDiff, border, objects, backend, keepHandEdits, recalc, cancel)
+        
+        if self.worker.IsBusy:
+            msg1 = "A background export is still writing to the PHPP. Cancel it, or wait for it to finish."
+            self.warn(msg1)
+            return (None,0)
         
-        return (excel,len(diff))
+        ghenv.Component.Message = 'AUG_29_2020'
+        return self.RunExport(excel, useDiff, border, objects, backend, keepHandEdits, recalc)
\ No newline at end of file
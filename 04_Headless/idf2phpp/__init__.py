@@ -0,0 +1,25 @@
+"""
+IDF2PHPP without Rhino: reads an EnergyPlus IDF file and builds the PHPP cell writes
+
+    from idf2phpp import idfToPHPP
+    for groupName, xlObj in idfToPHPP('model.idf'):
+        print(xlObj.getWrite('SI'))
+
+Or from the command line (run from the '04_Headless' folder):
+    python -m idf2phpp model.idf --saved-data rooms.json -o model_phpp.csv
+"""
+
+from .reader import IDF_Schema, IDF_Class, IDF_Model, idf_objectStream, idf_epJSONStream
+from .climate import PHPP_ClimateStore, PHPP_ClimateIndex, PHPP_ClimateDataSet
+from .objects import PHPP_SavedData
+from .xl import PHPP_UnitConverter, PHPP_XL_Obj, PHPP_XL_Address, PHPP_XL_WriteBatch, PHPP_XL_WriteSet, PHPP_XL_WritePlan
+from .xlsx import PHPP_XLSX_Workbook
+from .idf2phppObjs import PHPPObjs, buildPHPPObjs
+from .createXLObjGeom import createXLObjsGeom, geomGroupNames
+from .pipeline import readIDF, idfToPHPP
+
+__all__ = ['IDF_Schema', 'IDF_Class', 'IDF_Model', 'idf_objectStream', 'idf_epJSONStream',
+           'PHPP_ClimateStore', 'PHPP_ClimateIndex', 'PHPP_ClimateDataSet', 'PHPP_SavedData',
+           'PHPP_UnitConverter', 'PHPP_XL_Obj', 'PHPP_XL_Address', 'PHPP_XL_WriteBatch', 'PHPP_XL_WriteSet',
+           'PHPP_XL_WritePlan', 'PHPP_XLSX_Workbook', 'PHPPObjs', 'buildPHPPObjs', 'createXLObjsGeom',
+           'geomGroupNames', 'readIDF', 'idfToPHPP']
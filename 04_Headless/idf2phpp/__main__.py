@@ -0,0 +1,134 @@
+"""
+Command line IDF --> PHPP conversion. Writes out every PHPP cell write for each IDF file
+
+    python -m idf2phpp model.idf                              (CSV to the screen)
+    python -m idf2phpp model.idf --saved-data rooms.json -o model_phpp.csv
+    python -m idf2phpp variants/*.idf --format json -o out/   (one file per IDF)
+    python -m idf2phpp model.idf --format xlsx --template PHPP.xlsx -o model_PHPP.xlsx
+
+Each write is a Group, Worksheet, Range and Value, ready to pass on to whatever writes the
+PHPP Excel file. Or with '--format xlsx' the values are written straight into a copy of a
+PHPP .xlsx file, no Excel needed.
+"""
+
+import argparse
+import csv
+import io
+import json
+import logging
+import os
+import sys
+
+from .climate import PHPP_ClimateStore
+from .objects import PHPP_SavedData
+from .pipeline import idfToPHPP
+from .xl import PHPP_UnitConverter, PHPP_XL_WriteSet
+from .xlsx import PHPP_XLSX_Workbook
+
+log = logging.getLogger('idf2phpp')
+
+def parseArgs(_args):
+    parser = argparse.ArgumentParser(prog='idf2phpp', description='Convert EnergyPlus IDF / epJSON files to PHPP cell writes.')
+    parser.add_argument('idfFiles', nargs='+', help='The .idf or .epJSON file(s) to convert')
+    parser.add_argument('-o', '--output', help='Output file, or a folder when converting more than one file. Default prints to the screen')
+    parser.add_argument('--format', choices=['csv', 'json', 'xlsx'], default='csv', help='Output format. Default=csv')
+    parser.add_argument('--template', help='The PHPP .xlsx file to write into, for --format xlsx. It is copied, not changed')
+    parser.add_argument('--units', choices=['SI', 'IP'], help='Write the values for an SI or IP PHPP. Default=SI, or the --template PHPP\'s units')
+    parser.add_argument('--saved-data', help='A JSON file of the saved PHPP Rooms, Vent Systems, Thermal Bridges and TFA')
+    parser.add_argument('--climate-data', help='The PHPP Climate Data CSV file. Default uses the one in 01_GH_Components/ghuser')
+    parser.add_argument('--zones', nargs='*', default=[], help='Only include Zones with any of these in their name')
+    parser.add_argument('--exclude-zones', nargs='*', default=[], help='Leave out Zones with any of these in their name')
+    parser.add_argument('--row-start', action='append', default=[], help='A modified PHPP Start Row, ie: "Areas, Surfaces: 50"')
+    parser.add_argument('-q', '--quiet', action='store_true', help='Only show warnings and errors')
+
+    args = parser.parse_args(_args)
+    if args.format == 'xlsx' and not args.template:
+        parser.error('--format xlsx needs a PHPP --template file to write into')
+    
+    return args
+
+def writeRows(_writes, _units, _format, _outFile):
+    xlWrites = PHPP_UnitConverter.convertWriteSet([xlObj for groupName, xlObj in _writes], _units)
+    rows = [(groupName,) + xlWrite for (groupName, xlObj), xlWrite in zip(_writes, xlWrites)]
+
+    if _format == 'json':
+        json.dump([dict(zip(('Group', 'Worksheet', 'Range', 'Value'), row)) for row in rows], _outFile, indent=1)
+        _outFile.write('\n')
+    else:
+        if sys.version_info[0] < 3:
+            rows = [[v.encode('utf-8') if isinstance(v, type(u'')) else repr(v) if isinstance(v, float) else v for v in row] for row in rows]
+        writer = csv.writer(_outFile)
+        writer.writerow( ('Group', 'Worksheet', 'Range', 'Value') )
+        writer.writerows(rows)
+
+def writeXLSX(_writes, _units, _template, _outPath):
+    writeSet = PHPP_XL_WriteSet()
+    for groupName, xlObj in _writes:
+        writeSet.addXLObjs([xlObj], _units, groupName)
+    if writeSet.Conflicts:
+        log.warning('{} cell(s) are written more than once with different values. Only the last one is written:\n{}'.format(
+            len(writeSet.Conflicts), '\n'.join(writeSet.getConflictMessages())))
+    
+    workbook = PHPP_XLSX_Workbook(_template)
+    numCells = workbook.write(writeSet.getWrites(), _outPath=_outPath)
+    for warning in workbook.Warnings:
+        log.warning(warning)
+    
+    return numCells
+
+def openOutput(_filePath):
+    # csv wants bytes in Python 2, text in Python 3
+    if sys.version_info[0] < 3:
+        return open(_filePath, 'wb')
+    return io.open(_filePath, 'w', encoding='utf-8', newline='')
+
+def outputPath(_args, _idfFile):
+    if not _args.output:
+        if _args.format == 'xlsx':
+            return '{}_phpp.xlsx'.format(os.path.splitext(_idfFile)[0])
+        return None
+
+    if len(_args.idfFiles) == 1 and not os.path.isdir(_args.output):
+        return _args.output
+
+    if not os.path.isdir(_args.output):
+        os.makedirs(_args.output)
+    fileName = os.path.splitext(os.path.basename(_idfFile))[0]
+    return os.path.join(_args.output, '{}_phpp.{}'.format(fileName, _args.format))
+
+def main(_args=None):
+    args = parseArgs(sys.argv[1:] if _args is None else _args)
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO, format='%(levelname)s: %(message)s')
+
+    savedData = PHPP_SavedData.fromFile(args.saved_data)
+    climateStore = PHPP_ClimateStore(args.climate_data)
+    
+    units = args.units
+    if units is None:
+        units = PHPP_XLSX_Workbook(args.template).getPHPPUnits() if args.template else 'SI'
+
+    failed = []
+    for idfFile in args.idfFiles:
+        log.info('Converting: {}'.format(idfFile))
+        try:
+            writes = idfToPHPP(idfFile, savedData, climateStore, args.zones, args.exclude_zones, args.row_start)
+        except Exception as e:
+            log.error('Could not convert {}: {}'.format(idfFile, e))
+            failed.append(idfFile)
+            continue
+
+        outPath = outputPath(args, idfFile)
+        if args.format == 'xlsx':
+            numCells = writeXLSX(writes, units, args.template, outPath)
+            log.info('Wrote {} PHPP cells to: {}'.format(numCells, outPath))
+        elif outPath is None:
+            writeRows(writes, units, args.format, sys.stdout)
+        else:
+            with openOutput(outPath) as outFile:
+                writeRows(writes, units, args.format, outFile)
+            log.info('Wrote {} PHPP cell writes to: {}'.format(len(writes), outPath))
+
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,270 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+# 
+# This module is part of IDF2PHPP.
+# 
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com> 
+# IDF2PHPP is free software; you can redistribute it and/or modify 
+# it under the terms of the GNU General Public License as published 
+# by the Free Software Foundation; either version 3 of the License, 
+# or (at your option) any later version. 
+# 
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of 
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+# GNU General Public License for more details.
+# 
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+# 
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+The PHPP Climate Datasets and the index for finding the nearest one to a location
+
+Reads 'IDF2PHPP_ClimateData.csv' from the Grasshopper User Objects folders when loaded by
+BT_CORE, or from next to this package (or the IDF2PHPP_CLIMATE_DATA environment variable)
+when run headless.
+"""
+
+import csv
+import heapq
+import io
+import logging
+import math
+import os
+import sys
+from collections import namedtuple, defaultdict
+
+log = logging.getLogger(__name__)
+
+class PHPP_ClimateStore(object):
+    """ The catalogue of PHPP Climate Datasets, read from a data file the first time its used
+    
+    The datasets are kept in 'IDF2PHPP_ClimateData.csv' (one row per dataset, UTF-8) which
+    gets installed with the .ghuser files. A newer PHI catalogue can be dropped in by 
+    replacing the file, as long as it keeps the same column names. Nothing is read until 
+    the datasets are actually needed, and then they are indexed by Dataset code (ie: 
+    'US0055b'), Country and Region.
+    
+    Args:
+        _filePath (str): Optional. The full path to the data file. Default uses the 
+            IDF2PHPP_CLIMATE_DATA environment variable, then looks in the Grasshopper User 
+            Objects folders (and the folders inside them) and the copy in '01_GH_Components/ghuser'
+    """
+    
+    dataFileName = 'IDF2PHPP_ClimateData.csv'
+    
+    def __init__(self, _filePath=None):
+        self.filePath = _filePath
+        self._records = None
+        self._byCode = {}
+        self._byCountry = defaultdict(list)
+        self._byRegion = defaultdict(list)
+        self._index = None
+    
+    @classmethod
+    def findDataFile(cls):
+        filePath = os.environ.get('IDF2PHPP_CLIMATE_DATA')
+        if filePath and os.path.exists(filePath):
+            return filePath
+        
+        # When loaded by BT_CORE, the copy installed with the .ghuser files
+        try:
+            import Grasshopper
+            folders = list(Grasshopper.Folders.UserObjectFolders)
+        except (ImportError, AttributeError):
+            folders = []
+        
+        for folder in folders:
+            if not os.path.isdir(folder):
+                continue
+            
+            filePath = os.path.join(folder, cls.dataFileName)
+            if os.path.exists(filePath):
+                return filePath
+            
+            for subFolder in os.listdir(folder):
+                filePath = os.path.join(folder, subFolder, cls.dataFileName)
+                if os.path.exists(filePath):
+                    return filePath
+        
+        # The copy installed with the .ghuser files, in the same repository
+        packageFolder = os.path.dirname(os.path.abspath(__file__))
+        for folder in (packageFolder, os.path.join(packageFolder, '..', '..', '01_GH_Components', 'ghuser')):
+            filePath = os.path.normpath(os.path.join(folder, cls.dataFileName))
+            if os.path.exists(filePath):
+                return filePath
+        
+        return None
+    
+    def load(self):
+        """ Reads in the datasets, if they haven't been already """
+        
+        if self._records is not None:
+            return self
+        
+        self._records = []
+        self.filePath = self.filePath or self.findDataFile()
+        if not self.filePath:
+            log.warning('Could not find the PHPP Climate Data file: {}'.format(self.dataFileName))
+            return self
+        
+        self._records = list(self.readRows(self.filePath))
+        for record in self._records:
+            code = self.datasetCode(record.get('Dataset', ''))
+            self._byCode.setdefault(code, record)
+            self._byCountry[ PHPP_ClimateIndex.countryKey(record.get('Country', '')) ].append(record)
+            self._byRegion[ record.get('Region', '').strip().upper() ].append(record)
+        
+        return self
+    
+    @staticmethod
+    def readRows(_filePath):
+        # The csv module only reads bytes in Python 2, and only text in Python 3
+        if sys.version_info[0] < 3:
+            with open(_filePath, 'rb') as dataFile:
+                rows = csv.reader(dataFile)
+                header = [colName.decode('utf-8-sig') for colName in next(rows)]
+                for row in rows:
+                    if row:
+                        yield dict(zip(header, [value.decode('utf-8') for value in row]))
+        else:
+            with io.open(_filePath, 'r', encoding='utf-8-sig', newline='') as dataFile:
+                rows = csv.reader(dataFile)
+                header = next(rows)
+                for row in rows:
+                    if row:
+                        yield dict(zip(header, row))
+    
+    @staticmethod
+    def datasetCode(_dataset):
+        # 'US0055b-New York' --> 'US0055B'
+        return _dataset.split('-')[0].strip().upper()
+    
+    @property
+    def records(self):
+        return self.load()._records
+    
+    @property
+    def index(self):
+        """ The PHPP_ClimateIndex for finding the nearest datasets to a location """
+        if self._index is None:
+            self._index = PHPP_ClimateIndex(self.records)
+        return self._index
+    
+    def get(self, _code, _default=None):
+        """ Returns the dataset with the code (ie: 'US0055b' or 'US0055b-New York') """
+        return self.load()._byCode.get(self.datasetCode(_code), _default)
+    
+    def inCountry(self, _country):
+        """ Returns all the datasets for the Country ('US' or 'US-United States of America') """
+        return list( self.load()._byCountry.get(PHPP_ClimateIndex.countryKey(_country), []) )
+    
+    def inRegion(self, _region):
+        """ Returns all the datasets for the Region (ie: 'New York') """
+        return list( self.load()._byRegion.get(_region.strip().upper(), []) )
+    
+    def __len__(self):
+        return len(self.records)
+    
+    def __str__(self):
+        if self._records is None:
+            return 'PHPP Climate Data Store (not loaded yet)'
+        return 'PHPP Climate Data Store: {} Datasets from {}'.format(len(self._records), self.filePath)
+
+class PHPP_ClimateIndex(object):
+    """ A search index over the PHPP Climate Datasets for finding the nearest ones to a location
+    
+    Each dataset's Latitude / Longitude is turned into a unit vector on the sphere once, when 
+    the index is built. The great-circle distance to any location is then just the angle 
+    from a single dot product. The climate data itself is never changed.
+    
+    Usage:
+        index = PHPP_ClimateIndex( phpp_ClimateStore.records )
+        index.nearest(40.78, -73.97, k=3, country='US')
+        -> [ClimateMatch(Distance=4.3, Data={'Dataset':'US0055b-New York', ...}), ...]
+    """
+    
+    earthRadius = 6378 # km, same as the PHPP Climate worksheet
+    ClimateMatch = namedtuple('ClimateMatch', ['Distance', 'Data'])
+    
+    def __init__(self, _climateData):
+        self.data = _climateData
+        self.vectors = []
+        self.byCountry = defaultdict(list)
+        
+        for i, dataSet in enumerate(_climateData):
+            self.vectors.append( self.unitVector(dataSet.get('Latitude', 0), dataSet.get('Longitude', 0)) )
+            self.byCountry[ self.countryKey(dataSet.get('Country', '')) ].append(i)
+    
+    @staticmethod
+    def unitVector(_lat, _long):
+        lat = math.radians(float(_lat or 0))
+        long = math.radians(float(_long or 0))
+        return (math.cos(lat)*math.cos(long), math.cos(lat)*math.sin(long), math.sin(lat))
+    
+    @staticmethod
+    def countryKey(_country):
+        # 'US' and 'US-United States of America' both --> 'US'
+        return _country.split('-')[0].strip().upper()
+    
+    def nearest(self, _lat, _long, k=1, country=None, region=None):
+        """ Returns the k nearest Climate Datasets to the location, closest first
+        
+        Args:
+            _lat (float): Latitude of the location (Degrees)
+            _long (float): Longitude of the location (Degrees)
+            k (int): The number of datasets to return
+            country (str): Optional. Only look at datasets in this Country ('US' or 'US-United States of America')
+            region (str): Optional. Only look at datasets in this Region (ie: 'New York')
+        Returns:
+            (list): ClimateMatch(Distance (km), Data (dict)) for each dataset found
+        """
+        
+        if country:
+            candidates = self.byCountry.get(self.countryKey(country), [])
+        else:
+            candidates = range(len(self.data))
+        
+        if region:
+            region = region.strip().upper()
+            candidates = [i for i in candidates if self.data[i].get('Region', '').strip().upper() == region]
+        
+        x, y, z = self.unitVector(_lat, _long)
+        vectors = self.vectors
+        closest = heapq.nlargest(k, candidates, key=lambda i: vectors[i][0]*x + vectors[i][1]*y + vectors[i][2]*z)
+        
+        matches = []
+        for i in closest:
+            # Angle from the chord length, which stays accurate for very close locations
+            vx, vy, vz = vectors[i]
+            chord = math.sqrt((vx-x)**2 + (vy-y)**2 + (vz-z)**2)
+            matches.append( self.ClimateMatch(self.earthRadius * 2 * math.asin(min(1.0, chord/2)), self.data[i]) )
+        
+        return matches
+    
+    def __len__(self):
+        return len(self.data)
+    
+    def __str__(self):
+        return 'A PHPP Climate Index of {} Datasets'.format(len(self.data))
+
+class PHPP_ClimateDataSet:
+    
+    def __init__(self, _dataSet='US0055b-New York', _alt='=J23', _cntry='US-United States of America', _reg='New York'):
+        self.DataSet = _dataSet
+        self.Altitude = _alt
+        self.Country = _cntry
+        self.Region = _reg
+    
+    def __str__(self):
+        return 'A Location Object for: "{!r}":'.format(self.DataSet)
+    
+    def __repr__(self):
+        return "{}( _dataSet={!r}, _alt={!r}, _cntry={!r}, _reg{!r} )".format(
+               self.__class__.__name__,
+               self.DataSet,
+               self.Altitude,
+               self.Country,
+               self.Region)
@@ -0,0 +1,973 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+# 
+# This module is part of IDF2PHPP.
+# 
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com> 
+# IDF2PHPP is free software; you can redistribute it and/or modify 
+# it under the terms of the GNU General Public License as published 
+# by the Free Software Foundation; either version 3 of the License, 
+# or (at your option) any later version. 
+# 
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of 
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+# GNU General Public License for more details.
+# 
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+# 
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Creates the Excel-ready PHPP write objects, the same as the 'Create Excel Obj - Geom' component
+
+The getters are the same as the component's, taking their inputs as arguments instead of
+reading the component's global inputs. The Ground, DHW, Appliance and Lighting objects
+all come from the Honeybee Zones in GH, so there aren't any of those here (their groups
+are left empty) and the TFA can only be numbers, not Rhino geometry.
+"""
+
+import copy
+import logging
+
+from .xl import PHPP_XL_Address, PHPP_XL_WriteBatch
+
+log = logging.getLogger(__name__)
+
+# The default starting rows for each section of the PHPP
+# Modify values based on user input (if any) with updateStartRows
+defaultStartRows = {'Additional Ventilation':
+                {'Rooms':56,
+                'Vent Unit Selection':97,
+                'Vent Ducts':127 },
+            'Components':
+                {'Ventilator':15},
+            'Areas':
+                {'TB':145, 'Surfaces':41},
+            'Electricity non-res':
+                {'Lighting': 19,
+                'Office Equip': 62,
+                'Kitchen':77},
+            }
+
+# The same 17 groups (in the same order) as the component's 'toPHPP_Geom_' DataTree branches
+geomGroupNames = ['U-Values', 'Window Components', 'Areas', 'Windows', 'Shading', 'TFA', 'Thermal Bridges',
+                  'Addnl Vent Rooms', 'Addnl Vent Systems', 'Airtightness', 'Ground', 'DHW', 'Non-Res Elec',
+                  'Location', 'Appliances', 'Lighting', 'Footprint']
+
+#-------------------------------------------------------------------------------
+
+def getUvalues(_inputBranch, _materials):
+    uID_Count = 1
+    uValueUID_Names = []
+    uValuesConstructorStartRow = 10
+    uValuesList = PHPP_XL_WriteBatch()
+    log.info('Creating the U-Values Objects...')
+    for eachConst in _inputBranch:
+        # for each Construction Assembly in the model....
+        
+        # Get the Construction's Name and the Materal Layers in the EP Model
+        construcionNameEP = getattr(eachConst, 'Name')
+        layers = sorted(getattr(eachConst, 'Layers'))
+        
+        # Filter out any of the Window Constructions
+        isWindow = False
+        opaqueMaterialNames = []
+        for eachMat in _materials:
+            opaqueMaterialNames.append(eachMat.Name) # Get all the Opaque Construction Material Names
+        
+        # Check if the material matches any of the Opaque ones
+        for eachLayer in layers:
+            if eachLayer[1] in opaqueMaterialNames:
+                eachLayer[1]
+                break
+            else:
+                # If not... it must be a window (maybe?)
+                isWindow = True
+        
+        if isWindow == True:
+            pass
+        else:
+            # Fix the name to remove 'PHPP_CONST_'
+            if 'PHPP_CONST_' in construcionNameEP:
+                constName_clean = construcionNameEP.split('PHPP_CONST_')[1].replace('_', ' ')
+            else:
+                constName_clean = construcionNameEP.replace('_', ' ')
+            
+            # Create the list of User-ID Constructions to match PHPP
+            uValueUID_Names.append('{:02d}ud-{}'.format(uID_Count, constName_clean) )
+            
+            # Create the Objects for the Header Piece (Name, Rsi, Rse)
+            nameAddress = PHPP_XL_Address.cell('M', uValuesConstructorStartRow + 1) # Construction Name
+            rSi = PHPP_XL_Address.cell('M', uValuesConstructorStartRow + 3) # R-surface-int
+            rSe = PHPP_XL_Address.cell('M', uValuesConstructorStartRow + 4) # R-surface-ext
+            intIns = PHPP_XL_Address.cell('S', uValuesConstructorStartRow + 1) # Interior Insulation Flag
+            
+            uValuesList.add('U-Values', nameAddress, constName_clean)
+            uValuesList.add('U-Values', rSi, 0, 'M2K/W', 'HR-FT2-F/BTU')
+            uValuesList.add('U-Values', rSe, 0, 'M2K/W', 'HR-FT2-F/BTU') # For now, zero out
+            if eachConst.IntInsul != None:
+                uValuesList.add('U-Values', intIns, 'x')
+            
+            # Create the actual Material Layers for PHPP U-Value
+            layerCount = 0
+            for layer in layers:
+                # For each layer in the Construction Assembly...
+                for eachMatLayer in _materials:
+                    # See if the Construction's Layer material name matches one in the Materials list....
+                    # If so, use those parameters from the Material Layer
+                    if layer[1] == getattr(eachMatLayer, 'Name'):
+                        # Filter out any MASSLAYERs
+                        if layer[1] != 'MASSLAYER':
+                            
+                            # Clean the name
+                            if 'PHPP_MAT_' in layer[1]:
+                                layerMatName = layer[1].split('PHPP_MAT_')[1].replace('_', ' ')
+                            else:
+                                layerMatName = layer[1].replace('_', ' ')
+                            
+                            layerMatCond = getattr(eachMatLayer, 'LayerConductivity')
+                            layerThickness = getattr(eachMatLayer, 'LayerThickness')*1000 # Cus PHPP uses mm for thickness
+                            
+                            # Set up the Range tagets
+                            layer1Address_L = PHPP_XL_Address.cell('L', uValuesConstructorStartRow + 7 + layerCount) # Material Name
+                            layer1Address_M = PHPP_XL_Address.cell('M', uValuesConstructorStartRow + 7 + layerCount) # Conductivity
+                            layer1Address_S = PHPP_XL_Address.cell('S', uValuesConstructorStartRow + 7 + layerCount) # Thickness
+                            
+                            # Create the Layer Objects
+                            uValuesList.add('U-Values', layer1Address_L, layerMatName)# Material Name
+                            uValuesList.add('U-Values', layer1Address_M, layerMatCond, 'W/MK', 'HR-FT2-F/BTU-IN') # Conductivity
+                            uValuesList.add('U-Values', layer1Address_S, layerThickness, 'MM', 'IN') # Thickness
+                            
+                            layerCount+=1
+            
+            uID_Count += 1
+            uValuesConstructorStartRow += 21
+    
+    return uValuesList, uValueUID_Names
+
+def getComponents(_inputBranch):
+    winComponentStartRow = 15
+    frame_Count = 0
+    glass_Count = 0
+    winComponentsList = PHPP_XL_WriteBatch()
+    glassNameDict = {}
+    frameNameDict = {}
+    
+    log.info('Creating the Components:Window Objects...')
+    for eachWin in _inputBranch:
+        # For each PHPP Style Window Object in the model....
+        
+        ########## Glass ##########
+        # Pull out the Glass info from the window
+        gNm = getattr(eachWin.Type_Glass, 'Name')
+        gV = getattr(eachWin.Type_Glass, 'gValue')
+        uG = getattr(eachWin.Type_Glass, 'uValue')
+        
+        if gNm not in glassNameDict.keys():
+            # Add the new glass type to the dict of UD Names:
+            # ie: {'Ikon: SDH': '01ud-Ikon: SDH', ....}
+            glassNameDict[gNm] = '{:02d}ud-{}'.format(glass_Count+1, gNm)
+            
+            # Set the glass range addresses
+            Address_Gname = PHPP_XL_Address.cell('IE', winComponentStartRow + glass_Count) # Name
+            Address_Gvalue = PHPP_XL_Address.cell('IF', winComponentStartRow + glass_Count) # g-Value
+            Address_Uvalue = PHPP_XL_Address.cell('IG', winComponentStartRow + glass_Count) # U-Value
+            
+            # Create the PHPP write Objects
+            winComponentsList.add('Components', Address_Gname, gNm)# Glass Type Name
+            winComponentsList.add('Components', Address_Gvalue, gV)# g-Value
+            winComponentsList.add('Components', Address_Uvalue, uG, 'W/M2K', 'BTU/HR-FT2-F' )# U-Value
+            
+            glass_Count +=1
+            
+        # Add the new PHPP UD Glass Name to the Window:Simple Object
+        setattr(eachWin, 'UD_glass_Name', glassNameDict[gNm] )
+        
+        ########## Frames ##########
+        # Get the Frame info
+        fNm = getattr(eachWin.Type_Frame, 'Name')
+        uF_L, uF_R, uF_B, uF_T  = eachWin.Type_Frame.uLeft, eachWin.Type_Frame.uRight, eachWin.Type_Frame.uBottom, eachWin.Type_Frame.uTop
+        wF_L, wF_R, wF_B, wF_T  = eachWin.Type_Frame.fLeft, eachWin.Type_Frame.fRight, eachWin.Type_Frame.fBottom, eachWin.Type_Frame.fTop
+        psiG_L, psiG_R, psiG_B, psiG_T  = eachWin.Type_Frame.psigLeft, eachWin.Type_Frame.psigRight, eachWin.Type_Frame.psigBottom, eachWin.Type_Frame.psigTop
+        psiI_L, psiI_R, psiI_B, psiI_T  = eachWin.Type_Frame.psiInstLeft, eachWin.Type_Frame.psiInstRight, eachWin.Type_Frame.psiInstBottom, eachWin.Type_Frame.psiInstTop
+        
+        if fNm not in frameNameDict.keys():
+            # Add the new frame type to the dict of UD Names:
+            # ie: {'Ikon: SDH': '01ud-Ikon: SDH', ....}
+            frameNameDict[fNm] = '{:02d}ud-{}'.format(frame_Count+1, fNm) # was glass_count????
+            
+            # Set the frame range address
+            Address_Fname = PHPP_XL_Address.cell('IL', winComponentStartRow + frame_Count)
+            Address_Uf_Left = PHPP_XL_Address.cell('IM', winComponentStartRow + frame_Count)
+            Address_Uf_Right = PHPP_XL_Address.cell('IN', winComponentStartRow + frame_Count)
+            Address_Uf_Bottom = PHPP_XL_Address.cell('IO', winComponentStartRow + frame_Count)
+            Address_Uf_Top = PHPP_XL_Address.cell('IP', winComponentStartRow + frame_Count)
+            Address_W_Left = PHPP_XL_Address.cell('IQ', winComponentStartRow + frame_Count)
+            Address_W_Right = PHPP_XL_Address.cell('IR', winComponentStartRow + frame_Count)
+            Address_W_Bottom = PHPP_XL_Address.cell('IS', winComponentStartRow + frame_Count)
+            Address_W_Top = PHPP_XL_Address.cell('IT', winComponentStartRow + frame_Count)
+            Address_Psi_g_Left = PHPP_XL_Address.cell('IU', winComponentStartRow + frame_Count)
+            Address_Psi_g_Right = PHPP_XL_Address.cell('IV', winComponentStartRow + frame_Count)
+            Address_Psi_g_Bottom = PHPP_XL_Address.cell('IW', winComponentStartRow + frame_Count)
+            Address_Psi_g_Top = PHPP_XL_Address.cell('IX', winComponentStartRow + frame_Count)
+            Address_Psi_I_Left = PHPP_XL_Address.cell('IY', winComponentStartRow + frame_Count)
+            Address_Psi_I_Right = PHPP_XL_Address.cell('IZ', winComponentStartRow + frame_Count)
+            Address_Psi_I_Bottom = PHPP_XL_Address.cell('JA', winComponentStartRow + frame_Count)
+            Address_Psi_I_Top = PHPP_XL_Address.cell('JB', winComponentStartRow + frame_Count)
+            
+            # Create the PHPP Objects for the Frames
+            winComponentsList.add('Components', Address_Fname, fNm)# Frame Type Name
+            
+            winComponentsList.add('Components', Address_Uf_Left, uF_L, 'W/M2K', 'BTU/HR-FT2-F') # Frame Type U-Values
+            winComponentsList.add('Components', Address_Uf_Right, uF_R, 'W/M2K', 'BTU/HR-FT2-F')
+            winComponentsList.add('Components', Address_Uf_Bottom, uF_B, 'W/M2K', 'BTU/HR-FT2-F')
+            winComponentsList.add('Components', Address_Uf_Top, uF_T, 'W/M2K', 'BTU/HR-FT2-F')
+            
+            winComponentsList.add('Components', Address_W_Left, wF_L, 'M', 'IN') # Frame Type Widths
+            winComponentsList.add('Components', Address_W_Right, wF_R, 'M', 'IN')
+            winComponentsList.add('Components', Address_W_Bottom, wF_B, 'M', 'IN')
+            winComponentsList.add('Components', Address_W_Top, wF_T, 'M', 'IN')
+            
+            winComponentsList.add('Components', Address_Psi_g_Left, psiG_L, 'W/MK', 'BTU/HR-FT-F') # Frame Type Psi-Glazing
+            winComponentsList.add('Components', Address_Psi_g_Right, psiG_R, 'W/MK', 'BTU/HR-FT-F')
+            winComponentsList.add('Components', Address_Psi_g_Bottom, psiG_B, 'W/MK', 'BTU/HR-FT-F')
+            winComponentsList.add('Components', Address_Psi_g_Top, psiG_T, 'W/MK', 'BTU/HR-FT-F')
+            
+            winComponentsList.add('Components', Address_Psi_I_Left, psiI_L, 'W/MK', 'BTU/HR-FT-F') # Frame Type Psi-Installs
+            winComponentsList.add('Components', Address_Psi_I_Right, psiI_R, 'W/MK', 'BTU/HR-FT-F')
+            winComponentsList.add('Components', Address_Psi_I_Bottom, psiI_B, 'W/MK', 'BTU/HR-FT-F')
+            winComponentsList.add('Components', Address_Psi_I_Top, psiI_T, 'W/MK', 'BTU/HR-FT-F')
+            
+            frame_Count +=1
+            
+        # Add the PHPP UD Frame Name to the Window:Simple Object
+        setattr(eachWin, 'UD_frame_Name', frameNameDict[fNm] )
+    
+    return winComponentsList
+
+def getAreas(_inputBranch, _zones, _uValueUID_Names):
+    areasRowStart = 41
+    areaCount = 0
+    uID_Count = 1
+    areasList = PHPP_XL_WriteBatch()
+    surfacesIncluded = []
+    log.info("Creating the 'Areas' Objects...")
+    for surface in _inputBranch:
+        # for each Opaque Surface in the model....
+        
+        # First, see if the Surface should be included in the output
+        includeSurface = False
+        for eachZoneName in _zones:
+            if surface.HostZoneName == eachZoneName:
+                includeSurface = True
+                break
+            else:
+                includeSurface = False
+        
+        if includeSurface:
+            # Get the Surface Parameters
+            nm = getattr(surface, 'Name')
+            groupNum = getattr(surface, 'GroupNum')
+            quantity = 1
+            surfaceArea = getattr(surface, 'SurfaceArea')
+            assemblyName = getattr(surface, 'AssemblyName').replace('_', ' ') 
+            angleFromNorth = getattr(surface, 'AngleFromNorth')
+            angleFromHoriz = getattr(surface, 'AngleFromHoriz')
+            shading = getattr(surface, 'Factor_Shading')
+            abs = getattr(surface, 'Factor_Absorptivity')
+            emmis = getattr(surface, 'Factor_Emissivity')
+            
+            # Find the right UID name (with the numeric prefix)
+            for uIDName in _uValueUID_Names:
+                if assemblyName in uIDName[5:] or uIDName[5:] in assemblyName: # compare to slice without prefix
+                    assemblyName = uIDName
+            
+            # Setup the Excel Address Locations
+            Address_Name = PHPP_XL_Address.cell('L', areasRowStart + areaCount)
+            Address_GroupNum = PHPP_XL_Address.cell('M', areasRowStart + areaCount)
+            Address_Quantity = PHPP_XL_Address.cell('P', areasRowStart + areaCount)
+            Address_Area = PHPP_XL_Address.cell('V', areasRowStart + areaCount)
+            Address_Assembly = PHPP_XL_Address.cell('AC', areasRowStart + areaCount)
+            Address_AngleNorth = PHPP_XL_Address.cell('AG', areasRowStart + areaCount)
+            Address_AngleHoriz = PHPP_XL_Address.cell('AH', areasRowStart + areaCount)
+            Address_ShadingFac = PHPP_XL_Address.cell('AJ', areasRowStart + areaCount)
+            Address_Abs = PHPP_XL_Address.cell('AK', areasRowStart + areaCount)
+            Address_Emmis = PHPP_XL_Address.cell('AL', areasRowStart + areaCount)
+            
+            areasList.add('Areas', Address_Name, nm)# Surface Name
+            areasList.add('Areas', Address_GroupNum, groupNum)# Surface Group Number
+            areasList.add('Areas', Address_Quantity, quantity)# Surface Quantity
+            areasList.add('Areas', Address_Area, surfaceArea, 'M2', 'FT2')# Surface Area (m2)
+            areasList.add('Areas', Address_Assembly, assemblyName)# Assembly Type Name
+            areasList.add('Areas', Address_AngleNorth, angleFromNorth)# Orientation Off North
+            areasList.add('Areas', Address_AngleHoriz, angleFromHoriz)# Orientation Off Horizontal
+            areasList.add('Areas', Address_ShadingFac, shading)# Shading Factor
+            areasList.add('Areas', Address_Abs, abs)# Absorptivity
+            areasList.add('Areas', Address_Emmis, emmis)# Emmissivity
+            
+            # Add the PHPP UD Surface Name to the Surface Object
+            setattr(surface, 'UD_Srfc_Name', '{:d}-{}'.format(uID_Count, nm) )
+            
+            # Keep track of which Surfaces are included in the output
+            surfacesIncluded.append(nm)
+            
+            uID_Count += 1
+            areaCount += 1
+    
+    areasList.add('Areas', 'L19', 'Suspended Floor')
+    return areasList, surfacesIncluded
+
+def getThermalBridges(_inputBranch, _startRows):
+    tb_RowStart = _startRows.get('Areas').get('TB')
+    tb_List = PHPP_XL_WriteBatch()
+    log.info("Creating the 'Thermal Bridging' Objects...")
+    for i, tb in enumerate(_inputBranch):
+        # for each Thermal Bridge in the model....
+        if tb.Name == 'Estimated':
+            i = 0
+        else:
+            i = i+1
+        
+         # Setup the Excel Address Locations
+        Address_Name = PHPP_XL_Address.cell('L', tb_RowStart + i)
+        Address_GroupNo = PHPP_XL_Address.cell('M', tb_RowStart + i)
+        Address_Quantity = PHPP_XL_Address.cell('P', tb_RowStart + i)
+        Address_Length = PHPP_XL_Address.cell('R', tb_RowStart + i)
+        Address_PsiValue = PHPP_XL_Address.cell('X', tb_RowStart + i)
+        
+        tb_List.add('Areas', Address_Name, tb.Name)
+        tb_List.add('Areas', Address_GroupNo, tb.GroupNo)
+        tb_List.add('Areas', Address_Quantity, 1)
+        tb_List.add('Areas', Address_Length, tb.Length, 'M', 'FT')
+        tb_List.add('Areas', Address_PsiValue, tb.PsiValue, 'W/MK', 'BTU/HR-FT-F')
+    
+    return tb_List
+
+def getWindows(_inputBranch, _surfacesIncluded, _srfcBranch):
+    windowsRowStart = 24
+    windowsCount = 0
+    winSurfacesList = PHPP_XL_WriteBatch()
+    
+    log.info("Creating the 'Windows' Objects...")
+    for window in _inputBranch:
+        # for each Window Surface Object in the model....
+        # Get the window's basic params
+        quant = getattr(window, 'Quantity')
+        nm = getattr(window, 'Name')
+        w = getattr(window, 'Width')
+        h = getattr(window, 'Height')
+        host = getattr(window, 'HostSrfc')
+        glassTypeUD = getattr(window, 'UD_glass_Name')
+        frameTypeUD = getattr(window, 'UD_frame_Name')
+        variantType = getattr(window, 'Type_Variant', 'a')
+        
+        # See if the Window should be included in the output
+        includeWindow = False
+        for eachSurfaceName in _surfacesIncluded:
+            if eachSurfaceName == host:
+                includeWindow = True
+                break
+            else:
+                includeWindow = False
+        
+        if includeWindow:
+            # Find the Window's Host Surface UD
+            for srfc in _srfcBranch:
+                if host == getattr(srfc, 'Name'):
+                    hostUD = getattr(srfc, 'UD_Srfc_Name')
+           
+           # Get the Window Range Addresses
+            Address_varType = PHPP_XL_Address.cell('F', windowsRowStart + windowsCount)
+            Address_winQuantity = PHPP_XL_Address.cell('L', windowsRowStart + windowsCount)
+            Address_winName = PHPP_XL_Address.cell('M', windowsRowStart + windowsCount)
+            Address_w = PHPP_XL_Address.cell('Q', windowsRowStart + windowsCount)
+            Address_h = PHPP_XL_Address.cell('R', windowsRowStart + windowsCount)
+            Address_hostName = PHPP_XL_Address.cell('S', windowsRowStart + windowsCount)
+            Address_glassType = PHPP_XL_Address.cell('T', windowsRowStart + windowsCount)
+            Address_frameType = PHPP_XL_Address.cell('U', windowsRowStart + windowsCount)
+            Address_install_Left = PHPP_XL_Address.cell('AA', windowsRowStart + windowsCount)
+            Address_install_Right = PHPP_XL_Address.cell('AB', windowsRowStart + windowsCount)
+            Address_install_Bottom = PHPP_XL_Address.cell('AC', windowsRowStart + windowsCount)
+            Address_install_Top = PHPP_XL_Address.cell('AD', windowsRowStart + windowsCount)
+            
+            # Create the PHPP Window Object
+            winSurfacesList.add('Windows', Address_varType, variantType) # Quantity
+            winSurfacesList.add('Windows', Address_winQuantity, quant) # Quantity
+            winSurfacesList.add('Windows', Address_winName, nm) # Name
+            winSurfacesList.add('Windows', Address_w, w, 'M', 'FT') # Width
+            winSurfacesList.add('Windows', Address_h, h, 'M', 'FT') # Height
+            winSurfacesList.add('Windows', Address_hostName, hostUD) # Host Name
+            winSurfacesList.add('Windows', Address_glassType, glassTypeUD) # Glass UD Name
+            winSurfacesList.add('Windows', Address_frameType, frameTypeUD) # Frame UD Name
+            winSurfacesList.add('Windows', Address_install_Left, window.Installs.Inst_L) # Install Condition Left
+            winSurfacesList.add('Windows', Address_install_Right, window.Installs.Inst_R) # Install Condition Right
+            winSurfacesList.add('Windows', Address_install_Bottom, window.Installs.Inst_B) # Install Condition Bottom
+            winSurfacesList.add('Windows', Address_install_Top, window.Installs.Inst_T) # Install Condition Top
+            
+            windowsCount += 1
+            
+    return winSurfacesList
+
+def getShading(_inputBranch, _surfacesIncluded):
+    def includeWindow(_srf_names, host_srfc_name):
+        return True if host_srfc_name in _srf_names else False
+    
+    row_start = 17
+    row_count = 0
+    shadingList = PHPP_XL_WriteBatch()
+    log.info("Creating the 'Shading' Objects...")
+    for window in _inputBranch:
+        if includeWindow(_surfacesIncluded, getattr(window, 'HostSrfc')):
+            # First, try and get the 'simple' shading geometry if it exists
+            # Otherwise, try and get any direct shading factors applied to the window
+            row = row_start + row_count
+            row_count += 1
+           
+            shadingDims = window.getShadingDims_Simple()
+            if shadingDims:
+                try:
+                    shadingList.add( 'Shading', PHPP_XL_Address.cell('Z', row),  shadingDims.Horizon.h_hori)
+                    shadingList.add( 'Shading', PHPP_XL_Address.cell('AA', row), shadingDims.Horizon.d_hori)
+                    shadingList.add( 'Shading', PHPP_XL_Address.cell('AB', row), shadingDims.Reveal.o_reveal)
+                    shadingList.add( 'Shading', PHPP_XL_Address.cell('AC', row), shadingDims.Reveal.d_reveal)
+                    shadingList.add( 'Shading', PHPP_XL_Address.cell('AD', row), shadingDims.Overhang.o_over)
+                    shadingList.add( 'Shading', PHPP_XL_Address.cell('AE', row), shadingDims.Overhang.d_over)
+                except Exception as e:
+                    log.info('Something went wrong getting the Shading Dimension values?')
+                    log.info(e)
+            shading_factors = window.getShadingFactors()
+            if shading_factors:
+                winter_factor, summer_factor = shading_factors
+                
+                if winter_factor:
+                    shadingList.add( 'Shading', PHPP_XL_Address.cell('AF', row), winter_factor)
+                
+                if summer_factor:
+                    shadingList.add( 'Shading', PHPP_XL_Address.cell('AG', row), summer_factor)
+    
+    return shadingList
+
+def getTFA(tfaFromUser, tfaBranch, _zones):
+    ##########################################
+    ##############     TFA     ###############
+    tfa = PHPP_XL_WriteBatch()
+    
+    if len(tfaFromUser)>0:
+        if tfaFromUser[0] == 'From Zone Geometry':
+            # Pulling data in from the HB Zone Objects
+            log.info("Trying to find any Honeybee Zone Room TFA info...")
+            try:
+                tfaSurfaceAreas = [0]
+                for each in tfaBranch:
+                    # First, see if the Surface should be included in the output
+                    includeRoom = False
+                    for zoneName in _zones:
+                        if each.HostZoneName == zoneName:
+                            includeRoom = True
+                            break
+                        else:
+                            includeRoom = False
+                    
+                    if includeRoom:
+                        # Get the room's TFA info
+                        roomTFA = each.FloorArea_TFA
+                        tfaSurfaceAreas.append( roomTFA )
+                # Total up the TFA Areas for output
+                tfaTotal = sum(tfaSurfaceAreas)
+                tfa.add('Areas', 'V34', tfaTotal, 'M2', 'FT2' ) # TFA (m2)
+            except:
+                pass
+        else:
+            log.info("Determining the TFA from user input...")
+            tfaSurfaceAreas = [0]
+            for each in tfaFromUser:
+                try:
+                    # if its a number or list of numbers
+                    tfaSurfaceAreas.append(float(each))
+                except (TypeError, ValueError):
+                    # No geometry without Rhino, so only numbers here
+                    log.warning("Couldn't read the TFA value: {!r}".format(each))
+            
+            if sum(tfaSurfaceAreas) != 0:
+                tfaTotal = sum(tfaSurfaceAreas)
+                tfa.add('Areas', 'V34', tfaTotal, 'M2', 'FT2' ) # TFA (m2)
+    
+    return tfa
+
+def getAddnlVentRooms(_inputBranch, _ventSystems, _zones, _startRows):
+    log.info("Creating 'Additional Ventilation' Rooms... ")
+    addnlVentRooms = PHPP_XL_WriteBatch()
+    ventUnitsUsed = []
+    roomRowStart = _startRows.get('Additional Ventilation').get('Rooms', 57)
+    ventUnitRowStart = _startRows.get('Additional Ventilation').get('Vent Unit Selection', 97)
+    ventSystemsInlcuded = set()
+    i = 0
+    
+    for i, roomObj in enumerate(_inputBranch):
+        
+        # First, see if the Room should be included in the output
+        includeRoom = False
+        for zoneName in _zones:
+            if roomObj.HostZoneName == zoneName:
+                includeRoom = True
+                break
+            else:
+                includeRoom = False
+        
+        if includeRoom:
+            ventSystemsInlcuded.add(roomObj.VentSystemName)
+            
+            # Try and sort out the Room's Ventilation airflow and schedule if there is any
+            try:
+                roomAirFlow_sup = roomObj.getVsup()
+                roomAirFlow_eta = roomObj.getVeta()
+                roomAirFlow_trans = roomObj.getVtrans()
+            except:
+                roomAirFlow_sup = roomObj.getVsup()
+                roomAirFlow_eta = roomObj.getVeta()
+                roomAirFlow_trans = roomObj.getVtrans()
+            
+            try:
+                ventUnitName = roomObj.VentUnitName
+                ventSystemName = roomObj.VentSystemName
+            except:
+                ventUnitName = '97ud-Default HRV unit'
+                ventSystemName = 'Vent-1'
+            
+            # Get the Ventilation Schedule from the room if it has any
+            try:
+                speed_high = roomObj.phppVentSched.speed_high
+                time_high = roomObj.phppVentSched.time_high
+                speed_med = roomObj.phppVentSched.speed_med
+                time_med = roomObj.phppVentSched.time_med
+                speed_low = roomObj.phppVentSched.speed_low
+                time_low = roomObj.phppVentSched.time_low
+            except:
+                speed_high = 1
+                time_high = 1
+                speed_med = None
+                time_med = None
+                speed_low = None
+                time_low = None
+            
+            address_Amount = PHPP_XL_Address.cell('D', roomRowStart + i)
+            address_Name = PHPP_XL_Address.cell('E', roomRowStart + i)
+            address_VentAllocation = PHPP_XL_Address.cell('F', roomRowStart + i)
+            address_Area = PHPP_XL_Address.cell('G', roomRowStart + i)
+            address_RoomHeight = PHPP_XL_Address.cell('H', roomRowStart + i)
+            address_SupplyAirFlow = PHPP_XL_Address.cell('J', roomRowStart + i)
+            address_ExractAirFlow = PHPP_XL_Address.cell('K', roomRowStart + i)
+            address_TransferAirFlow = PHPP_XL_Address.cell('L', roomRowStart + i)
+            address_Util_hrs = PHPP_XL_Address.cell('N', roomRowStart + i)
+            address_Util_days = PHPP_XL_Address.cell('O', roomRowStart + i)
+            address_Holidays = PHPP_XL_Address.cell('P', roomRowStart + i)
+            
+            address_ventSpeed_high = PHPP_XL_Address.cell('Q', roomRowStart + i)
+            address_ventTime_high = PHPP_XL_Address.cell('R', roomRowStart + i) 
+            address_ventSpeed_med = PHPP_XL_Address.cell('S', roomRowStart + i)
+            address_ventTime_med = PHPP_XL_Address.cell('T', roomRowStart + i)
+            address_ventSpeed_low = PHPP_XL_Address.cell('U', roomRowStart + i)
+            address_ventTime_low = PHPP_XL_Address.cell('V', roomRowStart + i)
+            
+            ventMatchFormula = '=MATCH("{}",E{}:E{},0)'.format(ventSystemName, ventUnitRowStart, ventUnitRowStart+9)
+            
+            addnlVentRooms.add('Additional Vent', address_Amount, 1 )
+            addnlVentRooms.add('Additional Vent', address_Name, '{}-{}'.format(roomObj.RoomNumber, roomObj.RoomName ))
+            addnlVentRooms.add('Additional Vent', address_VentAllocation, ventMatchFormula )
+            addnlVentRooms.add('Additional Vent', address_Area, roomObj.FloorArea_TFA, 'M2', 'FT2')
+            addnlVentRooms.add('Additional Vent', address_RoomHeight, roomObj.RoomClearHeight, 'M2', 'FT2')
+            
+            addnlVentRooms.add('Additional Vent', address_SupplyAirFlow, roomAirFlow_sup, 'M3/H', 'CFM')
+            addnlVentRooms.add('Additional Vent', address_ExractAirFlow, roomAirFlow_eta, 'M3/H', 'CFM')
+            addnlVentRooms.add('Additional Vent', address_TransferAirFlow, roomAirFlow_trans, 'M3/H', 'CFM')
+            
+            addnlVentRooms.add('Additional Vent', address_Util_hrs, '24')
+            addnlVentRooms.add('Additional Vent', address_Util_days, '7')
+            addnlVentRooms.add('Additional Vent', address_Holidays,'0')
+            
+            addnlVentRooms.add('Additional Vent', address_ventSpeed_high, speed_high if speed_high else 1)
+            addnlVentRooms.add('Additional Vent', address_ventTime_high, time_high if time_high else 1)
+            addnlVentRooms.add('Additional Vent', address_ventSpeed_med,speed_med if speed_med else 1)
+            addnlVentRooms.add('Additional Vent', address_ventTime_med, time_med if time_med else 0)
+            addnlVentRooms.add('Additional Vent', address_ventSpeed_low,speed_low if speed_low else 0)
+            addnlVentRooms.add('Additional Vent', address_ventTime_low, time_low if time_low else 0)
+            
+            # Keep track of the names of the Vent units used
+            ventUnitsUsed.append( ventUnitName )
+    
+    # Include any Exhaust Ventilation Objects that are found in any of the included Vent Systems
+    rowCount = i+1
+    for ventSystemDict in _ventSystems:
+        for ventSystem in ventSystemDict.values():
+            if ventSystem.SystemName in ventSystemsInlcuded:
+                for exhaustVentObj in ventSystem.ExhaustObjs:
+                    for mode in ['on', 'off']:
+                        
+                        address_Amount = PHPP_XL_Address.cell('D', roomRowStart + rowCount)
+                        address_Name = PHPP_XL_Address.cell('E', roomRowStart + rowCount)
+                        address_VentAllocation = PHPP_XL_Address.cell('F', roomRowStart + rowCount)
+                        address_Area = PHPP_XL_Address.cell('G', roomRowStart + rowCount)
+                        address_RoomHeight = PHPP_XL_Address.cell('H', roomRowStart + rowCount)
+                        address_SupplyAirFlow = PHPP_XL_Address.cell('J', roomRowStart + rowCount)
+                        address_ExractAirFlow = PHPP_XL_Address.cell('K', roomRowStart + rowCount)
+                        address_TransferAirFlow = PHPP_XL_Address.cell('L', roomRowStart + rowCount)
+                        address_Util_hrs = PHPP_XL_Address.cell('N', roomRowStart + rowCount)
+                        address_Util_days = PHPP_XL_Address.cell('O', roomRowStart + rowCount)
+                        address_Holidays = PHPP_XL_Address.cell('P', roomRowStart + rowCount)
+                            
+                        address_ventSpeed_high = PHPP_XL_Address.cell('Q', roomRowStart + rowCount)
+                        address_ventTime_high = PHPP_XL_Address.cell('R', roomRowStart + rowCount) 
+                        address_ventSpeed_med = PHPP_XL_Address.cell('S', roomRowStart + rowCount)
+                        address_ventTime_med = PHPP_XL_Address.cell('T', roomRowStart + rowCount)
+                        address_ventSpeed_low = PHPP_XL_Address.cell('U', roomRowStart + rowCount)
+                        address_ventTime_low = PHPP_XL_Address.cell('V', roomRowStart + rowCount)
+                        
+                        ventMatchFormula = '=MATCH("{}",E{}:E{},0)'.format(exhaustVentObj.Name, ventUnitRowStart, ventUnitRowStart+9)
+                        
+                        addnlVentRooms.add('Additional Vent', address_Amount, 1 )
+                        addnlVentRooms.add('Additional Vent', address_Name, exhaustVentObj.Name +' [ON]' if mode=='on' else exhaustVentObj.Name +' [OFF]')
+                        addnlVentRooms.add('Additional Vent', address_VentAllocation, ventMatchFormula )
+                        addnlVentRooms.add('Additional Vent', address_Area, '10', 'M', 'FT')
+                        addnlVentRooms.add('Additional Vent', address_RoomHeight, '2.5', 'M', 'FT' )
+                        
+                        addnlVentRooms.add('Additional Vent', address_SupplyAirFlow, exhaustVentObj.FlowRate_On if mode=='on' else exhaustVentObj.FlowRate_Off, 'M3/H', 'CFM')
+                        addnlVentRooms.add('Additional Vent', address_ExractAirFlow, exhaustVentObj.FlowRate_On if mode=='on' else exhaustVentObj.FlowRate_Off, 'M3/H', 'CFM')
+                        addnlVentRooms.add('Additional Vent', address_TransferAirFlow, '0', 'M3/H', 'CFM' )
+                        
+                        addnlVentRooms.add('Additional Vent', address_Util_hrs, exhaustVentObj.HrsPerDay_On if mode=='on' else 24 - float(exhaustVentObj.HrsPerDay_On))
+                        addnlVentRooms.add('Additional Vent', address_Util_days, exhaustVentObj.DaysPerWeek_On if mode=='on' else 7)
+                        addnlVentRooms.add('Additional Vent', address_Holidays, exhaustVentObj.Holidays)
+                        
+                        addnlVentRooms.add('Additional Vent', address_ventSpeed_high, 1)
+                        addnlVentRooms.add('Additional Vent', address_ventTime_high, 1)
+                        addnlVentRooms.add('Additional Vent', address_ventSpeed_med,0)
+                        addnlVentRooms.add('Additional Vent', address_ventTime_med, 0)
+                        addnlVentRooms.add('Additional Vent', address_ventSpeed_low, 0)
+                        addnlVentRooms.add('Additional Vent', address_ventTime_low, 0)
+                        
+                        rowCount += 1
+    
+    return addnlVentRooms, ventUnitsUsed
+
+def getAddnlVentSystems(_inputBranch, _ventUnitsUsed, _startRows):
+    # Go through each Ventilation System passed in
+    vent = PHPP_XL_WriteBatch()
+    ventCompoRowStart = _startRows.get('Components').get('Ventilator')
+    ventUnitRowStart = _startRows.get('Additional Ventilation').get('Vent Unit Selection')
+    ventDuctsRowStart = _startRows.get('Additional Ventilation').get('Vent Ducts')
+    ventCount = 0
+    ductsCount = 0
+    ductColCount = ord('Q')
+    
+    if len(_inputBranch)>0:
+        log.info("Creating 'Additional Ventilation' Systems...")
+        vent.add('Ventilation', 'H42', 'x') # Turn on Additional Vent
+        vent.add('Additional Vent', 'F'+str(ventDuctsRowStart-11) , "=AVERAGE(Climate!E24, Climate!F24, Climate!N24, Climate!O24, Climate!P24") # External Average Temp
+        
+        for key in _inputBranch[0].keys():
+            ventSystem = _inputBranch[0][key] 
+            
+            # Test to see if the Vent System should be included in the output
+            ventIncluded = False
+            for ventUnitName in _ventUnitsUsed:
+                if ventSystem.Unit_Name == ventUnitName:
+                    ventIncluded = True
+                    break
+                else:
+                    ventIncluded = False
+            
+            # Basic Ventialtion
+            if ventIncluded:
+                # Create the Vent Unit in the Components Worksheet
+                vent.add('Components', PHPP_XL_Address.cell('JH', ventCompoRowStart + ventCount), ventSystem.Unit_Name if ventSystem else 'Default_Name' ) #  Create the Vent Unit
+                vent.add('Components', PHPP_XL_Address.cell('JI', ventCompoRowStart + ventCount), ventSystem.Unit_HR if ventSystem else 0.75 ) #  Vent Heat Recovery
+                vent.add('Components', PHPP_XL_Address.cell('JJ', ventCompoRowStart + ventCount), ventSystem.Unit_MR if ventSystem else 0 ) #  Vent Moisture Recovery
+                vent.add('Components', PHPP_XL_Address.cell('JK', ventCompoRowStart + ventCount), ventSystem.Unit_ElecEff if ventSystem else 0.45, 'WH/M3', 'W/CFM') #  Vent Elec Efficiency
+                vent.add('Components', PHPP_XL_Address.cell('JL', ventCompoRowStart + ventCount), 1, 'M3/H', 'CFM') #  DEFAULT MIN FLOW
+                vent.add('Components', PHPP_XL_Address.cell('JM', ventCompoRowStart + ventCount), 10000, 'M3/H', 'CFM' ) #  DEFAULT MAX FLOW
+                
+                # Set the Vent Unit Type
+                vent.add('Ventilation', 'L12', ventSystem.SystemType) 
+                
+                # Set the UD name for access in 'Addnl-Vent' dropdown list
+                setattr(ventSystem, 'Unit_Name_UD', '{:02d}ud-{}'.format(ventCount+1, ventSystem.Unit_Name))
+                
+                # Build the Vent Unit
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('D', ventUnitRowStart + ventCount) ,  1) # Quantity
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('E', ventUnitRowStart + ventCount) ,  ventSystem.SystemName  if ventSystem.SystemName else '') # System Name
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('F', ventUnitRowStart + ventCount) ,  ventSystem.Unit_Name_UD if ventSystem else '') # Vent Conpmonent UD Name
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('Q', ventUnitRowStart + ventCount) ,  ventSystem.Exterior if ventSystem else '') # Exterior Installation?
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('X', ventUnitRowStart + ventCount) ,  '2-Elec.') # Frost Protection Type
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('Y', ventUnitRowStart + ventCount) ,  ventSystem.FrostTemp if ventSystem else '-5', 'C', 'F') # Frost Protection Temp
+                
+                # Build the Vent Unit Ducting
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('D', ventDuctsRowStart + ductsCount) , 1) # Quantity
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('E', ventDuctsRowStart + ductsCount) , ventSystem.Duct01.DuctWidth if ventSystem else 104, 'MM', 'IN')
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('H', ventDuctsRowStart + ductsCount) , ventSystem.Duct01.InsulationThickness if ventSystem else 52, 'MM', 'IN')
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('I', ventDuctsRowStart + ductsCount) , ventSystem.Duct01.InsulationLambda if ventSystem else 0.04, 'W/MK', 'HR-FT2-F/BTU-IN')
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('J', ventDuctsRowStart + ductsCount) , 'x' )# Reflective
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('L', ventDuctsRowStart + ductsCount) , ventSystem.Duct01.DuctLength if ventSystem else 5, 'M', 'FT' )
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('M', ventDuctsRowStart + ductsCount) , '1')
+                
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('D', ventDuctsRowStart + ductsCount+1) , 1) # Quantity
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('E', ventDuctsRowStart + ductsCount+1) , ventSystem.Duct02.DuctWidth if ventSystem else 104, 'MM', 'IN')
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('H', ventDuctsRowStart + ductsCount+1) , ventSystem.Duct02.InsulationThickness if ventSystem else 52, 'MM', 'IN')
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('I', ventDuctsRowStart + ductsCount+1) , ventSystem.Duct02.InsulationLambda if ventSystem else 0.04, 'W/MK', 'HR-FT2-F/BTU-IN')
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('J', ventDuctsRowStart + ductsCount+1) , 'x' )# Reflective
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('L', ventDuctsRowStart + ductsCount+1) , ventSystem.Duct02.DuctLength if ventSystem else 5, 'M', 'FT')
+                vent.add('Additional Vent',  PHPP_XL_Address.cell('N', ventDuctsRowStart + ductsCount+1) , '1')
+                
+                vent.add('Additional Vent',  PHPP_XL_Address.cell(chr(ductColCount), ventDuctsRowStart + ductsCount) , 1) # Assign Duct to Vent
+                vent.add('Additional Vent',  PHPP_XL_Address.cell(chr(ductColCount), ventDuctsRowStart + ductsCount+1) , 1) # Assign Duct to Vent
+                
+                ductColCount+=1
+                ductsCount+=2
+                ventCount+=1
+                
+            # Exhaust Ventilation Objects
+            if ventIncluded:
+                # Add in any 'Exhaust Only' ventilation objects (kitchen hoods, etc...)
+                for exhaustSystem in ventSystem.ExhaustObjs:
+                    # Build the Vent in the Components Worksheet
+                    vent.add('Components', PHPP_XL_Address.cell('JH', ventCompoRowStart + ventCount), exhaustSystem.Name if exhaustSystem.Name else 'Exhaust' ) #  Create the Vent Unit
+                    vent.add('Components', PHPP_XL_Address.cell('JI', ventCompoRowStart + ventCount), 0 ) #  Vent Heat Recovery
+                    vent.add('Components', PHPP_XL_Address.cell('JJ', ventCompoRowStart + ventCount), 0 ) #  Vent Moisture Recovery
+                    vent.add('Components', PHPP_XL_Address.cell('JK', ventCompoRowStart + ventCount), 0.25, 'WH/M3', 'W/CFM' ) #  Vent Elec Efficiency
+                    vent.add('Components', PHPP_XL_Address.cell('JL', ventCompoRowStart + ventCount), 1, 'M3/H', 'CFM') #  DEFAULT MIN FLOW
+                    vent.add('Components', PHPP_XL_Address.cell('JM', ventCompoRowStart + ventCount), 10000, 'M3/H', 'CFM' ) #  DEFAULT MAX FLOW
+                    
+                    # Set the UD name for access in 'Addnl-Vent' dropdown list
+                    setattr(exhaustSystem, 'Unit_Name_UD', '{:02d}ud-{}'.format(ventCount+1, exhaustSystem.Name))
+                    
+                    # Build the Vent Unit
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('D', ventUnitRowStart + ventCount) ,  1) # Quantity
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('E', ventUnitRowStart + ventCount) ,  exhaustSystem.Name  if exhaustSystem.Name else 'Exhaust_Unit')
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('F', ventUnitRowStart + ventCount) ,  exhaustSystem.Unit_Name_UD) # Vent Component UD Name
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('Q', ventUnitRowStart + ventCount) ,  '') # Exterior Installation?
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('X', ventUnitRowStart + ventCount) ,  '1-No') # Frost Protection Type
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('Y', ventUnitRowStart + ventCount) ,  '-5', 'C', 'F') # Frost Protection Temp
+                    
+                    # Build the Vent Unit Ducting
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('D', ventDuctsRowStart + ductsCount) , 1) # Quantity
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('E', ventDuctsRowStart + ductsCount) , exhaustSystem.Duct01.DuctWidth if exhaustSystem else 104, 'MM', 'IN')
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('H', ventDuctsRowStart + ductsCount) , exhaustSystem.Duct01.InsulationThickness if exhaustSystem else 52, 'MM', 'IN')
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('I', ventDuctsRowStart + ductsCount) , exhaustSystem.Duct01.InsulationLambda if exhaustSystem else 0.04, 'W/MK', 'HR-FT2-F/BTU-IN')
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('J', ventDuctsRowStart + ductsCount) , 'x' )# Reflective
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('L', ventDuctsRowStart + ductsCount) , exhaustSystem.Duct01.DuctLength if exhaustSystem else 5, 'M', 'FT')
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('M', ventDuctsRowStart + ductsCount) , '1')
+                    
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('D', ventDuctsRowStart + ductsCount+1) , 1) # Quantity
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('E', ventDuctsRowStart + ductsCount+1) , exhaustSystem.Duct02.DuctWidth if exhaustSystem else 104, 'MM', 'IN')
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('H', ventDuctsRowStart + ductsCount+1) , exhaustSystem.Duct02.InsulationThickness if exhaustSystem else 52, 'MM', 'IN')
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('I', ventDuctsRowStart + ductsCount+1) , exhaustSystem.Duct02.InsulationLambda if exhaustSystem else 0.04, 'W/MK', 'HR-FT2-F/BTU-IN')
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('J', ventDuctsRowStart + ductsCount+1) , 'x' )# Reflective
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('L', ventDuctsRowStart + ductsCount+1) , exhaustSystem.Duct02.DuctLength if exhaustSystem else 5, 'M', 'FT')
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell('N', ventDuctsRowStart + ductsCount+1) , '1')
+                    
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell(chr(ductColCount), ventDuctsRowStart + ductsCount) , 1) # Assign Duct to Vent
+                    vent.add('Additional Vent',  PHPP_XL_Address.cell(chr(ductColCount), ventDuctsRowStart + ductsCount+1) , 1) # Assign Duct to Vent
+                    
+                    ductColCount+=1
+                    ductsCount+=2
+                    ventCount+=1
+    
+    return vent
+
+def getNonResRoomData(_inputBranch, _zones, _startRows):
+    log.info("Creating 'Electricity non-res' Objects ... ")
+    elecNonRes = PHPP_XL_WriteBatch()
+    rowStart_Lighting = _startRows.get('Electricity non-res').get('Lighting', 19)
+    
+    for i, roomObj in enumerate(_inputBranch):
+        # First, see if the Room should be included in the output
+        includeRoom = False
+        for zoneName in _zones:
+            if roomObj.HostZoneName != zoneName:
+                includeRoom = False
+            elif getattr(roomObj, 'NonRes_RoomUse', '-') == '-':
+                includeRoom = False
+            else:
+                includeRoom = True
+                break
+        
+        # If the Room is to be included, write out the Excel objects
+        if includeRoom:
+            # Try and sort out the Room's Ventilation airflow and schedule if there is any
+            if getattr(roomObj, 'NonRes_RoomLightingControl', None):
+                roomID = '{}-{}'.format(getattr(roomObj, 'RoomNumber', None), getattr(roomObj, 'RoomName', None) )
+                lightingControlNum = getattr(roomObj, 'NonRes_RoomLightingControl', '1-').split('-')[0]
+                
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('C', rowStart_Lighting+i), roomID)
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('D', rowStart_Lighting+i), getattr(roomObj, 'FloorArea_Gross', None), 'M2', 'FT2')
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('F', rowStart_Lighting+i), getattr(roomObj, 'NonRes_RoomUse', None) )
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('H', rowStart_Lighting+i), 0) # Deviation From North=0
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('J', rowStart_Lighting+i), 0.69) # Triple Glazing
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('M', rowStart_Lighting+i), getattr(roomObj, 'RoomDepth', None), 'M', 'FT')
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('N', rowStart_Lighting+i), '=D{}/M{}'.format(rowStart_Lighting+i, rowStart_Lighting+i)  )
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('O', rowStart_Lighting+i), getattr(roomObj, 'RoomClearHeight', None), 'M', 'FT')
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('P', rowStart_Lighting+i), 1, 'M', 'FT'  ) # Lintel Height
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('Q', rowStart_Lighting+i), 0, 'M', 'FT'  ) # Window Width                
+                elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('W', rowStart_Lighting+i), lightingControlNum )
+                
+                if getattr(roomObj, 'NonRes_RoomMotionControl', 'No')=='Yes':
+                    elecNonRes.add('Electricity non-res', PHPP_XL_Address.cell('X', rowStart_Lighting+i), 'x' )
+    
+    return elecNonRes
+
+def getInfiltration(_inputBranch, _zonesToInclude):
+    ##########################################
+    ######   Envelope Airtightness    ########
+    
+    # Defaults
+    Coef_E = 0.07
+    Coef_F  = 15
+    bldgWeightedACH = None
+    bldgVn50 = None
+    
+    # Find the Floor-Area Weighted Average ACH of the Zones
+    zonesVn50 = []
+    zonesFloorArea = []
+    zonesWeightedACH = []
+    
+    for zoneNametoInclude in _zonesToInclude:
+        for zoneObj in _inputBranch:
+            if zoneObj.ZoneName == zoneNametoInclude:
+                try:
+                    zonesFloorArea.append(zoneObj.FloorArea_Gross if zoneObj.FloorArea_Gross else False)
+                    zonesWeightedACH.append(zoneObj.InfiltrationACH50 * zoneObj.FloorArea_Gross)
+                    zonesVn50.append(zoneObj.Volume_Vn50)
+                except:
+                    pass
+    
+    if sum(zonesFloorArea)!= 0:
+        bldgWeightedACH = sum(zonesWeightedACH) / sum(zonesFloorArea)
+        bldgVn50 = sum(zonesVn50)
+    
+    airtightness = PHPP_XL_WriteBatch()
+    log.info("Creating the Airtightness Objects...")
+    airtightness.add('Ventilation', 'N25', Coef_E if Coef_E else float(0.07) )# Wind protection E
+    airtightness.add('Ventilation', 'N26', Coef_F if Coef_F else float(15) )# Wind protection F
+    airtightness.add('Ventilation', 'N27', bldgWeightedACH if bldgWeightedACH else float(0.6) )# ACH50
+    airtightness.add('Ventilation', 'P27', bldgVn50 if bldgVn50 else '=N9*1.2', 'M3', 'FT3' )#  Internal Reference Volume
+    
+    return airtightness
+
+def updateStartRows(_startRowDict, _udIn):
+    """Takes in the dictionary of start rows and any user-determined inputs
+    modifies the dict values based on iputs. This is useful if the user has
+    modified the PHPP for some reason and the start rows no longer align with 
+    the normal ones. This happens esp. if the user adds more rows for an XXL
+    size PHPP. (more rooms, more areas, etc...)"""
+    try:
+        for each in _udIn:
+            parsed = each.split(':')
+            newRowStart = int(parsed[1])
+            worksheet, startItem = (parsed[0].split(','))
+            _startRowDict[worksheet.lstrip().rstrip()][startItem.lstrip().rstrip()] = newRowStart
+    except (IndexError, KeyError, ValueError):
+        log.warning("Couldn't read the Start Rows? Make sure it has dict keys separated by a comma and a semicolon before the value.")
+    
+    return _startRowDict
+
+def filterName(_zoneName, _zonesNamesToFilter):
+    flag = True
+    for each in _zonesNamesToFilter:
+        if each in _zoneName:
+            flag = False
+    
+    return flag
+
+def getLocation(_locationObjs):
+    climate = PHPP_XL_WriteBatch()
+    
+    if len(_locationObjs) == 0:
+        return climate
+    
+    loc = _locationObjs[0]
+    log.info("Creating the 'Climate' Objeects...")
+    climate.add('Climate', 'D9', loc.Country if loc else 'US-United States of America' ) # Climate Data Set Name (Dropdown)
+    climate.add('Climate', 'D10', loc.Region if loc else 'New York' ) # Climate Data Set Name (Dropdown)
+    climate.add('Climate', 'D12', loc.DataSet if loc else 'US0055b-New York' ) # Climate Data Set Name (Dropdown)
+    climate.add('Climate', 'D18', loc.Altitude if loc else '=D17' ) # Altitude
+    
+    return climate
+
+def getFootprint(_fp):
+    footprint = PHPP_XL_WriteBatch()
+    try:
+        fp_area = _fp[0].Footprint_area
+    except:
+        fp_area = 0
+    footprint.add('Areas', 'V33', fp_area)
+    
+    return footprint
+
+
+
+#-------------------------------------------------------------------------------
+
+def selectZones(_zoneObjs, _zonesInclude=None, _zonesExclude=None):
+    # Sort out which zones to include in the output
+    zones = [x.ZoneName for x in _zoneObjs]
+    if _zonesInclude:
+        zones = [x for x in zones if not filterName(x, _zonesInclude)]
+    if _zonesExclude:
+        zones = [x for x in zones if filterName(x, _zonesExclude)]
+    
+    return zones
+
+def createXLObjsGeom(_phppObjs, _zonesInclude=None, _zonesExclude=None, _tfa=None, _thermalBridges=None, _udRowStarts=None):
+    """ Builds all the Excel-ready write objects for the model
+    
+    Args:
+        _phppObjs (PHPPObjs): The PHPP Objects from idf2phppObjs.buildPHPPObjs
+        _zonesInclude (list): Optional. Only include Zones with any of these in their name
+        _zonesExclude (list): Optional. Leave out Zones with any of these in their name
+        _tfa (list): Optional. TFA values (m2), or ['From Zone Geometry'] to use the Room TFAs
+        _thermalBridges (list): Optional. Thermal Bridge objects (Name, GroupNo, Length, PsiValue)
+        _udRowStarts (list): Optional. Start Row strings, ie: 'Areas, Surfaces: 50'
+    Returns:
+        (list): A list of the PHPP_XL_WriteBatches (or empty lists), one for each of the geomGroupNames
+    """
+    
+    startRows = copy.deepcopy(defaultStartRows)
+    if _udRowStarts:
+        startRows = updateStartRows(startRows, _udRowStarts)
+    
+    zones = selectZones(_phppObjs.Zones, _zonesInclude, _zonesExclude)
+    log.info('Inlcuding Zones {} in the Export'.format(zones))
+    
+    uValuesList, uValueUID_Names    = getUvalues( _phppObjs.Constructions, _phppObjs.Materials )
+    winComponentsList               = getComponents( _phppObjs.Windows )
+    areasList, surfacesIncluded     = getAreas( _phppObjs.Surfaces, zones, uValueUID_Names )
+    tb_List                         = getThermalBridges( _thermalBridges or [], startRows )
+    winSurfacesList                 = getWindows( _phppObjs.Windows, surfacesIncluded, _phppObjs.Surfaces )
+    shadingList                     = getShading( _phppObjs.Windows, surfacesIncluded )
+    tfa                             = getTFA( _tfa or [], _phppObjs.Rooms, zones )
+    addnlVentRooms, ventUnitsUsed   = getAddnlVentRooms( _phppObjs.Rooms, _phppObjs.VentSystems, zones, startRows )
+    vent                            = getAddnlVentSystems( _phppObjs.VentSystems, ventUnitsUsed, startRows )
+    airtightness                    = getInfiltration( _phppObjs.Zones, zones )
+    nonRes_Elec                     = getNonResRoomData( _phppObjs.Rooms, zones, startRows )
+    location                        = getLocation( _phppObjs.Climate )
+    footprint                       = getFootprint( _phppObjs.Footprint )
+    
+    groups = [uValuesList, winComponentsList, areasList, winSurfacesList, shadingList, tfa, tb_List,
+              addnlVentRooms, vent, airtightness, [], [], nonRes_Elec, location, [], [], footprint]
+    
+    #---------------------------------------------------------------------------
+    # Give Warnings
+    if len(areasList)/10 > 100:
+        log.warning('It looks like you have {:.0f} surfaces in the model. By Default the PHPP can only '\
+        'hold 100 surfaces. Add more lines to the "Areas" worksheet and set the Areas Start Rows.'.format(len(areasList)/10))
+    
+    if len(addnlVentRooms)/17 > 30:
+        log.warning('It looks like you have {:.0f} rooms in the model. By Default the PHPP can only hold 30 '\
+        'rooms in the "Additional Ventilation" worksheet. Add more lines and set the Start Rows.'.format(len(addnlVentRooms)/17))
+    
+    if len(nonRes_Elec)/8 > 22:
+        log.warning('It looks like you have {:.0f} Non-Residential Rooms in the model. By Default the PHPP '\
+        'can only hold 22 rooms in the "Electricity non-res" worksheet.'.format(len(nonRes_Elec)/8))
+    
+    return groups
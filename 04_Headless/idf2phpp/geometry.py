@@ -0,0 +1,426 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+# 
+# This module is part of IDF2PHPP.
+# 
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com> 
+# IDF2PHPP is free software; you can redistribute it and/or modify 
+# it under the terms of the GNU General Public License as published 
+# by the Free Software Foundation; either version 3 of the License, 
+# or (at your option) any later version. 
+# 
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of 
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+# GNU General Public License for more details.
+# 
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+# 
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Planar polygon geometry, straight from the vertex coordinates (no Rhino / GH needed)
+
+BT_CORE imports the polygon functions from here and registers them in the sticky. The
+North vector (rs.VectorRotate in the components) is just a 2D rotation here, and the Zone
+volumes (HB Zone getZoneVolume) come from the surfaces directly.
+"""
+
+import math
+from array import array
+from collections import namedtuple, defaultdict
+
+Vec3 = namedtuple('Vec3', ['X', 'Y', 'Z'])
+PolygonProps = namedtuple('PolygonProps', ['Area', 'Centroid', 'Normal'])
+
+def phpp_polygonProps(_vertices):
+    """ Computes the area, centroid and normal of a planar polygon from its vertices
+    
+    The normal comes from Newell's method, so it points the same way as the vertex order
+    (counter-clockwise seen from outside, as in EnergyPlus) and works for concave polygons.
+    The area and centroid are the sums over a fan of triangles from the first vertex.
+    
+    Args:
+        _vertices: A flat list of the vertex coordinates [x1, y1, z1, x2, y2, z2, ...] (ie: IDF_Class.vertices)
+    Returns:
+        PolygonProps: 
+            Area (float): The surface area (m2)
+            Centroid (Vec3): The area centroid point
+            Normal (Vec3): The unit normal vector
+    """
+    
+    xs = _vertices[0::3]
+    ys = _vertices[1::3]
+    zs = _vertices[2::3]
+    numPts = len(xs)
+    
+    if numPts < 3:
+        centroid = Vec3(sum(xs)/max(numPts, 1), sum(ys)/max(numPts, 1), sum(zs)/max(numPts, 1))
+        return PolygonProps(0.0, centroid, Vec3(0.0, 0.0, 0.0))
+    
+    # Newell's Method for the normal
+    nx = ny = nz = 0.0
+    for i in range(numPts):
+        j = i + 1 if i + 1 < numPts else 0
+        nx += (ys[i] - ys[j]) * (zs[i] + zs[j])
+        ny += (zs[i] - zs[j]) * (xs[i] + xs[j])
+        nz += (xs[i] - xs[j]) * (ys[i] + ys[j])
+    
+    length = math.sqrt(nx*nx + ny*ny + nz*nz)
+    if length == 0:
+        centroid = Vec3(sum(xs)/numPts, sum(ys)/numPts, sum(zs)/numPts)
+        return PolygonProps(0.0, centroid, Vec3(0.0, 0.0, 0.0))
+    
+    nx, ny, nz = nx/length, ny/length, nz/length
+    
+    # Fan of triangles from the first point, with signed areas so concave shapes work too
+    x0, y0, z0 = xs[0], ys[0], zs[0]
+    area = cx = cy = cz = 0.0
+    for i in range(1, numPts-1):
+        ax, ay, az = xs[i] - x0, ys[i] - y0, zs[i] - z0
+        bx, by, bz = xs[i+1] - x0, ys[i+1] - y0, zs[i+1] - z0
+        triArea = ( nx*(ay*bz - az*by) + ny*(az*bx - ax*bz) + nz*(ax*by - ay*bx) ) / 2
+        
+        area += triArea
+        cx += triArea * (x0 + xs[i] + xs[i+1]) / 3
+        cy += triArea * (y0 + ys[i] + ys[i+1]) / 3
+        cz += triArea * (z0 + zs[i] + zs[i+1]) / 3
+    
+    if area == 0:
+        centroid = Vec3(sum(xs)/numPts, sum(ys)/numPts, sum(zs)/numPts)
+    else:
+        centroid = Vec3(cx/area, cy/area, cz/area)
+    
+    return PolygonProps(abs(area), centroid, Vec3(nx, ny, nz))
+
+def phpp_tiltFromNormal(_normal):
+    """ Returns the angle (Degrees) between the normal and straight up. 0=Roof, 90=Wall, 180=Floor """
+    
+    return math.degrees( math.acos( max(-1.0, min(1.0, _normal.Z)) ) )
+
+def phpp_polygonSize(_vertices, _normal):
+    """ Finds the width and height of a planar polygon, measured in its own plane
+    
+    Width is measured along the horizontal direction in the surface's plane and height 
+    up the slope of the surface. For a horizontal surface (ie: a skylight), the width is
+    measured along the World X axis and the height along the World Y axis.
+    
+    Args:
+        _vertices: A flat list of the vertex coordinates [x1, y1, z1, x2, y2, z2, ...]
+        _normal (Vec3): The surface's unit normal vector
+    Returns:
+        (tuple): 
+            0: width (float)
+            1: height (float)
+    """
+    
+    # In-plane horizontal axis (World-Z x Normal), and the 'up' axis (Normal x Horizontal)
+    hx, hy = -_normal.Y, _normal.X
+    length = math.sqrt(hx*hx + hy*hy)
+    if length < 1e-6:
+        hx, hy = 1.0, 0.0
+    else:
+        hx, hy = hx/length, hy/length
+    
+    vx, vy, vz = -_normal.Z*hy, _normal.Z*hx, _normal.X*hy - _normal.Y*hx
+    
+    xs = _vertices[0::3]
+    ys = _vertices[1::3]
+    zs = _vertices[2::3]
+    us = [x*hx + y*hy for x, y in zip(xs, ys)]
+    vs = [x*vx + y*vy + z*vz for x, y, z in zip(xs, ys, zs)]
+    
+    if not us:
+        return 0.0, 0.0
+    
+    return max(us) - min(us), max(vs) - min(vs)
+
+def phpp_mergeTriangles(_triangles, _places=6):
+    """ Re-builds a single polygon from a set of triangles which share edges
+    
+    Honeybee splits some windows into triangles ('..._glzP_0', '..._glzP_1', etc..). An 
+    edge that is only used by one triangle must be on the outside, so the outside loop is 
+    found by counting the edges (using the coordinates rounded to _places as the keys) and 
+    then walking from vertex to vertex along those outside edges. Any points in the middle
+    of a straight side are removed. The loop is turned to face the same way as the triangles.
+    
+    Args:
+        _triangles: A list of flat vertex lists [x1, y1, z1, x2, y2, z2, x3, y3, z3]
+        _places (int): The number of decimal places to match the vertices to. Default=6
+    Returns:
+        (array): The flat vertex list [x1, y1, z1, x2, ...] of the largest outside loop
+    """
+    
+    points = {}
+    edgeCount = defaultdict(int)
+    nx = ny = nz = 0.0
+    for vertices in _triangles:
+        keys = []
+        for pt in zip(vertices[0::3], vertices[1::3], vertices[2::3]):
+            key = (round(pt[0], _places), round(pt[1], _places), round(pt[2], _places))
+            points.setdefault(key, pt)
+            keys.append(key)
+        
+        for a, b in zip(keys, keys[1:] + keys[:1]):
+            if a != b:
+                edgeCount[ (a, b) if a < b else (b, a) ] += 1
+        
+        normal = phpp_polygonProps(vertices).Normal
+        nx, ny, nz = nx + normal.X, ny + normal.Y, nz + normal.Z
+    
+    # The outside edges are the ones only used once
+    neighbors = defaultdict(list)
+    for (a, b), count in edgeCount.items():
+        if count == 1:
+            neighbors[a].append(b)
+            neighbors[b].append(a)
+    
+    # Walk around each loop of outside edges
+    loops = []
+    usedEdges = set()
+    for start in sorted(neighbors.keys()):
+        for firstStep in neighbors[start]:
+            if (start, firstStep) in usedEdges:
+                continue
+            
+            loop = [start]
+            previous, current = start, firstStep
+            usedEdges.update( [(start, firstStep), (firstStep, start)] )
+            while current != start:
+                loop.append(current)
+                options = [pt for pt in neighbors[current] if (current, pt) not in usedEdges]
+                if not options:
+                    break
+                previous, current = current, options[0]
+                usedEdges.update( [(previous, current), (current, previous)] )
+            
+            if len(loop) >= 3:
+                loops.append(loop)
+    
+    if not loops:
+        return array('d')
+    
+    def flatten(_loop):
+        return array('d', [v for key in _loop for v in points[key]])
+    
+    loop = max(loops, key=lambda loop: phpp_polygonProps(flatten(loop)).Area)
+    
+    # Drop any points in the middle of a straight side
+    def isCollinear(_a, _b, _c):
+        (ax, ay, az), (bx, by, bz), (cx, cy, cz) = points[_a], points[_b], points[_c]
+        ux, uy, uz = bx - ax, by - ay, bz - az
+        vx, vy, vz = cx - bx, cy - by, cz - bz
+        cross = (uy*vz - uz*vy, uz*vx - ux*vz, ux*vy - uy*vx)
+        return math.sqrt(sum(c*c for c in cross)) <= 10**-_places * math.sqrt(ux*ux + uy*uy + uz*uz + vx*vx + vy*vy + vz*vz)
+    
+    loop = [key for i, key in enumerate(loop) if not isCollinear(loop[i-1], key, loop[(i+1) % len(loop)])]
+    
+    # Face the same way as the triangles did
+    normal = phpp_polygonProps(flatten(loop)).Normal
+    if normal.X*nx + normal.Y*ny + normal.Z*nz < 0:
+        loop.reverse()
+    
+    return flatten(loop)
+
+Footprint2D = namedtuple('Footprint2D', ['Area', 'Outline'])
+
+def phpp_polygonUnion2D(_polygons):
+    """ Finds the area and outline of the union of a set of 2D polygons
+    
+    Sweeps across the polygons in X. The strips between each vertex X (and each X where 
+    two edges cross) contain no vertices or crossings, so across each strip the union is 
+    just a set of Y-intervals which change linearly: the area of the strip is exact from 
+    the intervals at its middle. The outline is made from the edges which sit on the
+    end of an interval, plus the vertical steps where the intervals change between strips.
+    Overlapping, touching, concave and stacked polygons (ie: the floors of a multi-storey 
+    building) are all fine.
+    
+    Args:
+        _polygons: A list of polygons, each a list of (x, y) points
+    Returns:
+        Footprint2D:
+            Area (float): The area of the union
+            Outline (list): The (x1, y1, x2, y2) segments of the union's boundary
+    """
+    
+    polygons = []
+    for polygon in _polygons:
+        pts = [(float(x), float(y)) for x, y in polygon]
+        pts = [pt for i, pt in enumerate(pts) if pt != pts[i-1]]
+        if len(pts) >= 3:
+            polygons.append(pts)
+    
+    if not polygons:
+        return Footprint2D(0.0, [])
+    
+    allXs = [x for pts in polygons for x, y in pts]
+    allYs = [y for pts in polygons for x, y in pts]
+    tol = 1e-9 * max(1.0, max(allXs) - min(allXs), max(allYs) - min(allYs))
+    
+    # Non-vertical edges, left point first: (x1, y1, x2, y2, polygon number)
+    edges = []
+    verticals = defaultdict(list)
+    for i, pts in enumerate(polygons):
+        for (xa, ya), (xb, yb) in zip(pts, pts[1:] + pts[:1]):
+            if xa == xb:
+                verticals[xa].extend([ya, yb])
+            elif xa < xb:
+                edges.append( (xa, ya, xb, yb, i) )
+            else:
+                edges.append( (xb, yb, xa, ya, i) )
+    edges.sort()
+    
+    def yAt(_edge, _x):
+        x1, y1, x2, y2 = _edge[:4]
+        return y1 + (y2 - y1) * (_x - x1) / (x2 - x1)
+    
+    def mergeIntervals(_intervals):
+        merged = []
+        for start, end in sorted(_intervals):
+            if merged and start <= merged[-1][1] + tol:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        return merged
+    
+    def unionIntervals(_active, _xOrder, _xEval):
+        # Pair up each polygon's edges in Y order (at _xOrder), then measure them at _xEval
+        byPolygon = defaultdict(list)
+        for edge in _active:
+            byPolygon[edge[4]].append( (yAt(edge, _xOrder), yAt(edge, _xEval)) )
+        
+        intervals = []
+        for ys in byPolygon.values():
+            ys.sort()
+            for k in range(0, len(ys) - 1, 2):
+                intervals.append( (min(ys[k][1], ys[k+1][1]), max(ys[k][1], ys[k+1][1])) )
+        
+        return mergeIntervals(intervals)
+    
+    def xorIntervals(_a, _b):
+        # The Y-ranges covered on one side of an X line but not the other
+        def covered(_intervals, _y):
+            return any(start < _y < end for start, end in _intervals)
+        
+        breaks = sorted( set(y for interval in _a + _b for y in interval) )
+        steps = []
+        for y1, y2 in zip(breaks[:-1], breaks[1:]):
+            if y2 - y1 > tol and covered(_a, (y1+y2)/2) != covered(_b, (y1+y2)/2):
+                if steps and abs(steps[-1][1] - y1) <= tol:
+                    steps[-1][1] = y2
+                else:
+                    steps.append([y1, y2])
+        return steps
+    
+    area = 0.0
+    outline = set()
+    xs = sorted(set(allXs))
+    active = []
+    nextEdge = 0
+    prevIntervals = []
+    
+    for xLeft, xRight in zip(xs[:-1], xs[1:]):
+        # The edges which span this strip
+        active = [edge for edge in active if edge[2] > xLeft]
+        while nextEdge < len(edges) and edges[nextEdge][0] <= xLeft:
+            if edges[nextEdge][2] > xLeft:
+                active.append(edges[nextEdge])
+            nextEdge += 1
+        
+        # Split the strip anywhere two of the edges cross
+        cuts = set([xLeft, xRight])
+        ysLeft = [yAt(edge, xLeft) for edge in active]
+        ysRight = [yAt(edge, xRight) for edge in active]
+        for i in range(len(active)):
+            for j in range(i+1, len(active)):
+                dLeft = ysLeft[i] - ysLeft[j]
+                dRight = ysRight[i] - ysRight[j]
+                if dLeft * dRight < 0:
+                    cuts.add( xLeft + (xRight - xLeft) * dLeft / (dLeft - dRight) )
+        
+        cuts = sorted(cuts)
+        for xA, xB in zip(cuts[:-1], cuts[1:]):
+            if xB - xA <= tol:
+                continue
+            
+            xMid = (xA + xB) / 2
+            midIntervals = unionIntervals(active, xMid, xMid)
+            area += sum(end - start for start, end in midIntervals) * (xB - xA)
+            
+            # Vertical steps in the outline where the strips meet
+            startIntervals = unionIntervals(active, xMid, xA)
+            for y1, y2 in xorIntervals(prevIntervals, startIntervals):
+                outline.add( (xA, y1, xA, y2) )
+            prevIntervals = unionIntervals(active, xMid, xB)
+            
+            # The edges at the top or bottom of an interval are on the outline
+            intervalEnds = [y for interval in midIntervals for y in interval]
+            for edge in active:
+                yMid = yAt(edge, xMid)
+                if any(abs(yMid - y) <= tol * 10 for y in intervalEnds):
+                    outline.add( (xA, yAt(edge, xA), xB, yAt(edge, xB)) )
+    
+    for y1, y2 in xorIntervals(prevIntervals, []):
+        outline.add( (xs[-1], y1, xs[-1], y2) )
+    
+    return Footprint2D(area, sorted(outline))
+
+
+def phpp_calcNorthAngle(_objNormVec, _refNorthVec):
+    """ Takes in a Surface's Normal Vector and the project's north angle vector and computes the angle 0--360 between
+    
+    http://frasergreenroyd.com/obtaining-the-angle-between-two-vectors-for-360-degrees/
+    Results 0=north, 90=east, 180=south, 270=west
+    
+    Args:
+        _objNormVec: A Vector3d of the surface's normal
+        _refNorthVec: A Vector3d of the project's north vector 
+    Returns: 
+        angle: the angle of North for the surface (Degrees)
+    """
+    
+    # Get the input Vector's X and Y parts
+    x1 = _objNormVec.X
+    y1 = _objNormVec.Y
+    
+    x2 = _refNorthVec.X
+    y2 = _refNorthVec.Y
+    
+    # Calc the angle between
+    angle = math.atan2(y2, x2) - math.atan2(y1, x1)
+    angle = angle * 360 / (2 * math.pi)
+    
+    if angle < 0:
+        angle = angle + 360
+    
+    # Return Angle in Degrees
+    return angle
+
+def phpp_northVector(_northAngle):
+    """ Returns the project's North vector from the IDF 'Building' North Axis (Degrees, clockwise)
+    
+    Same as rotating the World Y axis by -_northAngle about World Z, as IDF_Obj_building does
+    """
+    
+    angle = math.radians( float(_northAngle or 0) * -1 )
+    return Vec3(-math.sin(angle), math.cos(angle), 0.0)
+
+def phpp_zoneVolume(_polygons):
+    """ Returns the volume inside a closed set of planar polygons (ie: a Zone's surfaces)
+    
+    Sum of each polygon's area times the height of its centroid along its normal (the 
+    Divergence Theorem). The normals need to point out of the volume, as in EnergyPlus.
+    
+    Args:
+        _polygons: A list of flat vertex lists [x1, y1, z1, x2, y2, z2, ...]
+    Returns:
+        (float): The enclosed volume (m3)
+    """
+    
+    volume = 0.0
+    for vertices in _polygons:
+        area, centroid, normal = phpp_polygonProps(vertices)
+        volume += area * (centroid.X*normal.X + centroid.Y*normal.Y + centroid.Z*normal.Z)
+    
+    return abs(volume) / 3
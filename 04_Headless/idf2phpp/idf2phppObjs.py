@@ -0,0 +1,377 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This module is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Organizes the IDF objects for export to the PHPP, the same as the 'IDF->PHPP Objs' component
+
+Gets all the relevant Materials, Constructions, Surfaces, Windows and Zones from the
+IDF_Model. Where the GH component reads the Zone Floor Area, Volume and exposed Surface
+Area from the Honeybee Zones, these come straight from the Zone's IDF surfaces here. Any
+PHPP Rooms and Ventilation Systems come from the saved data (PHPP_SavedData) instead
+of the Honeybee Zones.
+"""
+
+import logging
+import math
+from collections import namedtuple, defaultdict
+
+from .geometry import phpp_mergeTriangles, phpp_polygonUnion2D, phpp_zoneVolume, phpp_northVector
+from .reader import IDF_Class
+from .climate import PHPP_ClimateDataSet
+from .objects import (IDF_Zone, IDF_ZoneList, IDF_ZoneInfilFlowRate, IDF_Obj_building,
+                      IDF_Obj_MaterialLayer, IDF_Obj_MaterialWindowSimple, IDF_Obj_MaterialWindowGlazing,
+                      IDF_Obj_MaterialWindowGas, IDF_Obj_Construction, IDF_Obj_surfaceWindow,
+                      IDF_Obj_surfaceOpaque)
+
+log = logging.getLogger(__name__)
+
+# The same 16 groups (in the same order) as the component's 'PHPPObjs_' DataTree branches
+PHPPObjs = namedtuple('PHPPObjs', ['Materials', 'Constructions', 'WindowMaterials', 'WindowConstructions',
+                                   'Surfaces', 'Windows', 'Rooms', 'VentSystems', 'Zones', 'ZoneInfiltration',
+                                   'DHWSystems', 'Ground', 'Climate', 'Appliances', 'Lighting', 'Footprint'])
+
+def parseIDFObjects(_idf):
+    # Looks at the IDF Objects and parses them  out
+    # Builds class objects as appropriate
+    zones = []
+    zoneInfiltrationRates = []
+    zonesList = []
+    opaqueMaterials = []
+    windowMaterialsSimple = {}
+    windowMaterialGas = {}
+    windowMaterialGlazing = {}
+    allConstructions = []
+    opaqueSurfaces = []
+    location = None
+
+    # First, need to find the North Direction. Have to do that before the rest
+    bldgNorthVec = phpp_northVector(0)
+    for each in _idf['Building']:
+        # Create the Building Object and get the Project's North Angle Vector
+        bldgNorthVec = IDF_Obj_building(each).NorthVector
+
+    for eachIDFobj in _idf.objectsOfClasses( _idf.classesContaining('BuildingSurface:Detailed') ):
+        opaqueSurfaces.append( IDF_Obj_surfaceOpaque(eachIDFobj, bldgNorthVec) )
+
+    # If its a 'Material' or 'Material:AirGap' object
+    for eachIDFobj in _idf.objectsOfClasses( ['Material', 'Material:AirGap'] ):
+        opaqueMaterials.append( IDF_Obj_MaterialLayer(eachIDFobj) )
+
+    for eachIDFobj in _idf['Material:NoMass']:
+        opaqueMaterials.append( IDF_Obj_MaterialLayer(eachIDFobj, noMass=True) )
+
+    # If its a simple EP Style Window Material
+    for eachIDFobj in _idf.objectsOfClasses( _idf.classesContaining('WindowMaterial:SimpleGlazingSystem') ):
+        windowMaterialsSimple[eachIDFobj.Name] = IDF_Obj_MaterialWindowSimple(eachIDFobj)
+
+    for eachIDFobj in _idf.objectsOfClasses( _idf.classesContaining('WindowMaterial:Gas') ):
+        windowMaterialGas[eachIDFobj.Name] = IDF_Obj_MaterialWindowGas(eachIDFobj)
+
+    for eachIDFobj in _idf.objectsOfClasses( _idf.classesContaining('WindowMaterial:Glazing') ):
+        windowMaterialGlazing[eachIDFobj.Name] = IDF_Obj_MaterialWindowGlazing(eachIDFobj)
+
+    for eachIDFobj in _idf.objectsOfClasses( _idf.classesContaining('Construction') ):
+        allConstructions.append( IDF_Obj_Construction(eachIDFobj) )
+
+    for eachIDFobj in _idf['Zone']:
+        zones.append( IDF_Zone(eachIDFobj) )
+
+    for eachIDFobj in _idf['ZoneList']:
+        zonesList.append( IDF_ZoneList(eachIDFobj) )
+
+    for eachIDFobj in _idf.objectsOfClasses( _idf.classesContaining('ZoneInfiltration:DesignFlowRate') ):
+        zoneInfiltrationRates.append( IDF_ZoneInfilFlowRate(eachIDFobj) )
+
+    for eachIDFobj in _idf.objectsOfClasses( _idf.classesContaining('Site:Location') ):
+        location = eachIDFobj
+
+    return opaqueSurfaces, opaqueMaterials, windowMaterialsSimple, windowMaterialGas, windowMaterialGlazing, allConstructions, zones, zoneInfiltrationRates, zonesList, location
+
+class _WindowSimpleParams:
+    # temp holder for params to pass to IDF_Obj_MaterialWindowSimple
+    pass
+
+def materialWindowSimpleFromLayers(_const, _windowMaterialGlazing, _windowMaterialGas):
+    # If its a Window 'construction' of multiple layers, calc an approximate effective Uw
+    # https://bigladdersoftware.com/epx/docs/8-5/engineering-reference/window-heat-balance-calculation.html#equivalent-layer-thermal-model
+    # NOTE: Not doing this correctly right now. Neglecting radiation of convective effects. Only a super simplified approximiation for now....
+
+    newWinUg = [0.04, 0.13] # Start with the Surface Film Resistances...
+    for eachLayer in _const.Layers:
+        if eachLayer[1] in _windowMaterialGlazing:
+            newWinUg.append( 1 / _windowMaterialGlazing[ eachLayer[1] ].uValue ) # Resistance of Glass Layers
+        elif eachLayer[1] in _windowMaterialGas:
+            newWinUg.append( 1 / _windowMaterialGas[ eachLayer[1] ].uValue * 0.5 ) # Resistance of Gas Layers
+    newWinUg = 1/sum(newWinUg)
+
+    # Create a New WindowMaterial:SimpleGlazingSystem Object to approximate this built-up construction
+    tempObj = _WindowSimpleParams()
+    setattr(tempObj, 'U-Factor {W/m2-K}', newWinUg)
+    setattr(tempObj, 'Solar Heat Gain Coefficient', 0.4)
+    setattr(tempObj, 'Visible Transmittance', 0.75)
+    setattr(tempObj, 'Name', _const.Name)
+
+    return IDF_Obj_MaterialWindowSimple( tempObj )
+
+def filterConstructions(_allConst, _materialsWindowSimple, _windowMaterialGas, _windowMaterialGlazing):
+    # Takes in all the construction and splits them into
+    # Window and Opaque constructions
+
+    opaqueConstructions = []
+    windowConstructionsSimple = {}
+    windowMaterialNames = set(mat.Name for mat in _materialsWindowSimple.values())
+    windowMaterialNames.update(_windowMaterialGas)
+    windowMaterialNames.update(_windowMaterialGlazing)
+
+    for construction in _allConst:
+        # Is it a Window Construction?
+        # If the Construction includes any materials found in the WindowMaterialsSimple, WindowGas or WindowGlazing, then yes
+        isWindow = any(layerName in windowMaterialNames for layerName in construction.LayerNames)
+
+        if not isWindow:
+            opaqueConstructions.append( construction )
+        elif len(construction.Layers) > 1:
+            # Its a built up window. So turn that into a Simple Window
+            materialWindowSimple = materialWindowSimpleFromLayers(construction, _windowMaterialGlazing, _windowMaterialGas)
+            _materialsWindowSimple[construction.Name] = materialWindowSimple
+            construction.Layers = [ ['Layer1', materialWindowSimple.Name] ]
+            windowConstructionsSimple[construction.Name] = construction
+        else:
+            windowConstructionsSimple[construction.Name] = construction
+
+    return opaqueConstructions, windowConstructionsSimple, _materialsWindowSimple
+
+def getIDFWindowObjects(_idf, _windowConstructionsSimple, _windowMaterialsSimple):
+    # Finds all  the widnow surfaces and builds window objects
+    windowSurfaces = []
+    windowObjs_filtered = []
+    windowObjs_triangulated = defaultdict(list)
+
+    for windowObj in _idf.objectsOfClasses( _idf.classesContaining('FenestrationSurface:Detailed') ):
+        # Honeybee adds the code '..._glzP_0, ..._glzP_1, etc..' suffix to the name for its triangulated windows
+        if '_glzP_' in windowObj.Name and len(windowObj.vertexPoints()) == 3:
+            windowObjs_triangulated[ windowObj.Name.split('_glzP_')[0] ].append(windowObj)
+        else:
+            windowObjs_filtered.append(windowObj)
+
+    # Unite the triangulated objects back into a single window, using the edges they share
+    for windowName, triangleObjs in windowObjs_triangulated.items():
+        newVerts = phpp_mergeTriangles( [windowObj.vertices for windowObj in triangleObjs] )
+
+        windowObj = triangleObjs[0]
+        newWindowObj = IDF_Class(windowObj.objName, list(windowObj.values), newVerts, windowObj.schema)
+        newWindowObj.setField('Name', windowName)
+
+        windowObjs_filtered.append(newWindowObj)
+
+    # Build the Window Objects
+    for eachWindowObj in windowObjs_filtered:
+        # Find the windows's CONSTRUCTION and MATERIAL information in the IDF
+        constName = getattr(eachWindowObj, 'Construction Name')
+        try:
+            matName = _windowConstructionsSimple[ constName ].Layers[0][1]
+            winSimpObj = _windowMaterialsSimple[ matName ]
+        except KeyError:
+            log.warning("Couldn't find the glazing for window '{}' (Construction '{}')".format(eachWindowObj.Name, constName))
+            continue
+
+        windowSurfaces.append( IDF_Obj_surfaceWindow(eachWindowObj, winSimpObj) )
+
+    return windowSurfaces
+
+def filterSurfaces(_surfaces):
+    # Filter to only include the surface if its 'exposed' to the outdoors or Ground (not an interior floor / wall)
+    return [srfc for srfc in _surfaces if srfc.exposure != 'Surface']
+
+ZoneParams = namedtuple('ZoneParams', ['ZoneName', 'InfiltrationACH50', 'Volume_Vn50', 'TFA', 'Volume_Gross', 'FloorArea_Gross'])
+
+def calcZoneACH50(_infilObj, _exposedArea, _floorArea, _volume, _blowerPressure=50):
+    # Calc the Infiltration Rate by Floor Area or by Facade Area
+    # (_blowerPressure//4 to match the integer division the GH component always had)
+    try:
+        infilRatebyFloor = float( getattr(_infilObj, 'FlowRatePerFloorArea') )# m3/s-m2
+        zoneInfilRate = infilRatebyFloor * _floorArea * 60 * 60 # sec/min * min/hour
+        return ((math.pow((_blowerPressure//4),0.63)) * zoneInfilRate ) / _volume
+    except (AttributeError, TypeError, ValueError, ZeroDivisionError):
+        try:
+            infilRatebyFacadeArea = float( getattr(_infilObj, 'FlowRatePerSurfaceArea') )# m3/s-m2
+            zoneInfilRate = infilRatebyFacadeArea * _exposedArea * 60 * 60
+            return ((math.pow((_blowerPressure//4),0.63)) * zoneInfilRate ) / _volume
+        except (AttributeError, TypeError, ValueError, ZeroDivisionError):
+            log.info('No Infiltration rate found for: {}'.format(getattr(_infilObj, 'Name', '')))
+            return None
+
+def zoneQuantities(_opaqueSurfaces):
+    # Zone Name --> (Exposed Area, Floor Area, Volume) from the Zone's IDF surfaces
+    # Same quantities as the HB Zone getExposedArea(), getFloorArea(), getZoneVolume()
+    zoneSurfaces = defaultdict(list)
+    for srfc in _opaqueSurfaces:
+        zoneSurfaces[srfc.HostZoneName].append(srfc)
+
+    quantities = {}
+    for zoneName, surfaces in zoneSurfaces.items():
+        exposedArea = sum(srfc.SurfaceArea for srfc in surfaces if srfc.exposure == 'Outdoors')
+        floorArea = sum(srfc.SurfaceArea for srfc in surfaces if srfc.srfcType == 'Floor')
+        volume = phpp_zoneVolume([srfc.Vertices for srfc in surfaces])
+        quantities[zoneName] = (exposedArea, floorArea, volume)
+
+    return quantities
+
+def calcZoneParams(_zonesList, _infilRates, _zoneObjs, _rooms, _zoneQuantities):
+    """ Joins the ZoneLists, Infiltration Rates, Zone quantities and Rooms for each Zone
+
+    Finds the right Infiltration Rate for each Zone and calcs its ACH50, and sets the Zone
+    Attributes for ACH, Volume and Floor Area. Used by the 'IDF->PHPP Objs' component (with the
+    HB Zone quantities) as well as headless (with the quantities from the IDF surfaces).
+
+    Args:
+        _zonesList (list): The IDF_ZoneList Objects
+        _infilRates (list): The IDF_ZoneInfilFlowRate Objects
+        _zoneObjs (list): The IDF_Zone Objects to set the attributes on
+        _rooms (list): The PHPP_Room Objects. Their TFA and Vn50 win over the Zone quantities
+        _zoneQuantities (dict): Zone Name --> (Exposed Area, Floor Area, Volume)
+    Returns:
+        zoneParams (dict): Zone Name --> ZoneParams for all the Zones
+    """
+
+    rooms = defaultdict(list)
+    for room in _rooms:
+        rooms[room.HostZoneName].append(room)
+
+    # ZoneList Name --> the names of the Zones in the List
+    zoneListMembers = {}
+    for zoneList in _zonesList:
+        zoneListMembers[zoneList.Name] = [v for k, v in zoneList.__dict__.items() if k != 'Name']
+
+    # Zone Name --> the Infiltration Objects which apply to it (through a ZoneList or directly)
+    infilRates = defaultdict(list)
+    for infilObj in _infilRates:
+        for zoneName in zoneListMembers.get(infilObj.ZoneName, [infilObj.ZoneName]):
+            infilRates[zoneName].append(infilObj)
+
+    zoneParams = {}
+    for zoneObj in _zoneObjs:
+        zoneRooms = rooms.get(zoneObj.ZoneName, [])
+        roomVn50 = sum(float(room.RoomNetClearVolume) for room in zoneRooms) if zoneRooms else None
+
+        if zoneObj.ZoneName in _zoneQuantities:
+            exposedArea, floorArea, volume = _zoneQuantities[zoneObj.ZoneName]
+
+            # Zone Volume, but use Room Vn50s if there are any
+            if roomVn50 is not None:
+                volume = roomVn50
+
+            for infilObj in infilRates.get(zoneObj.ZoneName, []):
+                zoneObj.InfiltrationACH50 = calcZoneACH50(infilObj, exposedArea, floorArea, volume)
+                zoneObj.Volume_Gross = volume
+                zoneObj.FloorArea_Gross = floorArea
+                zoneObj.Volume_Vn50 = volume
+                zoneObj.TFA = floorArea
+
+        # The Room Vn50 and TFA from the PHPP Rooms in the Zone, if there are any
+        if zoneRooms:
+            zoneObj.TFA = sum(float(room.FloorArea_TFA) for room in zoneRooms)
+            zoneObj.Volume_Vn50 = roomVn50
+
+        zoneParams[zoneObj.ZoneName] = ZoneParams(zoneObj.ZoneName, zoneObj.InfiltrationACH50,
+                zoneObj.Volume_Vn50, zoneObj.TFA, zoneObj.Volume_Gross, zoneObj.FloorArea_Gross)
+
+    return zoneParams
+
+Footprint = namedtuple('Footprint', ['Footprint_surface', 'Footprint_area'])
+
+def calcFootprint(_opaqueSurfaces):
+    # Finds the 'footprint' of the building for 'Primary Energy Renewable' reference
+    # The area of the 2D union of all the Floor, Roof and Ceiling surfaces. No surface without Rhino.
+    polygons = []
+    for srfc in _opaqueSurfaces:
+        if srfc.srfcType in ('Floor', 'Roof', 'Ceiling'):
+            polygons.append( list(zip(srfc.Vertices[0::3], srfc.Vertices[1::3])) )
+
+    if not polygons:
+        return None
+
+    footprint2D = phpp_polygonUnion2D(polygons)
+    if footprint2D.Area == 0:
+        return None
+
+    return Footprint(None, footprint2D.Area)
+
+def findNearestPHPPclimateZone(_lat, _long, _climateIndex):
+    """ Finds the nearest PHPP Climate zone to the EPW Lat /Long
+
+    Methodology copied from the PHPP v 9.6a (SI) Climate worksheet
+    """
+
+    nearest = _climateIndex.nearest(_lat, _long, k=1)
+    climateSetToUse = nearest[0].Data if nearest else {}
+
+    dataSet = climateSetToUse.get('Dataset', 'US0055b-New York')
+    alt = '=J23'
+    country = climateSetToUse.get('Country', 'US-United States of America')
+    region = climateSetToUse.get('Region', 'New York')
+
+    return [PHPP_ClimateDataSet(dataSet, alt, country, region)]
+
+def buildPHPPObjs(_idf, _savedData, _climateStore):
+    """ Builds all the PHPP Objects for the model, in the same groups as the 'PHPPObjs_' tree
+
+    Args:
+        _idf (IDF_Model): The IDF Objects read from the file
+        _savedData (PHPP_SavedData): Any saved PHPP Rooms, Ventilation Systems, etc..
+        _climateStore (PHPP_ClimateStore): The PHPP Climate Datasets
+    Returns:
+        PHPPObjs
+    """
+
+    (opaqueSurfaces,
+    opaqueMaterials,
+    windowMaterialsSimple,
+    windowMaterialGas,
+    windowMaterialGlazing,
+    allConstructions,
+    zones,
+    zoneInfiltrationRates,
+    zonesList,
+    location) = parseIDFObjects(_idf)
+
+    (opaqueConstructions,
+    windowConstructionsSimple,
+    windowMaterialsSimple) = filterConstructions(allConstructions, windowMaterialsSimple, windowMaterialGas, windowMaterialGlazing)
+
+    windowObjects = getIDFWindowObjects(_idf, windowConstructionsSimple, windowMaterialsSimple)
+
+    calcZoneParams(zonesList, zoneInfiltrationRates, zones, _savedData.Rooms, zoneQuantities(opaqueSurfaces))
+    footprint = calcFootprint(opaqueSurfaces)
+
+    # Figure out the Closest PHPP Climate Zone
+    try:
+        latitude = float(getattr(location, 'Latitude {deg}', 51.30))
+        longitude = float(getattr(location, 'Longitude {deg}', 9.44))
+        climate = findNearestPHPPclimateZone(latitude, longitude, _climateStore.index)
+    except (TypeError, ValueError):
+        log.warning('Error finding the nearest PHPP Climate Zone?')
+        climate = []
+
+    return PHPPObjs(opaqueMaterials, opaqueConstructions, list(windowMaterialsSimple.values()),
+                    list(windowConstructionsSimple.values()), filterSurfaces(opaqueSurfaces), windowObjects,
+                    _savedData.Rooms, _savedData.ventSystemsDict(), zones, zoneInfiltrationRates,
+                    [], [], climate, [], [], [footprint] if footprint else [])
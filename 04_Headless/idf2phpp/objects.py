@@ -0,0 +1,594 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+# 
+# This module is part of IDF2PHPP.
+# 
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com> 
+# IDF2PHPP is free software; you can redistribute it and/or modify 
+# it under the terms of the GNU General Public License as published 
+# by the Free Software Foundation; either version 3 of the License, 
+# or (at your option) any later version. 
+# 
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of 
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+# GNU General Public License for more details.
+# 
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+# 
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+The IDF2PHPP objects built from the IDF file, and from any saved PHPP room / system data
+
+The IDF_Obj_* and PHPP Window classes are the same as in BT_CORE, less the Rhino 
+geometry (Boundary, Srfc). The PHPP_Saved* classes stand in for the Honeybee Zone PHPP
+Rooms and Ventilation Systems: they hold the same attributes, read from a JSON file.
+"""
+
+import json
+import logging
+import random
+from array import array
+
+from .geometry import (phpp_polygonProps, phpp_polygonSize, phpp_tiltFromNormal,
+                       phpp_calcNorthAngle, phpp_northVector)
+
+log = logging.getLogger(__name__)
+
+class PHPP_Window_Install:
+    """ For storing the install conditions (0|1) of each edge in a window component """
+    
+    def __init__(self, _installs):
+        """
+        Args:
+            _installs (list): A list of four 'install' types (Left, Right, Bottom, Top)
+        """
+        self.Installs = _installs
+        self.setInstalls()
+        
+    def setInstalls(self):
+        # In case the number of installs passed != 4, use the first one for all of them
+        if len(self.Installs) != 4:
+            self.Inst_L = float(self.Installs[0]) if self.Installs[0] != None else 'Auto'
+            self.Inst_R = float(self.Installs[0]) if self.Installs[0] != None else 'Auto'
+            self.Inst_B = float(self.Installs[0]) if self.Installs[0] != None else 'Auto'
+            self.Inst_T = float(self.Installs[0]) if self.Installs[0] != None else 'Auto'
+        else:
+            self.Inst_L = float(self.Installs[0]) if self.Installs[0] != None else 'Auto'
+            self.Inst_R = float(self.Installs[1]) if self.Installs[1] != None else 'Auto'
+            self.Inst_B = float(self.Installs[2]) if self.Installs[2] != None else 'Auto'
+            self.Inst_T = float(self.Installs[3]) if self.Installs[3] != None else 'Auto'
+    
+    def getAllasList(self):
+        # So can easily output all the items in a single list
+        return [int(self.Inst_L), int(self.Inst_R), int(self.Inst_B), int(self.Inst_T)]
+    
+    def __str__(self):
+        return 'A PHPP Style Window Install Object: < L={self.Inst_L} | R={self.Inst_R} | T={self.Inst_T} | B={self.Inst_B} >'.format(self=self)
+    
+    def __repr__(self):
+       return "{}( _installs={!r} )".format(
+               self.__class__.__name__, self.Installs)
+
+class PHPP_Glazing:
+    """ For storing PHPP Style Glazing Parameters """
+    
+    def __init__(self, _nm, _gValue, _uValue):
+        """
+        Args:
+            _nm (str): The name of the glass type
+            _gValue (float): The g-Value (SHGC) value of the glass only as per EN 410 (%)
+            _uValue (float): The Thermal Trasmittance value of the center of glass (W/m2k) as per EN 673
+        """
+        self.Name = _nm
+        try:
+            self.gValue = float(_gValue)
+        except:
+            self.gValue = _gValue
+        
+        try:
+            self.uValue = float(_uValue)
+        except:
+            self.uValue = _uValue
+        
+        
+    def __str__(self):
+        return 'A PHPP Style Glazing Object: < {self.Name} >'.format(self=self)
+    
+    def __repr__(self):
+       return "{}( _nm={!r}, _gValue={!r}, _uValue={!r} )".format(
+               self.__class__.__name__,
+               self.Name,
+               self.gValue,
+               self.uValue)
+
+class PHPP_Frame:
+    """ For Storing PHPP Style Frame Parameters """
+    
+    def __init__(self, _nm, _uValues, _frameWidths, _psiGlazings, _psiInstalls, _chiGlassCarrier=None):
+        """
+        Args:
+            _nm (str): The name of the Frame Type
+            _uValues (list): A list of the 4 U-Values (W/m2k) for the frame sides (Left, Right, Bottom, Top)
+            _frameWidths (list): A list of the 4 U-Values (W/m2k) for the frame sides (Left, Right, Bottom, Top)
+            _psiGlazings (list): A list of the 4 Psi-Values (W/mk) for the glazing spacers (Left, Right, Bottom, Top)
+            _psiInstalls (list): A list of the 4 Psi-Values (W/mk) for the frame Installations (Left, Right, Bottom, Top)
+            _chiGlassCarrier (list): A value for the Chi-Value (W/k) of the glass carrier for curtain walls
+        """
+        self.Name = _nm
+        
+        self.uValues = _uValues
+        self.frameWidths = _frameWidths
+        self.PsiGVals = _psiGlazings
+        self.PsiInstalls = _psiInstalls
+        self.chiGlassCarrier = _chiGlassCarrier
+        
+        self.cleanAttrSet(['uLeft', 'uRight', 'uBottom', 'uTop'], self.uValues)
+        self.cleanAttrSet(['fLeft', 'fRight', 'fBottom', 'fTop'], self.frameWidths)
+        self.cleanAttrSet(['psigLeft', 'psigRight', 'psigBottom', 'psigTop'], self.PsiGVals)
+        self.cleanAttrSet(['psiInstLeft', 'psiInstRight', 'psiInstBottom', 'psiInstTop'], self.PsiInstalls)
+    
+    def cleanAttrSet(self, _inList, _attrList):
+        # In case the input len != 4 and convert to float values
+        if len(_attrList) != 4:
+            try:
+                val = float(_attrList[0])
+            except:
+                val = _attrList[0]
+            
+            for each in _inList:
+                setattr(self, each, val)
+        else:
+            for i, each in enumerate(_inList):
+                try:
+                    val = float(_attrList[i])
+                except:
+                    val = _attrList[i]
+                
+                setattr(self, _inList[i], val)
+    
+    def __str__(self):
+        return 'A PHPP Style Frame Object: < {self.Name} >'.format(self=self)
+    def __repr__(self):
+       return "{}( _nm={!r}, _uValues={!r}, _frameWidths={!r}, _psiGlazings={!r}, "\
+              "_psiInstalls={!r}, _chiGlassCarrier={!r} )".format(
+               self.__class__.__name__,
+               self.Name,
+               self.uValues,
+               self.frameWidths,
+               self.PsiGVals,
+               self.PsiInstalls,
+               self.chiGlassCarrier )
+
+#-------------------------------------------------------------------------------
+#### Objects built from the IDF  #####
+class IDF_Zone:
+    def __init__(self, _idfObj):
+        self.ZoneName = getattr(_idfObj, 'Name')
+        self.InfiltrationACH50 = None
+        self.Volume_Gross = None
+        self.FloorArea_Gross = False
+        self.Volume_Vn50 = None
+        self.TFA = None
+        
+    def __str__(self):
+        return 'An IDF Zone Object: {}'.format(self.ZoneName)
+
+class IDF_ZoneList:
+    def __init__(self, _idfObj):
+        self.Name = getattr(_idfObj, 'Name')
+        
+        # All the fields after the 'Name' are the names of the Zones in the List
+        for i, zoneName in enumerate(_idfObj.values):
+            if i > 0 and zoneName:
+                setattr(self, _idfObj.schema.fieldName(i), zoneName )
+                
+    def __str__(self):
+        return 'An IDF ZoneList Object: {}'.format(self.Name)
+
+class IDF_ZoneInfilFlowRate:
+    def __init__(self, _idfObj):
+        self.Name = getattr(_idfObj, 'Name')
+        self.ZoneName = getattr(_idfObj, 'Zone or ZoneList Name')
+        self.ScheduleName = getattr(_idfObj, 'Schedule Name')
+        self.DesignFlowRate = getattr(_idfObj, 'Design Flow Rate {m3/s}')
+        self.FlowRatePerFloorArea = getattr(_idfObj, 'Flow per Zone Floor Area {m3/s-m2}')
+        self.FlowRatePerSurfaceArea =  getattr(_idfObj, 'Flow per Exterior Surface Area {m3/s-m2}')
+        self.ACH =  getattr(_idfObj, 'Air Changes per Hour {1/hr}')
+        
+    def __str__(self):
+        return 'An IDF Zone Infiltration Flow Rate Object: {}'.format(self.Name)
+
+class IDF_Obj_building:
+    # Basic Building Data and North Orientation information
+    
+    def __init__(self, _idfObj):
+        self.BldgName = getattr(_idfObj, 'Name')
+        self.NorthAngle = getattr(_idfObj, 'North Axis {deg}') # in Degrees off North (North=0 ,East=90, etc..)
+        self.NorthVector = self.calcNorthAnglefromVec(self.NorthAngle) # Calc degrees from the Vector
+    
+    def calcNorthAnglefromVec(self, _northAngle):
+        return phpp_northVector(_northAngle)
+    
+    def __str__(self):
+        return 'The Building Data Object: [{}]'.format(self.Name)
+
+class IDF_Obj_MaterialLayer:
+    # For holding onto Params for 
+    # 'Material' and 'Material:AirGap' objects
+    
+    def __init__(self, _idfObj, noMass=False):
+        self.Name = getattr(_idfObj, 'Name').replace('__Int__', '')
+        self.MatType = getattr(_idfObj, 'objName')
+        
+        # Set object defaults
+        self.LayerThickness = None
+        self.LayerConductivity = None
+        self.LayerConductance = None
+        self.Type = None
+        
+        if noMass == False:
+            # Get the actual data from the IDF Object to set up the rest
+            self.getLayerData(_idfObj)
+            self.setLayerData()
+        elif noMass == True:
+            self.getNoMassData(_idfObj)
+    
+    def getNoMassData(self, _idfObj):
+        # Get all the relevant data from the IDF Object
+        resistance = getattr(_idfObj, 'Thermal Resistance {m2-K/W}', None)
+        if resistance:
+            self.LayerConductance = 1 / float(resistance)
+            self.LayerThickness = 1
+            self.LayerConductivity = self.LayerConductance
+    
+    def getLayerData(self, _idfObj):
+        # Get all the relevant data from the IDF Object
+        self.LayerThickness = getattr(_idfObj, 'Thickness {m}', None)
+        self.LayerConductivity = getattr(_idfObj, 'Conductivity {W/m-K}', None)
+        
+        resistance = getattr(_idfObj, 'Thermal Resistance {m2-K/W}', None)
+        if resistance:
+            self.LayerConductance = 1 / float(resistance)
+    
+    def setLayerData(self):
+        # Sort out the layer conductances/Resistances (m2-k/W)
+        if 'AirGap' in self.MatType:
+            self.LayerThickness = 1
+        
+        self.LayerThickness = float(self.LayerThickness) if self.LayerThickness else 0.1 # Apply default thickness if none
+        
+        if self.LayerConductance == None:
+            self.LayerConductance = float(self.LayerConductivity) * float(self.LayerThickness)
+        elif self.LayerConductance != None and self.LayerConductivity == None:
+            self.LayerConductivity = float(self.LayerConductance) / float(self.LayerThickness)
+        
+    def __str__(self):
+        return 'EnergyPlus Material Params: [{}]'.format(self.Name)
+
+class IDF_Obj_MaterialWindowSimple:
+    # For holding onto Params for
+    # WindowMaterial:SimpleGlazingSystem Objects
+    
+    def __init__(self, _idfObj):
+        self.Name = getattr(_idfObj, 'Name' )
+        self.uValue = getattr(_idfObj, 'U-Factor {W/m2-K}' )
+        self.gValue = getattr(_idfObj, 'Solar Heat Gain Coefficient' )
+        self.VT = getattr(_idfObj, 'Visible Transmittance' )
+    
+    def __str__(self):
+        return 'EnergyPlus WindowMaterial:Simple Params: [{}]'.format(self.Name)
+
+class IDF_Obj_MaterialWindowGlazing:
+    # For holding onto Params for
+    # WindowMaterial:Glazing Objects
+    
+    def __init__(self, _idfObj):
+        self.Name = getattr(_idfObj, 'Name' )
+        self.Thickness = float( getattr(_idfObj, 'Thickness {m}' ) )
+        self.Conductivity = float( getattr(_idfObj, 'Conductivity {W/m-K}' ) )
+        self.uValue = 1 / (self.Thickness/self.Conductivity)
+        self.gValue = getattr(_idfObj, 'Solar Transmittance at Normal Incidence' )
+        self.VT = getattr(_idfObj, 'Visible Transmittance at Normal Incidence' )
+    
+    def __str__(self):
+        return 'EnergyPlus WindowMaterial:Glazing Params: [{}]'.format(self.Name)
+
+class IDF_Obj_MaterialWindowGas:
+    # For holding onto Params for
+    # WindowMaterial:Gas Objects
+    #https://www.engineersedge.com/heat_transfer/thermal-conductivity-gases.htm
+    
+    gasConductivities = {'Air': 0.0262,
+                        'Argon': 0.0179,
+                        'Krypton': 0.0095,
+                        'Xenon': 0.0055
+    }
+    
+    def __init__(self, _idfObj):
+        self.Name = getattr(_idfObj, 'Name' )
+        self.GasType = getattr(_idfObj, 'Gas Type' )
+        self.Conductivity = self.gasConductivities[self.GasType]
+        self.Thickness = float( (getattr(_idfObj, 'Thickness {m}' ) ) )
+        self.uValue = 1 / (self.Thickness / self.Conductivity)
+    
+    def __str__(self):
+        return 'EnergyPlus WindowMaterial:Gas Params: [{}]'.format(self.Name)
+
+class IDF_Obj_Construction:
+    """
+    For holding onto Params for EnergPlus 'Construction' objects (Assemblies)
+    Note that when created, the new Object will clean up its name to remove any 
+    '__Int_' flags and then set the 'IntInsul' attribute as appropriate
+    """
+    def __init__(self, _idfObj):
+        self.Name = getattr(_idfObj, 'Name')
+        if not self.Name:
+            self.Name = getattr(_idfObj, 'name')
+        
+        if not self.Name:
+            self.Name = 'unnamed_construction_{}'.format(random.randint(1000,9999))
+        
+        self.getLayerNames(_idfObj)
+        self.checkInteriorInsul()
+    
+    def checkInteriorInsul(self):
+        if '__Int__' in self.Name:
+            self.IntInsul = 'x'
+            self.Name = self.Name.replace('__Int__', '')
+        else:
+            self.IntInsul = None
+            
+    def getLayerNames(self, _idfObj):
+        # Set the self.Layers list of names
+        self.Layers = []
+        self.LayerNames = []
+        
+        # All the fields after the 'Name' are the Construction's Material Layers
+        for i, layerName in enumerate(_idfObj.values):
+            if i > 0 and layerName:
+                layerNum = _idfObj.schema.fieldName(i)
+                layerName = layerName.replace('__Int__', '')
+                self.Layers.append( [layerNum, layerName]  )
+                self.LayerNames.append(layerName)
+    
+    def __str__(self):
+        return 'EnergyPlus Construction Params: [{}]'.format(self.Name)
+
+class IDF_Obj_surfaceWindow:
+    # For holding onto Params for
+    # FenestrationSurface:Detailed Objects
+    
+    def __init__(self, _idfObj, _winSimpleMat, _wShadFac=None, _sShadFac=None):
+        self.Quantity = 1
+        self.Name = getattr(_idfObj, 'Name')
+        self.Vertices = array('d', _idfObj.vertices or [])
+        self.SurfaceArea, self.Centroid, self.NormalVector = phpp_polygonProps(self.Vertices)
+        self.Dims = phpp_polygonSize(self.Vertices, self.NormalVector)
+        self.Width = self.Dims[0]
+        self.Height = self.Dims[1]
+        self.HostSrfc = getattr(_idfObj, 'Building Surface Name')
+        self.winterShadingFac = _wShadFac
+        self.summerShadingFac = _sShadFac
+        self.EPConstuctionName = getattr(_idfObj, "Construction Name")
+        
+        # This will take in an EP 'WindowMaterial:SimpleGlazingSystem' and build PHPP style frame / glass
+        self.setPHPPConstruction(self.EPConstuctionName, _winSimpleMat)
+    
+    def setPHPPConstruction(self, _constructionName, _winSimpleMat, _installs=[1,1,1,1]):
+        # Sets the PHPP Style Frame, Glass and Installs 
+        self.Type_Glass = PHPP_Glazing(
+                _constructionName, # Name
+                _winSimpleMat.gValue, # g-Value
+                _winSimpleMat.uValue # U-Value
+                )
+        
+        self.Type_Frame = PHPP_Frame(
+                _constructionName, # Name
+                [_winSimpleMat.uValue, _winSimpleMat.uValue, _winSimpleMat.uValue, _winSimpleMat.uValue], # Frame U-Values
+                [0.12, 0.12, 0.12, 0.12], # Frame Widths (Default to 0.1m)
+                [0.00, 0.00, 0.00, 0.00], # Psi-Glazing Edge Defaults
+                [0.00, 0.00, 0.00, 0.00] # Psi-Installs Defaults)
+                ) 
+        
+        self.Installs = PHPP_Window_Install(_installs)
+    
+    def setShadingDims_Simple(self, _in):
+        self.ShadingDimensions = _in
+    
+    def getShadingDims_Simple(self):
+        try:
+            return self.ShadingDimensions
+        except AttributeError:
+            return None
+    
+    def getShadingFactors(self):
+        try:
+            return self.winterShadingFac, self.summerShadingFac
+        except AttributeError:
+            return None
+    
+    def __str__(self):
+        return 'FenestrationSurface:Detailed: [{}]'.format(self.Name)
+
+class IDF_Obj_surfaceOpaque:
+    # For holding onto Params for
+    # BuildingSurface:Detailed Objects
+    
+    def __init__(self, _idfObj, _northAngle):
+        self.Name = getattr(_idfObj, 'Name')
+        self.AssemblyName = getattr(_idfObj, 'Construction Name')
+        self.srfcType = getattr(_idfObj, 'Surface Type')
+        self.exposure = getattr(_idfObj, 'Outside Boundary Condition')
+        self.HostZoneName = getattr(_idfObj, 'Zone Name')
+        self.findGroupNumber(self.srfcType, self.exposure)
+        self.getGeometryData(_idfObj, _northAngle)
+    
+    def getGeometryData(self, idfObj, _northAngle):
+        # Find the Area, Centroid and Normal straight from the Vertex points
+        self.Vertices = array('d', idfObj.vertices or [])
+        self.SurfaceArea, self.Centroid, self.NormalVector = phpp_polygonProps(self.Vertices)
+        
+        # Find the Rotation off North Vector
+        self.AngleFromNorth = phpp_calcNorthAngle(self.NormalVector, _northAngle)
+        
+        # Find the Rotation off Horizontal
+        self.AngleFromHoriz = phpp_tiltFromNormal(self.NormalVector)
+        
+        # Use Defaults at this time.
+        # Someday calc the shading factors and have inputs for the rest?
+        self.Factor_Shading = 0.5 # Default
+        self.Factor_Absorptivity = 0.6  # Default
+        self.Factor_Emissivity = 0.9   # Default
+    
+    def findGroupNumber(self, _srfcType, _exposureType):
+        # Figure out the 'Group Number' for PHPP based on the EP Exposure type
+        if _exposureType == 'Surface':
+            pass
+        elif _srfcType == 'Wall' and _exposureType == 'Outdoors':
+            self.GroupNum = 8
+        elif _srfcType == 'Wall' and _exposureType == 'Ground':
+            self.GroupNum = 9
+        elif _srfcType == 'Roof' and _exposureType == 'Outdoors':
+            self.GroupNum = 10
+        elif _srfcType == 'Floor' and _exposureType == 'Ground':
+            self.GroupNum = 11
+        elif _srfcType == 'Floor' and _exposureType == 'Outdoors':
+            self.GroupNum = 12
+        elif _exposureType == 'Adiabatic':
+            self.GroupNum = 18
+        else:
+            self.GroupNum = 13
+            log.warning("Couldn't figure out the Group Number for surface '{}'? ({}, {})".format(self.Name, _srfcType, _exposureType))
+    
+    def __str__(self):
+        return 'EnergyPlus BuildingSurface:Detailed Params: [{}]'.format(self.Name)
+
+class IDF_Obj_location:
+    def __init__(self, _idfObj):
+        self.Name = getattr(_idfObj, 'Name')
+        self.Latitude = getattr(_idfObj, 'Latitude {deg}')
+        self.Longitude = getattr(_idfObj, 'Longitude {deg}')
+        self.TimeZone = getattr(_idfObj, 'Time Zone {hr}')
+        self.Elevation = getattr(_idfObj, 'Elevation {m}')
+    
+    def __str__(self):
+        return 'EnergyPlus Location Params: [{}]'.format(self.Name)
+
+
+#-------------------------------------------------------------------------------
+#### Saved PHPP Room / System data  #####
+class PHPP_SavedObj(object):
+    """ A PHPP object read back from saved data, with the same attributes as the GH one
+    
+    Each key in the dict becomes an attribute. Any nested dicts / lists of dicts are 
+    built with the class in 'nested' (ie: a Ventilation System's 'Duct01'), and any 
+    attribute not in the data gets the value from 'defaults'.
+    """
+    
+    defaults = {}
+    nested = {}
+    
+    def __init__(self, _data=None):
+        for attrName, value in self.defaults.items():
+            setattr(self, attrName, value)
+        
+        for attrName, value in (_data or {}).items():
+            nestedClass = self.nested.get(attrName, PHPP_SavedObj)
+            if isinstance(value, dict):
+                value = nestedClass(value)
+            elif isinstance(value, list) and value and all(isinstance(v, dict) for v in value):
+                value = [nestedClass(v) for v in value]
+            setattr(self, attrName, value)
+    
+    def __str__(self):
+        return 'A saved PHPP Object: {}'.format(getattr(self, 'Name', self.__class__.__name__))
+
+class PHPP_SavedVentSchedule(PHPP_SavedObj):
+    defaults = {'speed_high':1, 'time_high':1, 'speed_med':None, 'time_med':None, 'speed_low':None, 'time_low':None}
+
+class PHPP_SavedRoom(PHPP_SavedObj):
+    """ Stands in for a Honeybee Zone's PHPP_Room (TFA, Volumes, Vent Airflows, Non-Res use) """
+    
+    defaults = {'RoomNumber':'', 'RoomName':'', 'HostZoneName':'',
+                'FloorArea_Gross':0, 'FloorArea_TFA':0, 'RoomNetClearVolume':0, 'RoomClearHeight':2.5,
+                'RoomDepth':None, 'V_sup':0, 'V_eta':0, 'V_trans':0,
+                'VentSystemName':'Vent-1', 'VentUnitName':'97ud-Default HRV unit',
+                'NonRes_RoomUse':'-', 'NonRes_RoomLightingControl':None, 'NonRes_RoomMotionControl':None}
+    nested = {'phppVentSched': PHPP_SavedVentSchedule}
+    
+    def airflow(self, _value):
+        try:
+            return float(_value)
+        except (TypeError, ValueError):
+            return 0 if 'Auto' in str(_value) else _value
+    
+    def getVsup(self):
+        return self.airflow(self.V_sup)
+    
+    def getVeta(self):
+        return self.airflow(self.V_eta)
+    
+    def getVtrans(self):
+        return self.airflow(self.V_trans)
+    
+    def __str__(self):
+        return 'A saved PHPP Room Object: {}-{} TFA: {}m2'.format(self.RoomNumber, self.RoomName, self.FloorArea_TFA)
+
+class PHPP_SavedDuct(PHPP_SavedObj):
+    defaults = {'DuctWidth':104, 'InsulationThickness':52, 'InsulationLambda':0.04, 'DuctLength':5}
+
+class PHPP_SavedExhaustVent(PHPP_SavedObj):
+    defaults = {'Name':'Exhaust Vent', 'FlowRate_On':450, 'FlowRate_Off':25, 'HrsPerDay_On':0.5,
+                'DaysPerWeek_On':7, 'Holidays':0, 'Duct01':PHPP_SavedDuct(), 'Duct02':PHPP_SavedDuct()}
+    nested = {'Duct01': PHPP_SavedDuct, 'Duct02': PHPP_SavedDuct}
+
+class PHPP_SavedVentSystem(PHPP_SavedObj):
+    """ Stands in for a Honeybee Zone's PHPP_Sys_Ventilation (Unit, Ducts and any Exhaust Vents) """
+    
+    defaults = {'SystemName':'Vent-1', 'SystemType':'1-Balanced PH ventilation with HR',
+                'Unit_Name':'Default_Unit', 'Unit_HR':0.75, 'Unit_MR':0, 'Unit_ElecEff':0.45,
+                'FrostTemp':-5, 'Exterior':'', 'Duct01':PHPP_SavedDuct(), 'Duct02':PHPP_SavedDuct(),
+                'ExhaustObjs':[]}
+    nested = {'Duct01': PHPP_SavedDuct, 'Duct02': PHPP_SavedDuct, 'ExhaustObjs': PHPP_SavedExhaustVent}
+
+class PHPP_SavedThermalBridge(PHPP_SavedObj):
+    defaults = {'Name':'Estimated', 'GroupNo':15, 'Length':0, 'PsiValue':0.01}
+
+class PHPP_SavedData:
+    """ The PHPP Rooms, Ventilation Systems, Thermal Bridges and TFA saved for a model
+    
+    Reads a JSON file like:
+        {"rooms": [{"RoomNumber": "101", "RoomName": "Living", "HostZoneName": "Zone_1",
+                    "FloorArea_TFA": 24.5, "RoomNetClearVolume": 61.2, "V_sup": 30, ...}],
+         "ventSystems": [{"SystemName": "Vent-1", "Unit_Name": "Zehnder ComfoAir Q350", 
+                          "Unit_HR": 0.84, "Duct01": {"DuctLength": 4.5}, ...}],
+         "thermalBridges": [{"Name": "Estimated", "GroupNo": 15, "Length": 120, "PsiValue": 0.01}],
+         "tfa": [85.2]}
+    All of the keys are optional. The attribute names are the same as on the GH objects.
+    """
+    
+    def __init__(self, _data=None):
+        _data = _data or {}
+        self.Rooms = [PHPP_SavedRoom(room) for room in _data.get('rooms', [])]
+        self.VentSystems = [PHPP_SavedVentSystem(system) for system in _data.get('ventSystems', [])]
+        self.ThermalBridges = [PHPP_SavedThermalBridge(tb) for tb in _data.get('thermalBridges', [])]
+        self.TFA = list(_data.get('tfa', []))
+    
+    @classmethod
+    def fromFile(cls, _filePath):
+        if not _filePath:
+            return cls()
+        
+        with open(_filePath, 'r') as dataFile:
+            return cls(json.load(dataFile))
+    
+    def ventSystemsDict(self):
+        # In the same {Unit Name: System} form as the HB Zone Vent Systems branch
+        return [dict( (system.Unit_Name, system) for system in self.VentSystems )] if self.VentSystems else []
+    
+    def __str__(self):
+        return 'Saved PHPP Data: {} Rooms, {} Vent Systems, {} Thermal Bridges'.format(
+                len(self.Rooms), len(self.VentSystems), len(self.ThermalBridges))
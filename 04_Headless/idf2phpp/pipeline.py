@@ -0,0 +1,74 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+# 
+# This module is part of IDF2PHPP.
+# 
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com> 
+# IDF2PHPP is free software; you can redistribute it and/or modify 
+# it under the terms of the GNU General Public License as published 
+# by the Free Software Foundation; either version 3 of the License, 
+# or (at your option) any later version. 
+# 
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of 
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+# GNU General Public License for more details.
+# 
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+# 
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+The full IDF --> PHPP chain: read the file, build the PHPP Objects, build the Excel writes
+
+Runs the same steps as the 'IDF Reader', 'IDF->PHPP Objs' and 'Create Excel Obj - Geom' 
+components, one after the other, with no Rhino / Grasshopper needed.
+"""
+
+import logging
+import os
+
+from .reader import IDF_Model, idf_objectStream, idf_epJSONStream
+from .climate import PHPP_ClimateStore
+from .objects import PHPP_SavedData
+from .idf2phppObjs import buildPHPPObjs
+from .createXLObjGeom import createXLObjsGeom, geomGroupNames
+
+log = logging.getLogger(__name__)
+
+def readIDF(_filePath):
+    """ Reads an .idf or .epJSON file into an IDF_Model """
+    
+    if os.path.splitext(_filePath)[1].lower() == '.epjson':
+        idf = IDF_Model( idf_epJSONStream(_filePath) )
+    else:
+        idf = IDF_Model( idf_objectStream(_filePath) )
+    
+    for warning in idf.warnings:
+        log.warning(warning)
+    
+    return idf
+
+def idfToPHPP(_filePath, _savedData=None, _climateStore=None, _zonesInclude=None, _zonesExclude=None, _udRowStarts=None):
+    """ Goes from an IDF file to the full list of PHPP cell writes
+    
+    Args:
+        _filePath (str): The full path to the .idf or .epJSON file
+        _savedData (PHPP_SavedData): Optional. Any saved PHPP Rooms, Vent Systems, Thermal Bridges and TFA
+        _climateStore (PHPP_ClimateStore): Optional. The PHPP Climate Datasets. Default reads the 
+            IDF2PHPP_ClimateData.csv from the GH Components folder
+        _zonesInclude (list): Optional. Only include Zones with any of these in their name
+        _zonesExclude (list): Optional. Leave out Zones with any of these in their name
+        _udRowStarts (list): Optional. Start Row strings for a modified PHPP, ie: 'Areas, Surfaces: 50'
+    Returns:
+        (list): (Group Name, PHPP_XL_Obj) for every write, in the same order as the GH component tree
+    """
+    
+    savedData = _savedData or PHPP_SavedData()
+    climateStore = _climateStore or PHPP_ClimateStore()
+    
+    phppObjs = buildPHPPObjs(readIDF(_filePath), savedData, climateStore)
+    groups = createXLObjsGeom(phppObjs, _zonesInclude, _zonesExclude, savedData.TFA, savedData.ThermalBridges, _udRowStarts)
+    
+    return [(groupName, xlObj) for groupName, xlObjs in zip(geomGroupNames, groups) for xlObj in xlObjs]
@@ -0,0 +1,642 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+# 
+# This module is part of IDF2PHPP.
+# 
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com> 
+# IDF2PHPP is free software; you can redistribute it and/or modify 
+# it under the terms of the GNU General Public License as published 
+# by the Free Software Foundation; either version 3 of the License, 
+# or (at your option) any later version. 
+# 
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of 
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+# GNU General Public License for more details.
+# 
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+# 
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Reads EnergyPlus IDF and epJSON files into IDF_Class objects, without Rhino
+
+BT_CORE imports IDF_Schema, IDF_Class, idf_objectStream, idf_epJSONStream and IDF_Model 
+from here and registers them in the sticky for the 'Read IDF' component, so the 
+Grasshopper components and the command line share the one reader.
+"""
+
+import json
+import numbers
+import re
+import weakref
+from array import array
+from collections import OrderedDict
+
+class IDF_Schema(object):
+    """ The shared, ordered list of field names for one IDF Class
+    
+    Every IDF_Class object of the same Class read from the same file points to the same 
+    schema, so the field names are only held once. The schema starts from the small IDD 
+    subset below (the Classes IDF2PHPP actually reads) and is updated from the '!-' comments 
+    in the file, if there are any. Any fields after 'Number of Vertices' are read as the 
+    flat vertex array. Each file read gets a new set of schemas, so the objects from one 
+    file are never changed by reading the next.
+    """
+    
+    iddSubset = {
+        'Building': ['Name', 'North Axis {deg}', 'Terrain', 'Loads Convergence Tolerance Value',
+            'Temperature Convergence Tolerance Value {deltaC}', 'Solar Distribution',
+            'Maximum Number of Warmup Days', 'Minimum Number of Warmup Days'],
+        'Site:Location': ['Name', 'Latitude {deg}', 'Longitude {deg}', 'Time Zone {hr}', 'Elevation {m}'],
+        'Zone': ['Name', 'Direction of Relative North {deg}', 'X Origin {m}', 'Y Origin {m}', 'Z Origin {m}',
+            'Type', 'Multiplier', 'Ceiling Height {m}', 'Volume {m3}', 'Floor Area {m2}',
+            'Zone Inside Convection Algorithm', 'Zone Outside Convection Algorithm', 'Part of Total Floor Area'],
+        'ZoneList': ['Name'],
+        'ZoneInfiltration:DesignFlowRate': ['Name', 'Zone or ZoneList Name', 'Schedule Name',
+            'Design Flow Rate Calculation Method', 'Design Flow Rate {m3/s}', 'Flow per Zone Floor Area {m3/s-m2}',
+            'Flow per Exterior Surface Area {m3/s-m2}', 'Air Changes per Hour {1/hr}', 'Constant Term Coefficient',
+            'Temperature Term Coefficient', 'Velocity Term Coefficient', 'Velocity Squared Term Coefficient'],
+        'Material': ['Name', 'Roughness', 'Thickness {m}', 'Conductivity {W/m-K}', 'Density {kg/m3}',
+            'Specific Heat {J/kg-K}', 'Thermal Absorptance', 'Solar Absorptance', 'Visible Absorptance'],
+        'Material:NoMass': ['Name', 'Roughness', 'Thermal Resistance {m2-K/W}', 'Thermal Absorptance',
+            'Solar Absorptance', 'Visible Absorptance'],
+        'Material:AirGap': ['Name', 'Thermal Resistance {m2-K/W}'],
+        'WindowMaterial:SimpleGlazingSystem': ['Name', 'U-Factor {W/m2-K}', 'Solar Heat Gain Coefficient',
+            'Visible Transmittance'],
+        'WindowMaterial:Glazing': ['Name', 'Optical Data Type', 'Window Glass Spectral Data Set Name', 'Thickness {m}',
+            'Solar Transmittance at Normal Incidence', 'Front Side Solar Reflectance at Normal Incidence',
+            'Back Side Solar Reflectance at Normal Incidence', 'Visible Transmittance at Normal Incidence',
+            'Front Side Visible Reflectance at Normal Incidence', 'Back Side Visible Reflectance at Normal Incidence',
+            'Infrared Transmittance at Normal Incidence', 'Front Side Infrared Hemispherical Emissivity',
+            'Back Side Infrared Hemispherical Emissivity', 'Conductivity {W/m-K}',
+            'Dirt Correction Factor for Solar and Visible Transmittance', 'Solar Diffusing'],
+        'WindowMaterial:Gas': ['Name', 'Gas Type', 'Thickness {m}'],
+        'Construction': ['Name', 'Outside Layer'],
+        'BuildingSurface:Detailed': ['Name', 'Surface Type', 'Construction Name', 'Zone Name',
+            'Outside Boundary Condition', 'Outside Boundary Condition Object', 'Sun Exposure', 'Wind Exposure',
+            'View Factor to Ground', 'Number of Vertices'],
+        'FenestrationSurface:Detailed': ['Name', 'Surface Type', 'Construction Name', 'Building Surface Name',
+            'Outside Boundary Condition Object', 'View Factor to Ground', 'Frame and Divider Name', 'Multiplier',
+            'Number of Vertices'],
+        }
+    
+    # Fields which other EnergyPlus versions have before the vertices, and the lists above don't.
+    # Only needed for a file without '!-' comments: (the field it comes after, the new field)
+    versionFields = {
+        'BuildingSurface:Detailed': [('Zone Name', 'Space Name')],                            # E+ 9.6 and later
+        'FenestrationSurface:Detailed': [('View Factor to Ground', 'Shading Control Name')],  # E+ 8.9 and earlier
+        }
+    
+    # Names for the repeating fields past the end of the lists above
+    extensibleNames = {
+        'ZoneList': lambda i: 'Zone {} Name'.format(i),
+        'Construction': lambda i: 'Layer {}'.format(i),
+        }
+    
+    # epJSON field keys which were renamed in later EnergyPlus versions
+    epJSONAliases = {
+        'flow_rate_per_floor_area': 'flow_per_zone_floor_area',
+        'flow_rate_per_exterior_surface_area': 'flow_per_exterior_surface_area',
+        'zone_or_zonelist_or_space_or_spacelist_name': 'zone_or_zonelist_name',
+        }
+    
+    _schemas = {}
+    
+    def __init__(self, _className, _fieldNames=None):
+        self.className = _className
+        self.fieldNames = []
+        self.fieldIndex = {}
+        self.vertexStart = None
+        self.learned = False
+        self.warnings = []
+        self.vertexCountMatched = False
+        self._keyIndex = None
+        
+        for fieldName in (_fieldNames or []):
+            self.setFieldName(len(self.fieldNames), fieldName)
+    
+    @classmethod
+    def forClass(cls, _className):
+        """ Returns the one shared schema for the IDF Class, creating it the first time """
+        
+        classKey = _className.upper()
+        schema = cls._schemas.get(classKey)
+        if schema is None:
+            fieldNames = None
+            for iddClassName, iddFieldNames in cls.iddSubset.items():
+                if iddClassName.upper() == classKey:
+                    _className, fieldNames = iddClassName, iddFieldNames
+                    break
+            schema = cls(_className, fieldNames)
+            cls._schemas[classKey] = schema
+        
+        return schema
+    
+    @classmethod
+    def resetAll(cls):
+        """ Starts a new set of Class schemas from the IDD subset for the next file read. Any
+        objects already read keep the schemas they were made with """
+        cls._schemas = {}
+    
+    @classmethod
+    def restore(cls, _className, _fieldNames, _vertexStart):
+        """ Returns a new schema with a saved set of field names (ie: from the IDF_ParseCache) """
+        
+        schema = cls(_className, _fieldNames)
+        
+        if _vertexStart is not None:
+            schema.setVertexStart(_vertexStart)
+        
+        schema.learned = True
+        return schema
+    
+    def fieldName(self, _i):
+        """ Returns the name of the field at position _i """
+        
+        if _i < len(self.fieldNames):
+            return self.fieldNames[_i]
+        
+        extensibleName = self.extensibleNames.get(self.className)
+        if extensibleName:
+            return extensibleName(_i)
+        
+        return 'Field {}'.format(_i+1)
+    
+    def setFieldName(self, _i, _fieldName):
+        while len(self.fieldNames) <= _i:
+            self.fieldNames.append( self.fieldName(len(self.fieldNames)) )
+        
+        oldName = self.fieldNames[_i]
+        if self.fieldIndex.get(oldName) == _i:
+            del self.fieldIndex[oldName]
+        
+        self.fieldNames[_i] = _fieldName
+        self.fieldIndex[_fieldName] = _i
+        self._keyIndex = None
+        
+        if _fieldName == 'Number of Vertices':
+            self.setVertexStart(_i + 1)
+    
+    def setVertexStart(self, _i):
+        # Everything from here on is vertex data, not named fields
+        self.vertexStart = _i
+        self._keyIndex = None
+        del self.fieldNames[_i:]
+        for fieldName, i in list(self.fieldIndex.items()):
+            if i >= _i:
+                del self.fieldIndex[fieldName]
+    
+    @staticmethod
+    def findVertexCount(_values, _guess=None):
+        """ Finds the 'Number of Vertices' field from the values themselves
+        
+        The vertices are always the last 3N values, just after the count field (N). The 
+        _guess position is tried first, then every field from the start.
+        
+        Returns:
+            (int): The position of the count field, or None if no field fits
+        """
+        
+        def isCount(_i):
+            numCoords = len(_values) - _i - 1
+            try:
+                numVertices = int(_values[_i])
+            except ValueError:
+                # EnergyPlus can work out the count itself
+                if _values[_i].strip().lower() != 'autocalculate':
+                    return False
+                numVertices = numCoords // 3
+            
+            if numVertices < 1 or numCoords != 3 * numVertices:
+                return False
+            
+            try:
+                [float(v) for v in _values[_i+1:]]
+            except ValueError:
+                return False
+            return True
+        
+        if _guess is not None and 0 < _guess < len(_values) and isCount(_guess):
+            return _guess
+        
+        for i in range(1, len(_values)):
+            if isCount(i):
+                return i
+        
+        return None
+    
+    def matchVertexCount(self, _values):
+        """ Moves the vertexStart to fit an object's values, for a file without '!-' comments
+        
+        Other EnergyPlus versions have more or fewer fields before the vertices than the IDD
+        subset, so the 'Number of Vertices' position comes from the values. If its moved by just
+        the known versionFields, those get put in so the field names after them still line up.
+        All the objects in a file are from the same version, so only the first one that fits
+        is needed.
+        """
+        
+        if self.vertexStart is None or self.vertexCountMatched:
+            return
+        
+        countField = self.findVertexCount(_values, self.vertexStart - 1)
+        if countField is None:
+            return
+        
+        self.vertexCountMatched = True
+        if countField == self.vertexStart - 1:
+            return
+        
+        versionFields = self.versionFields.get(self.className, [])
+        fieldNames = self.fieldNames[:self.vertexStart - 1]
+        if versionFields and countField - len(fieldNames) == len(versionFields):
+            for afterField, newField in versionFields:
+                fieldNames.insert(fieldNames.index(afterField) + 1, newField)
+        else:
+            fieldNames = fieldNames[:countField] + ['Field {}'.format(i+1) for i in range(len(fieldNames), countField)]
+        
+        self.fieldNames = []
+        self.fieldIndex = {}
+        self.vertexStart = None
+        for i, fieldName in enumerate(fieldNames + ['Number of Vertices']):
+            self.setFieldName(i, fieldName)
+    
+    @staticmethod
+    def fieldKey(_fieldName):
+        """ Returns the epJSON key for a field name, ie: 'U-Factor {W/m2-K}' -> 'u_factor' """
+        
+        key = re.sub(r'\{.*?\}', '', _fieldName).lower()
+        return re.sub(r'[^a-z0-9]+', '_', key).strip('_')
+    
+    def indexForKey(self, _key):
+        """ Returns the position of the field with the epJSON key, adding it to the end if its new
+        
+        Returns None for a new field in a Class with vertices, since everything after
+        the 'Number of Vertices' field is already vertex data.
+        """
+        
+        if self._keyIndex is None:
+            self._keyIndex = dict( (self.fieldKey(fieldName), i) for i, fieldName in enumerate(self.fieldNames) )
+        
+        _key = self.epJSONAliases.get(_key, _key)
+        i = self._keyIndex.get(_key)
+        if i is not None:
+            return i
+        
+        # Might be one of the repeating fields (ie: 'layer_4')
+        extensibleName = self.extensibleNames.get(self.className)
+        if extensibleName:
+            for i in range(len(self.fieldNames), len(self.fieldNames) + 100):
+                if self.fieldKey(extensibleName(i)) == _key:
+                    return i
+        
+        if self.vertexStart is not None:
+            return None
+        
+        i = len(self.fieldNames)
+        self.setFieldName(i, _key.replace('_', ' ').title())
+        return i
+    
+    def learn(self, _comments):
+        """ Updates the field names using the '!-' comments found for an object in the file
+        
+        The file's comments win over the IDD subset, since the file might be from an EnergyPlus
+        version with more (or fewer) fields before the vertices. Only needs to happen once for 
+        each Class, or when an object has more fields than any seen before (ZoneLists, 
+        Constructions with more layers, etc..)
+        """
+        
+        numFields = len(_comments) if self.vertexStart is None else min(len(_comments), self.vertexStart)
+        if self.learned and numFields <= len(self.fieldNames):
+            return
+        
+        for i, comment in enumerate(_comments):
+            if comment == 'Number of Vertices':
+                # Moves the vertexStart to just after this field
+                self.setFieldName(i, comment)
+                break
+            
+            if comment and 'Vertex' in comment:
+                self.setVertexStart(i)
+                break
+            
+            if self.learned and self.vertexStart is not None and i >= self.vertexStart:
+                break
+            
+            if comment and (i >= len(self.fieldNames) or self.fieldNames[i] != comment):
+                self.setFieldName(i, comment)
+        
+        self.learned = True
+    
+    def __str__(self):
+        return 'IDF Schema for: {} ({} fields)'.format(self.className, len(self.fieldNames))
+
+class IDF_Class(object):
+    """ A single Object read from the IDF file
+    
+    The field values are held by position in a plain list, with any vertex coordinates
+    in a flat array of floats [x1, y1, z1, x2, y2, ...]. The field names come from the 
+    Class's shared IDF_Schema, so fields can still be read by name:
+        getattr(idfObj, 'Construction Name')
+    """
+    
+    __slots__ = ('objName', 'schema', 'values', 'vertices')
+    
+    def __init__(self, _objName, _values=None, _vertices=None, _schema=None):
+        self.objName = _objName
+        self.schema = _schema or IDF_Schema.forClass(_objName)
+        self.values = _values or []
+        self.vertices = _vertices
+    
+    @classmethod
+    def fromFields(cls, _objName, _values, _comments=None):
+        """ Builds a new object from the field values (and their '!-' comments) read from the file """
+        
+        schema = IDF_Schema.forClass(_objName)
+        if _comments and any(_comments):
+            schema.learn(_comments)
+        elif not schema.learned:
+            # No comments to go by, so find where the vertices start from the values
+            schema.matchVertexCount(_values)
+        
+        vertices = None
+        if schema.vertexStart is not None and len(_values) > schema.vertexStart:
+            try:
+                vertices = array('d', [float(v) for v in _values[schema.vertexStart:]])
+                _values = _values[:schema.vertexStart]
+            except ValueError:
+                vertices = None
+            
+            if vertices is not None and len(vertices) % 3 != 0:
+                schema.warnings.append('{} "{}" has {} vertex coordinates, which is not a whole number of '
+                    '(X, Y, Z) points. Its geometry was left out.'.format(_objName, _values[0] if _values else '', len(vertices)))
+                vertices = None
+        
+        return cls(_objName, _values, vertices, schema)
+    
+    def __getattr__(self, _fieldName):
+        # Only gets called if the normal attribute lookup fails: find the field by name
+        if _fieldName.startswith('__') or _fieldName in IDF_Class.__slots__:
+            raise AttributeError(_fieldName)
+        
+        try:
+            i = self.schema.fieldIndex[_fieldName]
+        except KeyError:
+            raise AttributeError(_fieldName)
+        
+        # Any fields left off the end of the object (or the epJSON) are just blank
+        return self.values[i] if i < len(self.values) else ''
+    
+    def setField(self, _fieldName, _value):
+        i = self.schema.fieldIndex[_fieldName]
+        while len(self.values) <= i:
+            self.values.append('')
+        self.values[i] = _value
+    
+    def vertexPoints(self):
+        """ Returns the vertices as a list of (x, y, z) tuples """
+        
+        if not self.vertices:
+            return []
+        
+        v = self.vertices
+        return list(zip(v[0::3], v[1::3], v[2::3]))
+    
+    def items(self):
+        """ Returns a list of (field name, value) pairs for all the fields, including any vertices """
+        
+        fields = [(self.schema.fieldName(i), value) for i, value in enumerate(self.values)]
+        for i, pt in enumerate(self.vertexPoints()):
+            fields.append( ('Vertex {}'.format(i+1), '{} {} {}'.format(*pt)) )
+        
+        return fields
+    
+    def __str__(self):
+        return 'An IDF File object: {}'.format(self.objName)
+    
+    def __repr__(self):
+        return "An IDF File object with all its Params"
+
+def idf_objectStream(_filePath):
+    """ Reads through an IDF file one line at a time and yields each finished IDF_Class object
+    
+    Fields are separated by ',' and each object is closed by a ';'. Any text after a '!' is a
+    comment. The '!-' comment on a line is kept with the first field on that line and used to 
+    name the fields in the Class's IDF_Schema. Several fields can share a line (ie: 'X,Y,Z' 
+    vertex values) and fields don't need any '!-' comment at all.
+    
+    Args:
+        _filePath (str): The full path to the IDF file to read
+    Yields:
+        IDF_Class: One object for each complete object found in the file
+    """
+    
+    objName = None
+    values = []
+    comments = []
+    carry = ''
+    
+    # Each file might come from a different EnergyPlus version, so start from the IDD subset again
+    IDF_Schema.resetAll()
+    
+    with open(_filePath, 'r') as idfFile:
+        for line in idfFile:
+            data, bang, comment = line.partition('!')
+            comment = comment[1:].replace(',', '').strip() if comment.startswith('-') else ''
+            
+            # Split the line into its values, keeping track of the ',' or ';' after each
+            parts = re.split(r'([,;])', data)
+            for i in range(0, len(parts)-1, 2):
+                value = (carry + parts[i]).strip()
+                carry = ''
+                
+                if objName is None:
+                    objName = value
+                else:
+                    values.append(value)
+                    comments.append(comment or None)
+                    comment = '' # The comment only goes with the first value on the line
+                
+                if parts[i+1] == ';':
+                    # End of the object
+                    if objName:
+                        yield IDF_Class.fromFields(objName, values, comments)
+                    
+                    objName = None
+                    values = []
+                    comments = []
+            
+            # Any text without a ',' or ';' yet is part of a value that continues on the next line
+            if parts[-1].strip():
+                carry = carry + parts[-1]
+
+def idf_epJSONStream(_filePath):
+    """ Reads an EnergyPlus epJSON file and yields an IDF_Class object for each object in it
+    
+    The objects are exactly the same as the ones read from a text IDF: the field values are
+    put in the right position for the Class's IDF_Schema by matching the epJSON key to the
+    field name ('Construction Name' -> 'construction_name'). Numbers are turned back into 
+    text so the values read the same as they would from an IDF. A surface's 'vertices'
+    go into the vertex array, and any other repeating fields (ie: a ZoneList's 'zones') 
+    follow on in order after the Class's normal fields.
+    
+    Args:
+        _filePath (str): The full path to the epJSON file to read
+    Yields:
+        IDF_Class: One object for each object found in the file
+    """
+    
+    def fieldValue(_value):
+        if isinstance(_value, float):
+            return repr(_value)
+        elif isinstance(_value, numbers.Integral):
+            return str(_value)
+        return _value
+    
+    with open(_filePath, 'r') as epJSONFile:
+        data = json.load(epJSONFile, object_pairs_hook=OrderedDict)
+    
+    IDF_Schema.resetAll()
+    for className, objs in data.items():
+        if not isinstance(objs, dict):
+            continue
+        
+        schema = IDF_Schema.forClass(className)
+        numFixedFields = len(IDF_Schema.iddSubset.get(schema.className, []))
+        
+        for objName, fields in objs.items():
+            values = [objName]
+            repeatingValues = []
+            vertices = None
+            
+            for key, value in fields.items():
+                if key == 'vertices':
+                    vertices = array('d')
+                    for vertex in value:
+                        vertices.extend( [float(vertex['vertex_x_coordinate']),
+                                          float(vertex['vertex_y_coordinate']),
+                                          float(vertex['vertex_z_coordinate'])] )
+                    continue
+                
+                if isinstance(value, list):
+                    for item in value:
+                        repeatingValues.extend( fieldValue(v) for v in item.values() )
+                    continue
+                
+                i = schema.indexForKey(key)
+                if i is None:
+                    continue
+                
+                while len(values) <= i:
+                    values.append('')
+                values[i] = fieldValue(value)
+            
+            if repeatingValues:
+                while len(values) < numFixedFields:
+                    values.append('')
+                values.extend(repeatingValues)
+            
+            if vertices is not None:
+                if schema.vertexStart is None:
+                    schema.setVertexStart( max(len(values), len(schema.fieldNames)) )
+                
+                while len(values) < schema.vertexStart:
+                    values.append('')
+                
+                if 'Number of Vertices' in schema.fieldIndex:
+                    values[ schema.fieldIndex['Number of Vertices'] ] = str(len(vertices) // 3)
+            
+            yield IDF_Class(className, values, vertices, schema)
+
+class IDF_Model(object):
+    """ A container for all the IDF Objects read from a file, indexed by Class and by Name
+    
+    The indexes are built in a single pass when the model is created so that the 
+    later stages can look up objects directly instead of re-scanning the full list:
+        idf['Zone'] -> list of all the 'Zone' objects
+        idf.get('Construction', 'Ext_Wall') -> the 'Construction' object named 'Ext_Wall'
+    EnergyPlus Class and Object Names are not case sensitive so neither are the lookups.
+    """
+    
+    # The models built so far, so that the same object list never has to be indexed twice
+    _models = weakref.WeakValueDictionary()
+    
+    def __init__(self, _idfObjs=None):
+        self.objects = []
+        self.classNames = []
+        self._byClass = {}
+        self._byName = {}
+        
+        for idfObj in (_idfObjs or []):
+            self.add(idfObj)
+        
+        if self.objects:
+            IDF_Model._models[id(self.objects[0])] = self
+    
+    @classmethod
+    def fromObjects(cls, _idfObjs):
+        """ Returns the IDF_Model built at read time for this object list, or builds a new one """
+        
+        if _idfObjs:
+            model = cls._models.get(id(_idfObjs[0]))
+            if model is not None and len(model) == len(_idfObjs) and model.objects[0] is _idfObjs[0]:
+                return model
+        
+        return cls(_idfObjs)
+    
+    def add(self, _idfObj):
+        className = getattr(_idfObj, 'objName', '')
+        classKey = className.upper()
+        
+        if classKey not in self._byClass:
+            self._byClass[classKey] = []
+            self.classNames.append(className)
+        
+        self.objects.append(_idfObj)
+        self._byClass[classKey].append(_idfObj)
+        
+        name = getattr(_idfObj, 'Name', None)
+        if name is not None:
+            self._byName[(classKey, str(name).upper())] = _idfObj
+    
+    def get(self, _className, _name, _default=None):
+        """ Returns the object of the given Class with the given Name """
+        return self._byName.get((_className.upper(), str(_name).upper()), _default)
+    
+    def classesContaining(self, _text):
+        """ Returns the names of all the Classes in the model with the text anywhere in their name """
+        return [className for className in self.classNames if _text in className]
+    
+    def objectsOfClasses(self, _classNames):
+        """ Returns all the objects of the given Classes, in Class order """
+        objs = []
+        for className in _classNames:
+            objs.extend(self[className])
+        return objs
+    
+    def __getitem__(self, _className):
+        return self._byClass.get(_className.upper(), [])
+    
+    def __contains__(self, _className):
+        return _className.upper() in self._byClass
+    
+    def __iter__(self):
+        return iter(self.objects)
+    
+    @property
+    def warnings(self):
+        """ Any problems found reading the file (ie: surfaces with bad vertices), from each Class's IDF_Schema """
+        warnings = []
+        for className in self.classNames:
+            schema = getattr(self[className][0], 'schema', None)
+            if schema is not None:
+                warnings.extend(schema.warnings)
+        return warnings
+    
+    def __len__(self):
+        return len(self.objects)
+    
+    def __str__(self):
+        return 'An IDF Model with {} Objects in {} Classes'.format(len(self.objects), len(self.classNames))
+
@@ -0,0 +1,715 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+# 
+# This module is part of IDF2PHPP.
+# 
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com> 
+# IDF2PHPP is free software; you can redistribute it and/or modify 
+# it under the terms of the GNU General Public License as published 
+# by the Free Software Foundation; either version 3 of the License, 
+# or (at your option) any later version. 
+# 
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of 
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+# GNU General Public License for more details.
+# 
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+# 
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+The Excel-ready PHPP write objects: a Worksheet, a Cell Range and a Value
+
+BT_CORE imports these from here and registers them in the sticky, so the write sets 
+built headless line up one-to-one with the ones the 'Create Excel Obj' components pass 
+to the 'Write 2PHPP' component.
+"""
+
+import numbers
+import re
+from array import array
+from collections import OrderedDict
+
+class PHPP_UnitConverter:
+    """ Converts PHPP Values from their SI unit to the unit the PHPP wants
+    
+    Each (SI Unit, Target Unit) pair gets its converter function built once and 
+    re-used for every Value after that, instead of building and eval-ing a string for 
+    each one. Unknown units pass the Value through unchanged.
+    """
+    
+    # {Unit You have: {Unit you Want: (factor, offset, inverse)}, {...}, ...}
+    # New Value = Value * factor + offset, or factor / Value if inverse
+    schema = {
+            'C'    : {'F':(1.8, 32, False)},
+            'LITER': {'GALLON':(0.264172, 0, False)},
+            'MM'   : {'FT':(0.00328084, 0, False), 'IN':(0.0394, 0, False)},
+            'M'    : {'FT':(3.280839895, 0, False), 'IN':(39.3701, 0, False)},
+            'M/DAY': {'FT/DAY':(3.280839895, 0, False)},
+            'M2'   : {'FT2':(10.76391042, 0, False)},
+            'M3'   : {'FT3':(35.31466672, 0, False)},
+            'M3/H' : {'CFM':(0.588577779, 0, False)},
+            'WH/M3': {'W/CFM':(1.699010796, 0, False)},
+            'WH/KM2':{'BTU/FT2':(0.176110159, 0, False)},
+            'MJ/M3K':{'BTU/FT3-F':(14.91066014, 0, False)},
+            'W/M2K': {'BTU/HR-FT2-F':(0.176110159, 0, False), 'HR-FT2-F/BTU':(5.678264134, 0, True)},
+            'M2K/W': {'HR-FT2-F/BTU':(5.678264134, 0, False)},
+            'W/MK' : {'HR-FT2-F/BTU-IN':(0.144227909, 0, True), 'BTU/HR-FT-F':(0.577789236, 0, False)},
+            'W/K'  : {'BTU/HR-F':(1.895633976, 0, False)},
+            'KW'   : {'BTU/H':(3412.141156, 0, False)},
+            'W/W'  : {'BTU/HW':(3.412141156, 0, False)} # SEER
+            }
+    
+    reNumber = re.compile(r'^[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?$')
+    maxCacheSize = 4096
+    _converters = {}
+    
+    @classmethod
+    def getConverter(cls, _unitSI, _targetUnit):
+        """ The converter function for a unit pair: converter(value) -> converted value """
+        
+        key = (_unitSI, _targetUnit)
+        converter = cls._converters.get(key)
+        if converter is None:
+            converter = cls.buildConverter(_unitSI, _targetUnit)
+            cls._converters[key] = converter
+        
+        return converter
+    
+    @classmethod
+    def buildConverter(cls, _unitSI, _targetUnit):
+        factor, offset, inverse = cls.schema.get(_unitSI, {}).get(_targetUnit, (1, 0, False))
+        
+        if inverse:
+            convert = lambda _v: factor / float(_v)
+        elif offset:
+            convert = lambda _v: _v * factor + offset
+        elif factor != 1:
+            convert = lambda _v: _v * factor
+        else:
+            convert = lambda _v: _v
+        
+        # The same few Values (thicknesses, U-Values, etc...) get written over and over
+        # Keyed with the type as well, so 0 and 0.0 don't share a result
+        cache = {}
+        def converter(_value):
+            key = (type(_value), _value)
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+            except TypeError:
+                return cls.applyConverter(convert, _value)
+            
+            result = cls.applyConverter(convert, _value)
+            if len(cache) < cls.maxCacheSize:
+                cache[key] = result
+            return result
+        
+        return converter
+    
+    @classmethod
+    def applyConverter(cls, _convert, _value):
+        number = cls.toNumber(_value)
+        if number is None:
+            return _value
+        
+        try:
+            return _convert(number)
+        except ZeroDivisionError:
+            return _value
+    
+    @classmethod
+    def toNumber(cls, _value):
+        """ The Value as a number, if it is one (or is text of one). Otherwise None """
+        
+        if isinstance(_value, numbers.Number):
+            return _value
+        
+        try:
+            text = str(_value).strip()
+        except Exception:
+            return None
+        
+        if not cls.reNumber.match(text):
+            return None
+        if text.lstrip('+-').isdigit():
+            return int(text)
+        return float(text)
+    
+    @classmethod
+    def convertWriteSet(cls, _xlObjs, _units='SI'):
+        """ The (Worksheet, Range, Value) writes for a whole set of PHPP_XL_Objs at once
+        
+        Args:
+            _xlObjs: (list) The PHPP_XL_Obj objects (or PHPP_XL_WriteBatches) to write
+            _units: (str) 'SI' or 'IP'
+        Returns:
+            writes: (list) Tuples of (Worksheet, Range, converted Value) 
+        """
+        
+        converters = {}
+        writes = []
+        for xlObj in _xlObjs:
+            if isinstance(xlObj, PHPP_XL_WriteBatch):
+                writes.extend( xlObj.getWrites(_units) )
+                continue
+            
+            value = xlObj.Value
+            if xlObj.Unit_SI:
+                key = (xlObj.Unit_SI, xlObj.getTargetUnit(_units))
+                converter = converters.get(key)
+                if converter is None:
+                    converter = cls.getConverter(*key)
+                    converters[key] = converter
+                value = converter(value)
+            
+            writes.append( (xlObj.getWorksheet(_units), xlObj.Range, value) )
+        
+        return writes
+    
+    def __str__(self):
+        return "PHPP Unit Converter: {} Unit pairs built".format(len(self._converters))
+    def __repr__(self):
+        return "{}()".format(self.__class__.__name__)
+
+class PHPP_XL_Obj:
+    """ A holder for an Excel writable datapoint with a worksheet, range and value """
+    
+    def __init__(self, _shtNm, _rangeAddress, _val, _unitSI=None, _unitIP='SI', _source=None, _override=False):
+        """
+        Args:
+            _shtNm (str): The Name of the Worksheet to write to
+            _rangeAddress (str): The Cell Range (A1, B12, etc...) to write to on the Worksheet
+            _val (str): The Value to write to the Cell Range (Value2)
+            _unitSI: (str) The SI unit for the item
+            _unitIP: (str) The IP unit for the item
+            _source: (str) Optional. Where the write came from (the Component name), for reporting conflicts
+            _override: (bool) Optional. True if the write is meant to replace any other value for 
+                the cell (User-Defined values, Variants), so it isn't reported as a conflict
+        """
+        self.Worksheet = _shtNm
+        self.Range = _rangeAddress
+        self.Value = _val
+        self.Unit_SI = _unitSI
+        self.Unit_IP = _unitIP
+        self.Source = _source
+        self.Override = _override
+    
+    @staticmethod
+    def worksheetForUnits(_shtNm, _units='SI'):
+        """ A few of the Worksheets have different names in the IP PHPP """
+        if _units == 'SI':
+            return _shtNm
+        
+        if _shtNm == 'U-Values':
+            return 'R-Values'
+        elif _shtNm == 'Additional Vent':
+            return 'Addl vent'
+        else:
+            return _shtNm
+    
+    def getWorksheet(self, _units='SI'):
+        return self.worksheetForUnits(self.Worksheet, _units)
+    
+    def getTargetUnit(self, _units='SI'):
+        """ The unit to convert the Value to: the IP or SI unit, or any other unit name given """
+        if _units == 'IP':
+            return self.Unit_IP
+        elif _units == 'SI':
+            return self.Unit_SI
+        else:
+            return _units
+    
+    def getValue(self, _targetUnit='SI'):
+        """ Get the Item Value properly. Allows for unit conversion.
+        
+        For instance calling "obj.getValue(obj.Unit_IP)" will return the 
+        converted value into Inch-Pound units. Pass 'SI' or leave 
+        input blank for no conversion (return = self.Value)
+        
+        Args:
+            _targetUnit: (str) The unit to convert the value to. 'SI' or 'IP'
+        Returns:
+            value converted into the right units
+        """
+        
+        if not self.Unit_SI:
+            return self.Value
+        
+        converter = PHPP_UnitConverter.getConverter(self.Unit_SI, self.getTargetUnit(_targetUnit))
+        return converter(self.Value)
+    
+    def getWrite(self, _units='SI'):
+        """ Returns the (Worksheet, Range, Value) to write, in the SI or IP units """
+        return self.getWorksheet(_units), self.Range, self.getValue(_units)
+    
+    def __str__(self):
+        return "PHPP Obj | Worksheet: {self.Worksheet}  |  Cell: {self.Range}  |  Value: {self.Value}".format(self=self)
+    def __repr__(self):
+       return "{}( _shtNm={!r}, _rangeAddress={!r}, _val={!r}, _unitSI={!r}, _unitIP={!r} )".format(
+               self.__class__.__name__,
+               self.Worksheet,
+               self.Range,
+               self.Value,
+               self.Unit_SI,
+               self.Unit_IP)
+
+class PHPP_XL_Address:
+    """ Excel cell addresses as integer (row, col) pairs, both 1-based
+    
+    The A1 strings are only made (or read) at the edges, through cached tables, so 
+    building up and sorting the writes doesn't keep formatting and parsing strings.
+    A range is a (top, left, bottom, right) tuple of its corner rows and columns.
+    """
+    
+    reA1 = re.compile(r'^\$?([A-Z]{1,3})\$?([0-9]+)$')
+    maxCacheSize = 100000
+    _colLetters = {} # {col number: 'AB'}
+    _colNumbers = {} # {'AB': col number}
+    _cells = {}      # {'AB12': (row, col)}
+    
+    @classmethod
+    def colLetters(cls, _col):
+        letters = cls._colLetters.get(_col)
+        if letters is None:
+            col, letters = _col, ''
+            while col > 0:
+                col, remainder = divmod(col - 1, 26)
+                letters = chr(65 + remainder) + letters
+            cls._colLetters[_col] = letters
+        
+        return letters
+    
+    @classmethod
+    def colNumber(cls, _letters):
+        col = cls._colNumbers.get(_letters)
+        if col is None:
+            col = 0
+            for letter in _letters.upper():
+                col = col * 26 + ord(letter) - 64
+            cls._colNumbers[_letters] = col
+        
+        return col
+    
+    @classmethod
+    def cell(cls, _col, _row):
+        """ The (row, col) for a column and row, ie: cell('AC', 41) = (41, 29)
+        
+        Args:
+            _col: (str | int) The column letters, or the column number
+            _row: (int) The row number
+        """
+        if isinstance(_col, int):
+            return (int(_row), _col)
+        return (int(_row), cls.colNumber(_col))
+    
+    @classmethod
+    def fromA1(cls, _rangeAddress):
+        """ Returns the (row, col) of an 'AB12' style address. None if its not a single cell """
+        try:
+            return cls._cells[_rangeAddress]
+        except (KeyError, TypeError):
+            pass
+        
+        match = cls.reA1.match(str(_rangeAddress).strip().upper())
+        cell = (int(match.group(2)), cls.colNumber(match.group(1))) if match else None
+        
+        if len(cls._cells) < cls.maxCacheSize:
+            try:
+                cls._cells[_rangeAddress] = cell
+            except TypeError:
+                pass
+        return cell
+    
+    @classmethod
+    def toA1(cls, _cell):
+        return '{}{}'.format(cls.colLetters(_cell[1]), _cell[0])
+    
+    @classmethod
+    def rangeFromA1(cls, _rangeAddress):
+        """ Returns the (top, left, bottom, right) of an 'A1:C4' or 'A1' address. None if it isn't one """
+        corners = [cls.fromA1(each) for each in str(_rangeAddress).split(':')]
+        if not corners or len(corners) > 2 or None in corners:
+            return None
+        
+        rows = [corner[0] for corner in corners]
+        cols = [corner[1] for corner in corners]
+        return (min(rows), min(cols), max(rows), max(cols))
+    
+    @classmethod
+    def rangeToA1(cls, _range):
+        top, left, bottom, right = _range
+        if (top, left) == (bottom, right):
+            return cls.toA1((top, left))
+        return '{}:{}'.format(cls.toA1((top, left)), cls.toA1((bottom, right)))
+    
+    @staticmethod
+    def offset(_cell, _rows=0, _cols=0):
+        return (_cell[0] + _rows, _cell[1] + _cols)
+    
+    @staticmethod
+    def rangeCells(_range):
+        """ All the (row, col) cells in a range, row by row """
+        top, left, bottom, right = _range
+        return [(row, col) for row in range(top, bottom + 1) for col in range(left, right + 1)]
+    
+    @staticmethod
+    def boundingRange(_cells):
+        """ The smallest (top, left, bottom, right) range holding all the cells """
+        rows = [cell[0] for cell in _cells]
+        cols = [cell[1] for cell in _cells]
+        return (min(rows), min(cols), max(rows), max(cols))
+    
+    @staticmethod
+    def isNextTo(_cellA, _cellB):
+        """ True if the two cells share an edge """
+        return abs(_cellA[0] - _cellB[0]) + abs(_cellA[1] - _cellB[1]) == 1
+    
+    def __str__(self):
+        return "PHPP Excel Address table: {} cells cached".format(len(self._cells))
+    def __repr__(self):
+        return "{}()".format(self.__class__.__name__)
+
+class PHPP_XL_WriteBatch:
+    """ A column-wise set of PHPP writes, for building up a large export without a 
+    PHPP_XL_Obj for every cell. 
+    
+    Worksheet names and unit pairs are stored once, as small integer ids, and the 
+    cell addresses as integer row / column arrays. Iterating over a batch still gives 
+    PHPP_XL_Objs (made as needed), so anything expecting a list of those keeps working.
+    """
+    
+    # Shared by every batch, so batches can be merged without re-mapping the ids
+    SheetNames = []
+    SheetIds = {}
+    UnitPairs = []
+    UnitIds = {}
+    
+    def __init__(self, _xlObjs=None, _source=None):
+        """
+        Args:
+            _xlObjs (list): Optional. Any PHPP_XL_Objs (or other batches) to start with
+            _source: (str) Optional. Where the writes came from (the Component name), for reporting conflicts
+        """
+        self.Source = _source
+        self.Sheets = array('H')
+        self.Rows = array('i')
+        self.Cols = array('i')
+        self.Values = []
+        self.Units = array('H')
+        self.Ranges = {} # {index: Range} for any writes that aren't to a single A1 cell
+        
+        if _xlObjs:
+            self.extend(_xlObjs)
+    
+    @classmethod
+    def internId(cls, _key, _ids, _keys):
+        keyId = _ids.get(_key)
+        if keyId is None:
+            keyId = len(_keys)
+            _keys.append(_key)
+            _ids[_key] = keyId
+        return keyId
+    
+    def addCell(self, _shtNm, _row, _col, _val, _unitSI=None, _unitIP='SI'):
+        """ Adds a write to a cell by its (row, col), both 1-based """
+        self.Sheets.append( self.internId(_shtNm, self.SheetIds, self.SheetNames) )
+        self.Rows.append(_row)
+        self.Cols.append(_col)
+        self.Values.append(_val)
+        self.Units.append( self.internId((_unitSI, _unitIP), self.UnitIds, self.UnitPairs) )
+    
+    def add(self, _shtNm, _rangeAddress, _val, _unitSI=None, _unitIP='SI'):
+        """ Adds a write. Same Args as PHPP_XL_Obj, but the Range can also be a (row, col) cell """
+        cell = _rangeAddress if isinstance(_rangeAddress, tuple) else PHPP_XL_Address.fromA1(_rangeAddress)
+        if cell is None:
+            self.Ranges[len(self.Values)] = _rangeAddress
+            cell = (0, 0)
+        
+        self.addCell(_shtNm, cell[0], cell[1], _val, _unitSI, _unitIP)
+    
+    def append(self, _xlObj):
+        self.add(_xlObj.Worksheet, _xlObj.Range, _xlObj.Value, _xlObj.Unit_SI, _xlObj.Unit_IP)
+    
+    def extend(self, _xlObjs):
+        """ Adds all the writes from another batch, or from a list of PHPP_XL_Objs """
+        if not isinstance(_xlObjs, PHPP_XL_WriteBatch):
+            for xlObj in _xlObjs:
+                self.append(xlObj)
+            return
+        
+        offset = len(self.Values)
+        for i, rangeAddress in _xlObjs.Ranges.items():
+            self.Ranges[i + offset] = rangeAddress
+        self.Sheets.extend(_xlObjs.Sheets)
+        self.Rows.extend(_xlObjs.Rows)
+        self.Cols.extend(_xlObjs.Cols)
+        self.Values.extend(_xlObjs.Values)
+        self.Units.extend(_xlObjs.Units)
+    
+    @classmethod
+    def merge(cls, _batches):
+        """ A new batch with all the writes from each of the batches, in order """
+        merged = cls()
+        for batch in _batches:
+            merged.extend(batch)
+        return merged
+    
+    def getRange(self, _i):
+        if _i in self.Ranges:
+            return self.Ranges[_i]
+        return PHPP_XL_Address.toA1( (self.Rows[_i], self.Cols[_i]) )
+    
+    def getObj(self, _i):
+        unitSI, unitIP = self.UnitPairs[self.Units[_i]]
+        return PHPP_XL_Obj(self.SheetNames[self.Sheets[_i]], self.getRange(_i), self.Values[_i], unitSI, unitIP, self.Source)
+    
+    def getWrites(self, _units='SI'):
+        """ The (Worksheet, Range, Value) writes for the whole batch, in the SI or IP units 
+        
+        Each Worksheet name and unit converter is only looked up once per id, not once per cell.
+        """
+        worksheets = {}
+        converters = {}
+        writes = []
+        for i in range(len(self.Values)):
+            sheetId = self.Sheets[i]
+            worksheet = worksheets.get(sheetId)
+            if worksheet is None:
+                worksheet = PHPP_XL_Obj.worksheetForUnits(self.SheetNames[sheetId], _units)
+                worksheets[sheetId] = worksheet
+            
+            unitId = self.Units[i]
+            converter = converters.get(unitId)
+            if converter is None:
+                unitSI, unitIP = self.UnitPairs[unitId]
+                if unitSI:
+                    targetUnit = unitIP if _units == 'IP' else unitSI if _units == 'SI' else _units
+                    converter = PHPP_UnitConverter.getConverter(unitSI, targetUnit)
+                else:
+                    converter = False
+                converters[unitId] = converter
+            
+            value = self.Values[i]
+            if converter:
+                value = converter(value)
+            
+            writes.append( (worksheet, self.getRange(i), value) )
+        
+        return writes
+    
+    def __len__(self):
+        return len(self.Values)
+    
+    def __iter__(self):
+        for i in range(len(self.Values)):
+            yield self.getObj(i)
+    
+    def __str__(self):
+        sheetNames = sorted(set(self.SheetNames[sheetId] for sheetId in self.Sheets))
+        return "PHPP Write Batch | {} writes to: {}".format(len(self), ', '.join(sheetNames))
+    def __repr__(self):
+        return "{}( _xlObjs=[{} PHPP_XL_Objs] )".format(self.__class__.__name__, len(self))
+
+class PHPP_XL_WriteSet:
+    """ The final set of writes for one export, from all of the sources at once
+    
+    Writes to the same cell are collapsed to one: repeats of the same value are just 
+    dropped, but different values are kept as Conflicts (with where each one came from) 
+    so mapping mistakes can be found, unless the later write is an Override. As before, 
+    the last write to a cell wins. The writes come back out sorted by Worksheet, then 
+    row by row, for fewer, bigger blocks.
+    """
+    
+    def __init__(self):
+        self.Cells = OrderedDict()  # {(Worksheet, (row, col) or Range): (Range, Value, Source)}
+        self.Conflicts = []         # [(Worksheet, Range, [(Source, Value), ...]), ...]
+        self._conflictWrites = {}   # {(Worksheet, (row, col) or Range): [(Source, Value), ...]}
+        self.NumWrites = 0
+        self.NumDuplicates = 0
+        self.NumOverrides = 0
+    
+    def add(self, _worksheet, _rangeAddress, _value, _source=None, _override=False):
+        self.NumWrites += 1
+        cell = PHPP_XL_Address.fromA1(_rangeAddress)
+        key = (_worksheet, cell if cell else str(_rangeAddress).upper())
+        
+        existing = self.Cells.get(key)
+        if existing is not None:
+            if self.sameValue(existing[1], _value):
+                self.NumDuplicates += 1
+                return
+            elif _override:
+                self.NumOverrides += 1
+            else:
+                self.addConflict(key, existing, _value, _source)
+        
+        self.Cells[key] = (_rangeAddress, _value, _source)
+    
+    @staticmethod
+    def sameValue(_a, _b):
+        """ True if Excel would store both values the same way. 1 and 1.0 are the same number, 
+        but neither is the same as the text '1' or True """
+        aIsNumber = isinstance(_a, numbers.Number) and not isinstance(_a, bool)
+        bIsNumber = isinstance(_b, numbers.Number) and not isinstance(_b, bool)
+        return aIsNumber == bIsNumber and isinstance(_a, bool) == isinstance(_b, bool) and _a == _b
+    
+    def addConflict(self, _key, _existing, _value, _source):
+        writes = self._conflictWrites.get(_key)
+        if writes is None:
+            rangeAddress, value, source = _existing
+            writes = self._conflictWrites[_key] = [(source, value)]
+            self.Conflicts.append( (_key[0], rangeAddress, writes) )
+        
+        writes.append( (_source, _value) )
+    
+    def addWrites(self, _writes, _source=None, _override=False):
+        """ Adds a list of (Worksheet, Range, Value) writes, all from the same source """
+        for worksheet, rangeAddress, value in _writes:
+            self.add(worksheet, rangeAddress, value, _source, _override)
+    
+    def addXLObjs(self, _xlObjs, _units='SI', _source=None):
+        """ Adds PHPP_XL_Objs and / or PHPP_XL_WriteBatches, in their SI or IP units. Each
+        one's own Source is used if it has one, otherwise the _source given """
+        for xlObj in _xlObjs:
+            source = getattr(xlObj, 'Source', None) or _source
+            if source and _source and source != _source:
+                source = '{} {}'.format(source, _source)
+            self.addWrites(PHPP_UnitConverter.convertWriteSet([xlObj], _units), source, getattr(xlObj, 'Override', False))
+    
+    def getWrites(self):
+        """ All the (Worksheet, Range, Value) writes, one per cell, sorted by Worksheet and then by row / column """
+        def sortKey(_item):
+            (worksheet, cell), (rangeAddress, value, source) = _item
+            if not isinstance(cell, tuple):
+                cell = PHPP_XL_Address.rangeFromA1(rangeAddress) or (0, 0)
+            return (worksheet, cell[0], cell[1])
+        
+        return [(worksheet, rangeAddress, value) for (worksheet, cell), (rangeAddress, value, source) in sorted(self.Cells.items(), key=sortKey)]
+    
+    def getConflictMessages(self, _limit=10):
+        """ A line for each of the (first few) cells written more than once with different values """
+        messages = []
+        for worksheet, rangeAddress, writes in self.Conflicts[:_limit]:
+            sources = ', then '.join('{!r} from {}'.format(value, source or 'unknown') for source, value in writes)
+            messages.append( '{}!{}: {}'.format(worksheet, rangeAddress, sources) )
+        
+        if len(self.Conflicts) > _limit:
+            messages.append( '...and {} more'.format(len(self.Conflicts) - _limit) )
+        return messages
+    
+    def __len__(self):
+        return len(self.Cells)
+    
+    def __str__(self):
+        return "PHPP Write Set | {} writes to {} cells ({} repeated, {} overridden, {} conflicting)".format(
+                self.NumWrites, len(self), self.NumDuplicates, self.NumOverrides, len(self.Conflicts))
+    def __repr__(self):
+        return "{}()".format(self.__class__.__name__)
+
+class PHPP_XL_WritePlan:
+    """ Groups a set of (Worksheet, Range, Value) writes by Worksheet and coalesces 
+    neighbouring cells into rectangular blocks. Each block can then be written with a single 
+    2D Value2 assignment instead of one COM call per cell. """
+    
+    maxAddressLen = 255 # Excel won't take a longer Range address string
+    
+    def __init__(self, _writes):
+        """
+        Args:
+            _writes (list): The (Worksheet, Range, Value) writes, in order. The Range can be 
+                an A1 address or a (row, col) cell. If a cell is written more than once, 
+                the last one wins.
+        """
+        self.Blocks = OrderedDict() # {Worksheet: [(row, col, [[row values], ...]), ...]}
+        self.Loose = []             # Any writes that aren't to a single A1 cell
+        self.NumWrites = 0
+        
+        sheetCells = OrderedDict()
+        for worksheet, rangeAddress, value in _writes:
+            self.NumWrites += 1
+            cell = rangeAddress if isinstance(rangeAddress, tuple) else PHPP_XL_Address.fromA1(rangeAddress)
+            if cell is None:
+                self.Loose.append( (worksheet, rangeAddress, value) )
+            else:
+                sheetCells.setdefault(worksheet, {})[cell] = value
+        
+        for worksheet, cells in sheetCells.items():
+            self.Blocks[worksheet] = self.coalesce(cells)
+    
+    @staticmethod
+    def coalesce(_cells):
+        """ Row-major pass over the cells. Each block grows right along its row, then
+        down for as long as the next row has all the same columns to write. 
+        
+        Args:
+            _cells (dict): {(row, col): value, ...}
+        Returns:
+            blocks (list): [(top row, left col, [[row values], ...]), ...]
+        """
+        blocks = []
+        done = set()
+        for row, col in sorted(_cells):
+            if (row, col) in done:
+                continue
+            
+            width = 1
+            while (row, col + width) in _cells and (row, col + width) not in done:
+                width += 1
+            
+            height = 1
+            while all((row + height, c) in _cells and (row + height, c) not in done for c in range(col, col + width)):
+                height += 1
+            
+            values = []
+            for r in range(row, row + height):
+                values.append( [_cells[(r, c)] for c in range(col, col + width)] )
+                done.update( (r, c) for c in range(col, col + width) )
+            blocks.append( (row, col, values) )
+        
+        return blocks
+    
+    @staticmethod
+    def blockAddress(_row, _col, _values):
+        return PHPP_XL_Address.rangeToA1( (_row, _col, _row + len(_values) - 1, _col + len(_values[0]) - 1) )
+    
+    def getBlocks(self, _worksheet):
+        """ Yields the (Range Address, [[row values], ...]) of each block on the Worksheet """
+        for row, col, values in self.Blocks.get(_worksheet, []):
+            yield self.blockAddress(row, col, values), values
+    
+    def getHighlightRanges(self, _worksheet):
+        """ All of the Worksheet's blocks as a union Range address ('A1:C4,F7,...'). Only
+        gets split into more than one if its longer than Excel will accept """
+        addresses = []
+        for address, values in self.getBlocks(_worksheet):
+            if addresses and len(','.join(addresses + [address])) > self.maxAddressLen:
+                yield ','.join(addresses)
+                addresses = []
+            addresses.append(address)
+        
+        if addresses:
+            yield ','.join(addresses)
+    
+    def getCells(self, _worksheet):
+        """ Yields the (row, col) of every cell in the Worksheet's blocks """
+        for row, col, values in self.Blocks.get(_worksheet, []):
+            for i, rowValues in enumerate(values):
+                for j in range(len(rowValues)):
+                    yield (row + i, col + j)
+    
+    @property
+    def NumBlocks(self):
+        return sum(len(blocks) for blocks in self.Blocks.values()) + len(self.Loose)
+    
+    def __str__(self):
+        return "PHPP Write Plan | Writes: {}  |  Blocks: {}  |  Worksheets: {}".format(self.NumWrites, self.NumBlocks, len(self.Blocks))
+    def __repr__(self):
+       return "{}( NumWrites={!r}, NumBlocks={!r}, Worksheets={!r} )".format(
+               self.__class__.__name__,
+               self.NumWrites,
+               self.NumBlocks,
+               list(self.Blocks.keys()))
@@ -0,0 +1,417 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+# 
+# This module is part of IDF2PHPP.
+# 
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com> 
+# IDF2PHPP is free software; you can redistribute it and/or modify 
+# it under the terms of the GNU General Public License as published 
+# by the Free Software Foundation; either version 3 of the License, 
+# or (at your option) any later version. 
+# 
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of 
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+# GNU General Public License for more details.
+# 
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+# 
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Writes cells straight into a PHPP .xlsx file, no Excel needed
+
+BT_CORE registers this PHPP_XLSX_Workbook in the sticky for the 'Write 2PHPP' component's 'xlsx' backend.
+"""
+
+import math
+import numbers
+import os
+import re
+import shutil
+import tempfile
+import zipfile
+
+from .xl import PHPP_XL_Address
+
+try:
+    basestring
+except NameError:
+    basestring = str
+
+class PHPP_XLSX_Workbook:
+    """ Writes cells straight into the worksheet XML inside a PHPP .xlsx file, no Excel needed.
+    Only the rows being written to are changed. Everything else in the file (other
+    cells, formulas, styles, other worksheets) is copied across as-is. The workbook
+    gets flagged for a full recalculation the next time it is opened in Excel. """
+    
+    highlightFill = u'<fill><patternFill patternType="solid"><fgColor rgb="FF00FFFF"/><bgColor indexed="64"/></patternFill></fill>' # ColorIndex 8
+    reNumber = re.compile(r'^\s*[-+]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][-+]?[0-9]+)?\s*$')
+    reRow = re.compile(r'<row\b[^>]*?(?:/>|>.*?</row>)', re.DOTALL)
+    reCell = re.compile(r'<c\b[^>]*?(?:/>|>.*?</c>)', re.DOTALL)
+    reXf = re.compile(r'<xf\b[^>]*?(?:/>|>.*?</xf>)', re.DOTALL)
+    
+    def __init__(self, _filePath):
+        """
+        Args:
+            _filePath (str): The full path to the PHPP .xlsx (or .xlsm) file
+        """
+        self.FilePath = _filePath
+        self.Warnings = []
+        self.Skipped = []   # [(Worksheet, (row, col) or Range), ...] that couldn't be written
+        self._sharedStrings = None
+        
+        with zipfile.ZipFile(self.FilePath) as zin:
+            workbookXml = self.readXml(zin, 'xl/workbook.xml')
+            relsXml = self.readXml(zin, 'xl/_rels/workbook.xml.rels')
+        
+        relTargets = {}
+        for rel in re.findall(r'<Relationship\b[^>]*>', relsXml):
+            target = self.getAttr(rel, 'Target')
+            relTargets[self.getAttr(rel, 'Id')] = target.lstrip('/') if target.startswith('/') else 'xl/' + target
+        
+        self.SheetPaths = {}
+        for sheet in re.findall(r'<sheet\b[^>]*>', workbookXml):
+            self.SheetPaths[self.unescape(self.getAttr(sheet, 'name'))] = relTargets.get(self.getAttr(sheet, 'r:id'))
+    
+    @staticmethod
+    def readXml(_zip, _name):
+        return _zip.read(_name).decode('utf-8')
+    
+    @staticmethod
+    def getAttr(_tag, _name):
+        match = re.search(r'\s' + re.escape(_name) + r'="([^"]*)"', _tag)
+        return match.group(1) if match else None
+    
+    @staticmethod
+    def setAttr(_tag, _name, _value):
+        """ Sets (or adds) an attribute on the opening tag string """
+        if re.search(r'\s' + re.escape(_name) + r'="[^"]*"', _tag):
+            return re.sub(r'(\s' + re.escape(_name) + r'=)"[^"]*"', lambda m: u'{}"{}"'.format(m.group(1), _value), _tag, 1)
+        return re.sub(r'^(<[\w:]+)', lambda m: u'{} {}="{}"'.format(m.group(1), _name, _value), _tag, 1)
+    
+    @staticmethod
+    def escape(_text):
+        return _text.replace(u'&', u'&amp;').replace(u'<', u'&lt;').replace(u'>', u'&gt;').replace(u'"', u'&quot;')
+    
+    @staticmethod
+    def unescape(_text):
+        return _text.replace(u'&lt;', u'<').replace(u'&gt;', u'>').replace(u'&quot;', u'"').replace(u'&apos;', u"'").replace(u'&amp;', u'&')
+    
+    #---------------------------------------------------------------------------
+    # Reading
+    
+    def getSharedStrings(self):
+        if self._sharedStrings is None:
+            self._sharedStrings = []
+            with zipfile.ZipFile(self.FilePath) as zin:
+                if 'xl/sharedStrings.xml' in zin.namelist():
+                    for si in re.findall(r'<si>(.*?)</si>', self.readXml(zin, 'xl/sharedStrings.xml'), re.DOTALL):
+                        self._sharedStrings.append( self.unescape(u''.join(re.findall(r'<t\b[^>]*>(.*?)</t>', si, re.DOTALL))) )
+        
+        return self._sharedStrings
+    
+    def getCellValue(self, _sheetName, _rangeAddress):
+        """ Reads a single cell's (cached) value. Returns None if its blank or not found """
+        sheetPath = self.SheetPaths.get(_sheetName)
+        if not sheetPath:
+            return None
+        
+        with zipfile.ZipFile(self.FilePath) as zin:
+            sheetXml = self.readXml(zin, sheetPath)
+        
+        match = re.search(r'<c\b[^>]*\sr="' + re.escape(_rangeAddress.upper()) + r'"[^>]*?(?:/>|>.*?</c>)', sheetXml, re.DOTALL)
+        if not match:
+            return None
+        
+        return self.cellValue(match.group(0))
+    
+    def readCells(self, _sheetName):
+        """ Reads every cell on the Worksheet. Cells with a formula give the formula ('=A1*2'), 
+        same as Excel's Range.Formula, the others give their value.
+        
+        Returns:
+            (dict): {'A1': value, ...}
+        """
+        sheetPath = self.SheetPaths.get(_sheetName)
+        if not sheetPath:
+            return {}
+        
+        with zipfile.ZipFile(self.FilePath) as zin:
+            sheetXml = self.readXml(zin, sheetPath)
+        
+        cells = {}
+        for cellXml in self.reCell.findall(sheetXml):
+            cells[self.getAttr(cellXml[:cellXml.index(u'>') + 1], 'r')] = self.cellValue(cellXml, True)
+        return cells
+    
+    def cellValue(self, _cellXml, _formulas=False):
+        formula = re.search(r'<f\b[^>]*>(.*?)</f>', _cellXml, re.DOTALL)
+        if _formulas and formula:
+            return u'=' + self.unescape(formula.group(1))
+        
+        cellType = self.getAttr(_cellXml[:_cellXml.index('>')], 't')
+        if cellType == 'inlineStr':
+            return self.unescape(u''.join(re.findall(r'<t\b[^>]*>(.*?)</t>', _cellXml, re.DOTALL)))
+        
+        value = re.search(r'<v>(.*?)</v>', _cellXml, re.DOTALL)
+        if not value:
+            return None
+        elif cellType == 's':
+            return self.getSharedStrings()[int(value.group(1))]
+        elif cellType in ('str', 'e'):
+            return self.unescape(value.group(1))
+        elif cellType == 'b':
+            return value.group(1) == '1'
+        return float(value.group(1))
+    
+    def getPHPPUnits(self):
+        """ Looks at !Data:B3 to find version number. Returns 'SI' or 'IP' unit type """
+        version = self.getCellValue('Data', 'B3')
+        if version and 'IP' in str(version):
+            return 'IP'
+        return 'SI'
+    
+    #---------------------------------------------------------------------------
+    # Writing
+    
+    @staticmethod
+    def isNotANumber(_value):
+        return isinstance(_value, float) and (math.isnan(_value) or math.isinf(_value))
+    
+    def cellXml(self, _address, _value, _style):
+        """ The new <c> element for a value, the same way Excel would take it as a Value2 """
+        style = u' s="{}"'.format(_style) if _style is not None else u''
+        
+        if _value is None or (isinstance(_value, basestring) and len(_value) == 0):
+            return u'<c r="{}"{}/>'.format(_address, style)
+        elif isinstance(_value, bool):
+            return u'<c r="{}"{} t="b"><v>{}</v></c>'.format(_address, style, int(_value))
+        elif self.isNotANumber(_value):
+            # NaN / infinity have no <v> Excel can read, so the same error Excel gives for one
+            return u'<c r="{}"{} t="e"><v>#NUM!</v></c>'.format(_address, style)
+        elif isinstance(_value, numbers.Number):
+            return u'<c r="{}"{}><v>{}</v></c>'.format(_address, style, repr(_value) if isinstance(_value, float) else int(_value))
+        
+        text = _value if isinstance(_value, basestring) else str(_value)
+        if text.startswith(u'='):
+            return u'<c r="{}"{}><f>{}</f></c>'.format(_address, style, self.escape(text[1:]))
+        elif self.reNumber.match(text):
+            # Excel reads number-looking text as a number
+            return u'<c r="{}"{}><v>{!r}</v></c>'.format(_address, style, float(text))
+        
+        space = u' xml:space="preserve"' if text != text.strip() else u''
+        return u'<c r="{}"{} t="inlineStr"><is><t{}>{}</t></is></c>'.format(_address, style, space, self.escape(text))
+    
+    def patchRow(self, _sheetName, _rowXml, _rowNum, _cells, _highlightStyle):
+        """ Writes the cells into a single <row>, keeping any other cells there as they are """
+        if _rowXml is None:
+            openTag, existing = u'<row r="{}">'.format(_rowNum), []
+        elif _rowXml.endswith(u'/>'):
+            openTag, existing = _rowXml[:-2].rstrip() + u'>', []
+        else:
+            openTag = _rowXml[:_rowXml.index(u'>') + 1]
+            existing = self.reCell.findall(_rowXml, len(openTag))
+        
+        cellsOut = []
+        toWrite = sorted(_cells.items())
+        for cellXml in existing:
+            address = self.getAttr(cellXml[:cellXml.index(u'>') + 1], 'r')
+            col = PHPP_XL_Address.fromA1(address)[1]
+            while toWrite and toWrite[0][0] < col:
+                cellsOut.append(self.newCell(toWrite.pop(0), _rowNum, None, _highlightStyle))
+            
+            if toWrite and toWrite[0][0] == col:
+                cellOpenTag = cellXml[:cellXml.index(u'>') + 1]
+                formula = re.search(r'<f\b[^>]*>', cellXml)
+                if formula and self.getAttr(formula.group(0), 'ref'):
+                    # Overwriting the first cell of a shared / array formula would break the rest of it
+                    self.Warnings.append(u'Skipped {}!{}: it holds a shared or array formula'.format(_sheetName, address))
+                    self.Skipped.append( (_sheetName, (_rowNum, col)) )
+                    toWrite.pop(0)
+                    cellsOut.append(cellXml)
+                else:
+                    cellsOut.append(self.newCell(toWrite.pop(0), _rowNum, self.getAttr(cellOpenTag, 's'), _highlightStyle))
+            else:
+                cellsOut.append(cellXml)
+        
+        for cell in toWrite:
+            cellsOut.append(self.newCell(cell, _rowNum, None, _highlightStyle))
+        
+        return openTag + u''.join(cellsOut) + u'</row>'
+    
+    def newCell(self, _cell, _rowNum, _style, _highlightStyle):
+        col, value = _cell
+        address = PHPP_XL_Address.toA1( (_rowNum, col) )
+        return self.cellXml(address, value, _highlightStyle(_style) if _highlightStyle else _style)
+    
+    def patchSheet(self, _sheetName, _sheetXml, _cells, _highlightStyle):
+        """ Streams through the worksheet's <row> elements in order, patching
+        the ones with cells to write and adding any new rows needed """
+        rows = {}
+        for (row, col), value in _cells.items():
+            rows.setdefault(row, {})[col] = value
+        toWrite = sorted(rows)
+        
+        match = re.search(r'<sheetData\s*/>|<sheetData\b[^>]*>(.*?)</sheetData>', _sheetXml, re.DOTALL)
+        if match is None:
+            self.Warnings.append(u'No cell data found on the "{}" worksheet?'.format(_sheetName))
+            self.Skipped.extend( (_sheetName, cell) for cell in _cells )
+            return _sheetXml
+        
+        rowsOut = []
+        for rowMatch in self.reRow.finditer(match.group(1) or u''):
+            rowXml = rowMatch.group(0)
+            rowNum = int(self.getAttr(rowXml[:rowXml.index(u'>') + 1], 'r'))
+            while toWrite and toWrite[0] < rowNum:
+                row = toWrite.pop(0)
+                rowsOut.append(self.patchRow(_sheetName, None, row, rows[row], _highlightStyle))
+            
+            if toWrite and toWrite[0] == rowNum:
+                rowsOut.append(self.patchRow(_sheetName, rowXml, rowNum, rows[toWrite.pop(0)], _highlightStyle))
+            else:
+                rowsOut.append(rowXml)
+        
+        for row in toWrite:
+            rowsOut.append(self.patchRow(_sheetName, None, row, rows[row], _highlightStyle))
+        
+        return u'{}<sheetData>{}</sheetData>{}'.format(_sheetXml[:match.start()], u''.join(rowsOut), _sheetXml[match.end():])
+    
+    def getCellsBySheet(self, _writes):
+        """ {Worksheet: {(row, col): value}} from the (Worksheet, Range, Value) writes """
+        cellsBySheet = {}
+        notNumbers = []
+        for worksheet, rangeAddress, value in _writes:
+            if worksheet not in self.SheetPaths:
+                if u'Sheet not found: {}'.format(worksheet) not in self.Warnings:
+                    self.Warnings.append(u'Sheet not found: {}'.format(worksheet))
+                self.Skipped.append( (worksheet, rangeAddress) )
+                continue
+            
+            cellRange = PHPP_XL_Address.rangeFromA1(rangeAddress)
+            if cellRange is None:
+                self.Warnings.append(u'Could not write to: {}!{}'.format(worksheet, rangeAddress))
+                self.Skipped.append( (worksheet, rangeAddress) )
+                continue
+            
+            if self.isNotANumber(value):
+                notNumbers.append(u'{}!{}'.format(worksheet, rangeAddress))
+            
+            # A single value written to a multi-cell Range goes in every cell, same as Excel
+            sheetCells = cellsBySheet.setdefault(worksheet, {})
+            for cell in PHPP_XL_Address.rangeCells(cellRange):
+                sheetCells[cell] = value
+        
+        if notNumbers:
+            self.Warnings.append(u'{} cell(s) have no real number to write (NaN or infinity), so they show #NUM!: {}{}'.format(
+                len(notNumbers), u', '.join(notNumbers[:10]), u'...' if len(notNumbers) > 10 else u''))
+        
+        return cellsBySheet
+    
+    def write(self, _writes, _highlight=True, _outPath=None):
+        """ Writes the cell values into the workbook
+        
+        Args:
+            _writes (list): The (Worksheet, Range, Value) writes. If a cell is written
+                more than once, the last one wins.
+            _highlight (bool): Optional. Colour the written cells, same as the Excel writer. Default=True
+            _outPath (str): Optional. Save to a new file. Default=None updates the workbook file in place.
+        Returns:
+            (int): The number of cells written, not counting the Skipped ones
+        """
+        self.Warnings = []
+        self.Skipped = []
+        cellsBySheet = self.getCellsBySheet(_writes)
+        
+        with zipfile.ZipFile(self.FilePath) as zin:
+            names = zin.namelist()
+            patched = {}
+            
+            # Highlighted cells each get a copy of their current cell format, with the highlight fill
+            stylesXml = self.readXml(zin, 'xl/styles.xml') if _highlight and 'xl/styles.xml' in names else None
+            fillsMatch = re.search(r'<fills\b[^>]*>(.*?)</fills>', stylesXml, re.DOTALL) if stylesXml else None
+            xfsMatch = re.search(r'<cellXfs\b[^>]*>(.*?)</cellXfs>', stylesXml, re.DOTALL) if fillsMatch else None
+            if xfsMatch:
+                fills = re.findall(r'<fill\b[^>]*?(?:/>|>.*?</fill>)', fillsMatch.group(1), re.DOTALL)
+                fillId = fills.index(self.highlightFill) if self.highlightFill in fills else len(fills)
+                xfs = self.reXf.findall(xfsMatch.group(1))
+                newXfs = []
+                highlightStyles = {}
+                
+                def highlightStyle(_style):
+                    style = int(_style or 0)
+                    if style not in highlightStyles:
+                        xf = xfs[style] if style < len(xfs) else xfs[0]
+                        xfOpenTag = xf[:xf.index(u'>') + 1]
+                        newXf = self.setAttr(self.setAttr(xfOpenTag, 'fillId', fillId), 'applyFill', 1) + xf[len(xfOpenTag):]
+                        if newXf in xfs:
+                            highlightStyles[style] = xfs.index(newXf)
+                        else:
+                            xfs.append(newXf)
+                            newXfs.append(newXf)
+                            highlightStyles[style] = len(xfs) - 1
+                    return highlightStyles[style]
+            else:
+                highlightStyle = None
+            
+            for sheetName, cells in cellsBySheet.items():
+                sheetPath = self.SheetPaths[sheetName]
+                patched[sheetPath] = self.patchSheet(sheetName, self.readXml(zin, sheetPath), cells, highlightStyle)
+            
+            if xfsMatch and newXfs:
+                if fillId == len(fills):
+                    fillsXml = self.setAttr(fillsMatch.group(0)[:fillsMatch.group(0).index(u'>') + 1], 'count', len(fills) + 1)
+                    fillsXml += fillsMatch.group(1) + self.highlightFill + u'</fills>'
+                    stylesXml = stylesXml.replace(fillsMatch.group(0), fillsXml, 1)
+                    xfsMatch = re.search(r'<cellXfs\b[^>]*>(.*?)</cellXfs>', stylesXml, re.DOTALL)
+                xfsOpenTag = xfsMatch.group(0)[:xfsMatch.group(0).index(u'>') + 1]
+                xfsXml = self.setAttr(xfsOpenTag, 'count', len(xfs)) + xfsMatch.group(1) + u''.join(newXfs) + u'</cellXfs>'
+                patched['xl/styles.xml'] = stylesXml[:xfsMatch.start()] + xfsXml + stylesXml[xfsMatch.end():]
+            
+            # Full recalc when opened in Excel. The calc chain is dropped, Excel rebuilds it.
+            patched['xl/workbook.xml'] = self.setFullCalcOnLoad(self.readXml(zin, 'xl/workbook.xml'))
+            if 'xl/calcChain.xml' in names:
+                patched['xl/_rels/workbook.xml.rels'] = re.sub(r'<Relationship\b[^>]*Target="/?(xl/)?calcChain\.xml"[^>]*/>', u'', self.readXml(zin, 'xl/_rels/workbook.xml.rels'))
+                patched['[Content_Types].xml'] = re.sub(r'<Override\b[^>]*PartName="/xl/calcChain\.xml"[^>]*/>', u'', self.readXml(zin, '[Content_Types].xml'))
+            
+            outPath = _outPath or self.FilePath
+            fd, tempPath = tempfile.mkstemp(suffix='.xlsx', dir=os.path.dirname(os.path.abspath(outPath)))
+            os.close(fd)
+            try:
+                with zipfile.ZipFile(tempPath, 'w', zipfile.ZIP_DEFLATED) as zout:
+                    for info in zin.infolist():
+                        if info.filename == 'xl/calcChain.xml':
+                            continue
+                        elif info.filename in patched:
+                            zout.writestr(zipfile.ZipInfo(info.filename, info.date_time), patched[info.filename].encode('utf-8'), zipfile.ZIP_DEFLATED)
+                        else:
+                            zout.writestr(info, zin.read(info.filename))
+            except:
+                os.remove(tempPath)
+                raise
+        
+        if os.path.exists(outPath):
+            os.remove(outPath)
+        shutil.move(tempPath, outPath)
+        self.FilePath = outPath
+        
+        skippedCells = set(cell for cell in self.Skipped if cell[0] in cellsBySheet and cell[1] in cellsBySheet[cell[0]])
+        return sum(len(cells) for cells in cellsBySheet.values()) - len(skippedCells)
+    
+    def setFullCalcOnLoad(self, _workbookXml):
+        calcPr = re.search(r'<calcPr\b[^>]*?/?>', _workbookXml)
+        if calcPr:
+            return _workbookXml.replace(calcPr.group(0), self.setAttr(calcPr.group(0), 'fullCalcOnLoad', 1), 1)
+        
+        for tag in (u'</definedNames>', u'</sheets>'):
+            if tag in _workbookXml:
+                return _workbookXml.replace(tag, tag + u'<calcPr fullCalcOnLoad="1"/>', 1)
+        return _workbookXml
+    
+    def __str__(self):
+        return "PHPP .xlsx Workbook | File: {}".format(self.FilePath)
+    def __repr__(self):
+        return "{}( _filePath={!r} )".format(
+               self.__class__.__name__,
+               self.FilePath)
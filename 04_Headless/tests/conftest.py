@@ -0,0 +1,64 @@
+"""
+Shared fixtures for the headless IDF2PHPP tests. Run from the '04_Headless' folder:
+
+    python -m pytest tests
+"""
+
+import os
+import sys
+import zipfile
+
+import pytest
+
+HEADLESS_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if HEADLESS_FOLDER not in sys.path:
+    sys.path.insert(0, HEADLESS_FOLDER)
+
+DATA_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+# The PHPP Worksheets the box model writes to, plus 'Data' for the PHPP version / units
+PHPP_SHEETS = {'SI': ['Data', 'Climate', 'U-Values', 'Components', 'Areas', 'Windows', 'Ventilation', 'Additional Vent'],
+               'IP': ['Data', 'Climate', 'R-Values', 'Components', 'Areas', 'Windows', 'Ventilation', 'Addl vent']}
+
+def buildTemplate(_filePath, _units='SI', _sheetData=None):
+    """ Writes a bare-bones PHPP .xlsx: one empty Worksheet for each of the SI or IP PHPP_SHEETS,
+    or with the rows in _sheetData ({Worksheet: '<row ...>...</row>'}) """
+
+    sheetNames = PHPP_SHEETS[_units]
+    ns = 'http://schemas.openxmlformats.org/'
+    sheets = ''.join('<sheet name="{}" sheetId="{}" r:id="rId{}"/>'.format(name, i, i) for i, name in enumerate(sheetNames, 1))
+    rels = ''.join('<Relationship Id="rId{0}" Type="{1}officeDocument/2006/relationships/worksheet" '
+                   'Target="worksheets/sheet{0}.xml"/>'.format(i, ns) for i in range(1, len(sheetNames) + 1))
+    overrides = ''.join('<Override PartName="/xl/worksheets/sheet{}.xml" ContentType="application/'
+                        'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'.format(i) for i in range(1, len(sheetNames) + 1))
+    sheetXml = '<worksheet xmlns="{}spreadsheetml/2006/main"><sheetData>{{}}</sheetData></worksheet>'.format(ns)
+    dataSheet = ('<worksheet xmlns="{}spreadsheetml/2006/main"><sheetData><row r="3"><c r="B3" t="inlineStr">'
+                 '<is><t>PHPP 9.6 {}</t></is></c></row></sheetData></worksheet>').format(ns, _units)
+
+    with zipfile.ZipFile(_filePath, 'w') as zout:
+        zout.writestr('[Content_Types].xml', '<Types xmlns="{}package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" ContentType="application/'
+            'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>{}</Types>'.format(ns, overrides))
+        zout.writestr('_rels/.rels', '<Relationships xmlns="{0}package/2006/relationships"><Relationship Id="rId1" '
+            'Type="{0}officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/></Relationships>'.format(ns))
+        zout.writestr('xl/workbook.xml', '<workbook xmlns="{0}spreadsheetml/2006/main" xmlns:r="{0}officeDocument/2006/'
+            'relationships"><sheets>{1}</sheets></workbook>'.format(ns, sheets))
+        zout.writestr('xl/_rels/workbook.xml.rels', '<Relationships xmlns="{}package/2006/relationships">{}'
+            '</Relationships>'.format(ns, rels))
+        for i, name in enumerate(sheetNames, 1):
+            zout.writestr('xl/worksheets/sheet{}.xml'.format(i), dataSheet if name == 'Data' else
+                          sheetXml.format((_sheetData or {}).get(name, '')))
+
+    return _filePath
+
+@pytest.fixture
+def dataPath():
+    """ Returns the full path to a file in the 'tests/data' folder """
+    return lambda _fileName: os.path.join(DATA_FOLDER, _fileName)
+
+@pytest.fixture
+def phppTemplate(tmpdir):
+    """ Returns a function that writes a bare-bones SI or IP PHPP .xlsx into the test's temp folder """
+    return lambda _units='SI', _sheetData=None: buildTemplate(str(tmpdir.join('PHPP_{}.xlsx'.format(_units))), _units, _sheetData)
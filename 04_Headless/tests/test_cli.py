@@ -0,0 +1,101 @@
+"""
+Runs the command line converter ('python -m idf2phpp') on the box model in 'tests/data' and
+checks the PHPP cells it writes out as csv, json and straight into an .xlsx
+"""
+
+import csv
+import io
+import json
+import sys
+
+import pytest
+
+from idf2phpp.__main__ import main
+from idf2phpp.xlsx import PHPP_XLSX_Workbook
+
+def readCSV(_filePath):
+    # csv wants bytes in Python 2, text in Python 3
+    if sys.version_info[0] < 3:
+        with open(_filePath, 'rb') as csvFile:
+            return [[v.decode('utf-8') for v in row] for row in csv.reader(csvFile)]
+    with io.open(_filePath, 'r', encoding='utf-8', newline='') as csvFile:
+        return list(csv.reader(csvFile))
+
+def readJSON(_filePath):
+    with open(_filePath, 'r') as jsonFile:
+        return dict(((write['Worksheet'], write['Range']), write['Value']) for write in json.load(jsonFile))
+
+def runCLI(_args):
+    assert main(list(_args) + ['-q']) == 0
+
+@pytest.fixture
+def convert(dataPath, tmpdir):
+    """ Converts a model in 'tests/data' with the saved Rooms and returns the output file path """
+    def _convert(_modelFile, _format='csv', *_args):
+        outPath = str(tmpdir.join('out.{}'.format(_format)))
+        runCLI([dataPath(_modelFile), '--saved-data', dataPath('rooms.json'), '--format', _format, '-o', outPath] + list(_args))
+        return outPath
+    return _convert
+
+def test_csv_from_idf(convert):
+    rows = readCSV(convert('box.idf', 'csv'))
+    assert rows[0] == ['Group', 'Worksheet', 'Range', 'Value']
+
+    cells = dict(((worksheet, cellRange), (group, value)) for group, worksheet, cellRange, value in rows[1:])
+    assert len(cells) == len(rows) - 1
+
+    # The South wall: name, area from the vertices, and tilt
+    assert cells[('Areas', 'L43')] == ('Areas', 'South')
+    assert float(cells[('Areas', 'V43')][1]) == pytest.approx(30.0)
+    assert float(cells[('Areas', 'AH43')][1]) == pytest.approx(90.0)
+
+    # The two triangles of 'Win2_glzP_*' merged back into one 2 x 1.5 Window
+    assert cells[('Windows', 'M25')] == ('Windows', 'Win2')
+    assert float(cells[('Windows', 'Q25')][1]) == pytest.approx(2.0)
+    assert float(cells[('Windows', 'R25')][1]) == pytest.approx(1.5)
+
+    # Airtightness: the Room Vn50 wins over the Zone volume (8 x 10 x 3 = 240)
+    assert float(cells[('Ventilation', 'P27')][1]) == pytest.approx(190.0)
+    assert float(cells[('Ventilation', 'N27')][1]) == pytest.approx(5.1134285, rel=1e-6)
+    assert cells[('Areas', 'V34')] == ('TFA', '70.5')
+
+    assert cells[('Climate', 'D12')] == ('Location', 'US0055b-New York')
+
+def test_json_from_epJSON_matches_idf(convert):
+    fromIDF = readJSON(convert('box.idf', 'json'))
+    fromEpJSON = readJSON(convert('box.epJSON', 'json'))
+
+    # Same geometry in both, but only the .idf has the Windows
+    assert not any(worksheet == 'Windows' for worksheet, cellRange in fromEpJSON)
+    for key, value in fromEpJSON.items():
+        if key[0] in ('Areas', 'Ventilation', 'Climate', 'U-Values'):
+            assert fromIDF[key] == pytest.approx(value) if isinstance(value, float) else fromIDF[key] == value, key
+
+    assert fromEpJSON[('Areas', 'V33')] == pytest.approx(80.0)
+    assert fromEpJSON[('Ventilation', 'P27')] == pytest.approx(190.0)
+
+@pytest.mark.parametrize('units', ['SI', 'IP'])
+def test_xlsx_from_template(convert, phppTemplate, units):
+    templatePath = phppTemplate(units)
+    outPath = convert('box.idf', 'xlsx', '--template', templatePath)
+    expected = readJSON(convert('box.idf', 'json', '--units', units))
+
+    workbook = PHPP_XLSX_Workbook(outPath)
+    assert workbook.getPHPPUnits() == units
+    for (worksheet, cellRange), value in expected.items():
+        if isinstance(value, type(u'')) and value.startswith('='):
+            continue    # Formulas only get a value once Excel recalcs
+
+        cellValue = workbook.getCellValue(worksheet, cellRange)
+        try:
+            # Same as Excel, number-looking text ('24') is written as a number
+            assert cellValue == pytest.approx(float(value)), (worksheet, cellRange)
+        except (TypeError, ValueError):
+            assert cellValue == (value or None), (worksheet, cellRange)
+
+    # The template itself is copied, not changed
+    assert PHPP_XLSX_Workbook(templatePath).getCellValue('Areas', 'V43') is None
+    assert workbook.getCellValue('Areas', 'V43') == pytest.approx(30.0 if units == 'SI' else 30.0 * 10.7639, rel=1e-4)
+
+def test_bad_file_fails(dataPath, tmpdir):
+    assert main([dataPath('missing.idf'), '-o', str(tmpdir.join('out.csv')), '-q']) == 1
@@ -0,0 +1,59 @@
+"""
+Reads IDF files without any '!-' field comments, from EnergyPlus versions with more or
+fewer fields before the surface vertices than the reader's IDD subset
+"""
+
+from idf2phpp.pipeline import readIDF
+from idf2phpp.reader import IDF_Schema
+
+WALL_VERTICES = '0,0,3, 0,0,0, 10,0,0, 10,0,3'
+
+def writeIDF(_tmpdir, _text):
+    idfFile = _tmpdir.join('model.idf')
+    idfFile.write(_text)
+    return str(idfFile)
+
+def test_find_vertex_count():
+    values = ['Win', 'Window', 'Glz', 'Wall', '', '', '', '', '1', '4'] + WALL_VERTICES.replace(' ', '').split(',')
+    assert IDF_Schema.findVertexCount(values) == 9
+    assert IDF_Schema.findVertexCount(values, 8) == 9
+    assert IDF_Schema.findVertexCount(values[:-1]) is None
+
+    values[9] = 'autocalculate'
+    assert IDF_Schema.findVertexCount(values, 9) == 9
+
+def test_space_name_without_comments(tmpdir):
+    # E+ 9.6 added 'Space Name' after 'Zone Name'
+    idf = readIDF(writeIDF(tmpdir, 'BuildingSurface:Detailed, WallS, Wall, ExtWall, ZONE_A, SPACE_A, Outdoors, , '
+                                   'SunExposed, WindExposed, , 4, {};\n'.format(WALL_VERTICES)))
+    wall = idf.get('BuildingSurface:Detailed', 'WallS')
+
+    assert wall.vertexPoints() == [(0, 0, 3), (0, 0, 0), (10, 0, 0), (10, 0, 3)]
+    assert getattr(wall, 'Space Name') == 'SPACE_A'
+    assert getattr(wall, 'Outside Boundary Condition') == 'Outdoors'
+    assert getattr(wall, 'Number of Vertices') == '4'
+    assert idf.warnings == []
+
+def test_shading_control_without_comments(tmpdir):
+    # E+ 8.9 still had 'Shading Control Name' before 'Frame and Divider Name'
+    idf = readIDF(writeIDF(tmpdir, 'FenestrationSurface:Detailed, WinS, Window, Win, WallS, , , Shade, , 1, 4, '
+                                   '2,0,2, 2,0,1, 4,0,1, 4,0,2;\n'
+                                   'FenestrationSurface:Detailed, WinN, Window, Win, WallN, , , , , 1, 3, '
+                                   '2,8,2, 2,8,1, 4,8,1;\n'))
+
+    windowS, windowN = idf['FenestrationSurface:Detailed']
+    assert len(windowS.vertices) == 12
+    assert len(windowN.vertices) == 9
+    assert getattr(windowS, 'Shading Control Name') == 'Shade'
+    assert getattr(windowS, 'Multiplier') == '1'
+
+def test_bad_vertex_count_is_left_out(tmpdir):
+    idf = readIDF(writeIDF(tmpdir, 'BuildingSurface:Detailed, WallS, Wall, ExtWall, ZONE_A, Outdoors, , '
+                                   'SunExposed, WindExposed, , 4, {};\n'
+                                   'BuildingSurface:Detailed, WallN, Wall, ExtWall, ZONE_A, Outdoors, , '
+                                   'SunExposed, WindExposed, , 4, 0,8,3, 0,8,0, 10,8,0, 10,8;\n'.format(WALL_VERTICES)))
+
+    assert len(idf.get('BuildingSurface:Detailed', 'WallS').vertices) == 12
+    assert idf.get('BuildingSurface:Detailed', 'WallN').vertices is None
+    assert len(idf.warnings) == 1
+    assert 'WallN' in idf.warnings[0]
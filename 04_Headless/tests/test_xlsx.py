@@ -0,0 +1,36 @@
+"""
+Writes cells straight into a bare-bones PHPP .xlsx with PHPP_XLSX_Workbook, for the values
+Excel can't hold and the cells that have to be left alone
+"""
+
+import zipfile
+
+from idf2phpp.xlsx import PHPP_XLSX_Workbook
+
+def sheetXml(_filePath, _sheetName):
+    workbook = PHPP_XLSX_Workbook(_filePath)
+    with zipfile.ZipFile(_filePath) as zin:
+        return zin.read(workbook.SheetPaths[_sheetName]).decode('utf-8')
+
+def test_nan_and_inf_written_as_num_error(phppTemplate):
+    workbook = PHPP_XLSX_Workbook(phppTemplate())
+    numCells = workbook.write([('Areas', 'V43', float('nan')), ('Areas', 'V44', float('inf')),
+                               ('Areas', 'V45', float('-inf')), ('Areas', 'V46', 30.0)])
+
+    assert numCells == 4
+    assert 'nan' not in sheetXml(workbook.FilePath, 'Areas').lower()
+    assert [workbook.getCellValue('Areas', 'V{}'.format(row)) for row in (43, 44, 45, 46)] == ['#NUM!', '#NUM!', '#NUM!', 30.0]
+    assert len(workbook.Warnings) == 1
+    assert workbook.Warnings[0].startswith('3 cell(s)') and 'Areas!V43' in workbook.Warnings[0]
+
+def test_skipped_cells_not_counted(phppTemplate):
+    # V43:V44 share one formula. Overwriting V43 would break V44, so it is left alone
+    sharedFormula = ('<row r="43"><c r="V43"><f t="shared" ref="V43:V44" si="0">A43*2</f><v>0</v></c></row>'
+                     '<row r="44"><c r="V44"><f t="shared" si="0"/><v>0</v></c></row>')
+    workbook = PHPP_XLSX_Workbook(phppTemplate(_sheetData={'Areas': sharedFormula}))
+    numCells = workbook.write([('Areas', 'V43', 1.0), ('Areas', 'V45', 2.0), ('Areas', 'V46:V47', 3.0), ('Nowhere', 'A1', 4.0)])
+
+    assert numCells == 3
+    assert sorted(workbook.Skipped) == [('Areas', (43, 22)), ('Nowhere', 'A1')]
+    assert workbook.getCellValue('Areas', 'V43') == 0.0
+    assert workbook.getCellValue('Areas', 'V47') == 3.0